@@ -0,0 +1,176 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Regression corpus and throughput benchmark for ``src.bbcode.BBCODE``.
+
+The descriptions in ``benchmarks/bbcode_corpus`` are cleaned/converted as the trackers do and
+compared with ``expected.json``. For throughput, each description is repeated ``--scale`` times,
+like the multi-disc packs that reach hundreds of KB. ``--baseline REV`` loads ``src/bbcode.py``
+from that git revision and times it (and diffs its output) against the working tree.
+
+Usage:
+    python -m benchmarks.bbcode [--scale 40] [--rounds 3] [--baseline REV] [--update]
+"""
+import argparse
+import difflib
+import importlib.util
+import json
+import os
+import subprocess  # nosec B404 - only runs git show
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from src import bbcode as bbcode_module
+from src.bbcode import BBCODE
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bbcode_corpus')
+EXPECTED_PATH = os.path.join(CORPUS_DIR, 'expected.json')
+
+# Conversion chains used by trackers' description builders
+CHAINS: dict[str, list[tuple[str, tuple[Any, ...]]]] = {
+    'ant': [('convert_to_align', ()), ('remove_img_resize', ()), ('remove_sup', ()), ('remove_sub', ()), ('remove_list', ()), ('remove_extra_lines', ())],
+    'hdt': [('remove_sub', ()), ('remove_sup', ()), ('convert_spoiler_to_hide', ()), ('remove_img_resize', ()),
+            ('convert_comparison_to_centered', (1000,)), ('remove_spoiler', ()), ('remove_list', ()), ('remove_extra_lines', ())],
+    'oe': [('convert_pre_to_code', ()), ('convert_hide_to_spoiler', ()), ('convert_comparison_to_collapse', (1000,))],
+    'dc': [('remove_sup', ()), ('remove_sub', ()), ('convert_named_spoiler_to_normal_spoiler', ()), ('convert_comparison_to_centered', (1000,)),
+           ('remove_extra_lines', ())],
+    'spoiler_code_quote': [('convert_spoiler_to_code', ()), ('convert_code_to_quote', ())],
+    'named_hide': [('convert_named_spoiler_to_named_hide', ()), ('remove_hide', ()), ('convert_code_to_pre', ())],
+}
+
+# (case name, corpus file, method, extra args); 'chain:<name>' runs one of CHAINS
+CASES: list[tuple[str, str, str, tuple[Any, ...]]] = [
+    ('ptp_movie', 'ptp_movie.txt', 'clean_ptp_description', ('',)),
+    ('ptp_movie_dvd', 'ptp_movie.txt', 'clean_ptp_description', ('DVD',)),
+    ('ptp_bdmv', 'ptp_bdmv.txt', 'clean_ptp_description', ('BDMV',)),
+    ('unit3d', 'unit3d.txt', 'clean_unit3d_description', ('https://blutopia.cc',)),
+    ('hdb', 'hdb.txt', 'clean_hdb_description', ()),
+    ('bhd', 'bhd.txt', 'clean_bhd_description', ({'flux': True},)),
+] + [(f'chain_{name}', 'tracker.txt', f'chain:{name}', ()) for name in CHAINS]
+
+
+# Chain steps that are plain rule sets; consecutive ones go through one BBCODE.apply, as the trackers do
+RULE_SET_STEPS: dict[str, str] = {
+    'convert_pre_to_code': 'PRE_TO_CODE', 'convert_code_to_pre': 'CODE_TO_PRE', 'convert_hide_to_spoiler': 'HIDE_TO_SPOILER',
+    'convert_spoiler_to_hide': 'SPOILER_TO_HIDE', 'remove_hide': 'REMOVE_HIDE', 'convert_named_spoiler_to_named_hide': 'NAMED_SPOILER_TO_NAMED_HIDE',
+    'remove_spoiler': 'REMOVE_SPOILER', 'convert_named_spoiler_to_normal_spoiler': 'NAMED_SPOILER_TO_NORMAL_SPOILER',
+    'convert_spoiler_to_code': 'SPOILER_TO_CODE', 'convert_code_to_quote': 'CODE_TO_QUOTE', 'remove_img_resize': 'REMOVE_IMG_RESIZE',
+    'convert_to_align': 'CONVERT_TO_ALIGN', 'remove_sup': 'REMOVE_SUP', 'remove_sub': 'REMOVE_SUB', 'remove_list': 'REMOVE_LIST',
+}
+
+
+def run_chain(bbcode: Any, steps: list[tuple[str, tuple[Any, ...]]], text: str) -> str:
+    pending: list[Any] = []
+    for step, step_args in steps:
+        if hasattr(bbcode, 'apply') and step in RULE_SET_STEPS:
+            pending.append(getattr(bbcode_module, RULE_SET_STEPS[step]))
+            continue
+        if pending:
+            text = bbcode.apply(text, *pending)
+            pending = []
+        text = getattr(bbcode, step)(text, *step_args)
+    return bbcode.apply(text, *pending) if pending else text
+
+
+def run_case(bbcode: Any, method: str, text: str, args: tuple[Any, ...]) -> Any:
+    if method.startswith('chain:'):
+        return run_chain(bbcode, CHAINS[method.split(':', 1)[1]], text)
+    result = getattr(bbcode, method)(text, *args)
+    return list(result) if isinstance(result, tuple) else result
+
+
+def load_corpus() -> dict[str, str]:
+    corpus: dict[str, str] = {}
+    for _name, filename, _method, _args in CASES:
+        with open(os.path.join(CORPUS_DIR, filename), encoding='utf-8') as f:
+            corpus[filename] = f.read()
+    return corpus
+
+
+def load_baseline(rev: str) -> Any:
+    source = subprocess.run(  # nosec B603 B607 - fixed git command
+        ['git', 'show', f'{rev}:src/bbcode.py'], check=True, capture_output=True, text=True,
+    ).stdout
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf-8') as f:
+        f.write(source)
+    try:
+        spec = importlib.util.spec_from_file_location('bbcode_baseline', f.name)
+        assert spec is not None and spec.loader is not None  # nosec B101
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.unlink(f.name)
+    return module.BBCODE()
+
+
+def timed(fn: Callable[[], Any], rounds: int) -> float:
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check(results: dict[str, Any], expected: dict[str, Any], label: str) -> int:
+    failures = 0
+    for name, value in results.items():
+        if name not in expected:
+            print(f"  {name}: no expected output (run with --update)")
+            failures += 1
+        elif value != expected[name]:
+            failures += 1
+            print(f"  {name}: output differs from {label}")
+            got = json.dumps(value, indent=1, ensure_ascii=False).splitlines()
+            want = json.dumps(expected[name], indent=1, ensure_ascii=False).splitlines()
+            for line in difflib.unified_diff(want, got, label, 'current', lineterm='', n=1):
+                print(f"    {line}")
+    return failures
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="BBCode regression corpus and throughput benchmark")
+    parser.add_argument('--scale', type=int, default=40, help="repeat each description this many times for timing")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--baseline', help="git revision whose src/bbcode.py to compare against")
+    parser.add_argument('--update', action='store_true', help="rewrite expected.json from the current implementation")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus()
+    bbcode = BBCODE()
+    results = {name: run_case(bbcode, method, corpus[filename], extra) for name, filename, method, extra in CASES}
+
+    if args.update:
+        with open(EXPECTED_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, ensure_ascii=False, sort_keys=True)
+            f.write('\n')
+        print(f"Wrote {len(results)} expected outputs to {EXPECTED_PATH}")
+        return 0
+
+    with open(EXPECTED_PATH, encoding='utf-8') as f:
+        expected = json.load(f)
+    print("Regression corpus:")
+    failures = check(results, expected, 'expected')
+    print(f"  {len(results) - failures}/{len(results)} cases match")
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    if baseline is not None:
+        baseline_results = {name: run_case(baseline, method, corpus[filename], extra) for name, filename, method, extra in CASES}
+        print(f"Differences from {args.baseline}:")
+        if not check(results, baseline_results, args.baseline):
+            print("  none")
+
+    print(f"Throughput (each description x{args.scale}, best of {args.rounds}):")
+    for name, filename, method, extra in CASES:
+        text = '\n'.join([corpus[filename]] * args.scale)
+        current = timed(lambda method=method, text=text, extra=extra: run_case(bbcode, method, text, extra), args.rounds)
+        line = f"  {name:<24} {len(text) / 1024:7.0f} KB   current {current * 1000:8.2f} ms"
+        if baseline is not None:
+            before = timed(lambda method=method, text=text, extra=extra: run_case(baseline, method, text, extra), args.rounds)
+            line += f"   {args.baseline} {before * 1000:8.2f} ms   x{before / current:5.1f}"
+        print(line)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
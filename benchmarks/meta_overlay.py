@@ -0,0 +1,123 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Compare per-tracker ``copy.deepcopy(meta)`` with ``MetaOverlay`` views during tracker checks.
+
+Each mode runs in a fresh interpreter so the reported peak RSS is not polluted by the other.
+
+Usage:
+    python -m benchmarks.meta_overlay [--trackers 30] [--scale 1]
+"""
+import argparse
+import asyncio
+import copy
+import json
+import resource
+import subprocess  # nosec B404 - only runs the current interpreter
+import sys
+import time
+from collections.abc import MutableMapping
+from typing import Any, Optional
+
+from src.metaview import MetaOverlay
+
+
+def build_meta(trackers: list[str], scale: int) -> dict[str, Any]:
+    track = {f"field_{i}": f"value {i} " * 4 for i in range(80)}
+    return {
+        'name': 'Some Movie 2024 1080p BluRay REMUX AVC DTS-HD MA 5.1-GROUP',
+        'uuid': 'benchmark',
+        'debug': False,
+        'unattended': True,
+        'trackers': trackers,
+        'tracker_status': {tracker: {} for tracker in trackers},
+        'mediainfo': {'media': {'track': [dict(track, **{'@type': 'Audio'}) for _ in range(40 * scale)]}},
+        'bdinfo': {'summary': 'Disc Title: X\n' * 4000 * scale, 'files': [{'file': f'{i:05d}.m2ts', 'length': '0:01:00'} for i in range(500 * scale)]},
+        'discs': [{'path': f'/media/disc{i}', 'playlists': [{'items': list(range(200))} for _ in range(20)]} for i in range(4 * scale)],
+        'image_list': [{'img_url': f'https://img/{i}.png', 'raw_url': f'https://img/{i}.png', 'web_url': f'https://img/{i}'} for i in range(60 * scale)],
+        'imdb_info': {'akas': [{'title': f'aka {i}', 'country': 'US'} for i in range(300 * scale)]},
+        'tmdb_localized_data': {'en': {'main': {'overview': 'x' * 20000 * scale}}},
+        'overview': 'y' * 5000,
+        'description': 'z' * 200000 * scale,
+    }
+
+
+async def check_tracker(local_meta: MutableMapping[str, Any], tracker: str) -> None:
+    # Roughly what a dupe search touches: a few scalars, tracker_status and the mediainfo tracks
+    _ = local_meta['name'].replace(' DUPE?', '')
+    local_meta['tracker_status'][tracker]['other'] = False
+    _ = [t.get('@type') for t in local_meta['mediainfo']['media']['track']]
+    _ = len(local_meta.get('image_list', []))
+    local_meta[f'{tracker}_matched_episode_ids'] = [1, 2]
+    await asyncio.sleep(0)
+
+
+async def run_mode(mode: str, trackers: list[str], scale: int) -> float:
+    meta = build_meta(trackers, scale)
+    lock = asyncio.Lock()
+
+    async def one(tracker: str) -> None:
+        if mode == 'deepcopy':
+            local_meta: MutableMapping[str, Any] = copy.deepcopy(meta)
+            await check_tracker(local_meta, tracker)
+            async with lock:
+                meta[f'{tracker}_matched_episode_ids'] = local_meta[f'{tracker}_matched_episode_ids']
+        else:
+            view = MetaOverlay(meta)
+            await check_tracker(view, tracker)
+            async with lock:
+                view.merge_into(meta, [f'{tracker}_matched_episode_ids'])
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(tracker) for tracker in trackers])
+    return time.perf_counter() - start
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def child(mode: str, trackers: int, scale: int) -> None:
+    names = [f"T{i:02d}" for i in range(trackers)]
+    baseline = peak_rss_mb()
+    build_meta(names, scale)
+    elapsed = asyncio.run(run_mode(mode, names, scale))
+    print(json.dumps({'mode': mode, 'seconds': elapsed, 'peak_rss_mb': peak_rss_mb(), 'baseline_rss_mb': baseline}))
+
+
+def run_child(mode: str, trackers: int, scale: int) -> Optional[dict[str, Any]]:
+    result = subprocess.run(  # nosec B603
+        [sys.executable, '-m', 'benchmarks.meta_overlay', '--child', mode, '--trackers', str(trackers), '--scale', str(scale)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return None
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark deepcopy vs MetaOverlay for tracker checks")
+    parser.add_argument('--trackers', type=int, default=30)
+    parser.add_argument('--scale', type=int, default=1, help="Multiplier for the size of the synthetic meta")
+    parser.add_argument('--child', choices=['deepcopy', 'overlay'], help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child, args.trackers, args.scale)
+        return 0
+
+    meta_size = len(json.dumps(build_meta([f"T{i:02d}" for i in range(args.trackers)], args.scale)))
+    print(f"Synthetic meta: {meta_size / 1024 / 1024:.1f} MB as JSON, {args.trackers} trackers")
+    results = [run_child(mode, args.trackers, args.scale) for mode in ('deepcopy', 'overlay')]
+    for result in results:
+        if result is None:
+            return 1
+        print(f"  {result['mode']:<9} wall {result['seconds'] * 1000:8.1f} ms   peak RSS {result['peak_rss_mb']:7.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Compare full ``torrents/info`` scans with the ``sync/maindata`` inventory for existing-torrent searches.
+
+A mock client serves a synthetic torrent list as JSON (so decoding the response is part of
+the cost, like with a real client) and a few changed torrents between searches.
+
+Usage:
+    python -m benchmarks.torrent_inventory [--torrents 50000] [--searches 20]
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Any, Optional
+
+from src.torrent_inventory import TorrentInventory
+
+
+class MockQbitClient:
+    """Just enough of ``qbittorrentapi.Client`` for the searches: torrents_info and sync_maindata."""
+
+    def __init__(self, count: int) -> None:
+        self.rng = random.Random(42)  # nosec B311 - synthetic data
+        self.torrents: dict[str, dict[str, Any]] = {}
+        for i in range(count):
+            name = f"Some.Show.S{i % 30:02d}E{i % 24:02d}.{i}.1080p.WEB-DL.DDP5.1.H.264-GROUP"
+            self.torrents[f"{i:040x}"] = {
+                'name': name,
+                'content_path': f"/data/torrents/{name}",
+                'save_path': "/data/torrents",
+                'size': 1_500_000_000 + i,
+                'progress': 1.0,
+                'upspeed': 0,
+                'category': 'tv',
+                'num_complete': 10,
+                'tracker': 'https://tracker.example/announce',
+                'comment': f"https://tracker.example/torrents/{i}",
+            }
+        self.rid = 0
+        self.changed: set[str] = set()
+        self.reported: set[str] = set()
+
+    def tick(self) -> None:
+        # Between two searches a handful of torrents make progress and one is added
+        for info_hash in self.rng.sample(list(self.torrents), 25):
+            self.torrents[info_hash]['upspeed'] = self.rng.randint(0, 10_000_000)
+            self.changed.add(info_hash)
+        new_hash = f"{len(self.torrents) + 10**9:040x}"
+        self.torrents[new_hash] = dict(next(iter(self.torrents.values())), name=f"New.Release.{new_hash}")
+        self.changed.add(new_hash)
+
+    def torrents_info(self) -> list[dict[str, Any]]:
+        payload = json.dumps([dict(torrent, hash=info_hash) for info_hash, torrent in self.torrents.items()])
+        return json.loads(payload)
+
+    def sync_maindata(self, rid: int = 0) -> dict[str, Any]:
+        if rid == 0 or rid != self.rid:
+            data: dict[str, Any] = {'rid': self.rid + 1, 'full_update': True, 'torrents': self.torrents}
+        else:
+            data = {'rid': self.rid + 1, 'torrents': {
+                info_hash: self.torrents[info_hash] if info_hash not in self.reported else {'upspeed': self.torrents[info_hash]['upspeed']}
+                for info_hash in self.changed
+            }}
+        self.rid += 1
+        self.reported = set(self.torrents)
+        self.changed = set()
+        return json.loads(json.dumps(data))
+
+
+def run_scan(client: MockQbitClient, names: list[str]) -> tuple[float, int]:
+    found = 0
+    start = time.perf_counter()
+    for name in names:
+        client.tick()
+        for torrent in client.torrents_info():
+            if torrent['name'].lower() == name.lower():
+                found += 1
+    return time.perf_counter() - start, found
+
+
+def run_inventory(client: MockQbitClient, names: list[str]) -> tuple[float, float, int]:
+    inventory = TorrentInventory()
+    found = 0
+    start = time.perf_counter()
+    inventory.refresh(client.sync_maindata, max_age=0)
+    first = time.perf_counter() - start
+    for name in names:
+        client.tick()
+        inventory.refresh(client.sync_maindata, max_age=0)
+        found += len(inventory.by_name(name))
+    return first, time.perf_counter() - start, found
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark full torrent list scans vs the sync/maindata inventory")
+    parser.add_argument('--torrents', type=int, default=50000)
+    parser.add_argument('--searches', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    client = MockQbitClient(args.torrents)
+    rng = random.Random(7)  # nosec B311 - synthetic data
+    names = [client.torrents[rng.choice(list(client.torrents))]['name'] for _ in range(args.searches)]
+
+    print(f"Mock client with {args.torrents} torrents, {args.searches} searches")
+    scan_seconds, scan_found = run_scan(MockQbitClient(args.torrents), names)
+    first_sync, inventory_seconds, inventory_found = run_inventory(client, names)
+    print(f"  full scan  total {scan_seconds * 1000:9.1f} ms   per search {scan_seconds / args.searches * 1000:8.2f} ms   matches {scan_found}")
+    per_search = (inventory_seconds - first_sync) / args.searches
+    print(f"  inventory  total {inventory_seconds * 1000:9.1f} ms   per search {per_search * 1000:8.2f} ms   matches {inventory_found}"
+          f"   (first sync {first_sync * 1000:.1f} ms)")
+    return 0 if scan_found == inventory_found else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
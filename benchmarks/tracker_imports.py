@@ -0,0 +1,84 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""Report the cold-start import cost of the tracker registry and of each tracker module.
+
+Usage:
+    python -m benchmarks.tracker_imports            # incremental cost inside one interpreter
+    python -m benchmarks.tracker_imports --isolated # cold cost, one fresh interpreter per tracker
+"""
+import argparse
+import subprocess  # nosec B404 - only runs the current interpreter
+import sys
+import time
+from typing import Optional
+
+ISOLATED_SNIPPET = (
+    "import time; import src.trackersetup as ts; "
+    "t = time.perf_counter(); ts.tracker_class_map[{name!r}]; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def time_registry_import() -> float:
+    start = time.perf_counter()
+    import src.trackersetup  # noqa: F401
+    return time.perf_counter() - start
+
+
+def time_isolated(name: str) -> Optional[float]:
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", ISOLATED_SNIPPET.format(name=name)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        return float(result.stdout.strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        return None
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tracker module import cost")
+    parser.add_argument("--isolated", action="store_true", help="Import each tracker in a fresh interpreter")
+    parser.add_argument("--top", type=int, default=0, help="Only show the N slowest trackers")
+    args = parser.parse_args(argv)
+
+    registry_time = time_registry_import()
+    from src.trackersetup import tracker_class_map
+
+    timings: dict[str, float] = {}
+    failed: list[str] = []
+    for name in tracker_class_map:
+        if args.isolated:
+            elapsed = time_isolated(name)
+            if elapsed is None:
+                failed.append(name)
+                continue
+            timings[name] = elapsed
+        else:
+            try:
+                tracker_class_map[name]
+            except Exception:
+                failed.append(name)
+                continue
+            timings[name] = tracker_class_map.import_times.get(name, 0.0)
+
+    ranked = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+    if args.top > 0:
+        ranked = ranked[:args.top]
+
+    mode = "isolated" if args.isolated else "incremental"
+    print(f"src.trackersetup import: {registry_time * 1000:.1f} ms")
+    print(f"Per-tracker import cost ({mode}):")
+    for name, elapsed in ranked:
+        print(f"  {name:<8} {elapsed * 1000:8.1f} ms")
+    print(f"Total for {len(timings)} trackers: {sum(timings.values()) * 1000:.1f} ms")
+    if failed:
+        print(f"Failed to import: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ import json
 import re
 from typing import TYPE_CHECKING, Any, Optional, cast
 
-import aiofiles
+from src.metastore import meta_store
 
 if TYPE_CHECKING:
     from upload import Meta
@@ -149,9 +149,7 @@ class Redaction:
         if 'matched_episode_ids' in meta:
             del meta['matched_episode_ids']
 
-        output_path = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-        async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
 
         return meta
 
@@ -28,6 +28,14 @@ config = {
         # Will prevent meta.json file from being deleted before running
         "keep_meta": False,
 
+        # Queue runs only (--queue / site upload queues) in unattended mode.
+        # Set true to gather info (mediainfo, bdinfo, metadata lookups) for the next queue items in the background
+        # while the current item takes screenshots and uploads. Uploads still happen one item at a time.
+        "queue_pipeline": False,
+
+        # How many queue items to prepare ahead when queue_pipeline is enabled
+        "queue_prep_workers": 1,
+
         # IMAGE HOSTING SETTINGS
 
         # Order of image hosts. primary host as first with others as backup
@@ -71,6 +79,11 @@ config = {
         # Set to true to always just use the largest playlist on a blu-ray, without selection prompt.
         "use_largest_playlist": False,
 
+        # Multi-disc blu-rays: how many discs BDInfo may scan at once. Discs on the same device (disk, mount)
+        # are limited to bdinfo_parallel_per_device at a time, so a single disk isn't made to seek between scans.
+        "bdinfo_max_parallel": 4,
+        "bdinfo_parallel_per_device": 1,
+
         # Set False to skip getting images from tracker descriptions
         "keep_images": True,
 
@@ -108,6 +121,43 @@ config = {
         # predb is not consistent, can timeout, but can find some releases not found on SRRDB
         "check_predb": False,
 
+        # Cache TMDB/IMDb/TVDB/TVmaze responses on disk (data/cache) so repeated lookups across runs,
+        # such as every episode of a season in a queue, are served locally until they expire
+        "metadata_cache": True,
+
+        # Maximum size of the metadata cache in MB, least recently used entries are removed first
+        "metadata_cache_size_mb": 256,
+
+        # Days to remember the URLs of uploaded screenshots per image host (in the metadata cache), so the same image
+        # is not uploaded to a host again for another tracker or a re-run. 0 to disable
+        "image_upload_cache_days": 30,
+
+        # Upper bound of concurrent screenshot uploads per image host. The actual number adapts to each host's latency,
+        # rate limiting (429) and server errors, and is remembered between runs
+        "image_upload_max_concurrency": 10,
+
+        # HTTP connections to trackers, image hosts and metadata sites are pooled and kept alive for reuse
+        # Maximum concurrent requests per host
+        "http_max_per_host": 8,
+
+        # Seconds an idle pooled connection is kept open
+        "http_keepalive_expiry": 30,
+
+        # Per-host overrides for the concurrent request limit and request timeout (seconds)
+        # e.g. {"aither.cc": {"limit": 2, "timeout": 60}}
+        "http_host_limits": {},
+
+        # The web UI browse search and Discord search answer from a file name index kept in data/cache
+        # Seconds before the index is refreshed in the background, only directories whose mtime changed are re-read
+        "search_index_refresh_interval": 60,
+
+        # Also refresh the index on filesystem events (requires the optional watchdog package)
+        "search_index_watch": False,
+
+        # Tracker banned group, claim and TRaSH lists are kept in data/cache and refreshed for all trackers at startup
+        # Seconds before a list is asked for again; unchanged lists cost a single conditional request
+        "tracker_lists_refresh_interval": 3600,
+
         # SCREENSHOT HANDLING
 
         # Number of screenshots to capture
@@ -154,6 +204,22 @@ config = {
         # 6 is a good balance between compression and speed
         "ffmpeg_compression": "6",
 
+        # Capture several screenshots of a file with one ffmpeg process, so the file is opened and the
+        # tonemap filters are set up once per batch. Falls back to one process per screenshot on failure
+        "ffmpeg_batch_screens": True,
+
+        # Maximum number of screenshots captured by one batched ffmpeg process
+        "ffmpeg_batch_size": 6,
+
+        # Set true to pick screenshot frames by content instead of evenly spaced times. A few keyframes around
+        # each screenshot position are sampled as small thumbnails and scored for brightness, detail and scene cuts,
+        # which avoids most black/blank frames and the retakes they cause. Installing numpy speeds up the scoring.
+        "frame_selection": False,
+
+        # Losslessly recompress screenshots with oxipng (pip install pyoxipng) while the remaining
+        # screenshots are still being captured. Has no effect when oxipng is not installed
+        "optimize_images": True,
+
         # Tonemap screenshots with the following settings (doesn't apply when using libplacebo)
         # See https://ayosec.github.io/ffmpeg-filters-docs/7.1/Filters/Video/tonemap.html
         "algorithm": "mobius",
@@ -298,7 +364,7 @@ config = {
         # set true to use mkbrr for torrent creation
         "mkbrr": True,
 
-        # Create using a specific number of worker threads for hashing (e.g., 8) with mkbrr
+        # Create using a specific number of worker threads for hashing (e.g., 8) with mkbrr or the built-in hasher
         # Experimenting with different values might yield better performance than the default automatic setting.
         # Conversely, you can set a lower amount such as 1 to protect system resources (default "0" (auto))
         "mkbrr_threads": "0",
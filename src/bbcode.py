@@ -3,8 +3,9 @@ import html
 import os
 import re
 import urllib.parse
-from typing import Any
+from typing import Any, Optional
 
+from src.bbcode_engine import DROP, KEEP, RENAME, UNWRAP, Element, Node, Rule, RuleSet, parse, prune, render, transform
 from src.console import console
 
 # Bold - KEEP
@@ -35,6 +36,126 @@ from src.console import console
 # IMG - REMOVE?
 # INDENT - Probably not an issue, but maybe just remove tags
 
+# Tag conversions as rule sets for BBCODE.apply, which runs any number of them in one pass
+PRE_TO_CODE: RuleSet = {'pre': [Rule(RENAME, 'code')]}
+CODE_TO_PRE: RuleSet = {'code': [Rule(RENAME, 'pre')]}
+HIDE_TO_SPOILER: RuleSet = {'hide': [Rule(RENAME, 'spoiler')]}
+SPOILER_TO_HIDE: RuleSet = {'spoiler': [Rule(RENAME, 'hide')]}
+REMOVE_HIDE: RuleSet = {'hide': [Rule(UNWRAP, when='bare')]}
+NAMED_SPOILER_TO_NAMED_HIDE: RuleSet = {'spoiler': [Rule(RENAME, 'hide', when='option')]}
+REMOVE_SPOILER: RuleSet = {'spoiler': [Rule(UNWRAP)]}
+NAMED_SPOILER_TO_NORMAL_SPOILER: RuleSet = {'spoiler': [Rule(KEEP, option='')]}
+SPOILER_TO_CODE: RuleSet = {'spoiler': [Rule(RENAME, 'code')]}
+CODE_TO_QUOTE: RuleSet = {'code': [Rule(RENAME, 'quote')]}
+REMOVE_IMG_RESIZE: RuleSet = {'img': [Rule(KEEP, option='')]}
+CONVERT_TO_ALIGN: RuleSet = {align: [Rule(RENAME, 'align', option=f'={align}')] for align in ('right', 'center', 'left')}
+REMOVE_SUP: RuleSet = {'sup': [Rule(UNWRAP)]}
+REMOVE_SUB: RuleSet = {'sub': [Rule(UNWRAP)]}
+REMOVE_LIST: RuleSet = {'list': [Rule(UNWRAP)]}
+
+# Tags PTP descriptions lose or change when cleaned
+PTP_TAGS: RuleSet = {
+    'quote': [Rule(RENAME, 'code', option='')],
+    'align': [Rule(UNWRAP)],
+    'size': [Rule(UNWRAP)],
+    'video': [Rule(DROP)],
+    'staff': [Rule(DROP)],
+    'movie': [Rule(UNWRAP)],
+    'artist': [Rule(UNWRAP)],
+    'user': [Rule(UNWRAP)],
+    'indent': [Rule(UNWRAP)],
+    'hr': [Rule(DROP)],
+    'img': [Rule(DROP)],
+}
+
+_EXTRA_LINES_RE = re.compile(r'\n{3,}')
+
+_HDB_URL_RE = re.compile(r"\[url[\=\]]https?:\/\/(?:img\.|t\.)?hdbits\.org[^\]]+\](?:.*?\[\/url\])?", re.IGNORECASE)
+_HDB_STANDALONE_URL_RE = re.compile(r"https?:\/\/(?:img\.|t\.)?hdbits\.org\/[^\s\[\]]+", re.IGNORECASE)
+_LOOSE_IMAGE_RE = re.compile(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", re.IGNORECASE)
+_WEB_URL_RE = re.compile(r"=https?:\/\/", re.IGNORECASE)
+
+# BDInfo report sections in PTP descriptions of discs
+_PTP_BDINFO_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"DISC INFO:[\s\S]*?(\n\n|$)",
+    r"Disc Title:[\s\S]*?(\n\n|$)",
+    r"Disc Size:[\s\S]*?(\n\n|$)",
+    r"Protection:[\s\S]*?(\n\n|$)",
+    r"BD-Java:[\s\S]*?(\n\n|$)",
+    r"BDInfo:[\s\S]*?(\n\n|$)",
+    r"PLAYLIST REPORT:[\s\S]*?(?=\n\n|$)",
+    r"Name:[\s\S]*?(\n\n|$)",
+    r"Length:[\s\S]*?(\n\n|$)",
+    r"Size:[\s\S]*?(\n\n|$)",
+    r"Total Bitrate:[\s\S]*?(\n\n|$)",
+    r"VIDEO:[\s\S]*?(?=\n\n|$)",
+    r"AUDIO:[\s\S]*?(?=\n\n|$)",
+    r"SUBTITLES:[\s\S]*?(?=\n\n|$)",
+    r"Codec\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)",
+    r"Codec\s+Language\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)",
+)]
+
+# Links to PTP and HDB in PTP descriptions, and the url tags around them
+_PTP_URL_TAG_RE = re.compile(r"(?:\[url(?:=|\])[^\]]*https?:\/\/passthepopcorn\.m[^\]]*\]|\bhttps?:\/\/passthepopcorn\.m[^\s]+)", re.IGNORECASE)
+_PTP_HDB_URL_TAG_RE = re.compile(r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+)([^\[]+)(\[\/url\])?", re.IGNORECASE)
+_PTP_URL_OPENER_RE = re.compile(r"(\[url[\=\]]https?:\/\/passthepopcorn\.m[^\]]+])", re.IGNORECASE)
+_PTP_HDB_URL_OPENER_RE = re.compile(r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+])", re.IGNORECASE)
+
+# Source vs encode comparisons in PTP descriptions run to the end of the description
+_PTP_SOURCE_ENCODE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (r"\[comparison=Source, Encode\][\s\S]*", r"Source Vs Encode:[\s\S]*")]
+_PTP_COMPARISON_RE = re.compile(r"\[comparison=[\s\S]*?\[\/comparison\]", re.IGNORECASE)
+_PTP_HIDE_RE = re.compile(r"\[hide[\s\S]*?\[\/hide\]", re.IGNORECASE)
+_PTP_COMPARISON_PLACEHOLDER_RE = re.compile(r"COMPARISON_PLACEHOLDER-(\d+) ")
+_IMG_TAG_RE = re.compile(r"\[\/?img[\s\S]*?\]", re.IGNORECASE)
+_LINK_RE = re.compile(r'https?://\S+')
+_LINK_PLACEHOLDER_RE = re.compile(r'__LINK_PLACEHOLDER_(\d+)__')
+
+# MediaInfo pasted into PTP descriptions, in tags or as plain text up to the next blank line
+_PTP_MEDIAINFO_TAG_RE = re.compile(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]")
+_PTP_MEDIAINFO_TEXT_RE = re.compile(
+    r"^(?:general\nunique|general\ncomplete|Format[\s]{2,}:|(?:video|audio|text)(?: #\d+)?\nid).*?^$",
+    re.MULTILINE | re.IGNORECASE | re.DOTALL,
+)
+_PTP_MEDIAINFO_MENU_RE = re.compile(r"(^(menu)( #\d+)?\n)(.*?)^$", re.MULTILINE | re.IGNORECASE | re.DOTALL)
+_PTP_MEDIAINFO_BOLD_RE = re.compile(
+    r"\[b\](.*?)(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps)\[/b\]",
+    re.IGNORECASE | re.DOTALL,
+)
+_PTP_MEDIAINFO_VALUE_RE = re.compile(
+    r"(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps|[0-9]+\s+channels|[0-9]+\.[0-9]+\s+KHz|[0-9]+ KHz|[0-9]+\s+bits)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PTP_MEDIAINFO_LABEL_RE = re.compile(r"\[u\](Format|Bitrate|Channels|Sampling Rate|Resolution):\[/u\]\s*\d*.*?", re.IGNORECASE)
+_PTP_MEDIAINFO_UNIT_LINE_RE = re.compile(r"^\s*\d+\s*(channels|KHz|bits)\s*$", re.MULTILINE | re.IGNORECASE)
+_BLANK_LINE_RE = re.compile(r"^\s+$", re.MULTILINE)
+
+
+def _linked_image(element: Element) -> Optional[tuple[str, Element]]:
+    """(web url, img element) of ``[url=web][img]...[/img][/url]``, else None."""
+    if element.name != 'url' or not _WEB_URL_RE.match(element.option) or len(element.children) != 1:
+        return None
+    img = element.children[0]
+    if not isinstance(img, Element) or img.name != 'img' or not img.paired:
+        return None
+    return element.option[1:], img
+
+
+def _trim_centers(nodes: list[Node]) -> list[Node]:
+    """``nodes`` with whitespace trimmed inside ``[center]`` tags and empty ones removed."""
+    kept: list[Node] = []
+    for node in nodes:
+        if isinstance(node, Element) and node.paired and node.name == 'center':
+            children = _trim_centers(node.children)
+            if all(isinstance(child, str) and not child.strip() for child in children):
+                continue
+            if isinstance(children[0], str):
+                children[0] = children[0].lstrip()
+            if isinstance(children[-1], str):
+                children[-1] = children[-1].rstrip()
+            node.children = children
+        kept.append(node)
+    return kept
+
 
 class BBCODE:
     def __init__(self) -> None:
@@ -76,20 +197,13 @@ class BBCODE:
         desc = re.sub(r"\[url=https?:\/\/(img\.|t\.)?hdbits\.org[^\]]*\]\[\/url\]", "", desc, flags=re.IGNORECASE)
 
         # Remove URL tags with visible content
-        hdbits_urls = re.findall(r"(\[url[\=\]]https?:\/\/(img\.|t\.)?hdbits\.org[^\]]+\])(.*?)(\[\/url\])?", desc, flags=re.IGNORECASE)
-        for url_parts in hdbits_urls:
-            full_url = ''.join(url_parts)
-            desc = desc.replace(full_url, '')
+        desc = _HDB_URL_RE.sub('', desc)
 
         # Remove HDBits image tags
-        hdbits_imgs = re.findall(r"\[img\][\s\S]*?(img\.|t\.)?hdbits\.org[\s\S]*?\[\/img\]", desc, flags=re.IGNORECASE)
-        for img_tag in hdbits_imgs:
-            desc = desc.replace(img_tag, '')
+        desc = render(prune(parse(desc, ('img',)), lambda element: not element.option and 'hdbits.org' in element.text().lower()))
 
         # Remove any standalone HDBits URLs
-        standalone_urls = re.findall(r"https?:\/\/(img\.|t\.)?hdbits\.org\/[^\s\[\]]+", desc, flags=re.IGNORECASE)
-        for url in standalone_urls:
-            desc = desc.replace(url, '')
+        desc = _HDB_STANDALONE_URL_RE.sub('', desc)
 
         # Catch any remaining URL tags with hdbits.org in them
         desc = re.sub(r"\[url[^\]]*hdbits\.org[^\]]*\](.*?)\[\/url\]", "", desc, flags=re.IGNORECASE)
@@ -108,13 +222,17 @@ class BBCODE:
         desc = re.sub(r"\n{3,}", "\n\n", desc)
 
         # Extract images wrapped in URL tags (e.g., [url=https://imgbox.com/xxx][img]https://thumbs.imgbox.com/xxx[/img][/url])
-        url_img_pattern = r"\[url=(https?:\/\/[^\]]+)\]\[img\](https?:\/\/[^\]]+)\[\/img\]\[\/url\]"
-        url_img_matches: list[tuple[str, str]] = re.findall(url_img_pattern, desc, flags=re.IGNORECASE)
-        for web_url, img_url in url_img_matches:
+        def take_linked_image(element: Element) -> bool:
+            image = _linked_image(element)
+            if image is None:
+                return False
+            web_url, img = image
+            img_url = render(img.children)
+            if img.option or not _WEB_URL_RE.match(f"={img_url}") or '[' in img_url or ']' in img_url:
+                return False
             # Skip HDBits images
             if "hdbits.org" in web_url.lower() or "hdbits.org" in img_url.lower():
-                desc = desc.replace(f"[url={web_url}][img]{img_url}[/img][/url]", '')
-                continue
+                return True
 
             raw_url = img_url
             if "thumbs2.imgbox.com" in img_url:
@@ -127,7 +245,9 @@ class BBCODE:
                 'web_url': web_url
             }
             imagelist.append(image_dict)
-            desc = desc.replace(f"[url={web_url}][img]{img_url}[/img][/url]", '')
+            return True
+
+        desc = render(prune(parse(desc, ('url', 'img')), take_linked_image))
 
         description = desc.strip()
         if self.is_only_bbcode(description):
@@ -165,7 +285,7 @@ class BBCODE:
         desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
 
         # Extract loose images and add to imagelist as dictionaries
-        loose_images = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", desc, flags=re.IGNORECASE)
+        loose_images: list[str] = _LOOSE_IMAGE_RE.findall(desc)
         for img_url in loose_images:
             image_dict = {
                 'img_url': img_url,
@@ -173,13 +293,9 @@ class BBCODE:
                 'web_url': img_url
             }
             imagelist.append(image_dict)
-            desc = desc.replace(img_url, '')
-
-        # Now, remove matching URLs from [URL] tags
-        for img in imagelist:
-            img_url = re.escape(img['img_url'])
-            desc = re.sub(rf"\[URL={img_url}\]\[/URL\]", '', desc, flags=re.IGNORECASE)
-            desc = re.sub(rf"\[URL={img_url}\]\[img[^\]]*\]{img_url}\[/img\]\[/URL\]", '', desc, flags=re.IGNORECASE)
+        # Remove every occurrence of them, which also empties [URL=...][/URL] tags pointing at them
+        if loose_images:
+            desc = re.sub('|'.join(re.escape(img_url) for img_url in sorted(set(loose_images), key=len, reverse=True)), '', desc)
 
         # Remove leftover [img] or [URL] tags in the description
         desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
@@ -221,25 +337,14 @@ class BBCODE:
         desc = desc.replace('\r\n', '\n')
 
         # Remove url tags with PTP/HDB links
-        url_tags: list[str] = re.findall(
-            r"(?:\[url(?:=|\])[^\]]*https?:\/\/passthepopcorn\.m[^\]]*\]|\bhttps?:\/\/passthepopcorn\.m[^\s]+)",
-            desc,
-            flags=re.IGNORECASE,
-        )
-        url_tags += [
-            ''.join(tag)
-            for tag in re.findall(
-                r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+)([^\[]+)(\[\/url\])?",
-                desc,
-                flags=re.IGNORECASE,
-            )
-        ]
-        if url_tags:
-            for url_tag in url_tags:
-                url_tag_removed = re.sub(r"(\[url[\=\]]https?:\/\/passthepopcorn\.m[^\]]+])", "", url_tag, flags=re.IGNORECASE)
-                url_tag_removed = re.sub(r"(\[url[\=\]]https?:\/\/hdbits\.o[^\]]+])", "", url_tag_removed, flags=re.IGNORECASE)
-                url_tag_removed = url_tag_removed.replace("[/url]", "")
-                desc = desc.replace(url_tag, url_tag_removed)
+        url_tags: list[str] = _PTP_URL_TAG_RE.findall(desc)
+        url_tags += [''.join(tag) for tag in _PTP_HDB_URL_TAG_RE.findall(desc)]
+        # Each replace covers every copy of a tag, so repeated tags are handled once
+        for url_tag in dict.fromkeys(url_tags):
+            url_tag_removed = _PTP_URL_OPENER_RE.sub("", url_tag)
+            url_tag_removed = _PTP_HDB_URL_OPENER_RE.sub("", url_tag_removed)
+            url_tag_removed = url_tag_removed.replace("[/url]", "")
+            desc = desc.replace(url_tag, url_tag_removed)
 
         # Remove links to PTP/HDB
         desc = desc.replace('http://passthepopcorn.me', 'PTP').replace('https://passthepopcorn.me', 'PTP')
@@ -249,19 +354,17 @@ class BBCODE:
         imagelist: list[dict[str, Any]] = []
         excluded_urls: set[str] = set()
 
-        source_encode_comps = re.findall(r"\[comparison=Source, Encode\][\s\S]*", desc, flags=re.IGNORECASE)
-        source_vs_encode_sections = re.findall(r"Source Vs Encode:[\s\S]*", desc, flags=re.IGNORECASE)
-        specific_cases = source_encode_comps + source_vs_encode_sections
+        specific_cases = [block for pattern in _PTP_SOURCE_ENCODE_RES for block in pattern.findall(desc)]
 
         # Extract URLs and update excluded_urls
         for block in specific_cases:
-            urls = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", block, flags=re.IGNORECASE)
+            urls = _LOOSE_IMAGE_RE.findall(block)
             excluded_urls.update(urls)
             desc = desc.replace(block, '')
 
         # General [comparison=...] handling
-        comps = re.findall(r"\[comparison=[\s\S]*?\[\/comparison\]", desc, flags=re.IGNORECASE)
-        hides = re.findall(r"\[hide[\s\S]*?\[\/hide\]", desc, flags=re.IGNORECASE)
+        comps = _PTP_COMPARISON_RE.findall(desc)
+        hides = _PTP_HIDE_RE.findall(desc)
         comps.extend(hides)
         nocomp = desc
 
@@ -272,123 +375,60 @@ class BBCODE:
         comp_placeholders: list[str] = []
 
         # Replace comparison/hide tags with placeholder because sometimes uploaders use comp images as loose images
-        for i, comp in enumerate(comps):
+        for comp in dict.fromkeys(comps):
             nocomp = nocomp.replace(comp, '')
-            desc = desc.replace(comp, f"COMPARISON_PLACEHOLDER-{i} ")
+            desc = desc.replace(comp, f"COMPARISON_PLACEHOLDER-{len(comp_placeholders)} ")
             comp_placeholders.append(comp)
 
         # as the name implies, protect image links while doing regex things
         def protect_links(desc: str) -> tuple[str, list[str]]:
-            links: list[str] = re.findall(r'https?://\S+', desc)
-            for i, link in enumerate(links):
-                desc = desc.replace(link, f'__LINK_PLACEHOLDER_{i}__')
-            return desc, links
+            links: list[str] = []
+
+            def protect(match: re.Match[str]) -> str:
+                links.append(match.group(0))
+                return f'__LINK_PLACEHOLDER_{len(links) - 1}__'
+
+            return _LINK_RE.sub(protect, desc), links
 
         def restore_links(desc: str, links: list[str]) -> str:
-            for i, link in enumerate(links):
-                desc = desc.replace(f'__LINK_PLACEHOLDER_{i}__', link)
-            return desc
+            def restore(match: re.Match[str]) -> str:
+                index = int(match.group(1))
+                return links[index] if index < len(links) else match.group(0)
+
+            return _LINK_PLACEHOLDER_RE.sub(restore, desc) if links else desc
 
         links: list[str] = []
 
         if is_disc == "DVD":
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
+            desc = _PTP_MEDIAINFO_TAG_RE.sub("", desc)
 
         elif is_disc == "BDMV":
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
-            desc = re.sub(r"DISC INFO:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Disc Title:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Disc Size:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Protection:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"BD-Java:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"BDInfo:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"PLAYLIST REPORT:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Name:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Length:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Size:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Total Bitrate:[\s\S]*?(\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"VIDEO:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"AUDIO:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"SUBTITLES:[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Codec\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
-            desc = re.sub(r"Codec\s+Language\s+Bitrate\s+Description[\s\S]*?(?=\n\n|$)", "", desc, flags=re.IGNORECASE)
+            desc = _PTP_MEDIAINFO_TAG_RE.sub("", desc)
+            for pattern in _PTP_BDINFO_RES:
+                desc = pattern.sub("", desc)
 
         else:
-            desc = re.sub(r"\[mediainfo\][\s\S]*?\[\/mediainfo\]", "", desc)
-            desc = re.sub(r"(^general\nunique)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^general\ncomplete)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(Format[\s]{2,}:))(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(video|audio|text)( #\d+)?\nid)(.*?)^$", "", desc, flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            desc = re.sub(r"(^(menu)( #\d+)?\n)(.*?)^$", "", f"{desc}\n\n", flags=re.MULTILINE | re.IGNORECASE | re.DOTALL)
+            desc = _PTP_MEDIAINFO_TAG_RE.sub("", desc)
+            desc = _PTP_MEDIAINFO_TEXT_RE.sub("", desc)
+            desc = _PTP_MEDIAINFO_MENU_RE.sub("", f"{desc}\n\n")
 
             desc, links = protect_links(desc)
 
-            desc = re.sub(
-                r"\[b\](.*?)(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps)\[/b\]",
-                "",
-                desc,
-                flags=re.IGNORECASE | re.DOTALL,
-            )
-            desc = re.sub(
-                r"(Matroska|DTS|AVC|x264|Progressive|23\.976 fps|16:9|[0-9]+x[0-9]+|[0-9]+ MiB|[0-9]+ Kbps|[0-9]+ bits|cabac=.*?/ aq=.*?|\d+\.\d+ Mbps|[0-9]+\s+channels|[0-9]+\.[0-9]+\s+KHz|[0-9]+ KHz|[0-9]+\s+bits)",
-                "",
-                desc,
-                flags=re.IGNORECASE | re.DOTALL,
-            )
-            desc = re.sub(
-                r"\[u\](Format|Bitrate|Channels|Sampling Rate|Resolution):\[/u\]\s*\d*.*?",
-                "",
-                desc,
-                flags=re.IGNORECASE,
-            )
-            desc = re.sub(
-                r"^\s*\d+\s*(channels|KHz|bits)\s*$",
-                "",
-                desc,
-                flags=re.MULTILINE | re.IGNORECASE,
-            )
-
-            desc = re.sub(r"^\s+$", "", desc, flags=re.MULTILINE)
+            desc = _PTP_MEDIAINFO_BOLD_RE.sub("", desc)
+            desc = _PTP_MEDIAINFO_VALUE_RE.sub("", desc)
+            desc = _PTP_MEDIAINFO_LABEL_RE.sub("", desc)
+            desc = _PTP_MEDIAINFO_UNIT_LINE_RE.sub("", desc)
+
+            desc = _BLANK_LINE_RE.sub("", desc)
             desc = re.sub(r"\n{2,}", "\n", desc)
 
         desc = restore_links(desc, links)
 
-        # Convert Quote tags:
-        desc = re.sub(r"\[quote.*?\]", "[code]", desc)
-        desc = desc.replace("[/quote]", "[/code]")
-
-        # Remove Alignments:
-        desc = re.sub(r"\[align=.*?\]", "", desc)
-        desc = desc.replace("[/align]", "")
-
-        # Remove size tags
-        desc = re.sub(r"\[size=.*?\]", "", desc)
-        desc = desc.replace("[/size]", "")
-
-        # Remove Videos
-        desc = re.sub(r"\[video\][\s\S]*?\[\/video\]", "", desc)
-
-        # Remove Staff tags
-        desc = re.sub(r"\[staff[\s\S]*?\[\/staff\]", "", desc)
-
-        # Remove Movie/Person/User/hr/Indent
-        remove_list = [
-            '[movie]', '[/movie]',
-            '[artist]', '[/artist]',
-            '[user]', '[/user]',
-            '[indent]', '[/indent]',
-            '[size]', '[/size]',
-            '[hr]'
-        ]
-        for each in remove_list:
-            desc = desc.replace(each, '')
-
-        # Remove Images in IMG tags
-        desc = re.sub(r"\[img\][\s\S]*?\[\/img\]", "", desc, flags=re.IGNORECASE)
-        desc = re.sub(r"\[img=[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
+        # Quotes to code; remove alignments, sizes, videos, staff, movie/person/user/hr/indent tags and images
+        desc = transform(desc, PTP_TAGS)
 
         # Extract loose images and add to imagelist as dictionaries
-        loose_images = re.findall(r"(https?:\/\/[^\s\[\]]+\.(?:png|jpg))", nocomp, flags=re.IGNORECASE)
+        loose_images = _LOOSE_IMAGE_RE.findall(nocomp)
         for img_url in loose_images:
             if img_url not in excluded_urls:  # Only include URLs not part of excluded sections
                 image_dict = {
@@ -397,12 +437,18 @@ class BBCODE:
                     'web_url': img_url
                 }
                 imagelist.append(image_dict)
+        for img_url in dict.fromkeys(loose_images):
+            if img_url not in excluded_urls:
                 desc = desc.replace(img_url, '')
 
         # Re-place comparisons
-        for i, comp in enumerate(comp_placeholders):
-            comp = re.sub(r"\[\/?img[\s\S]*?\]", "", comp, flags=re.IGNORECASE)
-            desc = desc.replace(f"COMPARISON_PLACEHOLDER-{i} ", comp)
+        comp_placeholders = [_IMG_TAG_RE.sub("", comp) for comp in comp_placeholders]
+
+        def restore_comparison(match: re.Match[str]) -> str:
+            index = int(match.group(1))
+            return comp_placeholders[index] if index < len(comp_placeholders) else match.group(0)
+
+        desc = _PTP_COMPARISON_PLACEHOLDER_RE.sub(restore_comparison, desc)
 
         # Convert hides with multiple images to comparison
         desc = self.convert_collapse_to_comparison(desc, "hide", hides)
@@ -442,46 +488,49 @@ class BBCODE:
 
         desc = desc.replace(site_netloc, site_domain)
 
-        # Temporarily hide spoiler tags
-        spoilers = re.findall(r"\[spoiler[\s\S]*?\[\/spoiler\]", desc)
-        nospoil = desc
-        spoiler_placeholders: list[str] = []
-        for i in range(len(spoilers)):
-            nospoil = nospoil.replace(spoilers[i], '')
-            desc = desc.replace(spoilers[i], f"SPOILER_PLACEHOLDER-{i} ")
-            spoiler_placeholders.append(spoilers[i])
-
-        # Get Images from [img] tags, checking if they're wrapped in [url] tags
+        # Get Images from [img] tags outside spoilers, checking if they're wrapped in [url] tags
         imagelist: list[dict[str, Any]] = []
-
-        # First, find images wrapped in URL tags: [url=web_url][img]img_url[/img][/url]
-        url_img_pattern = r"\[url=(https?://[^\]]+)\]\[img[^\]]*\](.*?)\[/img\]\[/url\]"
-        url_img_matches = re.findall(url_img_pattern, desc, flags=re.IGNORECASE)
-        for web_url, img_url in url_img_matches:
+        nodes = parse(desc, ('url', 'img', 'spoiler'))
+
+        # First, take images wrapped in URL tags: [url=web_url][img]img_url[/img][/url]
+        def take_linked_image(element: Element) -> bool:
+            image = _linked_image(element)
+            if image is None:
+                return False
+            web_url, img = image
+            img_url = render(img.children)
+            if '\n' in img_url:
+                return False
             image_dict = {
                 'img_url': img_url.strip(),
                 'raw_url': img_url.strip(),
                 'web_url': web_url.strip(),
             }
             imagelist.append(image_dict)
-            # Remove the entire [url=...][img]...[/img][/url] structure
-            desc = re.sub(rf"\[url={re.escape(web_url)}\]\[img[^\]]*\]{re.escape(img_url)}\[/img\]\[/url\]", '', desc, flags=re.IGNORECASE)
-
-        # Then find standalone [img] tags (not wrapped in URL)
-        img_tags = re.findall(r"\[img[^\]]*\](.*?)\[/img\]", desc, re.IGNORECASE)
-        if img_tags:
-            for img_url in img_tags:
-                img_url = img_url.strip()
-                # Check if this image was already added (wrapped in URL)
-                if not any(img['img_url'] == img_url for img in imagelist):
-                    image_dict = {
-                        'img_url': img_url,
-                        'raw_url': img_url,
-                        'web_url': img_url,
-                    }
-                    imagelist.append(image_dict)
-                # Remove the [img] tag
-                desc = re.sub(rf"\[img[^\]]*\]{re.escape(img_url)}\[/img\]", '', desc, flags=re.IGNORECASE)
+            return True
+
+        # Then take standalone [img] tags (not wrapped in URL)
+        def take_image(element: Element) -> bool:
+            if element.name != 'img':
+                return False
+            img_url = render(element.children)
+            if '\n' in img_url:
+                return False
+            img_url = img_url.strip()
+            # Check if this image was already added (wrapped in URL)
+            if img_url not in seen_urls:
+                seen_urls.add(img_url)
+                image_dict = {
+                    'img_url': img_url,
+                    'raw_url': img_url,
+                    'web_url': img_url,
+                }
+                imagelist.append(image_dict)
+            return True
+
+        nodes = prune(nodes, take_linked_image, skip=('spoiler',))
+        seen_urls = {img['img_url'] for img in imagelist}
+        nodes = prune(nodes, take_image, skip=('spoiler',))
 
         # Filter out bot images from imagelist
         bot_image_urls = [
@@ -496,20 +545,8 @@ class BBCODE:
             if img['img_url'] not in bot_image_urls and not re.search(r'thumbs', img['img_url'], re.IGNORECASE)
         ]
 
-        # Restore spoiler tags
-        if spoiler_placeholders:
-            for i, spoiler in enumerate(spoiler_placeholders):
-                desc = desc.replace(f"SPOILER_PLACEHOLDER-{i} ", spoiler)
-
-        # Check for and clean up empty [center] tags
-        centers = re.findall(r"\[center[\s\S]*?\[\/center\]", desc)
-        if centers:
-            for center in centers:
-                # If [center] contains only whitespace or empty tags, remove the entire tag
-                cleaned_center = re.sub(r'\[center\]\s*\[\/center\]', '', center)
-                cleaned_center = re.sub(r'\[center\]\s+', '[center]', cleaned_center)
-                cleaned_center = re.sub(r'\s*\[\/center\]', '[/center]', cleaned_center)
-                desc = desc.replace(center, '') if cleaned_center == '[center][/center]' else desc.replace(center, cleaned_center.strip())
+        # Clean up whitespace in [center] tags and remove empty ones
+        desc = render(_trim_centers(parse(render(nodes), ('center',))))
 
         # Remove bot signatures
         bot_signature_regex = r"""
@@ -543,6 +580,12 @@ class BBCODE:
             return "", imagelist
         return desc, imagelist
 
+    def apply(self, desc: str, *rule_sets: RuleSet) -> str:
+        '''
+        Applies several tag conversions (PRE_TO_CODE, REMOVE_SUP, ...) in order, in one call
+        '''
+        return transform(desc, *rule_sets)
+
     def is_only_bbcode(self, desc: str) -> bool:
         # Remove all BBCode tags
         text = re.sub(r"\[/?[a-zA-Z0-9]+(?:=[^\]]*)?\]", "", desc)
@@ -552,97 +595,73 @@ class BBCODE:
         return not text
 
     def convert_pre_to_code(self, desc: str) -> str:
-        desc = desc.replace('[pre]', '[code]')
-        desc = desc.replace('[/pre]', '[/code]')
-        return desc
+        return transform(desc, PRE_TO_CODE)
 
     def convert_code_to_pre(self, desc: str) -> str:
-        desc = desc.replace('[code]', '[pre]')
-        desc = desc.replace('[/code]', '[/pre]')
-        return desc
+        return transform(desc, CODE_TO_PRE)
 
     def convert_hide_to_spoiler(self, desc: str) -> str:
-        desc = desc.replace('[hide', '[spoiler')
-        desc = desc.replace('[/hide]', '[/spoiler]')
-        return desc
+        return transform(desc, HIDE_TO_SPOILER)
 
     def convert_spoiler_to_hide(self, desc: str) -> str:
-        desc = desc.replace('[spoiler', '[hide')
-        desc = desc.replace('[/spoiler]', '[/hide]')
-        return desc
+        return transform(desc, SPOILER_TO_HIDE)
 
     def remove_hide(self, desc: str) -> str:
-        desc = desc.replace('[hide]', '').replace('[/hide]', '')
-        return desc
+        return transform(desc, REMOVE_HIDE)
 
     def convert_named_spoiler_to_named_hide(self, desc: str) -> str:
         '''
         Converts [spoiler=Name] to [hide=Name]
         '''
-        desc = re.sub(r"\[spoiler=([^]]+)]", r"[hide=\1]", desc, flags=re.IGNORECASE)
-        desc = desc.replace('[/spoiler]', '[/hide]')
-        return desc
+        return transform(desc, NAMED_SPOILER_TO_NAMED_HIDE)
 
     def remove_spoiler(self, desc: str) -> str:
-        desc = re.sub(r"\[\/?spoiler[\s\S]*?\]", "", desc, flags=re.IGNORECASE)
-        return desc
+        return transform(desc, REMOVE_SPOILER)
 
     def convert_named_spoiler_to_normal_spoiler(self, desc: str) -> str:
-        desc = re.sub(r'(\[spoiler=[^]]+])', '[spoiler]', desc, flags=re.IGNORECASE)
-        return desc
+        return transform(desc, NAMED_SPOILER_TO_NORMAL_SPOILER)
 
     def convert_spoiler_to_code(self, desc: str) -> str:
-        desc = desc.replace('[spoiler', '[code')
-        desc = desc.replace('[/spoiler]', '[/code]')
-        return desc
+        return transform(desc, SPOILER_TO_CODE)
 
     def convert_code_to_quote(self, desc: str) -> str:
-        desc = desc.replace('[code', '[quote')
-        desc = desc.replace('[/code]', '[/quote]')
-        return desc
+        return transform(desc, CODE_TO_QUOTE)
 
     def remove_img_resize(self, desc: str) -> str:
         '''
         Converts [img=number] or any other parameters to just [img]
         '''
-        desc = re.sub(r'\[img(?:[^\]]*)\]', '[img]', desc, flags=re.IGNORECASE)
-        return desc
+        return transform(desc, REMOVE_IMG_RESIZE)
 
     def remove_extra_lines(self, desc: str) -> str:
         '''
         Removes more than 2 consecutive newlines
         '''
-        desc = re.sub(r'\n{3,}', '\n\n', desc)
-        return desc
+        return _EXTRA_LINES_RE.sub('\n\n', desc)
 
     def convert_to_align(self, desc: str) -> str:
         '''
         Converts [right], [left], [center] to [align=right], [align=left], [align=center]
         '''
-        desc = re.sub(r'\[(right|center|left)\]', lambda m: f"[align={m.group(1)}]", desc)
-        desc = re.sub(r'\[/(right|center|left)\]', "[/align]", desc)
-        return desc
+        return transform(desc, CONVERT_TO_ALIGN)
 
     def remove_sup(self, desc: str) -> str:
         '''
         Removes [sup] tags
         '''
-        desc = desc.replace('[sup]', '').replace('[/sup]', '')
-        return desc
+        return transform(desc, REMOVE_SUP)
 
     def remove_sub(self, desc: str) -> str:
         '''
         Removes [sub] tags
         '''
-        desc = desc.replace('[sub]', '').replace('[/sub]', '')
-        return desc
+        return transform(desc, REMOVE_SUB)
 
     def remove_list(self, desc: str) -> str:
         '''
         Removes [list] tags
         '''
-        desc = desc.replace('[list]', '').replace('[/list]', '')
-        return desc
+        return transform(desc, REMOVE_LIST)
 
     def convert_comparison_to_collapse(self, desc: str, max_width: int) -> str:
         comparisons = re.findall(r"\[comparison=[\s\S]*?\[\/comparison\]", desc)
@@ -698,8 +717,8 @@ class BBCODE:
     def convert_collapse_to_comparison(self, desc: str, spoiler_hide: str, collapses: list[str]) -> str:
         # Convert Comparison spoilers to [comparison=]
         if collapses != []:
-            for i in range(len(collapses)):
-                tag = collapses[i]
+            # Each replace covers every copy of a tag, so repeated tags are handled once
+            for tag in dict.fromkeys(collapses):
                 images = re.findall(r"\[img[\s\S]*?\[\/img\]", tag, flags=re.IGNORECASE)
                 if len(images) >= 6:
                     comp_images: list[str] = []
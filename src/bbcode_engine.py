@@ -0,0 +1,411 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Single-pass BBCode transformation.
+
+``parse`` tokenizes a description once into a tree of ``Element`` and text nodes. Tags are
+paired with their closers, and openers that are never closed (``[hr]``, ``[*]``, text such as
+``[Group] Show.mkv``) stay leaves. ``render`` writes the tree back out in one pass while
+applying declarative rule sets. A rule set maps a tag name to ``Rule`` entries that rename
+the tag, change its option, unwrap it (drop the tags, keep the content) or drop it with its
+content. Several rule sets passed together are applied in order to every tag.
+
+Rendering is lossless: tags without a matching rule, and all text, come out byte for byte as
+they went in.
+
+``transform`` is what the trackers run on their own descriptions. Like the string replaces it
+took over from, it only rewrites the lowercase tags those descriptions are written with. It is
+deliberately a hybrid: the tree is only built when a rule drops content, since only pairing
+tells where that content ends. Otherwise tags whose rules don't depend on the tag are
+rewritten by one substitution per tag name, and only tags whose closer depends on its opener
+(``when='bare'`` or ``'option'``) are paired, per tag name. Both ways give the same result;
+they differ in speed only. Short conversion chains are about as fast as the replaces were,
+and slower where closers are now paired that the replaces renamed or dropped blindly.
+"""
+import functools
+import re
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from typing import Callable, NamedTuple, Optional, Union
+
+_NAME = r"[A-Za-z][A-Za-z0-9]*"
+# Tags that never take a closer
+VOID_TAGS = frozenset({'*', 'hr', 'br'})
+
+KEEP = 'keep'
+RENAME = 'rename'
+UNWRAP = 'unwrap'
+DROP = 'drop'
+
+
+class Rule(NamedTuple):
+    """What to do with a tag.
+
+    ``when`` limits the rule to tags with an option (``'option'``), without one (``'bare'``)
+    or applies it to every tag (``'any'``). ``to`` is the new tag name for ``rename``.
+    ``option`` replaces the tag's option (including its ``=``); None keeps it.
+    """
+
+    action: str
+    to: str = ''
+    option: Optional[str] = None
+    when: str = 'any'
+
+
+RuleSet = Mapping[str, Sequence[Rule]]
+
+
+class Element:
+    __slots__ = ('children', 'close_raw', 'name', 'open_raw', 'option')
+
+    def __init__(self, name: str, option: str, open_raw: Optional[str], close_raw: Optional[str]) -> None:
+        self.name = name
+        self.option = option
+        # None for a closer without opener
+        self.open_raw = open_raw
+        # None for an opener that was never closed (a leaf)
+        self.close_raw = close_raw
+        self.children: list[Node] = []
+
+    @property
+    def paired(self) -> bool:
+        return self.open_raw is not None and self.close_raw is not None
+
+    def text(self) -> str:
+        """Concatenated text of the element's content, without tags."""
+        return ''.join(child if isinstance(child, str) else child.text() for child in self.children)
+
+    def __repr__(self) -> str:
+        return f"Element({self.name!r}, {self.option!r}, children={len(self.children)})"
+
+
+Node = Union[str, Element]
+
+
+@functools.lru_cache(maxsize=64)
+def _token_re(names: Optional[frozenset[str]]) -> re.Pattern[str]:
+    # Closers carry no option; openers have an optional "=value" or " key=value" part
+    if names is None:
+        closer, opener = _NAME, rf"{_NAME}|\*"
+    else:
+        alternatives = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+        closer = opener = f"(?:{alternatives})"
+    return re.compile(rf"\[(?:/({closer})|({opener})([=\s][^\]\n]*)?)\]", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _name_res(name: str) -> tuple[re.Pattern[str], re.Pattern[str], re.Pattern[str]]:
+    """Opener, closer and "option holding another tag" patterns of one lowercase tag name.
+
+    They are matched against the lowercased text and start with a literal, which makes them
+    much faster than one case-insensitive pattern that has to try every ``[``.
+    """
+    escaped = re.escape(name)
+    return (
+        re.compile(rf"\[({escaped})([=\s][^\]\n]*)?\]"),
+        re.compile(rf"\[/({escaped})\]"),
+        re.compile(rf"\[{escaped}[=\s][^\]\n]*\["),
+    )
+
+
+Token = tuple[int, int, Optional[str], Optional[str], Optional[str]]
+
+
+def _tokens(text: str, names: Optional[frozenset[str]], lowercase_only: bool = False) -> list[Token]:
+    """(start, end, closer name, opener name, option) of every tag of ``names`` in ``text``."""
+    if names is not None:
+        if lowercase_only:
+            return _scan(text, text, names)
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return _scan(text, lowered, names)
+    return [(*match.span(), *match.groups()) for match in _token_re(names).finditer(text)]
+
+
+def _scan(text: str, lowered: str, names: frozenset[str]) -> list[Token]:
+    found: list[Token] = []
+    for name in names:
+        if f'[{name}' not in lowered and f'[/{name}' not in lowered:
+            continue
+        opener_re, closer_re, _ = _name_res(name)
+        for match in opener_re.finditer(lowered):
+            option_start, option_end = match.span(2)
+            found.append((match.start(), match.end(), None, name, text[option_start:option_end] if option_start >= 0 else None))
+        found.extend((match.start(), match.end(), name, None, None) for match in closer_re.finditer(lowered))
+    found.sort()
+    # A tag can only overlap another one whose option holds it, e.g. [url=a[b]; the left one wins
+    tokens: list[Token] = []
+    end = 0
+    for token in found:
+        if token[0] >= end:
+            tokens.append(token)
+            end = token[1]
+    return tokens
+
+
+def parse(text: str, names: Optional[Collection[str]] = None, lowercase_only: bool = False) -> list[Node]:
+    """Tree of ``text``; ``render(parse(text))`` gives ``text`` back.
+
+    With ``names``, only those tags become elements and all other tags stay text, which keeps
+    the tree small when only a few tags are of interest. ``lowercase_only`` leaves tags of
+    ``names`` written in other cases as text.
+    """
+    root: list[Node] = []
+    children = root
+    # Open elements, and the stack positions of the open elements per tag name
+    stack: list[Element] = []
+    open_by_name: dict[str, list[int]] = {}
+    pos = 0
+    for start, end, closing, name, option in _tokens(text, frozenset(name.lower() for name in names) if names is not None else None, lowercase_only):
+        if start > pos:
+            children.append(text[pos:start])
+        pos = end
+        if closing is not None:
+            name = closing.lower()
+            positions = open_by_name.get(name)
+            if not positions:
+                children.append(Element(name, '', None, text[start:end]))
+                continue
+            _close_above(stack, open_by_name, positions[-1], root)
+            element = stack.pop()
+            positions.pop()
+            element.close_raw = text[start:end]
+            children = stack[-1].children if stack else root
+        else:
+            assert name is not None  # nosec B101 - a token is either a closer or an opener
+            name = name.lower()
+            element = Element(name, option or '', text[start:end], None)
+            children.append(element)
+            if name not in VOID_TAGS:
+                open_by_name.setdefault(name, []).append(len(stack))
+                stack.append(element)
+                children = element.children
+    if pos < len(text):
+        children.append(text[pos:])
+    _close_above(stack, open_by_name, -1, root)
+    return root
+
+
+def _close_above(stack: list[Element], open_by_name: dict[str, list[int]], depth: int, root: list[Node]) -> None:
+    """Turn the open elements above ``depth`` into leaves; they were never closed."""
+    while len(stack) - 1 > depth:
+        element = stack.pop()
+        open_by_name[element.name].pop()
+        # The element is the last child of its parent, so its content follows it there
+        (stack[-1].children if stack else root).extend(element.children)
+        element.children = []
+
+
+def walk(nodes: Iterable[Node]) -> Iterator[Element]:
+    """All elements of ``nodes``, depth first in document order."""
+    stack: list[Iterator[Node]] = [iter(nodes)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Element):
+                yield node
+                if node.children:
+                    stack.append(iter(node.children))
+                    break
+        else:
+            stack.pop()
+
+
+def prune(nodes: Sequence[Node], predicate: Callable[[Element], bool], skip: Collection[str] = ()) -> list[Node]:
+    """``nodes`` without the paired elements for which ``predicate`` is true, content included.
+
+    The content of elements named in ``skip`` is left as it is.
+    """
+    kept: list[Node] = []
+    for node in nodes:
+        if isinstance(node, Element) and node.paired:
+            if predicate(node):
+                continue
+            if node.children and node.name not in skip:
+                node.children = prune(node.children, predicate, skip)
+        kept.append(node)
+    return kept
+
+
+class _Resolution(NamedTuple):
+    action: str
+    name: str
+    option: str
+    changed: bool
+
+
+def _resolve(element: Element, rule_sets: Sequence[RuleSet], closer_only: bool) -> _Resolution:
+    name, option, changed = element.name, element.option, False
+    for rule_set in rule_sets:
+        for rule in rule_set.get(name, ()):
+            if rule.when != 'any' and (closer_only or (rule.when == 'option') != bool(option)):
+                continue
+            if rule.action in (UNWRAP, DROP):
+                return _Resolution(rule.action, name, option, True)
+            if rule.action == RENAME and rule.to:
+                name = rule.to
+            if rule.option is not None:
+                option = rule.option
+            changed = True
+            break
+    return _Resolution(KEEP, name, option, changed)
+
+
+def render(nodes: Sequence[Node], rule_sets: Sequence[RuleSet] = ()) -> str:
+    """Render ``nodes`` with ``rule_sets`` applied to every tag, in order."""
+    out: list[str] = []
+    _render(nodes, tuple(rule_sets), out)
+    return ''.join(out)
+
+
+def _render(nodes: Sequence[Node], rule_sets: tuple[RuleSet, ...], out: list[str]) -> None:
+    append = out.append
+    for node in nodes:
+        if isinstance(node, str):
+            append(node)
+            continue
+        resolution = _resolve(node, rule_sets, node.open_raw is None)
+        action = resolution.action
+        if node.open_raw is None:
+            # Closer without opener: renamed or removed along with its tag name, never dropped
+            if action == UNWRAP:
+                continue
+            append(f"[/{resolution.name}]" if resolution.changed and action == KEEP else node.close_raw or '')
+            continue
+        if action == DROP:
+            continue
+        if action == KEEP:
+            append(f"[{resolution.name}{resolution.option}]" if resolution.changed else node.open_raw)
+        if node.children:
+            _render(node.children, rule_sets, out)
+        if node.close_raw is not None and action == KEEP:
+            append(f"[/{resolution.name}]" if resolution.changed else node.close_raw)
+
+
+Outcome = tuple[str, str, Optional[str]]
+
+
+# Stands in for "some option" when working out what rules do to a tag
+_ANY_OPTION = '=\x00'
+
+
+def _outcomes(rule_sets: Sequence[RuleSet]) -> dict[str, Optional[Outcome]]:
+    """Per tag name (action, new name, new option), or None where that depends on the tag.
+
+    Rules that do the same to a tag with and without an option, and to its closer, need no
+    pairing and can be applied tag by tag. A new option of None keeps the tag's own.
+    """
+    outcomes: dict[str, Optional[Outcome]] = {}
+    for name in {name for rule_set in rule_sets for name in rule_set}:
+        bare = _resolve(Element(name, '', None, None), rule_sets, False)
+        named = _resolve(Element(name, _ANY_OPTION, None, None), rule_sets, False)
+        stray = _resolve(Element(name, '', None, None), rule_sets, True)
+        option = None if named.option == _ANY_OPTION else named.option
+        if DROP in (bare.action, named.action) or not bare.action == named.action == stray.action:
+            outcomes[name] = None
+        elif bare.action == UNWRAP:
+            outcomes[name] = (UNWRAP, name, None)
+        elif bare.name == named.name == stray.name and bare.option == (option or ''):
+            outcomes[name] = (KEEP, bare.name, option)
+        else:
+            outcomes[name] = None
+    return outcomes
+
+
+@functools.lru_cache(maxsize=64)
+def _tag_subs(name: str, outcome: Outcome) -> tuple[tuple[re.Pattern[str], str], ...]:
+    """(pattern, literal replacement) pairs that apply ``outcome`` to every lowercase ``name`` tag.
+
+    Like the string replaces they took over from, they leave other spellings alone. Each pattern
+    starts with the tag as a literal and no replacement holds a group reference, so ``re.sub``
+    finds and rewrites the tags without calling back into Python.
+    """
+    action, new_name, option = outcome
+    escaped = re.escape(name)
+    closer_re = re.compile(rf"\[/{escaped}\]")
+    if action == UNWRAP:
+        return (closer_re, ''), (re.compile(rf"\[{escaped}(?:[=\s][^\]\n]*)?\]"), '')
+    closer = (closer_re, f'[/{new_name}]'.replace('\\', r'\\'))
+    if option is None:
+        # The option stays, only the name changes
+        return closer, (re.compile(rf"\[{escaped}(?=(?:[=\s][^\]\n]*)?\])"), f'[{new_name}'.replace('\\', r'\\'))
+    opener = (re.compile(rf"\[{escaped}(?:[=\s][^\]\n]*)?\]"), f'[{new_name}{option}]'.replace('\\', r'\\'))
+    return (closer, opener) if new_name != name else (opener,)
+
+
+@functools.lru_cache(maxsize=64)
+def _name_re(name: str) -> re.Pattern[str]:
+    """The name of each lowercase ``name`` tag, with the tag's option as group 1.
+
+    The tag itself starts one (``[``) or two (``[/``) characters before the match. Starting with
+    the name as a literal makes this much faster than a pattern that has to try every ``[``.
+    """
+    return re.compile(rf"{re.escape(name)}(?=((?:[=\s][^\]\n]*)?)\])")
+
+
+def _tag_changes(name: str, option: str, rule_sets: tuple[RuleSet, ...], closer_only: bool = False) -> tuple[Optional[str], Optional[str]]:
+    """New opener and closer of a ``name`` tag with ``option``; None where they stay as they are."""
+    resolution = _resolve(Element(name, option, None, None), rule_sets, closer_only)
+    if resolution.action == UNWRAP:
+        return '', ''
+    if not resolution.changed:
+        return None, None
+    return f"[{resolution.name}{resolution.option}]", f"[/{resolution.name}]"
+
+
+def _pair_tags(text: str, name: str, rule_sets: tuple[RuleSet, ...], changes: list[tuple[int, int, str]]) -> None:
+    """Add (start, end, replacement) of the ``name`` tags that change, with each closer following its opener."""
+    by_option: dict[str, tuple[Optional[str], Optional[str]]] = {}
+    stray_closer = _tag_changes(name, '', rule_sets, closer_only=True)[1]
+    # New closers of the open tags, innermost last
+    stack: list[Optional[str]] = []
+    void = name in VOID_TAGS
+    for match in _name_re(name).finditer(text):
+        name_start = match.start()
+        option_start, option_end = match.span(1)
+        if name_start and text[name_start - 1] == '[':
+            option = text[option_start:option_end]
+            if option not in by_option:
+                by_option[option] = _tag_changes(name, option, rule_sets)
+            opener, closer = by_option[option]
+            if not void:
+                stack.append(closer)
+            if opener is not None:
+                changes.append((name_start - 1, option_end + 1, opener))
+        elif option_start == option_end and text[name_start - 2:name_start] == '[/':
+            closer = stack.pop() if stack else stray_closer
+            if closer is not None:
+                changes.append((name_start - 2, option_end + 1, closer))
+
+
+def transform(text: str, *rule_sets: RuleSet) -> str:
+    """Apply ``rule_sets`` to the lowercase tags of ``text``, in order."""
+    if '[' not in text or not rule_sets:
+        return text
+    outcomes = _outcomes(rule_sets)
+    separable = (
+        not any(rule.action == DROP for rule_set in rule_sets for rules in rule_set.values() for rule in rules)
+        # A renamed tag must not be picked up again by another rule
+        and not any(outcome is not None and outcome[1] != name and outcome[1].lower() in outcomes for name, outcome in outcomes.items())
+    )
+    if not separable:
+        return render(parse(text, outcomes, lowercase_only=True), rule_sets)
+    for name, outcome in outcomes.items():
+        if outcome is not None and outcome != (KEEP, name, None):
+            for pattern, replacement in _tag_subs(name, outcome):
+                text = pattern.sub(replacement, text)
+    paired = [name for name, outcome in outcomes.items() if outcome is None]
+    if not paired:
+        return text
+    changes: list[tuple[int, int, str]] = []
+    for name in paired:
+        _pair_tags(text, name, rule_sets, changes)
+    changes.sort()
+    out: list[str] = []
+    pos = 0
+    for start, end, replacement in changes:
+        # A tag inside another one's option, e.g. [spoiler=a[hide], is part of that option
+        if start < pos:
+            continue
+        out.append(text[pos:start])
+        out.append(replacement)
+        pos = end
+    out.append(text[pos:])
+    return ''.join(out)
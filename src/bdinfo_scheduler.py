@@ -0,0 +1,57 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Scheduling of BDInfo scans for multi-disc uploads.
+
+A BDInfo scan reads every stream of a playlist, so it is bound by the device it reads from.
+Discs on different devices (mounts, NAS volumes) are scanned in parallel, up to
+``bdinfo_max_parallel`` at once, while discs on the same device take turns
+(``bdinfo_parallel_per_device``, default 1) so one disk isn't made to seek between streams.
+"""
+import asyncio
+import contextlib
+import os
+from collections.abc import AsyncIterator, Hashable
+from typing import Any, cast
+
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_PER_DEVICE = 1
+
+
+def _positive_int(value: Any, default: int) -> int:
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class BDInfoScheduler:
+    def __init__(self, max_parallel: int = DEFAULT_MAX_PARALLEL, per_device: int = DEFAULT_PER_DEVICE) -> None:
+        self.max_parallel = max(1, max_parallel)
+        self.per_device = max(1, per_device)
+        self._slots = asyncio.Semaphore(self.max_parallel)
+        self._devices: dict[Hashable, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "BDInfoScheduler":
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        return cls(
+            _positive_int(default_cfg.get('bdinfo_max_parallel', DEFAULT_MAX_PARALLEL), DEFAULT_MAX_PARALLEL),
+            _positive_int(default_cfg.get('bdinfo_parallel_per_device', DEFAULT_PER_DEVICE), DEFAULT_PER_DEVICE),
+        )
+
+    @staticmethod
+    def device_of(path: str) -> Hashable:
+        """Device id of the filesystem holding ``path``; the path itself if it can't be stat'ed."""
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            return path
+
+    @contextlib.asynccontextmanager
+    async def slot(self, path: str) -> AsyncIterator[None]:
+        """Hold a scan slot for the disc at ``path``."""
+        device = await asyncio.to_thread(self.device_of, path)
+        device_slots = self._devices.setdefault(device, asyncio.Semaphore(self.per_device))
+        # Device first, so a disc waiting for its device doesn't keep a global slot from another device
+        async with device_slots, self._slots:
+            yield
@@ -1,10 +1,11 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
 import json
 import os
 import random
 import re
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import AsyncIterator, Mapping, MutableMapping, Sequence
 from pathlib import Path
 from typing import Any, Optional, cast
 
@@ -14,12 +15,18 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from rich.console import Console
 
+from src.http_pool import http_pool
+from src.metadata_cache import metadata_cache
+
 console = Console()
 
 Meta = MutableMapping[str, Any]
 Release = MutableMapping[str, Any]
 MovieLink = MutableMapping[str, Any]
 
+# Release pages fetched at the same time when all releases are processed
+MAX_CONCURRENT_RELEASE_FETCHES = 3
+
 
 def _style_contains(style: Optional[str], token: str) -> bool:
     return bool(style and token in style)
@@ -92,7 +99,7 @@ async def search_bluray(meta: Meta) -> Optional[str]:
 
             if meta.get('debug'):
                 console.print(f"[yellow]Sending request to blu-ray.com (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
-            async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
 
                 if response.status_code == 200 and "No index" not in response.text:
@@ -415,7 +422,7 @@ async def get_bluray_releases(meta: Meta) -> list[Release]:
 
             while retry_count <= max_retries:
                 try:  # noqa: PERF203
-                    async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+                    async with httpx.AsyncClient(transport=http_pool.transport(), timeout=15.0, follow_redirects=True) as client:
                         response = await client.get(ajax_url, headers=headers)
 
                         if response.status_code == 200 and "No index" not in response.text:
@@ -780,7 +787,7 @@ async def download_cover_images(meta: Meta) -> bool:
     downloaded_images: dict[str, str] = {}
     console.print("[blue]Downloading cover images...[/blue]")
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+    async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0, follow_redirects=True) as client:
         cover_images = cast(Mapping[str, str], meta.get('cover_images', {}))
         for img_type, url in cover_images.items():
             file_ext = os.path.splitext(url)[1]
@@ -895,17 +902,39 @@ def clean_image_url(url: Optional[str]) -> Optional[str]:
     return url
 
 
-async def fetch_release_details(release: Release, meta: Meta) -> Release:
-    release_url = release['url']
+class _RequestLimiter:
+    """Bounds concurrent blu-ray.com page requests and keeps a randomized gap between their starts."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_RELEASE_FETCHES, min_gap: float = 1.5, max_gap: float = 3.0) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+        self._min_gap = min_gap
+        self._max_gap = max_gap
+
+    @contextlib.asynccontextmanager
+    async def slot(self, meta: Meta) -> AsyncIterator[None]:
+        async with self._semaphore:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                delay = self._next_start - loop.time()
+                if delay > 0:
+                    if meta.get('debug'):
+                        console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
+                    await asyncio.sleep(delay)
+                self._next_start = loop.time() + random.uniform(self._min_gap, self._max_gap)  # nosec B311 - Rate limiting delay, not cryptographic
+            yield
+
+
+async def fetch_release_details(release: Release, meta: Meta, limiter: Optional[_RequestLimiter] = None) -> Release:
     release_id = release.get('release_id', '0000000')
     debug_filename = f"{meta.get('base_dir', '')}/tmp/{meta.get('uuid', '')}/debug_release_{release_id}.html"
     if meta.get('debug'):
-        console.print(f"[yellow]Fetching details for: {release['title']} - {release_url}[/yellow]")
+        console.print(f"[yellow]Fetching details for: {release['title']} - {release['url']}[/yellow]")
 
     response_text: Optional[str] = None
 
     try:
-        import os
         if os.path.exists(debug_filename):
             if meta.get('debug'):
                 console.print(f"[green]Found existing debug file for release ID {release_id}[/green]")
@@ -918,11 +947,32 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
     except Exception as e:
         console.print(f"[yellow]Error reading cached file: {str(e)}[/yellow]")
 
-    # If we're here, we need to make a request
-    delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
-    if meta.get('debug'):
-        console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
-    await asyncio.sleep(delay)
+    async def download() -> Optional[str]:
+        return await download_release_page(release, meta, limiter)
+
+    # Release pages barely change, so they are shared across runs keyed by the blu-ray.com product ID
+    if release.get('release_id'):
+        response_text = cast(Optional[str], await metadata_cache.cached_call('bluray', 'release', str(release['release_id']), download))
+    else:
+        response_text = await download()
+
+    if not response_text:
+        console.print("[red]Failed to retrieve release details after all attempts[/red]")
+        return release
+    else:
+        release = await parse_release_details(response_text, release, meta)
+        return release
+
+
+async def download_release_page(release: Release, meta: Meta, limiter: Optional[_RequestLimiter] = None) -> Optional[str]:
+    release_url = release['url']
+    response_text: Optional[str] = None
+
+    if limiter is None:
+        delay = random.uniform(2, 4)  # nosec B311 - Rate limiting delay, not cryptographic
+        if meta.get('debug'):
+            console.print(f"[dim]Waiting {delay:.2f} seconds before request...[/dim]")
+        await asyncio.sleep(delay)
 
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -945,43 +995,46 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
             if meta.get('debug'):
                 console.print(f"[yellow]Sending request to {release_url} (attempt {retry_count + 1}/{max_retries + 1})...[/yellow]")
 
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+            async with contextlib.AsyncExitStack() as stack:
+                if limiter is not None:
+                    await stack.enter_async_context(limiter.slot(meta))
+                client = await stack.enter_async_context(httpx.AsyncClient(transport=http_pool.transport(), timeout=15.0, follow_redirects=True))
                 response = await client.get(release_url, headers=headers)
 
-                if response.status_code == 200 and "No index" not in response.text:
-                    response_text = response.text
+            if response.status_code == 200 and "No index" not in response.text:
+                response_text = response.text
 
-                    try:
-                        release_id = release.get('release_id', '0000000')
-                        debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
-                        await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
-                        if meta.get('debug'):
-                            console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
-                    except Exception as e:
-                        console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
+                try:
+                    release_id = release.get('release_id', '0000000')
+                    debug_path = Path(str(meta.get('base_dir', ''))) / "tmp" / str(meta.get('uuid', '')) / f"debug_release_{release_id}.html"
+                    await asyncio.to_thread(debug_path.write_text, response_text, encoding="utf-8")
+                    if meta.get('debug'):
+                        console.print(f"[dim]Saved release page to debug_release_{release_id}.html[/dim]")
+                except Exception as e:
+                    console.print(f"[dim]Could not save debug file: {str(e)}[/dim]")
 
-                    break
+                break
 
-                elif "No index" in response.text:
-                    console.print(f"[red]Blocked by blu-ray.com when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < 2:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
+            elif "No index" in response.text:
+                console.print(f"[red]Blocked by blu-ray.com when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
+                if retry_count < 2:
+                    backoff_time *= 2
+                    console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
+                    await asyncio.sleep(backoff_time)
+                    retry_count += 1
                 else:
-                    console.print(f"[red]Failed to get release details, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
-                    if retry_count < max_retries:
-                        backoff_time *= 2
-                        console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
-                        await asyncio.sleep(backoff_time)
-                        retry_count += 1
-                    else:
-                        console.print("[red]Maximum retries reached, giving up on this release[/red]")
-                        break
+                    console.print("[red]Maximum retries reached, giving up on this release[/red]")
+                    break
+            else:
+                console.print(f"[red]Failed to get release details, status code: {response.status_code} (attempt {retry_count + 1}/{max_retries + 1})[/red]")
+                if retry_count < max_retries:
+                    backoff_time *= 2
+                    console.print(f"[yellow]Retrying in {backoff_time:.1f} seconds...[/yellow]")
+                    await asyncio.sleep(backoff_time)
+                    retry_count += 1
+                else:
+                    console.print("[red]Maximum retries reached, giving up on this release[/red]")
+                    break
 
         except httpx.RequestError as e:
             console.print(f"[red]HTTP request error when accessing {release_url} (attempt {retry_count + 1}/{max_retries + 1}): {str(e)}[/red]")
@@ -994,12 +1047,7 @@ async def fetch_release_details(release: Release, meta: Meta) -> Release:
                 console.print("[red]Maximum retries reached, giving up on this release[/red]")
                 break
 
-    if not response_text:
-        console.print("[red]Failed to retrieve release details after all attempts[/red]")
-        return release
-    else:
-        release = await parse_release_details(response_text, release, meta)
-        return release
+    return response_text
 
 
 def extract_section(specs_td: Any, section_title: str) -> Optional[str]:
@@ -1107,11 +1155,15 @@ async def process_all_releases(releases: Sequence[Release], meta: Meta) -> list[
         else:
             console.print(f"[red]BD_SUMMARY file not found: {bd_summary_path}[/red]")
 
-    detailed_releases: list[Release] = []
-    for idx, release in enumerate(releases, 1):
+    # Fetch concurrently (bounded and spaced out by the limiter); scoring below runs on the
+    # results in the original release order, so it does not depend on completion order
+    limiter = _RequestLimiter()
+
+    async def fetch(idx: int, release: Release) -> Release:
         console.print(f"[cyan]Processing release {idx}/{len(releases)}: {release['title']} ({release['country']})")
-        detailed_release = await fetch_release_details(release, meta)
-        detailed_releases.append(detailed_release)
+        return await fetch_release_details(release, meta, limiter)
+
+    detailed_releases: list[Release] = list(await asyncio.gather(*(fetch(idx, release) for idx, release in enumerate(releases, 1))))
 
     if meta.get('debug'):
         console.print()
@@ -8,6 +8,7 @@ from typing_extensions import TypeAlias
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.http_pool import http_pool
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
@@ -37,7 +38,7 @@ class BtnIdManager:
         headers = {"Content-Type": "application/json"}
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                 response = await client.post(post_query_url, headers=headers, json=post_data, timeout=10)
                 response.raise_for_status()
                 try:
@@ -116,7 +117,7 @@ class BtnIdManager:
         headers = {"Content-Type": "application/json"}
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                 response = await client.post(post_query_url, headers=headers, json=post_data, timeout=10)
                 response.raise_for_status()
                 try:
@@ -162,7 +163,7 @@ class BtnIdManager:
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     desc_response = await client.post(post_query_url, headers=headers, json=desc_post_data, timeout=10)
                     desc_response.raise_for_status()
                     desc_data = desc_response.json()
@@ -8,6 +8,7 @@ import re
 import subprocess
 import sys
 import threading
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
@@ -30,6 +31,40 @@ erase_key: Optional[str] = None
 
 
 class CleanupManager:
+    # Queue prep workers running on their own threads (see src/queuepipeline.py)
+    _background_jobs = 0
+    _background_lock = threading.Lock()
+    # Child processes left running by a cleanup that ran while a prep worker was busy
+    _deferred_children: list[psutil.Process] = []
+
+    @contextlib.contextmanager
+    def background_job(self) -> Iterator[None]:
+        """Mark work running outside the main loop whose child processes must survive ``cleanup``."""
+        with self._background_lock:
+            CleanupManager._background_jobs += 1
+        try:
+            yield
+        finally:
+            with self._background_lock:
+                CleanupManager._background_jobs -= 1
+                deferred: list[psutil.Process] = []
+                if not CleanupManager._background_jobs:
+                    deferred, CleanupManager._deferred_children = CleanupManager._deferred_children, []
+            # The processes a skipped cleanup would have killed; anything started since is left alone
+            stray = [child for child in deferred if child.is_running()]
+            if stray:
+                with contextlib.suppress(psutil.Error, PermissionError, OSError):
+                    self._terminate_processes(stray)
+
+    def _defer_child_sweep(self) -> bool:
+        """While a prep worker is busy, remember the current child processes to kill once it is done."""
+        with self._background_lock:
+            if not CleanupManager._background_jobs:
+                return False
+            with contextlib.suppress(psutil.Error, PermissionError, OSError):
+                CleanupManager._deferred_children.extend(psutil.Process().children(recursive=True))
+            return True
+
     async def cleanup(self) -> None:
         """Ensure all running tasks, threads, and subprocesses are properly cleaned up before exiting."""
         # console.print("[yellow]Cleaning up tasks before exiting...[/yellow]")
@@ -146,28 +181,14 @@ class CleanupManager:
             except Exception:
                 # Silently handle Android permission issues
                 pass
+        elif self._defer_child_sweep():
+            # Child processes may belong to a queue prep worker; they are killed once it is done
+            pass
         else:
             # Standard process cleanup for non-Android systems
             try:
                 current_process = psutil.Process()
-                children = current_process.children(recursive=True)
-
-                for child in children:
-                    # console.print(f"[yellow]Terminating process {child.pid}...[/yellow]")
-                    with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, PermissionError):
-                        child.terminate()
-
-                # Wait for a short time for processes to terminate
-                if not IS_MACOS:
-                    try:
-                        _, still_alive = psutil.wait_procs(children, timeout=3)
-                        for child in still_alive:
-                            # console.print(f"[red]Force killing stubborn process: {child.pid}[/red]")
-                            with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, PermissionError):
-                                child.kill()
-                    except (psutil.AccessDenied, PermissionError):
-                        # Handle systems where we can't wait for processes
-                        pass
+                self._terminate_processes(current_process.children(recursive=True))
             except (PermissionError, psutil.AccessDenied, OSError) as e:
                 if not IS_ANDROID:
                     console.print(f"[yellow]Limited process access: {e}[/yellow]")
@@ -201,6 +222,24 @@ class CleanupManager:
 
         # console.print("[green]Thread cleanup completed.[/green]")
 
+    def _terminate_processes(self, children: list[psutil.Process]) -> None:
+        for child in children:
+            # console.print(f"[yellow]Terminating process {child.pid}...[/yellow]")
+            with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, PermissionError):
+                child.terminate()
+
+        # Wait for a short time for processes to terminate
+        if not IS_MACOS:
+            try:
+                _, still_alive = psutil.wait_procs(children, timeout=3)
+                for child in still_alive:
+                    # console.print(f"[red]Force killing stubborn process: {child.pid}[/red]")
+                    with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied, PermissionError):
+                        child.kill()
+            except (psutil.AccessDenied, PermissionError):
+                # Handle systems where we can't wait for processes
+                pass
+
     def reset_terminal(self) -> None:
         """Reset the terminal while allowing the script to continue running (Linux/macOS only)."""
         if os.name != "posix" or IS_ANDROID:
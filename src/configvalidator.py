@@ -42,6 +42,10 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "ffmpeg_is_good": (bool,),
     "ffmpeg_warmup": (bool,),
     "ffmpeg_compression": (str, int),
+    "ffmpeg_batch_screens": (bool,),
+    "ffmpeg_batch_size": (str, int),
+    "frame_selection": (bool,),
+    "optimize_images": (bool,),
     "process_limit": (str, int),
     "threads": (str, int),
     "ffmpeg_limit": (bool,),
@@ -55,6 +59,8 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "sfx_on_prompt": (bool,),
     "tracker_pass_checks": (str, int),
     "use_largest_playlist": (bool,),
+    "bdinfo_max_parallel": (str, int),
+    "bdinfo_parallel_per_device": (str, int),
     "keep_images": (bool,),
     "only_id": (bool,),
     "use_sonarr": (bool,),
@@ -70,6 +76,8 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "bluray_score": (float, int),
     "bluray_single_score": (float, int),
     "keep_meta": (bool,),
+    "queue_pipeline": (bool,),
+    "queue_prep_workers": (str, int),
     "show_upload_duration": (bool,),
     "print_tracker_messages": (bool,),
     "print_tracker_links": (bool,),
@@ -77,6 +85,16 @@ DEFAULT_KEY_TYPES: dict[str, tuple[type, ...]] = {
     "emby_tv_dir": (str, type(None)),
     "search_requests": (bool,),
     "check_predb": (bool,),
+    "metadata_cache": (bool,),
+    "metadata_cache_size_mb": (str, int),
+    "image_upload_cache_days": (str, int),
+    "image_upload_max_concurrency": (str, int),
+    "http_max_per_host": (str, int),
+    "http_keepalive_expiry": (str, int, float),
+    "http_host_limits": (dict,),
+    "search_index_refresh_interval": (str, int, float),
+    "search_index_watch": (bool,),
+    "tracker_lists_refresh_interval": (str, int, float),
     "prefer_max_16_torrent": (bool,),
     "cross_seeding": (bool,),
     "cross_seed_check_everything": (bool,),
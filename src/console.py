@@ -1,5 +1,11 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import contextlib
+import io
+import sys
+import threading
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import IO, Optional
 
 from rich.console import Console
 from rich.text import Text
@@ -52,3 +58,92 @@ def ansi_to_html(ansi_chunk: str, width: int = 120) -> str:
 # Force terminal mode so that when other processes import `src.console.console`
 # they will emit ANSI color codes to stdout even when not attached to a real TTY.
 console = Console(force_terminal=True)
+
+
+class OutputBuffer:
+    """Holds back console output of a task until ``release`` is called."""
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._lock = threading.Lock()
+        self._target: Optional[IO[str]] = None
+        self.released = False
+
+    def write(self, s: str, target: IO[str]) -> int:
+        # Written from a worker thread, released from the main one
+        with self._lock:
+            self._target = target
+            if not self.released:
+                self._chunks.append(s)
+                return len(s)
+        return target.write(s)
+
+    def release(self) -> None:
+        """Print the held back output and pass everything after it straight through."""
+        with self._lock:
+            self.released = True
+            target = self._target or sys.stdout
+            held = ''.join(self._chunks)
+            self._chunks.clear()
+            if held:
+                target.write(held)
+            target.flush()
+
+
+# Console output of the current asyncio task goes here while set (see buffered_output)
+_output_buffer: ContextVar[Optional[OutputBuffer]] = ContextVar('console_output_buffer', default=None)
+
+
+class _TaskRoutedStream(io.TextIOBase):
+    """Stand-in for the console's file that holds back writes from tasks running inside ``buffered_output``."""
+
+    def __init__(self, target: IO[str]) -> None:
+        super().__init__()
+        self._target = target
+
+    def _held(self) -> bool:
+        buffer = _output_buffer.get()
+        return buffer is not None and not buffer.released
+
+    def write(self, s: str) -> int:
+        buffer = _output_buffer.get()
+        if buffer is not None:
+            return buffer.write(s, self._target)
+        return self._target.write(s)
+
+    def flush(self) -> None:
+        if not self._held():
+            self._target.flush()
+
+    def fileno(self) -> int:
+        if self._held():
+            raise io.UnsupportedOperation("held back console output has no file descriptor")
+        return self._target.fileno()
+
+    def isatty(self) -> bool:
+        return self._target.isatty()
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self._target, 'encoding', None) or 'utf-8'
+
+
+@contextlib.contextmanager
+def task_routed_console() -> Iterator[None]:
+    """Route ``console`` output per asyncio task, so ``buffered_output`` can hold it back."""
+    previous = console.file
+    console.file = _TaskRoutedStream(previous)
+    try:
+        yield
+    finally:
+        console.file = previous
+
+
+@contextlib.contextmanager
+def buffered_output(buffer: OutputBuffer) -> Iterator[OutputBuffer]:
+    """Send ``console`` output of the current task (inside ``task_routed_console``) to ``buffer``."""
+    token = _output_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _output_buffer.reset(token)
@@ -1,13 +1,16 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
+import heapq
 import json
 import os
 import platform
 import re
 import shutil
+import time
 import traceback
 from collections import OrderedDict, defaultdict
-from glob import glob
+from glob import escape, glob
 from pathlib import Path
 from typing import Any, Optional, cast
 
@@ -17,12 +20,23 @@ from langcodes import Language
 from pymediainfo import MediaInfo
 
 from bin.get_playlist import MplsParser
+from src.bdinfo_scheduler import BDInfoScheduler
 from src.console import console
 from src.exportmi import setup_mediainfo_library
+from src.metadata_cache import metadata_cache
 
 PlaylistItem = dict[str, Any]
 PlaylistInfo = dict[str, Any]
 
+# Playlists offered for selection (and kept with their items) per disc
+TOP_PLAYLISTS = 5
+
+
+def _mediainfo_text(file_path: str) -> str:
+    """MediaInfo text report of ``file_path`` that names the file without its directory."""
+    output = cast(str, MediaInfo.parse(file_path, output='STRING', full=False)).replace('\r\n', '\n')
+    return output.replace(file_path, os.path.basename(file_path)).replace(os.path.normpath(file_path), os.path.basename(file_path))
+
 
 class DiscParse:
     def __init__(self, config: dict[str, Any]) -> None:
@@ -72,6 +86,129 @@ class DiscParse:
 
         return score
 
+    @staticmethod
+    def _read_play_items(mpls_path: str) -> list[list[Any]]:
+        """``[clip name, intime, outtime]`` of each play item with in/out times in a .mpls."""
+        with open(mpls_path, "rb") as mpls_file:
+            parser = MplsParser(mpls_file)
+            header = parser.load_movie_playlist()
+            mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
+            playlist_data = parser.load_playlist()
+        play_items: list[list[Any]] = []
+        for item in getattr(playlist_data, "play_items", None) or []:
+            intime = getattr(item, "intime", None)
+            outtime = getattr(item, "outtime", None)
+            if intime is None or outtime is None:
+                continue
+            clip_name = getattr(item, "clip_information_filename", None)
+            play_items.append([clip_name.strip() if isinstance(clip_name, str) else None, intime, outtime])
+        return play_items
+
+    def _scan_disc_playlists(
+        self, path: str, cached: dict[str, Any], debug: bool = False
+    ) -> tuple[list[PlaylistInfo], list[tuple[PlaylistInfo, float]], dict[str, Any]]:
+        """Parse and score the playlists of one disc. Blocking.
+
+        Returns every valid playlist (file and duration only), the top scoring playlists with
+        their items and scores, best first, and the parsed play items for the cache.
+        Playlists are scored as they are parsed and only the best ``TOP_PLAYLISTS`` keep
+        their item lists. A .mpls whose size and mtime match its ``cached`` entry is not read again.
+        """
+        playlists_path = os.path.join(path, "PLAYLIST")
+        stream_directory = os.path.join(path, "STREAM")
+        if not os.path.isdir(playlists_path):
+            return [], [], {}
+        if debug:
+            console.print(f"[cyan]Parsing playlists from: {playlists_path}")
+
+        # One directory listing for the clip sizes instead of two stats per play item
+        clip_sizes: dict[str, int] = {}
+        with contextlib.suppress(OSError), os.scandir(stream_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".m2ts"):
+                    with contextlib.suppress(OSError):
+                        clip_sizes[entry.name] = entry.stat().st_size
+
+        valid_playlists: list[PlaylistInfo] = []
+        top: list[tuple[float, int, PlaylistInfo]] = []
+        parsed: dict[str, Any] = {}
+        for seq, file_name in enumerate(sorted(os.listdir(playlists_path))):
+            if not file_name.endswith(".mpls"):
+                continue
+
+            mpls_path = os.path.join(playlists_path, file_name)
+            if debug:
+                console.print(f"[cyan]Processing playlist: {file_name}")
+
+            try:
+                stat = os.stat(mpls_path)
+                cached_entry = cached.get(file_name)
+                if isinstance(cached_entry, list) and cached_entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+                    play_items = cast(list[list[Any]], cast(list[Any], cached_entry)[2])
+                else:
+                    play_items = self._read_play_items(mpls_path)
+                parsed[file_name] = [stat.st_size, stat.st_mtime_ns, play_items]
+
+                if not play_items:
+                    if debug:
+                        console.print(f"[yellow]  No play_items found in {file_name}")
+                    continue
+                if debug:
+                    console.print(f"[cyan]  Found {len(play_items)} play items in {file_name}")
+
+                duration: float = 0.0
+                file_counts: defaultdict[str, int] = defaultdict(int)
+                file_sizes: dict[str, int] = {}
+                for clip_name, intime, outtime in play_items:
+                    duration += (outtime - intime) / 45000.0
+                    if not clip_name:
+                        continue
+                    size = clip_sizes.get(clip_name + ".m2ts")
+                    if size is not None:
+                        m2ts_file = os.path.join(stream_directory, clip_name + ".m2ts")
+                        file_counts[m2ts_file] += 1
+                        file_sizes[m2ts_file] = size
+                    elif debug:
+                        console.print(f"[yellow]    Missing m2ts file: {clip_name}.m2ts")
+
+                if not file_sizes:
+                    if debug:
+                        console.print(f"[yellow]  No m2ts files found for {file_name}")
+                    continue
+
+                items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
+                playlist: PlaylistInfo = {"file": file_name, "duration": duration, "path": mpls_path, "items": items}
+                score = self._calculate_playlist_score(playlist)
+                valid_playlists.append({"file": file_name, "duration": duration})
+                # Min-heap of the best playlists so far; on equal scores the earlier playlist wins
+                candidate = (score, -seq, playlist)
+                if len(top) < TOP_PLAYLISTS:
+                    heapq.heappush(top, candidate)
+                elif candidate[:2] > top[0][:2]:
+                    heapq.heapreplace(top, candidate)
+
+                if debug:
+                    total_size = sum(file_sizes.values())
+                    duplicates = [f for f, c in file_counts.items() if c > 1]
+                    if duplicates:
+                        console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(file_sizes)} unique files ({len(duplicates)} files repeated), {total_size // (1024 * 1024)} MB total")
+                    else:
+                        console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(items)} unique files, {total_size // (1024 * 1024)} MB total")
+            except Exception as e:
+                console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
+
+        scored_playlists = [(playlist, score) for score, _seq, playlist in sorted(top, key=lambda entry: entry[:2], reverse=True)]
+        return valid_playlists, scored_playlists, parsed
+
+    async def _load_disc_playlists(self, path: str, debug: bool = False) -> tuple[list[PlaylistInfo], list[tuple[PlaylistInfo, float]]]:
+        """``_scan_disc_playlists`` in a worker thread, with the parsed .mpls files cached across runs."""
+        cached = await metadata_cache.get_json('mpls', 'playlists', path)
+        cached_entries = cast(dict[str, Any], cached) if isinstance(cached, dict) else {}
+        valid_playlists, scored_playlists, parsed = await asyncio.to_thread(self._scan_disc_playlists, path, cached_entries, debug)
+        if parsed and parsed != cached_entries:
+            await metadata_cache.put_json('mpls', 'playlists', path, parsed)
+        return valid_playlists, scored_playlists
+
     def setup_mediainfo_for_dvd(self, base_dir: Optional[str], debug: bool = False) -> Optional[str]:
         """Setup MediaInfo binary for DVD processing using the complete setup from exportmi"""
         if self.mediainfo_config is None:
@@ -103,6 +240,17 @@ class DiscParse:
         if meta.get('emby', False):
             return discs, meta_discs
 
+        # Parse the playlists of every disc that needs a scan up front, all discs at once
+        scan_indexes = [
+            i for i in range(len(discs))
+            if meta_discs == [] or not os.path.exists(os.path.join(save_dir, f"BD_SUMMARY_{str(i).zfill(2)}.txt"))
+        ]
+        scans = await asyncio.gather(*[
+            self._load_disc_playlists(os.path.abspath(discs[i]['path']), bool(meta.get('debug'))) for i in scan_indexes
+        ])
+        playlist_scans = dict(zip(scan_indexes, scans))
+
+        pending_scans: list[tuple[int, str, list[PlaylistInfo], list[PlaylistInfo]]] = []
         for i in range(len(discs)):
             bdinfo_text = None
             path = os.path.abspath(discs[i]['path'])
@@ -114,103 +262,17 @@ class DiscParse:
                 if file == f"BD_SUMMARY_{str(i).zfill(2)}.txt":
                     bdinfo_text = save_dir + "/" + file
             if bdinfo_text is None or meta_discs == []:
-                bdinfo_text = ""
                 playlists_path = os.path.join(path, "PLAYLIST")
 
                 if not os.path.exists(playlists_path):
                     console.print(f"[bold red]PLAYLIST directory not found for disc {path}")
                     continue
 
-                if meta.get('debug'):
-                    console.print(f"[cyan]Parsing playlists from: {playlists_path}")
-
-                def _load_mpls(mpls_path: str) -> tuple[Any, Any]:
-                    with open(mpls_path, "rb") as mpls_file:
-                        parser = MplsParser(mpls_file)
-                        header = parser.load_movie_playlist()
-                        mpls_file.seek(header.playlist_start_address, os.SEEK_SET)
-                        playlist_data = parser.load_playlist()
-                    return header, playlist_data
-
-                # Parse playlists
-                valid_playlists: list[PlaylistInfo] = []
-                for file_name in os.listdir(playlists_path):
-                    if not file_name.endswith(".mpls"):
-                        continue
-
-                    mpls_path = os.path.join(playlists_path, file_name)
-                    if meta.get('debug'):
-                        console.print(f"[cyan]Processing playlist: {file_name}")
-
-                    try:
-                        _, playlist_data = await asyncio.to_thread(_load_mpls, mpls_path)
-                        duration: float = 0.0
-                        stream_directory = os.path.join(path, "STREAM")
-                        file_counts: defaultdict[str, int] = defaultdict(int)
-                        file_sizes: dict[str, int] = {}
-
-                        play_items = getattr(playlist_data, "play_items", None)
-                        if not play_items:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]  No play_items found in {file_name}")
-                            continue
-
-                        if meta.get('debug'):
-                            console.print(f"[cyan]  Found {len(play_items)} play items in {file_name}")
-
-                        for item in play_items:
-                            intime = getattr(item, "intime", None)
-                            outtime = getattr(item, "outtime", None)
-                            if intime is None or outtime is None:
-                                continue
-                            duration += (outtime - intime) / 45000.0
-                            try:
-                                clip_name = getattr(item, "clip_information_filename", None)
-                                if not isinstance(clip_name, str):
-                                    continue
-                                clip_name = clip_name.strip()
-                                if not clip_name:
-                                    continue
-                                m2ts_file = os.path.join(stream_directory, clip_name + ".m2ts")
-                                if os.path.exists(m2ts_file):
-                                    size = os.path.getsize(m2ts_file)
-                                    file_counts[m2ts_file] += 1
-                                    file_sizes[m2ts_file] = size
-                                elif meta.get('debug'):
-                                    console.print(f"[yellow]    Missing m2ts file: {clip_name}.m2ts")
-                            except AttributeError as e:
-                                console.print(f"[bold red]Error accessing clip information for item in {file_name}: {e}")
-
-                        if not file_sizes:
-                            if meta.get('debug'):
-                                console.print(f"[yellow]  No m2ts files found for {file_name}")
-                            continue
-
-                        items = [{"file": file, "size": file_sizes[file]} for file in file_counts]
-                        total_size = sum(file_sizes.values())
-                        valid_playlists.append({
-                            "file": file_name,
-                            "duration": duration,
-                            "path": mpls_path,
-                            "items": items
-                        })
-
-                        if meta.get('debug'):
-                            duplicates = [f for f, c in file_counts.items() if c > 1]
-                            if duplicates:
-                                console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(file_sizes)} unique files ({len(duplicates)} files repeated), {total_size // (1024 * 1024)} MB total")
-                            else:
-                                console.print(f"[green]  ✓ Added {file_name}: {duration:.1f}s, {len(items)} unique files, {total_size // (1024 * 1024)} MB total")
-                    except Exception as e:
-                        console.print(f"[bold red]Error parsing playlist {mpls_path}: {e}")
-
+                valid_playlists, scored_playlists = playlist_scans.get(i, ([], []))
                 if not valid_playlists:
                     console.print(f"[bold red]No playlists found for disc {path}")
                     continue
-
-                scored_playlists = [(p, self._calculate_playlist_score(p)) for p in valid_playlists]
-                scored_playlists.sort(key=lambda x: x[1], reverse=True)
-                top_playlists = [p for p, _score in scored_playlists[:5]]
+                top_playlists = [p for p, _score in scored_playlists]
 
                 if use_largest or (meta['unattended'] and not meta.get('unattended_confirm', False)):
                     best_playlist, best_score = scored_playlists[0]
@@ -249,163 +311,228 @@ class DiscParse:
                                 except ValueError:
                                     console.print("[bold red]Invalid input. Please try again.")
 
-                for idx, playlist in enumerate(selected_playlists):
-                    console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
-                    playlist_number = playlist['file'].replace(".mpls", "")
-                    playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+                pending_scans.append((i, path, selected_playlists, valid_playlists))
 
-                    if os.path.exists(playlist_report_path):
-                        bdinfo_text = playlist_report_path
-                    else:
-                        try:
-                            bdinfo_executable = None
-                            # Prefer the bundled bdinfo binary for the detected OS/arch
-                            system = platform.system().lower()
-                            machine = platform.machine().lower()
-                            if system == "linux":
-                                if machine in ("x86_64", "amd64"):
-                                    folder = "linux/amd64"
-                                elif machine in ("arm64", "aarch64"):
-                                    folder = "linux/arm64"
-                                else:
-                                    folder = "linux/arm"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "darwin":
-                                folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, path, '-m', playlist['file'], save_dir]
-                            elif system == "windows":
-                                # Windows builds are provided as x64
-                                bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
-                                if os.path.exists(bdinfo_path):
-                                    bdinfo_executable = [bdinfo_path, '-m', playlist['file'], path, save_dir]
-
-                            # Fallback to system-installed commands if bundled binary not present
-                            if bdinfo_executable is None:
-                                if shutil.which("bdinfo"):
-                                    bdinfo_executable = ["bdinfo", path, '-m', playlist['file'], save_dir]
-                                elif shutil.which("BDInfo"):
-                                    bdinfo_executable = ["BDInfo", path, '-m', playlist['file'], save_dir]
-                                else:
-                                    console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
-                                    continue
+            else:
+                discs = meta_discs
 
-                            if bdinfo_executable:
-                                proc = await asyncio.create_subprocess_exec(
-                                    *bdinfo_executable
-                                )
-                                await proc.wait()
+        if pending_scans:
+            # Selection is done for every disc; scan them in parallel across devices and write
+            # each disc's summaries as soon as its scans are done
+            scheduler = BDInfoScheduler.from_config(self.config)
+            quiet = len(pending_scans) > 1 and scheduler.max_parallel > 1
 
-                                if proc.returncode != 0:
-                                    console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
-                                    continue
+            async def scan_and_read(i: int, path: str, selected_playlists: list[PlaylistInfo], valid_playlists: list[PlaylistInfo]) -> None:
+                await self._scan_disc(scheduler, base_dir, save_dir, i, len(discs), path, selected_playlists, quiet)
+                await self._read_bdinfo_reports(meta, discs, i, path, save_dir, selected_playlists, valid_playlists)
 
-                                # Rename the output to playlist_report_path
-                                for file in os.listdir(save_dir):
-                                    if file.startswith("BDINFO") and file.endswith(".txt"):
-                                        bdinfo_text = os.path.join(save_dir, file)
-                                        shutil.move(bdinfo_text, playlist_report_path)
-                                        bdinfo_text = playlist_report_path  # Update bdinfo_text to the renamed file
-                                        break
-                        except Exception as e:
-                            console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
-                            continue
+            await asyncio.gather(*[scan_and_read(*pending) for pending in pending_scans])
 
-                    # Process the BDInfo report in the while True loop
-                    while True:
-                        try:
-                            if not os.path.exists(bdinfo_text):
-                                console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
-                                break
+            # Prompts wait for every scan, so they aren't interleaved with the progress of other discs
+            for i, _path, selected_playlists, _valid_playlists in pending_scans:
+                self._ask_playlist_editions(meta, discs, i, selected_playlists)
 
-                            text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
-                            result = text.split("QUICK SUMMARY:", 2)
-                            files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
-                            result2 = result[1].rstrip(" \n")
-                            result = result2.split("********************", 1)
-                            bd_summary = result[0].rstrip(" \n")
-
-                            result = text.split("[code]", 3)
-                            result2 = result[2].rstrip(" \n")
-                            result = result2.split("FILES:", 1)
-                            ext_bd_summary = result[0].rstrip(" \n")
-
-                            # Save summaries and bdinfo for each playlist
-                            if idx == 0:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
-                            else:
-                                summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
-                                extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
-
-                            # Strip multiple spaces to single spaces before saving
-                            bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
-                            ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
-
-                            await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
-                            await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
-
-                            bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
-
-                            # Prompt user for custom edition if conditions are met
-                            if len(selected_playlists) > 1:
-                                current_label = bdinfo.get('label', f"Playlist {idx}")
-                                console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
-
-                                if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
-                                    console.print("[bold green]You can create a custom Edition for this playlist.")
-                                    user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
-                                    user_input = (user_input_raw or "").strip()
-                                    if user_input:
-                                        bdinfo['edition'] = user_input
-                                        selected_playlists[idx]['edition'] = user_input
-                                        console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
-                                else:
-                                    console.print("[bold yellow]Unattended mode: Custom edition not added.")
-
-                            # Save to discs array
-                            if idx == 0:
-                                discs[i]['summary'] = bd_summary_cleaned
-                                discs[i]['bdinfo'] = bdinfo
-                                discs[i]['playlists'] = selected_playlists
-                                if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
-                                    simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
-                                    duration_map: dict[int, dict[str, Any]] = {}
-
-                                    # Store simplified version with only file and duration, keeping only one per unique duration
-                                    for playlist in valid_playlists:
-                                        rounded_duration = round(float(playlist["duration"]))
-                                        if rounded_duration in duration_map:
-                                            continue
-
-                                        duration_map[rounded_duration] = {
-                                            "file": playlist["file"],
-                                            "duration": playlist["duration"]
-                                        }
-
-                                    simplified_playlists = list(duration_map.values())
-                                    simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
-                                    discs[i]['all_valid_playlists'] = simplified_playlists
-
-                                    if meta['debug']:
-                                        console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
-                            else:
-                                discs[i][f'summary_{idx}'] = bd_summary_cleaned
-                                discs[i][f'bdinfo_{idx}'] = bdinfo
+        return discs, discs[0]['bdinfo']
+
+    def _bdinfo_command(self, base_dir: str, path: str, playlist_file: str, out_dir: str) -> Optional[list[str]]:
+        """BDInfo command line for one playlist, preferring the bundled binary for the detected OS/arch."""
+        system = platform.system().lower()
+        machine = platform.machine().lower()
+        if system == "linux":
+            if machine in ("x86_64", "amd64"):
+                folder = "linux/amd64"
+            elif machine in ("arm64", "aarch64"):
+                folder = "linux/arm64"
+            else:
+                folder = "linux/arm"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, out_dir]
+        elif system == "darwin":
+            folder = "macos/arm64" if machine in ("arm64",) else "macos/x86_64"
+            bdinfo_path = f"{base_dir}/bin/bdinfo/{folder}/bdinfo"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, path, '-m', playlist_file, out_dir]
+        elif system == "windows":
+            # Windows builds are provided as x64
+            bdinfo_path = f"{base_dir}/bin/bdinfo/windows/x86_64/bdinfo.exe"
+            if os.path.exists(bdinfo_path):
+                return [bdinfo_path, '-m', playlist_file, path, out_dir]
+
+        # Fallback to system-installed commands if bundled binary not present
+        if shutil.which("bdinfo"):
+            return ["bdinfo", path, '-m', playlist_file, out_dir]
+        if shutil.which("BDInfo"):
+            return ["BDInfo", path, '-m', playlist_file, out_dir]
+        return None
+
+    async def _scan_disc(
+        self,
+        scheduler: BDInfoScheduler,
+        base_dir: str,
+        save_dir: str,
+        i: int,
+        disc_count: int,
+        path: str,
+        selected_playlists: list[PlaylistInfo],
+        quiet: bool = False,
+    ) -> None:
+        """Run BDInfo on the selected playlists of disc ``i``, leaving ``Disc<n>_<playlist>_FULL.txt`` in save_dir.
+
+        ``quiet`` hides BDInfo's own output (several discs at once) and prints per-disc progress instead.
+        """
+        label = f"Disc {i + 1}/{disc_count}"
+        if quiet:
+            console.print(f"[cyan]{label}: waiting for a BDInfo slot ({os.path.basename(os.path.dirname(path)) or path})")
+        async with scheduler.slot(path):
+            started = time.monotonic()
+            for done, playlist in enumerate(selected_playlists):
+                if quiet:
+                    console.print(f"[cyan]{label}: scanning playlist {done + 1}/{len(selected_playlists)}")
+                console.print(f"[bold green]Scanning playlist {playlist['file']} with duration {int(playlist['duration'] // 3600)} hours {int((playlist['duration'] % 3600) // 60)} minutes {int(playlist['duration'] % 60)} seconds")
+                playlist_number = playlist['file'].replace(".mpls", "")
+                playlist_report_path = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+                if os.path.exists(playlist_report_path):
+                    continue
+
+                # Own output dir per scan, so parallel scans can't pick up each other's report
+                out_dir = os.path.join(save_dir, f"bdinfo_{str(i).zfill(2)}_{playlist_number}")
+                try:
+                    bdinfo_executable = self._bdinfo_command(base_dir, path, playlist['file'], out_dir)
+                    if bdinfo_executable is None:
+                        console.print(f"[bold red]BDInfo not found. Please download bdinfo and place it under {base_dir}/bin/bdinfo/ or install a system bdinfo/BDInfo binary[/bold red]")
+                        return
+                    os.makedirs(out_dir, exist_ok=True)
+                    proc = await asyncio.create_subprocess_exec(
+                        *bdinfo_executable,
+                        stdout=asyncio.subprocess.DEVNULL if quiet else None
+                    )
+                    await proc.wait()
+
+                    if proc.returncode != 0:
+                        console.print(f"[bold red]BDInfo failed with return code {proc.returncode}[/bold red]")
+                        continue
 
-                        except Exception:
-                            console.print(traceback.format_exc())
-                            await asyncio.sleep(5)
-                            continue
+                    # Rename the output to playlist_report_path
+                    for file in os.listdir(out_dir):
+                        if file.startswith("BDINFO") and file.endswith(".txt"):
+                            shutil.move(os.path.join(out_dir, file), playlist_report_path)
+                            break
+                except Exception as e:
+                    console.print(f"[bold red]Error scanning playlist {playlist['file']}: {e}")
+                finally:
+                    shutil.rmtree(out_dir, ignore_errors=True)
+            if quiet:
+                console.print(f"[green]{label}: BDInfo done in {time.monotonic() - started:.0f}s")
+
+    async def _read_bdinfo_reports(
+        self,
+        meta: dict[str, Any],
+        discs: list[dict[str, Any]],
+        i: int,
+        path: str,
+        save_dir: str,
+        selected_playlists: list[PlaylistInfo],
+        valid_playlists: list[PlaylistInfo],
+    ) -> None:
+        """Write the BD_SUMMARY files of disc ``i`` and store its parsed BDInfo in ``discs[i]``."""
+        for idx, playlist in enumerate(selected_playlists):
+            playlist_number = playlist['file'].replace(".mpls", "")
+            bdinfo_text = os.path.join(save_dir, f"Disc{i + 1}_{playlist_number}_FULL.txt")
+
+            # Process the BDInfo report in the while True loop
+            while True:
+                try:
+                    if not os.path.exists(bdinfo_text):
+                        console.print(f"[bold red]No valid BDInfo file found for playlist {playlist_number}.")
                         break
 
-            else:
-                discs = meta_discs
+                    text = await asyncio.to_thread(Path(bdinfo_text).read_text, encoding="utf-8", errors="replace")
+                    result = text.split("QUICK SUMMARY:", 2)
+                    files = result[0].split("FILES:", 2)[1].split("CHAPTERS:", 2)[0].split("-------------")
+                    result2 = result[1].rstrip(" \n")
+                    result = result2.split("********************", 1)
+                    bd_summary = result[0].rstrip(" \n")
+
+                    result = text.split("[code]", 3)
+                    result2 = result[2].rstrip(" \n")
+                    result = result2.split("FILES:", 1)
+                    ext_bd_summary = result[0].rstrip(" \n")
+
+                    # Save summaries and bdinfo for each playlist
+                    if idx == 0:
+                        summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}.txt"
+                        extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}.txt"
+                    else:
+                        summary_file = f"{save_dir}/BD_SUMMARY_{str(i).zfill(2)}_{idx}.txt"
+                        extended_summary_file = f"{save_dir}/BD_SUMMARY_EXT_{str(i).zfill(2)}_{idx}.txt"
+
+                    # Strip multiple spaces to single spaces before saving
+                    bd_summary_cleaned = re.sub(r' +', ' ', bd_summary.strip())
+                    ext_bd_summary_cleaned = re.sub(r' +', ' ', ext_bd_summary.strip())
+
+                    await asyncio.to_thread(Path(summary_file).write_text, bd_summary_cleaned, encoding="utf-8", errors="replace")
+                    await asyncio.to_thread(Path(extended_summary_file).write_text, ext_bd_summary_cleaned, encoding="utf-8", errors="replace")
+
+                    bdinfo = self.parse_bdinfo(bd_summary_cleaned, files[1], path)
+
+                    # Save to discs array
+                    if idx == 0:
+                        discs[i]['summary'] = bd_summary_cleaned
+                        discs[i]['bdinfo'] = bdinfo
+                        discs[i]['playlists'] = selected_playlists
+                        if valid_playlists and meta['unattended'] and not meta.get('unattended_confirm', False):
+                            simplified_playlists: list[dict[str, Any]] = [{"file": p["file"], "duration": p["duration"]} for p in valid_playlists]
+                            duration_map: dict[int, dict[str, Any]] = {}
+
+                            # Store simplified version with only file and duration, keeping only one per unique duration
+                            for playlist in valid_playlists:
+                                rounded_duration = round(float(playlist["duration"]))
+                                if rounded_duration in duration_map:
+                                    continue
 
-        return discs, discs[0]['bdinfo']
+                                duration_map[rounded_duration] = {
+                                    "file": playlist["file"],
+                                    "duration": playlist["duration"]
+                                }
+
+                            simplified_playlists = list(duration_map.values())
+                            simplified_playlists.sort(key=lambda x: float(x["duration"]), reverse=True)
+                            discs[i]['all_valid_playlists'] = simplified_playlists
+
+                            if meta['debug']:
+                                console.print(f"[cyan]Stored {len(simplified_playlists)} unique playlists by duration (from {len(valid_playlists)} total)")
+                    else:
+                        discs[i][f'summary_{idx}'] = bd_summary_cleaned
+                        discs[i][f'bdinfo_{idx}'] = bdinfo
+
+                except Exception:
+                    console.print(traceback.format_exc())
+                    await asyncio.sleep(5)
+                    continue
+                break
+
+    def _ask_playlist_editions(self, meta: dict[str, Any], discs: list[dict[str, Any]], i: int, selected_playlists: list[PlaylistInfo]) -> None:
+        """Offer a custom edition for each scanned playlist of disc ``i`` when more than one was selected."""
+        if len(selected_playlists) <= 1:
+            return
+        for idx, playlist in enumerate(selected_playlists):
+            bdinfo = discs[i].get('bdinfo' if idx == 0 else f'bdinfo_{idx}')
+            if not bdinfo:
+                continue
+            current_label = bdinfo.get('label', f"Playlist {idx}")
+            console.print(f"[bold yellow]Current label for playlist {playlist['file']}: {current_label}")
+
+            if not meta['unattended'] or (meta['unattended'] and meta.get('unattended_confirm', False)):
+                console.print("[bold green]You can create a custom Edition for this playlist.")
+                user_input_raw = cli_ui.ask_string(f"Enter a new Edition title for playlist {playlist['file']} (or press Enter to keep the current label): ")
+                user_input = (user_input_raw or "").strip()
+                if user_input:
+                    bdinfo['edition'] = user_input
+                    selected_playlists[idx]['edition'] = user_input
+                    console.print(f"[bold green]Edition updated to: {bdinfo['edition']}")
+            else:
+                console.print("[bold yellow]Unattended mode: Custom edition not added.")
 
     def parse_bdinfo_files(self, files: str) -> list[dict[str, str]]:
         """
@@ -549,9 +676,7 @@ class DiscParse:
             path = each.get('path')
             if not isinstance(path, str) or not path:
                 continue
-            os.chdir(path)
-            files = glob("VTS_*.VOB")
-            files.sort()
+            files = sorted(os.path.basename(file) for file in glob(os.path.join(escape(path), "VTS_*.VOB")))
             filesdict: OrderedDict[str, list[str]] = OrderedDict()
             main_set: list[str] = []
             for file in files:
@@ -563,7 +688,7 @@ class DiscParse:
 
             for vob_set in filesdict.values():
                 try:
-                    ifo_file = f"VTS_{vob_set[0][:2]}_0.IFO"
+                    ifo_file = os.path.join(path, f"VTS_{vob_set[0][:2]}_0.IFO")
 
                     try:
                         if mediainfo_binary:
@@ -629,7 +754,8 @@ class DiscParse:
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, vob_basename,
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
@@ -639,12 +765,12 @@ class DiscParse:
                             console.print("[yellow]Specialized MediaInfo failed for VOB, falling back[/yellow]")
                             if stderr:
                                 console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                            vob_mi_output = _mediainfo_text(vob)
                     else:
-                        vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                        vob_mi_output = _mediainfo_text(vob)
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for VOB: {str(e)}")
-                    vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
+                    vob_mi_output = _mediainfo_text(vob)
 
                 # Store VOB mediainfo (same output for both keys)
                 each['vob_mi'] = vob_mi_output
@@ -656,7 +782,8 @@ class DiscParse:
                         process = await asyncio.create_subprocess_exec(
                             mediainfo_binary, ifo_basename,
                             stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE
+                            stderr=asyncio.subprocess.PIPE,
+                            cwd=path
                         )
                         stdout, stderr = await process.communicate()
 
@@ -666,12 +793,12 @@ class DiscParse:
                             console.print("[yellow]Specialized MediaInfo failed for IFO, falling back[/yellow]")
                             if stderr:
                                 console.print(f"[red]MediaInfo stderr: {stderr.decode()}[/red]")
-                            ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                            ifo_mi_output = _mediainfo_text(ifo)
                     else:
-                        ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                        ifo_mi_output = _mediainfo_text(ifo)
                 except Exception as e:
                     console.print(f"[yellow]Error with DVD MediaInfo binary for IFO: {str(e)}")
-                    ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                    ifo_mi_output = _mediainfo_text(ifo)
 
                 each['ifo_mi'] = ifo_mi_output
                 each['ifo_mi_full'] = ifo_mi_output
@@ -679,14 +806,15 @@ class DiscParse:
             except Exception as e:
                 console.print(f"[yellow]Error using DVD MediaInfo binary, falling back to standard: {e}")
                 # Fallback to standard MediaInfo using basenames
-                vob_mi_output = MediaInfo.parse(vob_basename, output='STRING', full=False).replace('\r\n', '\n')
-                ifo_mi_output = MediaInfo.parse(ifo_basename, output='STRING', full=False).replace('\r\n', '\n')
+                vob_mi_output = _mediainfo_text(vob)
+                ifo_mi_output = _mediainfo_text(ifo)
                 each['vob_mi'] = vob_mi_output
                 each['ifo_mi'] = ifo_mi_output
                 each['vob_mi_full'] = vob_mi_output
                 each['ifo_mi_full'] = ifo_mi_output
 
-            size = sum(os.path.getsize(f) for f in os.listdir('.') if os.path.isfile(f)) / float(1 << 30)
+            disc_files = [os.path.join(path, f) for f in os.listdir(path)]
+            size = sum(os.path.getsize(f) for f in disc_files if os.path.isfile(f)) / float(1 << 30)
             each['disc_size'] = round(size, 2)
             dvd_size = "DVD9"
             if size <= 4.37:
@@ -700,7 +828,6 @@ class DiscParse:
             path = each.get('path')
             if not isinstance(path, str) or not path:
                 continue
-            os.chdir(path)
 
             try:
                 # Define the playlist path
@@ -951,7 +1078,7 @@ class DiscParse:
                 console.print(f"Playlist processing failed: {e}. Falling back to largest EVO file detection.")
 
                 # Fallback to largest .EVO file
-                files = glob("*.EVO")
+                files = glob(os.path.join(escape(path), "*.EVO"))
                 if not files:
                     console.print("No EVO files found in the directory.")
                     continue
@@ -967,8 +1094,8 @@ class DiscParse:
                         size = file_size
 
                 # Generate MediaInfo for the largest EVO file
-                each['evo_mi'] = MediaInfo.parse(os.path.basename(largest), output='STRING', full=False)
-                each['largest_evo'] = os.path.abspath(f"{path}/{largest}")
+                each['evo_mi'] = _mediainfo_text(largest)
+                each['largest_evo'] = os.path.abspath(largest)
 
         return discs
 
@@ -1,6 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import os
 import re
+import time
 from collections.abc import MutableMapping, Sequence
 from typing import Any, Callable, Optional, TypedDict, Union, cast
 
@@ -8,7 +9,7 @@ from typing_extensions import TypeAlias
 
 from cogs.redaction import Redaction
 from src.console import console
-from src.trackers.HUNO import HUNO
+from src.trackersetup import tracker_class_map
 
 Meta: TypeAlias = MutableMapping[str, Any]
 
@@ -33,16 +34,623 @@ class DupeEntry(TypedDict, total=False):
 DupeInput: TypeAlias = Union[str, DupeEntry, MutableMapping[str, Any]]
 
 
-class AttributeCheck(TypedDict):
-    key: str
-    uuid_flag: bool
-    condition: Callable[[str], bool]
-    exclude_msg: Callable[[str], str]
+WEB_TERMS = ("web-dl", "web -dl", "webdl", "web dl")
+BLURAY_TERMS = ('blu-ray', 'blu ray', 'bluray', 'blu -ray')
+HD_RESOLUTIONS = ('1080', '720', '2160')
+
+_EPISODE_RE = re.compile(r"[eE]\d{2}", re.IGNORECASE)
+_DISC_EXTENSION_RE = re.compile(r'\.\w{2,4}$')
+_MTV_AUDIO_RES = [
+    (re.compile(r'\.DDP\.(\d)'), r'.DDP\1'),
+    (re.compile(r'\.DD\.(\d)'), r'.DD\1'),
+    (re.compile(r'\.AC3\.(\d)'), r'.AC3\1'),
+    (re.compile(r'\.DTS\.(\d)'), r'.DTS\1'),
+]
+
+# Rule outcome: True excludes the dupe, False keeps it, None moves on to the next rule
+DupeRule: TypeAlias = Callable[['DupeCandidate'], Optional[bool]]
+
+
+def _coerce_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize(filename: str) -> str:
+    return filename.lower().replace("-", " -").replace(" ", " ").replace(".", " ")
+
+
+def _hdr_terms(hdr: Optional[str]) -> set[str]:
+    if hdr is None:
+        return set()
+    hdr_upper = str(hdr).upper()
+    terms: set[str] = set()
+    if "DV" in hdr_upper or "DOVI" in hdr_upper:
+        terms.add("DV")
+    if "HDR" in hdr_upper:  # Any HDR-related term is normalized to 'HDR'
+        terms.add("HDR")
+    return terms
+
+
+def _simplify_hdr(hdr_set: set[str], meta_type: str, tracker: Optional[str]) -> set[str]:
+    """Simplify HDR terms to just HDR and DV; DV+HDR compares as HDR."""
+    simplified: set[str] = set()
+    if any(h in hdr_set for h in {"HDR", "HDR10", "HDR10+"}):
+        simplified.add("HDR")
+    if any(h == "DV" or "DV" in h for h in hdr_set):
+        simplified.add("DV")
+        if 'web' not in meta_type:
+            simplified.add("HDR")
+        if tracker == "ANT":
+            simplified.add("HDR")
+    return simplified
+
+
+def season_episode_matcher(
+    target_season: Optional[Union[str, int]],
+    target_episode: Optional[Union[str, int]],
+) -> Callable[[str], tuple[bool, bool]]:
+    """(season/episode match, is season) of a filename against the target, with the patterns compiled once."""
+    season_match = re.search(r'[sS](\d+)', str(target_season))
+    target_season_value = int(season_match.group(1)) if season_match else None
+    target_episodes = [int(ep) for ep in re.findall(r'\d+', str(target_episode))] if target_episode else []
+
+    season_re = re.compile(rf"[sS]{target_season_value:02}", re.IGNORECASE) if target_season_value is not None else None
+    episode_res = [re.compile(rf"[eE]{ep:02}", re.IGNORECASE) for ep in target_episodes]
+
+    def match(filename: str) -> tuple[bool, bool]:
+        # Determine if filename represents a season pack (no explicit episode pattern)
+        is_season_pack = not _EPISODE_RE.search(filename)
+
+        # If `target_episode` is empty, match only season packs
+        if not target_episodes:
+            season_matches = bool(season_re and season_re.search(filename))
+            return (season_matches and is_season_pack, season_matches)
+
+        # If `target_episode` is provided, match both season packs and episode files
+        if season_re:
+            if is_season_pack:
+                return (bool(season_re.search(filename)), True)  # Match season pack
+            if episode_res:
+                return (
+                    bool(season_re.search(filename)) and any(episode_re.search(filename) for episode_re in episode_res),
+                    False,
+                )  # Match episode file
+
+        return (False, False)  # No match
+
+    return match
+
+
+class DupeTarget:
+    """Facts about the upload that every dupe is compared against, worked out once per upload."""
+
+    def __init__(self, meta: Meta) -> None:
+        self.name = str(meta.get('name', ''))
+        self.uuid_lower = str(meta.get('uuid', '')).lower()
+        self.has_repack = "repack" in self.uuid_lower
+        self.is_remux = "remux" in self.name.lower()
+        video_encode_value = meta.get("video_encode")
+        self.video_encode_lower = str(video_encode_value).lower() if video_encode_value else ""
+
+        self.file_size: Optional[int] = None
+        if meta.get('is_disc') != "BDMV":
+            mediainfo = cast(dict[str, Any], meta.get('mediainfo', {}))
+            tracks = cast(list[dict[str, Any]], mediainfo.get('media', {}).get('track', []))
+            if tracks:
+                self.file_size = _coerce_int(tracks[0].get('FileSize'))
+        self.source_size_raw = meta.get('source_size')
+        self.source_size = _coerce_int(self.source_size_raw)
+
+        self.is_disc = meta.get('is_disc')
+        self.has_is_disc = bool(self.is_disc)
+        self.is_bdmv = self.is_disc == "BDMV"
+        self.hdr_raw = cast(Optional[str], meta.get("hdr"))
+        self.hdr = _hdr_terms(self.hdr_raw)
+        self.meta_type = str(meta.get('type', '')).lower()
+        self.season = meta.get("season")
+        self.episode = meta.get("episode")
+        self.match_season_episode = season_episode_matcher(self.season, self.episode)
+        self.is_tv = meta.get('category') == "TV"
+        self.resolution = str(meta.get("resolution", ""))
+        self.tag = str(meta.get("tag", "")).lower().replace("-", " ")
+        self.tag_raw_lower = str(meta.get('tag', '')).lower()
+        self.is_dvd = self.is_disc == "DVD"
+        self.is_dvdrip = meta.get('type') == "DVDRIP"
+        self.web_dl = meta.get('type') == "WEBDL"
+        self.is_hdtv = meta.get('type') == "HDTV"
+        self.source = str(meta.get("source", ""))
+        self.is_sd = int(meta.get('sd') or 0)
+        self.skip_resolution_check = bool(self.is_dvd or "DVD" in self.source or self.is_dvdrip)
+
+        self.filelist: list[str] = []
+        self.filenames: list[str] = []
+        filelist_value = meta.get('filelist')
+        if not self.has_is_disc and isinstance(filelist_value, Sequence) and not isinstance(filelist_value, (str, bytes)):
+            self.filelist = [str(file_path) for file_path in cast(Sequence[Any], filelist_value)]
+            # Just the filenames without the path
+            self.filenames = [os.path.basename(file_path) for file_path in self.filelist]
+        self.filenames_lower = [filename.lower() for filename in self.filenames]
+        self.filenames_set = set(self.filenames_lower)
+
+        mtv_name = self.name.replace(' ', '.').replace('DD+', 'DDP')
+        for pattern, replacement in _MTV_AUDIO_RES:
+            mtv_name = pattern.sub(replacement, mtv_name)
+        self.mtv_name = mtv_name
+        self.bhd_name = self.name.replace('DD+', 'DDP')
+
+    @staticmethod
+    def fingerprint(meta: Meta) -> tuple[str, ...]:
+        """The meta fields the target is built from; the file list and mediainfo follow the uuid."""
+        return tuple(str(meta.get(key)) for key in (
+            'uuid', 'name', 'video_encode', 'is_disc', 'source_size', 'hdr', 'type', 'season', 'episode',
+            'category', 'resolution', 'tag', 'source', 'sd',
+        ))
+
+
+class DupeCandidate:
+    """One tracker result with the strings the rules look at normalized once."""
+
+    __slots__ = ('each', 'each_lower', 'entry', 'file_count', 'file_hdr', 'files', 'files_lower', 'flags', 'normalized')
+
+    def __init__(self, entry: DupeEntry) -> None:
+        self.entry = entry
+        self.each = str(entry.get('name', ''))
+        self.each_lower = self.each.lower()
+        self.normalized = _normalize(self.each)
+
+        files = [str(file) for file in cast(list[Any], entry.get('files') or [])]
+        # Handle case where files might be comma-separated strings in a list
+        if files and len(files) == 1 and ',' in files[0]:
+            files = [f.strip() for f in files[0].split(',')]
+        self.files = files
+        self.files_lower = [f.lower() for f in files]
+        self.file_count = _coerce_int(entry.get('file_count', 0)) or 0
+
+        # Use flags field if available for more accurate HDR detection
+        self.flags = [str(flag) for flag in cast(list[Any], entry.get('flags') or [])]
+        if self.flags:
+            file_hdr: set[str] = set()
+            for flag in self.flags:
+                flag_upper = flag.upper()
+                if flag_upper == 'DV':
+                    file_hdr.add('DV')
+                elif flag_upper in ['HDR', 'HDR10', 'HDR10+']:
+                    file_hdr.add('HDR')
+            self.file_hdr = file_hdr
+        else:
+            # Fall back to parsing filename for HDR terms
+            self.file_hdr = _hdr_terms(self.normalized)
+
+
+class RuleStats:
+    __slots__ = ('calls', 'excluded', 'kept', 'seconds')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.excluded = 0
+        self.kept = 0
+        self.seconds = 0.0
+
+
+class DupeRulePlan:
+    """
+    The exclusion rules that apply to one tracker's results, in evaluation order.
+
+    Rules that cannot fire for this upload and tracker are left out when the plan is built,
+    so each result only runs through the checks that matter. Evaluation is synchronous; every
+    rule counts its calls, decisions and time in ``stats``.
+    """
+
+    def __init__(
+        self,
+        target: DupeTarget,
+        meta: Meta,
+        tracker_name: str,
+        config: dict[str, Any],
+        result_count: int,
+        huno_name: Optional[str] = None,
+    ) -> None:
+        self.target = target
+        self.meta = meta
+        self.tracker_name = tracker_name
+        self.debug = bool(meta.get('debug'))
+        self.huno_name = huno_name
+        self.target_hdr_simple = _simplify_hdr(target.hdr, target.meta_type, tracker_name)
+        self.stats: dict[str, RuleStats] = {}
+
+        self.aither_internal_groups: list[Any] = []
+        trackers_section = cast(dict[str, Any], config.get('TRACKERS', {}))
+        aither_settings = cast(dict[str, Any], trackers_section.get('AITHER', {}))
+        if aither_settings.get('internal') is True and isinstance(aither_settings.get('internal_groups', []), list):
+            self.aither_internal_groups = cast(list[Any], aither_settings.get('internal_groups', []))
+
+        single_result = result_count == 1 and not target.is_bdmv
+        candidates: list[tuple[str, DupeRule, bool]] = [
+            ('trumpable', self._trumpable, tracker_name in ("AITHER", "LST")),
+            ('filename', self._filename, not target.has_is_disc),
+            ('disc_size', self._disc_size, target.has_is_disc),
+            ('disc_file_count', self._disc_file_count, target.has_is_disc),
+            ('repack', self._repack, target.has_repack),
+            ('mtv_name', self._mtv_name, tracker_name == "MTV"),
+            ('bhd_name', self._bhd_name, tracker_name == "BHD"),
+            ('huno_name', self._huno_name, tracker_name == "HUNO" and huno_name is not None),
+            ('framestor', self._framestor, tracker_name in ("BHD", "MTV", "RTF", "AR") and '2160p' in target.resolution),
+            ('disc_m2ts', self._disc_m2ts, target.has_is_disc),
+            ('disc_extension', self._disc_extension, target.has_is_disc),
+            ('sd_resolution', self._sd_resolution, target.is_sd == 1 and tracker_name in ("BHD", "AITHER")),
+            ('hdr_4k', self._hdr_4k, bool(target.hdr) and '1080p' in target.resolution),
+            ('dvd_tag', self._dvd_tag, tracker_name in ("AITHER", "LST") and target.is_dvd),
+            ('webdl_source', self._webdl_source, target.web_dl),
+            ('non_webdl_source', self._non_webdl_source, not target.web_dl),
+            ('resolution', self._resolution, not target.skip_resolution_check and bool(target.resolution)),
+            ('hdr', self._hdr, not target.skip_resolution_check),
+            ('dvd_resolution', self._dvd_resolution, target.is_dvd and tracker_name != "BHD"),
+            ('remux', self._remux, True),
+            ('season_episode', self._season_episode, target.is_tv),
+            ('hdtv_webdl', self._hdtv_webdl, target.is_hdtv),
+            ('size_ratio', self._size_ratio, single_result and tracker_name in ("AITHER", "BHD", "HUNO", "OE", "ULCX") and target.file_size is not None
+             and "1080" in target.resolution and 'x264' in target.video_encode_lower),
+            ('rf_tag', self._rf_tag, single_result and tracker_name == "RF" and bool(target.tag.strip())),
+        ]
+        self.rules: list[tuple[str, DupeRule]] = [(name, rule) for name, rule, applies in candidates if applies]
+
+    def filter(self, entries: Sequence[DupeEntry]) -> list[DupeEntry]:
+        """The entries that are not excluded."""
+        return [entry for entry in entries if not self.excluded(DupeCandidate(entry))]
+
+    def excluded(self, candidate: DupeCandidate) -> bool:
+        if self.debug:
+            self._log_candidate(candidate)
+        for name, rule in self.rules:
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = RuleStats()
+            start = time.perf_counter()
+            decision = rule(candidate)
+            stats.seconds += time.perf_counter() - start
+            stats.calls += 1
+            if decision is not None:
+                if decision:
+                    stats.excluded += 1
+                else:
+                    stats.kept += 1
+                return decision
+        if self.debug:
+            console.log(f"[cyan]Release PASSED all checks: {candidate.each}")
+        return False
+
+    def summary(self) -> str:
+        total = sum(stats.seconds for stats in self.stats.values())
+        slowest = sorted(self.stats.items(), key=lambda item: item[1].seconds, reverse=True)[:5]
+        rules = ", ".join(
+            f"{name} {stats.calls}x {stats.seconds * 1000:.2f}ms ({stats.excluded} excluded, {stats.kept} kept)" for name, stats in slowest
+        )
+        return f"{len(self.rules)} rules, {total * 1000:.2f}ms; {rules}"
+
+    def _log_candidate(self, candidate: DupeCandidate) -> None:
+        target = self.target
+        console.log(f"[debug] Evaluating dupe: {candidate.each}")
+        console.log(f"[debug] Normalized dupe: {candidate.normalized}")
+        console.log(f"[debug] Target resolution: {target.resolution}")
+        console.log(f"[debug] Target source: {target.source}")
+        console.log(f"[debug] File HDR terms: {candidate.file_hdr}")
+        console.log(f"[debug] Flags: {candidate.flags}")
+        console.log(f"[debug] Target HDR terms: {target.hdr}")
+        console.log(f"[debug] Target Season: {target.season}")
+        console.log(f"[debug] Target Episode: {target.episode}")
+        console.log(f"[debug] TAG: {target.tag}")
+        console.log(f"[debug] has_repack_in_uuid: {target.has_repack}, 'repack' in name: {'repack' in candidate.each_lower}")
+        console.log(f"[debug] type_id: {candidate.entry.get('type')}, res_id: {candidate.entry.get('res')}")
+        console.log(f"[debug] link: {candidate.entry.get('link', None)}")
+        console.log(f"[debug] files: {candidate.files[:10]}{'...' if len(candidate.files) > 10 else ''}")
+        console.log(f"[debug] file_count: {candidate.file_count}")
+
+    def _exclude(self, reason: str, candidate: DupeCandidate) -> bool:
+        if self.debug:
+            console.log(f"[yellow]Excluding result due to {reason}: {candidate.each}")
+        return True
+
+    def _remember(self, candidate: DupeCandidate, reason: str) -> None:
+        """Persist details about the dupe that triggered a match for later use."""
+        entry, meta, tracker_name = candidate.entry, self.meta, self.tracker_name
+        meta[f"{tracker_name}_matched_name"] = entry.get('name')
+        if entry.get('link'):
+            meta[f"{tracker_name}_matched_link"] = entry.get('link')
+        if entry.get('download'):
+            meta[f"{tracker_name}_matched_download"] = entry.get('download')
+        meta[f"{tracker_name}_matched_reason"] = reason
+        if candidate.file_count:
+            meta[f"{tracker_name}_matched_file_count"] = candidate.file_count
+        if entry.get('id'):
+            meta[f"{tracker_name}_matched_id"] = entry.get('id')
+
+    def _match_text(self, candidate: DupeCandidate) -> str:
+        return f"{candidate.entry.get('name')} = {candidate.entry.get('link', None)}"
+
+    def _size_matches(self, candidate: DupeCandidate) -> bool:
+        entry_size = _coerce_int(candidate.entry.get('size'))
+        source_size = self.target.source_size
+        if entry_size is not None and source_size is not None:
+            if self.debug:
+                console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
+            if entry_size == source_size:
+                self.meta['size_match'] = self._match_text(candidate)
+                self._remember(candidate, 'size')
+                return True
+        elif self.debug and entry_size is None and self.target.source_size_raw is not None:
+            console.log(f"[debug] Size comparison failed due to ValueError: entry_size={candidate.entry.get('size')}, source_size={self.target.source_size_raw}")
+        return False
+
+    # Rules, in evaluation order
+
+    def _trumpable(self, candidate: DupeCandidate) -> Optional[bool]:
+        # Aither-specific trumping logic - no internal checking, if it's marked trumpable, it's trumpable
+        res_id = candidate.entry.get('res')
+        if candidate.entry.get('trumpable', False) and res_id and self.target.resolution == res_id:
+            self.meta['trumpable_id'] = candidate.entry.get('id')
+            self._remember(candidate, 'trumpable_id')
+        return None
+
+    def _filename(self, candidate: DupeCandidate) -> Optional[bool]:
+        target = self.target
+        if self.tracker_name in ("MTV", "AR", "RTF"):
+            # MTV: check if any dupe file is a substring of our file (ignoring extension)
+            for file in target.filenames_lower:
+                if any(f in file for f in candidate.files_lower):
+                    self.meta['filename_match'] = self._match_text(candidate)
+                    self._remember(candidate, 'filename')
+                    if candidate.file_count and candidate.file_count == len(target.filelist):
+                        self.meta['file_count_match'] = candidate.file_count
+                        self._remember(candidate, 'file_count')
+                        return False
+                if self._size_matches(candidate):
+                    return False
+        elif target.filenames_set and not target.filenames_set.isdisjoint(candidate.files_lower):
+            self.meta['filename_match'] = self._match_text(candidate)
+            if self.debug:
+                console.log(f"[debug] Filename match found: {self.meta['filename_match']}")
+            self._remember(candidate, 'filename')
+            self._remember(candidate, 'id')
+            if candidate.file_count and candidate.file_count == len(target.filelist):
+                self.meta['file_count_match'] = candidate.file_count
+                if self.debug:
+                    console.log(f"[debug] File count match found: {self.meta['file_count_match']}")
+                self._remember(candidate, 'file_count')
+                return False
+        if self.tracker_name == "BHD" and self._size_matches(candidate):
+            return False
+        return None
+
+    def _disc_size(self, candidate: DupeCandidate) -> Optional[bool]:
+        return False if self._size_matches(candidate) else None
+
+    def _disc_file_count(self, candidate: DupeCandidate) -> Optional[bool]:
+        if candidate.file_count and candidate.file_count < 2:
+            return self._exclude("file count less than 2 for disc upload", candidate)
+        return None
+
+    def _repack(self, candidate: DupeCandidate) -> Optional[bool]:
+        if "repack" not in candidate.normalized and self.target.tag_raw_lower in candidate.normalized:
+            return self._exclude('repack release', candidate)
+        return None
+
+    def _mtv_name(self, candidate: DupeCandidate) -> Optional[bool]:
+        if self.target.mtv_name == candidate.each:
+            self.meta['filename_match'] = self._match_text(candidate)
+            return False
+        return None
+
+    def _bhd_name(self, candidate: DupeCandidate) -> Optional[bool]:
+        if candidate.each == self.target.bhd_name:
+            self.meta['filename_match'] = self._match_text(candidate)
+            return False
+        return None
+
+    def _huno_name(self, candidate: DupeCandidate) -> Optional[bool]:
+        if candidate.each == self.huno_name:
+            self.meta['filename_match'] = self._match_text(candidate)
+            return False
+        return None
+
+    def _framestor(self, candidate: DupeCandidate) -> Optional[bool]:
+        if '2160p' in candidate.each and ('framestor' in candidate.each_lower or 'framestor' in self.target.uuid_lower):
+            return False
+        return None
+
+    def _disc_m2ts(self, candidate: DupeCandidate) -> Optional[bool]:
+        return False if candidate.each_lower.endswith(".m2ts") else None
+
+    def _disc_extension(self, candidate: DupeCandidate) -> Optional[bool]:
+        if _DISC_EXTENSION_RE.search(candidate.each):
+            return self._exclude("file extension mismatch (is_disc=True)", candidate)
+        return None
+
+    def _sd_resolution(self, candidate: DupeCandidate) -> Optional[bool]:
+        return False if any(res in candidate.each for res in HD_RESOLUTIONS) else None
+
+    def _hdr_4k(self, candidate: DupeCandidate) -> Optional[bool]:
+        if '2160p' in candidate.each:
+            self._exclude("No 1080p HDR when 4K exists", candidate)
+            return False
+        return None
+
+    def _dvd_tag(self, candidate: DupeCandidate) -> Optional[bool]:
+        tag = self.target.tag
+        if len(candidate.each) >= 1 and tag == "":
+            return False
+        return not (tag.strip() and tag.strip() in candidate.normalized)
+
+    def _webdl_source(self, candidate: DupeCandidate) -> Optional[bool]:
+        normalized = candidate.normalized
+        if any(web_term in normalized for web_term in WEB_TERMS):
+            return None
+        if "hdtv" in normalized:
+            return self._exclude("source mismatch: WEB-DL vs HDTV", candidate)
+        if any(term in normalized for term in BLURAY_TERMS):
+            return self._exclude("source mismatch: WEB-DL vs BluRay", candidate)
+        return None
+
+    def _non_webdl_source(self, candidate: DupeCandidate) -> Optional[bool]:
+        if any(web_term in candidate.normalized for web_term in WEB_TERMS):
+            return self._exclude("source mismatch: non-WEB-DL vs WEB-DL", candidate)
+        return None
+
+    def _resolution(self, candidate: DupeCandidate) -> Optional[bool]:
+        if self.target.resolution not in candidate.each:
+            return self._exclude(f"resolution '{self.target.resolution}' mismatch", candidate)
+        return None
+
+    def _hdr(self, candidate: DupeCandidate) -> Optional[bool]:
+        file_hdr_simple = _simplify_hdr(candidate.file_hdr, self.target.meta_type, self.tracker_name)
+        target_hdr_simple = self.target_hdr_simple
+        if file_hdr_simple == {"DV", "HDR"}:
+            file_hdr_simple = {"HDR"}
+            if target_hdr_simple == {"DV", "HDR"}:
+                target_hdr_simple = {"HDR"}
+        if file_hdr_simple != target_hdr_simple:
+            return self._exclude(f"HDR mismatch: Expected {self.target.hdr}, got {candidate.file_hdr}", candidate)
+        return None
+
+    def _dvd_resolution(self, candidate: DupeCandidate) -> Optional[bool]:
+        if any(res in candidate.each for res in HD_RESOLUTIONS):
+            self._exclude(f"resolution '{self.target.resolution}' mismatch", candidate)
+            return False
+        return None
+
+    def _remux(self, candidate: DupeCandidate) -> Optional[bool]:
+        # Bidirectional check: if your upload is a REMUX, dupe must be REMUX
+        # If your upload is NOT a REMUX (i.e., an encode), dupe must NOT be a REMUX
+        uuid_has_remux = self.target.is_remux
+        dupe_has_remux = "remux" in candidate.normalized
+        if self.debug:
+            console.log(f"[debug] Remux check: uuid_has_remux={uuid_has_remux}, dupe_has_remux={dupe_has_remux}")
+        if uuid_has_remux and not dupe_has_remux:
+            return self._exclude("missing 'remux'", candidate)
+        if not uuid_has_remux and dupe_has_remux:
+            return self._exclude("dupe is remux but upload is not", candidate)
+        return None
+
+    def _season_episode(self, candidate: DupeCandidate) -> Optional[bool]:
+        target, meta, entry, each = self.target, self.meta, candidate.entry, candidate.each
+        season_episode_match, is_season = target.match_season_episode(candidate.normalized)
+        if self.debug:
+            console.log(f"[debug] Season/Episode match result: {season_episode_match}")
+            console.log(f"[debug] is_season: {is_season}")
+        # Aither episode trumping logic
+        if is_season and self.tracker_name in ("AITHER", "LST"):
+            # Null-safe normalization for comparisons
+            target_source_lower = (target.source or "").lower()
+            type_id_lower = str(entry.get('type') or "").lower()
+            res_id_safe = entry.get('res') or ""
+            target_resolution_safe = target.resolution or ""
+
+            if type_id_lower and res_id_safe:
+                if self.debug:
+                    console.log(
+                        f"[debug] Checking trumping: target_source='{target_source_lower}', type_id='{type_id_lower}', target_res='{target_resolution_safe}', res_id='{res_id_safe}'"
+                    )
+                if target_source_lower in type_id_lower and target_resolution_safe == res_id_safe:
+                    if self.debug:
+                        console.log(f"[debug] Episode with matching source and resolution found for trumping: {each}")
+
+                    is_internal = False
+                    if entry.get('internal', 0) == 1:
+                        tag_without_prefix = target.tag[1:] if target.tag else ""
+                        if tag_without_prefix in self.aither_internal_groups and tag_without_prefix.lower() in candidate.normalized:
+                            is_internal = True
+                        if not is_internal and self.debug:
+                            console.log("[debug] Skipping internal episode for trumping since you're not the internal uploader.")
+
+                    if not entry.get('internal', False) or is_internal:
+                        # Store the matched episode ID/s for later use
+                        # is_season=True means seasons match, which is sufficient for trump targeting
+                        # (season pack can trump individual episodes from same season)
+                        matched_episode_ids = cast(list[dict[str, Any]], meta.setdefault(f'{self.tracker_name}_matched_episode_ids', []))
+
+                        entry_id = entry.get('id')
+                        entry_link = entry.get('link')
+
+                        # De-duplication guard: check if this entry already exists
+                        already_exists = (
+                            any(
+                                existing.get('id') == entry_id
+                                or (existing.get('link') == entry_link and existing.get('tracker') == self.tracker_name)
+                                for existing in matched_episode_ids
+                            )
+                            if entry_id or entry_link
+                            else False
+                        )
+
+                        if entry_id and not already_exists:
+                            matched_episode_ids.append({
+                                'id': entry_id,
+                                'name': each,
+                                'link': entry_link,
+                                'tracker': self.tracker_name,
+                                'internal': entry.get('internal', 0),
+                            })
+                            if self.debug:
+                                console.log(f"[debug] Added episode ID {entry_id} to matched list")
+                            # Ensure this matched dupe is recorded for later use
+                            self._remember(candidate, 'season_pack_contains_episode')
+                            # Don't exclude this entry - it's a valid trump target
+                            return False
+                        if already_exists and self.debug:
+                            console.log(f"[debug] Skipping duplicate entry for episode ID {entry_id}")
+
+        # Normal season/episode matching
+        if not season_episode_match:
+            return self._exclude("season/episode mismatch", candidate)
+
+        # Check if uploading an episode but a matching season pack exists
+        if is_season and target.episode:
+            # We're uploading an episode and found a matching season pack
+            meta['season_pack_exists'] = True
+            meta['season_pack_name'] = each
+            meta['season_pack_link'] = entry.get('link')
+            meta['season_pack_id'] = entry.get('id')
+            if self.debug:
+                console.log(f"[yellow]Season pack detected for episode upload: {each}")
+                console.log(f"[yellow]Your episode {target.season}{target.episode} is contained in existing season pack")
+            self._remember(candidate, 'season_pack_contains_episode')
+            return False
+        return None
+
+    def _hdtv_webdl(self, candidate: DupeCandidate) -> Optional[bool]:
+        return False if any(web_term in candidate.normalized for web_term in WEB_TERMS) else None
+
+    def _size_ratio(self, candidate: DupeCandidate) -> Optional[bool]:
+        target_size = self.target.file_size
+        dupe_size = _coerce_int(candidate.entry.get('size'))
+        if target_size is not None and dupe_size is not None and dupe_size != 0:
+            size_difference = (target_size - dupe_size) / dupe_size
+            if self.debug:
+                console.print(f"Your size: {target_size}, Dupe size: {dupe_size}, Size difference: {size_difference:.4f}")
+            if size_difference >= 0.20:
+                return self._exclude(f"Your file is significantly larger ({size_difference * 100:.2f}%)", candidate)
+        return None
+
+    def _rf_tag(self, candidate: DupeCandidate) -> Optional[bool]:
+        tag = self.target.tag.strip()
+        if tag in candidate.normalized:
+            return False
+        return self._exclude(f"Tag '{self.target.tag}' not found in normalized name", candidate)
 
 
 class DupeChecker:
     def __init__(self, config: dict[str, Any]) -> None:
         self.config = config
+        self._target: Optional[tuple[tuple[str, ...], DupeTarget]] = None
+
+    def target_for(self, meta: Meta) -> DupeTarget:
+        """The upload's target facts, built once and reused for every tracker."""
+        fingerprint = DupeTarget.fingerprint(meta)
+        if self._target is None or self._target[0] != fingerprint:
+            self._target = (fingerprint, DupeTarget(meta))
+        return self._target[1]
 
     async def filter_dupes(self, dupes: Sequence[DupeInput], meta: Meta, tracker_name: str) -> list[DupeEntry]:
         """
@@ -125,463 +733,21 @@ class DupeChecker:
 
                 processed_dupes.append(entry)
 
-        def coerce_int(value: Any) -> Optional[int]:
-            try:
-                return int(value) if value is not None else None
-            except (TypeError, ValueError):
-                return None
-
-        new_dupes: list[DupeEntry]
-
-        has_repack_in_uuid = "repack" in str(meta.get('uuid', '')).lower()
-        video_encode_value = meta.get("video_encode")
-        video_encode = str(video_encode_value) if video_encode_value else ""
-        normalized_encoder = await DupeChecker.normalize_filename(video_encode) if video_encode else ""
-        video_encode_lower = video_encode.lower()
-
-        file_size: Optional[int] = None
-        if meta.get('is_disc') != "BDMV":
-            mediainfo = cast(dict[str, Any], meta.get('mediainfo', {}))
-            tracks = cast(list[dict[str, Any]], mediainfo.get('media', {}).get('track', []))
-            if tracks:
-                file_size = coerce_int(tracks[0].get('FileSize'))
-
-        has_is_disc = bool(meta.get('is_disc', False))
-        target_hdr = await DupeChecker.refine_hdr_terms(cast(Optional[str], meta.get("hdr")))
-        target_season = meta.get("season")
-        target_episode = meta.get("episode")
-        target_resolution = str(meta.get("resolution", ""))
-        tag = str(meta.get("tag", "")).lower().replace("-", " ")
-        is_dvd = meta.get('is_disc') == "DVD"
-        is_dvdrip = meta.get('type') == "DVDRIP"
-        web_dl = meta.get('type') == "WEBDL"
-        is_hdtv = meta.get('type') == "HDTV"
-        target_source = str(meta.get("source", ""))
-        is_sd = int(meta.get('sd') or 0)
-
-        filenames: list[str] = []
-        filelist_value = meta.get('filelist')
-        filelist: list[str] = []
-        if not meta.get('is_disc'):
-            if isinstance(filelist_value, Sequence) and not isinstance(filelist_value, (str, bytes)):
-                filelist = [str(file_path) for file_path in cast(Sequence[Any], filelist_value)]
-                for file_path in filelist:
-                    # Extract just the filename without the path
-                    filename = os.path.basename(file_path)
-                    filenames.append(filename)
-            if meta.get('debug'):
-                console.log(f"dupe checking filenames: {filenames[:10]}{'...' if len(filenames) > 10 else ''}")
-
-        attribute_checks: list[AttributeCheck] = [
-            {
-                "key": "remux",
-                "uuid_flag": "remux" in str(meta.get('name', '')).lower(),
-                "condition": lambda each: "remux" in each.lower(),
-                "exclude_msg": lambda each: f"Excluding result due to 'remux' mismatch: {each}",
-            },
-            {
-                "key": "uhd",
-                "uuid_flag": "uhd" in str(meta.get('name', '')).lower(),
-                "condition": lambda each: "uhd" in each.lower(),
-                "exclude_msg": lambda each: f"Excluding result due to 'UHD' mismatch: {each}",
-            },
-        ]
-
-        async def log_exclusion(reason: str, item: str) -> None:
-            if meta.get('debug'):
-                console.log(f"[yellow]Excluding result due to {reason}: {item}")
-
-        async def process_exclusion(entry: DupeEntry) -> bool:
-            """
-            Determine if an entry should be excluded.
-            Returns True if the entry should be excluded, otherwise allowed as dupe.
-            """
-            each = str(entry.get('name', ''))
-            sized = entry.get('size')  # This may come as a string, such as "1.5 GB"
-
-            files_value = cast(list[Any], entry.get('files') or [])
-            files = [str(file) for file in files_value]
-
-            # Handle case where files might be comma-separated strings in a list
-            if files and len(files) == 1 and ',' in files[0]:
-                # Split comma-separated string into individual filenames
-                files = [f.strip() for f in files[0].split(',')]
-
-            file_count_raw = entry.get('file_count', 0)
-            file_count = coerce_int(file_count_raw) or 0
-            normalized = await DupeChecker.normalize_filename(each)
-            type_id = entry.get('type', None)
-            res_id = entry.get('res', None)
-
-            # Use flags field if available for more accurate HDR detection
-            flags_value = cast(list[Any], entry.get('flags') or [])
-            flags = [str(flag) for flag in flags_value]
-
-            if flags:
-                # If flags are provided, use them directly for HDR information
-                file_hdr: set[str] = set()
-                for flag in flags:
-                    flag_upper = str(flag).upper()
-                    if flag_upper == 'DV':
-                        file_hdr.add('DV')
-                    elif flag_upper in ['HDR', 'HDR10', 'HDR10+']:
-                        file_hdr.add('HDR')
-                if meta.get('debug'):
-                    console.log(f"[debug] Using flags for HDR detection: {flags} -> {file_hdr}")
-            else:
-                # Fall back to parsing filename for HDR terms
-                file_hdr = await DupeChecker.refine_hdr_terms(normalized)
-
-            if meta.get('debug'):
-                console.log(f"[debug] Evaluating dupe: {each}")
-                console.log(f"[debug] Normalized dupe: {normalized}")
-                console.log(f"[debug] Target resolution: {target_resolution}")
-                console.log(f"[debug] Target source: {target_source}")
-                console.log(f"[debug] File HDR terms: {file_hdr}")
-                console.log(f"[debug] Flags: {flags}")
-                console.log(f"[debug] Target HDR terms: {target_hdr}")
-                console.log(f"[debug] Target Season: {target_season}")
-                console.log(f"[debug] Target Episode: {target_episode}")
-                console.log(f"[debug] TAG: {tag}")
-                console.log("[debug] Evaluating repack condition:")
-                console.log(f"  has_repack_in_uuid: {has_repack_in_uuid}")
-                console.log(f"  'repack' in each.lower(): {'repack' in each.lower()}")
-                console.log(f"[debug] meta['uuid']: {meta.get('uuid', '')}")
-                console.log(f"[debug] normalized encoder: {normalized_encoder}")
-                console.log(f"[debug] type_id: {type_id}, res_id: {res_id}")
-                console.log(f"[debug] link: {entry.get('link', None)}")
-                console.log(f"[debug] files: {files[:10]}{'...' if len(files) > 10 else ''}")
-                console.log(f"[debug] file_count: {file_count}")
-
-            def remember_match(reason: str) -> None:
-                """Persist details about the dupe that triggered a match for later use."""
-                matched_name_key = f"{tracker_name}_matched_name"
-                matched_link_key = f"{tracker_name}_matched_link"
-                matched_download_key = f"{tracker_name}_matched_download"
-                matched_reason_key = f"{tracker_name}_matched_reason"
-                matched_count_key = f"{tracker_name}_matched_file_count"
-                matched_torrent_id = f"{tracker_name}_matched_id"
-
-                meta[matched_name_key] = entry.get('name')
-                if entry.get('link'):
-                    meta[matched_link_key] = entry.get('link')
-                if entry.get('download'):
-                    meta[matched_download_key] = entry.get('download')
-                meta[matched_reason_key] = reason
-                if file_count:
-                    meta[matched_count_key] = file_count
-                if entry.get('id'):
-                    meta[matched_torrent_id] = entry.get('id')
-
-            # Aither-specific trumping logic - no internal checking, if it's marked trumpable, it's trumpable
-            if tracker_name in ["AITHER", "LST"] and entry.get('trumpable', False) and res_id and target_resolution == res_id:
-                meta['trumpable_id'] = entry.get('id')
-                remember_match('trumpable_id')
-
-            if not meta.get('is_disc'):
-                for file in filenames:
-                    if tracker_name in ["MTV", "AR", "RTF"]:
-                        # MTV: check if any dupe file is a substring of our file (ignoring extension)
-                        if any(f.lower() in file.lower() for f in files):
-                            meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('filename')
-                            if file_count and file_count == len(filelist):
-                                meta['file_count_match'] = file_count
-                                remember_match('file_count')
-                                return False
-                        entry_size = coerce_int(entry.get('size'))
-                        source_size = coerce_int(meta.get('source_size'))
-                        if entry_size is not None and source_size is not None and entry_size == source_size:
-                            meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('size')
-                            return False
-                        if meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                            console.log(
-                                f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                            )
-                    else:
-                        if meta.get('debug'):
-                            console.log(f"[debug] Comparing file: {file} against dupe files list.")
-                            console.log(f"[debug] Dupe files list: {files[:10]}{'...' if len(files) > 10 else files}")
-                        if any(file.lower() == f.lower() for f in files):
-                            meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            if meta.get('debug'):
-                                console.log(f"[debug] Filename match found: {meta['filename_match']}")
-                            remember_match('filename')
-                            remember_match('id')
-                            if file_count and file_count == len(filelist):
-                                meta['file_count_match'] = file_count
-                                if meta.get('debug'):
-                                    console.log(f"[debug] File count match found: {meta['file_count_match']}")
-                                remember_match('file_count')
-                                return False
-                if tracker_name in ["BHD"]:
-                    # BHD: compare sizes
-                    entry_size = coerce_int(entry.get('size'))
-                    source_size = coerce_int(meta.get('source_size'))
-                    if entry_size is not None and source_size is not None:
-                        if meta.get('debug'):
-                            console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
-                        if entry_size == source_size:
-                            meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                            remember_match('size')
-                            return False
-                    elif meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                        console.log(
-                            f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                        )
-
-            else:
-                entry_size = coerce_int(entry.get('size'))
-                source_size = coerce_int(meta.get('source_size'))
-                if entry_size is not None and source_size is not None:
-                    if meta.get('debug'):
-                        console.log(f"[debug] Comparing sizes: Entry size {entry_size} vs Source size {source_size}")
-                    if entry_size == source_size:
-                        meta['size_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                        remember_match('size')
-                        return False
-                elif meta.get('debug') and entry_size is None and meta.get('source_size') is not None:
-                    console.log(
-                        f"[debug] Size comparison failed due to ValueError: entry_size={entry.get('size')}, source_size={meta.get('source_size')}"
-                    )
-
-            if meta.get('is_disc') and file_count and file_count < 2:
-                await log_exclusion("file count less than 2 for disc upload", each)
-                return True
-
-            if has_repack_in_uuid and "repack" not in normalized and str(meta.get('tag', '')).lower() in normalized:
-                await log_exclusion('repack release', each)
-                return True
-
-            if tracker_name == "MTV":
-                target_name = str(meta.get('name', '')).replace(' ', '.').replace('DD+', 'DDP')
-                dupe_name = str(entry.get('name', ''))
-
-                def normalize_mtv_name(name: str) -> str:
-                    # Handle audio format variations: DDP.5.1 <-> DDP5.1
-                    name = re.sub(r'\.DDP\.(\d)', r'.DDP\1', name)
-                    name = re.sub(r'\.DD\.(\d)', r'.DD\1', name)
-                    name = re.sub(r'\.AC3\.(\d)', r'.AC3\1', name)
-                    name = re.sub(r'\.DTS\.(\d)', r'.DTS\1', name)
-                    return name
-
-                normalized_target = normalize_mtv_name(target_name)
-                if normalized_target == dupe_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name == "BHD":
-                target_name = str(meta.get('name', '')).replace('DD+', 'DDP')
-                if str(entry.get('name')) == target_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name == "HUNO":
-                huno = HUNO(config=self.config)
-                huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
-                huno_name_map = cast(dict[str, Any], huno_name_result)
-                huno_name = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
-                if str(entry.get('name')) == huno_name:
-                    meta['filename_match'] = f"{entry.get('name')} = {entry.get('link', None)}"
-                    return False
-
-            if tracker_name in ["BHD", "MTV", "RTF", "AR"] and (
-                ('2160p' in target_resolution and '2160p' in each)
-                and ('framestor' in each.lower() or 'framestor' in str(meta.get('uuid', '')).lower())
-            ):
-                return False
-
-            if has_is_disc and each.lower().endswith(".m2ts"):
-                return False
-
-            if has_is_disc and re.search(r'\.\w{2,4}$', each):
-                await log_exclusion("file extension mismatch (is_disc=True)", each)
-                return True
-
-            if is_sd == 1 and tracker_name in {"BHD", "AITHER"} and any(str(res) in each for res in [1080, 720, 2160]):
-                return False
-
-            if target_hdr and '1080p' in target_resolution and '2160p' in each:
-                await log_exclusion("No 1080p HDR when 4K exists", each)
-                return False
-
-            if tracker_name in ["AITHER", "LST"] and is_dvd:
-                if len(each) >= 1 and tag == "":
-                    return False
-                return not (tag.strip() and tag.strip() in normalized)
-
-            if web_dl:
-                if "hdtv" in normalized and not any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
-                    await log_exclusion("source mismatch: WEB-DL vs HDTV", each)
-                    return True
-                if any(term in normalized for term in ['blu-ray', 'blu ray', 'bluray', 'blu -ray']) and not any(
-                    web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]
-                ):
-                    await log_exclusion("source mismatch: WEB-DL vs BluRay", each)
-                    return True
-            if not web_dl and any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
-                await log_exclusion("source mismatch: non-WEB-DL vs WEB-DL", each)
-                return True
-
-            skip_resolution_check = bool(is_dvd or "DVD" in target_source or is_dvdrip)
-
-            if not skip_resolution_check:
-                if target_resolution and target_resolution not in each:
-                    await log_exclusion(f"resolution '{target_resolution}' mismatch", each)
-                    return True
-                if not await DupeChecker.has_matching_hdr(file_hdr, target_hdr, meta, tracker=tracker_name):
-                    await log_exclusion(f"HDR mismatch: Expected {target_hdr}, got {file_hdr}", each)
-                    return True
-
-            if is_dvd and tracker_name != "BHD" and any(str(res) in each for res in [1080, 720, 2160]):
-                await log_exclusion(f"resolution '{target_resolution}' mismatch", each)
-                return False
-
-            for check in attribute_checks:
-                if check["key"] == "repack":
-                    if has_repack_in_uuid and "repack" not in normalized and tag and tag in normalized:
-                        await log_exclusion("missing 'repack'", each)
-                        return True
-                elif check["key"] == "remux":
-                    # Bidirectional check: if your upload is a REMUX, dupe must be REMUX
-                    # If your upload is NOT a REMUX (i.e., an encode), dupe must NOT be a REMUX
-                    uuid_has_remux = check["uuid_flag"]
-                    dupe_has_remux = check["condition"](normalized)
-
-                    if meta.get('debug'):
-                        console.log(f"[debug] Remux check: uuid_has_remux={uuid_has_remux}, dupe_has_remux={dupe_has_remux}")
-
-                    if uuid_has_remux and not dupe_has_remux:
-                        await log_exclusion("missing 'remux'", each)
-                        return True
-                    if not uuid_has_remux and dupe_has_remux:
-                        await log_exclusion("dupe is remux but upload is not", each)
-                        return True
-
-            if meta.get('category') == "TV":
-                season_episode_match, is_season = await DupeChecker.is_season_episode_match(normalized, target_season, target_episode)
-                if meta.get('debug'):
-                    console.log(f"[debug] Season/Episode match result: {season_episode_match}")
-                    console.log(f"[debug] is_season: {is_season}")
-                # Aither episode trumping logic
-                if is_season and tracker_name in ["AITHER", "LST"]:
-                    # Null-safe normalization for comparisons
-                    target_source_lower = (target_source or "").lower()
-                    type_id_lower = (type_id or "").lower()
-                    res_id_safe = res_id or ""
-                    target_resolution_safe = target_resolution or ""
-
-                    if type_id_lower and res_id_safe:
-                        if meta.get('debug'):
-                            console.log(
-                                f"[debug] Checking trumping: target_source='{target_source_lower}', type_id='{type_id_lower}', target_res='{target_resolution_safe}', res_id='{res_id_safe}'"
-                            )
-                        if target_source_lower in type_id_lower and target_resolution_safe == res_id_safe:
-                            if meta.get('debug'):
-                                console.log(f"[debug] Episode with matching source and resolution found for trumping: {each}")
-
-                            is_internal = False
-                            if entry.get('internal', 0) == 1:
-                                trackers_section: dict[str, Any] = cast(dict[str, Any], self.config.get('TRACKERS', {}))
-                                aither_settings: dict[str, Any] = trackers_section.get('AITHER', {})
-                                if aither_settings.get('internal') is True:
-                                    internal_groups = aither_settings.get('internal_groups', [])
-                                    if isinstance(internal_groups, list):
-                                        tag_without_prefix = tag[1:] if tag else ""
-                                        if tag_without_prefix in internal_groups and tag_without_prefix.lower() in normalized:
-                                            is_internal = True
-                                if not is_internal and meta.get('debug'):
-                                    console.log("[debug] Skipping internal episode for trumping since you're not the internal uploader.")
-
-                            if not entry.get('internal', False) or is_internal:
-                                # Store the matched episode ID/s for later use
-                                # is_season=True means seasons match, which is sufficient for trump targeting
-                                # (season pack can trump individual episodes from same season)
-                                matched_episode_ids = cast(list[dict[str, Any]], meta.setdefault(f'{tracker_name}_matched_episode_ids', []))
-
-                                entry_id = entry.get('id')
-                                entry_link = entry.get('link')
-
-                                # De-duplication guard: check if this entry already exists
-                                already_exists = (
-                                    any(
-                                        existing.get('id') == entry_id
-                                        or (existing.get('link') == entry_link and existing.get('tracker') == tracker_name)
-                                        for existing in matched_episode_ids
-                                    )
-                                    if entry_id or entry_link
-                                    else False
-                                )
-
-                                if entry_id and not already_exists:
-                                    matched_episode_ids.append({
-                                        'id': entry_id,
-                                        'name': each,
-                                        'link': entry_link,
-                                        'tracker': tracker_name,
-                                        'internal': entry.get('internal', 0),
-                                    })
-                                    if meta.get('debug'):
-                                        console.log(f"[debug] Added episode ID {entry_id} to matched list")
-                                    # Ensure this matched dupe is recorded for later use
-                                    remember_match('season_pack_contains_episode')
-                                    # Don't exclude this entry - it's a valid trump target
-                                    return False
-                                if already_exists and meta.get('debug'):
-                                    console.log(f"[debug] Skipping duplicate entry for episode ID {entry_id}")
-
-                # Normal season/episode matching
-                if not season_episode_match:
-                    await log_exclusion("season/episode mismatch", each)
-                    return True
-
-                # Check if uploading an episode but a matching season pack exists
-                if is_season and target_episode:
-                    # We're uploading an episode and found a matching season pack
-                    meta['season_pack_exists'] = True
-                    meta['season_pack_name'] = each
-                    meta['season_pack_link'] = entry.get('link')
-                    meta['season_pack_id'] = entry.get('id')
-                    if meta.get('debug'):
-                        console.log(f"[yellow]Season pack detected for episode upload: {each}")
-                        console.log(f"[yellow]Your episode {target_season}{target_episode} is contained in existing season pack")
-                    remember_match('season_pack_contains_episode')
-                    return False
-
-            if is_hdtv and any(web_term in normalized for web_term in ["web-dl", "web -dl", "webdl", "web dl"]):
-                return False
+        target = self.target_for(meta)
+        if meta.get('debug') and not target.has_is_disc:
+            console.log(f"dupe checking filenames: {target.filenames[:10]}{'...' if len(target.filenames) > 10 else ''}")
 
-            if (
-                len(dupes) == 1
-                and meta.get('is_disc') != "BDMV"
-                and tracker_name in ["AITHER", "BHD", "HUNO", "OE", "ULCX"]
-                and file_size is not None
-                and "1080" in target_resolution
-                and 'x264' in video_encode_lower
-            ):
-                target_size = file_size
-                dupe_size = coerce_int(sized)
-
-                if dupe_size is not None and dupe_size != 0:
-                    size_difference = (target_size - dupe_size) / dupe_size
-                    if meta.get('debug'):
-                        console.print(f"Your size: {target_size}, Dupe size: {dupe_size}, Size difference: {size_difference:.4f}")
-                    if size_difference >= 0.20:
-                        await log_exclusion(f"Your file is significantly larger ({size_difference * 100:.2f}%)", each)
-                        return True
-            if len(dupes) == 1 and meta.get('is_disc') != "BDMV" and tracker_name == "RF":
-                if tag.strip() and tag.strip() in normalized:
-                    return False
-                if tag.strip() and tag.strip() not in normalized:
-                    await log_exclusion(f"Tag '{tag}' not found in normalized name", each)
-                    return True
+        huno_name: Optional[str] = None
+        if tracker_name == "HUNO" and processed_dupes:
+            huno = tracker_class_map['HUNO'](config=self.config)
+            huno_name_result: Any = await huno.get_name(cast(dict[str, Any], meta))
+            huno_name_map = cast(dict[str, Any], huno_name_result)
+            huno_name = str(huno_name_map.get('name', huno_name_result)) if isinstance(huno_name_result, dict) else str(huno_name_result)
 
-            if meta.get('debug'):
-                console.log(f"[cyan]Release PASSED all checks: {each}")
-            return False
-
-        new_dupes = [each for each in processed_dupes if not await process_exclusion(each)]
+        plan = DupeRulePlan(target, meta, tracker_name, self.config, len(dupes), huno_name)
+        new_dupes = plan.filter(processed_dupes)
+        if meta.get('debug'):
+            console.log(f"[cyan]Dupe rules on {tracker_name}: {plan.summary()}")
 
         if new_dupes and not meta.get('unattended', False) and meta.get('debug'):
             if len(processed_dupes) > 1:
@@ -613,9 +779,7 @@ class DupeChecker:
             filename = str(filename.get('name', ''))
         if not isinstance(filename, str):
             raise ValueError(f"Expected a string or a dictionary with a 'name' key, but got: {type(filename)}")
-        normalized = filename.lower().replace("-", " -").replace(" ", " ").replace(".", " ")
-
-        return normalized
+        return _normalize(filename)
 
     @staticmethod
     async def is_season_episode_match(
@@ -626,38 +790,7 @@ class DupeChecker:
         """
         Check if the filename matches the given season and episode.
         """
-        season_match = re.search(r'[sS](\d+)', str(target_season))
-        target_season_value = int(season_match.group(1)) if season_match else None
-
-        if target_episode:
-            episode_matches = re.findall(r'\d+', str(target_episode))
-            target_episodes = [int(ep) for ep in episode_matches]
-        else:
-            target_episodes = []
-
-        season_pattern = rf"[sS]{target_season_value:02}" if target_season_value is not None else None
-        episode_patterns = [rf"[eE]{ep:02}" for ep in target_episodes] if target_episodes else []
-
-        # Determine if filename represents a season pack (no explicit episode pattern)
-        is_season_pack = not re.search(r"[eE]\d{2}", filename, re.IGNORECASE)
-
-        # If `target_episode` is empty, match only season packs
-        if not target_episodes:
-            season_matches = bool(season_pattern and re.search(season_pattern, filename, re.IGNORECASE))
-            return (season_matches and is_season_pack, season_matches)
-
-        # If `target_episode` is provided, match both season packs and episode files
-        if season_pattern:
-            if is_season_pack:
-                return (bool(re.search(season_pattern, filename, re.IGNORECASE)), True)  # Match season pack
-            if episode_patterns:
-                return (
-                    bool(re.search(season_pattern, filename, re.IGNORECASE))
-                    and any(re.search(ep, filename, re.IGNORECASE) for ep in episode_patterns),
-                    False,
-                )  # Match episode file
-
-        return (False, False)  # No match
+        return season_episode_matcher(target_season, target_episode)(filename)
 
     @staticmethod
     async def refine_hdr_terms(hdr: Optional[str]) -> set[str]:
@@ -665,41 +798,20 @@ class DupeChecker:
         Normalize HDR terms for consistent comparison.
         Simplifies all HDR entries to 'HDR' and DV entries to 'DV'.
         """
-        if hdr is None:
-            return set()
-        hdr_upper = str(hdr).upper()
-        terms: set[str] = set()
-        if "DV" in hdr_upper or "DOVI" in hdr_upper:
-            terms.add("DV")
-        if "HDR" in hdr_upper:  # Any HDR-related term is normalized to 'HDR'
-            terms.add("HDR")
-        return terms
+        return _hdr_terms(hdr)
 
     @staticmethod
     async def has_matching_hdr(file_hdr: set[str], target_hdr: set[str], meta: Meta, tracker: Optional[str] = None) -> bool:
         """
         Check if the HDR terms match or are compatible.
         """
-        def simplify_hdr(hdr_set: set[str], tracker_name: Optional[str] = None) -> set[str]:
-            """Simplify HDR terms to just HDR and DV."""
-            simplified: set[str] = set()
-            if any(h in hdr_set for h in {"HDR", "HDR10", "HDR10+"}):
-                simplified.add("HDR")
-            if any(h == "DV" or "DV" in h for h in hdr_set):
-                simplified.add("DV")
-                meta_type = str(meta.get('type', '')).lower()
-                if 'web' not in meta_type:
-                    simplified.add("HDR")
-                if tracker_name == "ANT":
-                    simplified.add("HDR")
-            return simplified
-
-        file_hdr_simple = simplify_hdr(file_hdr, tracker)
-        target_hdr_simple = simplify_hdr(target_hdr, tracker)
-
-        if file_hdr_simple in [{"DV", "HDR"}, {"HDR", "DV"}]:
+        meta_type = str(meta.get('type', '')).lower()
+        file_hdr_simple = _simplify_hdr(file_hdr, meta_type, tracker)
+        target_hdr_simple = _simplify_hdr(target_hdr, meta_type, tracker)
+
+        if file_hdr_simple == {"DV", "HDR"}:
             file_hdr_simple = {"HDR"}
-            if target_hdr_simple in [{"DV", "HDR"}, {"HDR", "DV"}]:
+            if target_hdr_simple == {"DV", "HDR"}:
                 target_hdr_simple = {"HDR"}
 
         return file_hdr_simple == target_hdr_simple
@@ -1,9 +1,12 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import contextlib
+import hashlib
 import json
 import os
 import platform
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any, Optional, Union, cast
 
@@ -12,6 +15,8 @@ from pymediainfo import MediaInfo
 
 from src.console import console
 
+_environment_lock = threading.Lock()
+
 
 def validate_file_path(file_path: str) -> str:
     if not file_path:
@@ -68,19 +73,159 @@ def setup_mediainfo_library(base_dir: str, debug: bool = False) -> Optional[dict
 
         if lib_available:
             # Set library directory for LD_LIBRARY_PATH
-            current_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-            if lib_dir not in current_ld_path:
-                if current_ld_path:
-                    os.environ["LD_LIBRARY_PATH"] = f"{lib_dir}:{current_ld_path}"
-                else:
-                    os.environ["LD_LIBRARY_PATH"] = lib_dir
-                if debug:
-                    console.print(f"[blue]Updated LD_LIBRARY_PATH to include: {lib_dir}[/blue]")
+            # Disc prep runs on worker threads; don't lose an update of the shared environment
+            with _environment_lock:
+                current_ld_path = os.environ.get("LD_LIBRARY_PATH", "")
+                updated = lib_dir not in current_ld_path
+                if updated:
+                    os.environ["LD_LIBRARY_PATH"] = f"{lib_dir}:{current_ld_path}" if current_ld_path else lib_dir
+            if updated and debug:
+                console.print(f"[blue]Updated LD_LIBRARY_PATH to include: {lib_dir}[/blue]")
 
         return {"cli": mediainfo_cli if cli_available else None, "lib": mediainfo_lib if lib_available else None, "lib_dir": lib_dir}
     return None
 
 
+MEDIAINFO_CACHE_MAX_ENTRIES = 500
+
+
+def parse_text_and_json(video: str, library_file: Optional[str] = None) -> tuple[str, str]:
+    """Open ``video`` once with libmediainfo and render both the text report and the JSON output.
+
+    Blocking, run it with ``asyncio.to_thread``.
+    """
+    try:
+        lib, handle, _, lib_version = cast(Any, MediaInfo)._get_library(library_file)
+    except Exception:
+        # Private pymediainfo API unavailable, parse twice through the public API instead
+        return (
+            cast(str, MediaInfo.parse(video, output="STRING", full=False, library_file=library_file)),
+            cast(str, MediaInfo.parse(video, output="JSON", full=True, library_file=library_file)),
+        )
+
+    try:
+        # The options MediaInfo.parse sets with its defaults, so the reports match what it returns
+        if lib_version >= (18, 3):
+            lib.MediaInfo_Option(handle, "Cover_Data", "")
+        lib.MediaInfo_Option(handle, "CharSet", "UTF-8")
+        lib.MediaInfo_Option(handle, "ParseSpeed", "0.5")
+        lib.MediaInfo_Option(handle, "LegacyStreamDisplay", "")
+        lib.MediaInfo_Option(handle, "Complete", "")
+        lib.MediaInfo_Option(handle, "Inform", "STRING")
+        if lib.MediaInfo_Open(handle, video) == 0:
+            if not os.path.exists(video):
+                raise FileNotFoundError(video)
+            raise RuntimeError(f"An error occured while opening {video} with libmediainfo")
+        text_report = cast(str, lib.MediaInfo_Inform(handle, 0))
+        lib.MediaInfo_Option(handle, "Complete", "1")
+        lib.MediaInfo_Option(handle, "Inform", "JSON")
+        json_report = cast(str, lib.MediaInfo_Inform(handle, 0))
+    finally:
+        lib.MediaInfo_Close(handle)
+        lib.MediaInfo_Delete(handle)
+    return text_report, json_report
+
+
+async def _run_mediainfo_cli(mediainfo_cmd: str, video: str, json_output: bool) -> str:
+    safe_video_path = validate_file_path(video)
+    safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
+    cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path] if json_output else [safe_mediainfo_cmd, safe_video_path]
+    result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0 or not result.stdout:
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+    if json_output:
+        # Make sure the output is usable before we trust it
+        json.loads(result.stdout)
+    return result.stdout
+
+
+async def _run_mediainfo(
+    video: str,
+    is_dvd: bool,
+    mediainfo_cmd: Optional[str],
+    mediainfo_config: Optional[dict[str, Any]],
+    debug: bool,
+) -> tuple[str, str]:
+    library_file = mediainfo_config.get("lib") if is_dvd and mediainfo_config else None
+
+    if is_dvd and library_file:
+        try:
+            return await asyncio.to_thread(parse_text_and_json, video, library_file)
+        except Exception as e:
+            if debug:
+                console.print(f"[yellow]Specialized MediaInfo library failed: {e}[/yellow]")
+
+    if is_dvd and mediainfo_cmd:
+        try:
+            text_report, json_report = await asyncio.gather(
+                _run_mediainfo_cli(mediainfo_cmd, video, json_output=False),
+                _run_mediainfo_cli(mediainfo_cmd, video, json_output=True),
+            )
+            return text_report, json_report
+        except subprocess.TimeoutExpired:
+            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
+        except ValueError as e:
+            console.print(f"[bold red]Path validation error: {e}[/bold red]")
+            console.print("[bold yellow]Falling back to standard MediaInfo...")
+        except Exception as e:
+            console.print(f"[bold red]Error getting output from specialized MediaInfo: {e}")
+            if debug and isinstance(e, subprocess.CalledProcessError):
+                console.print(f"[red]Subprocess stderr: {e.stderr}[/red]")
+                console.print(f"[red]Subprocess returncode: {e.returncode}[/red]")
+            console.print("[bold yellow]Falling back to standard MediaInfo...")
+
+    return await asyncio.to_thread(parse_text_and_json, video)
+
+
+def mediainfo_cache_key(video: str, is_dvd: bool) -> Optional[str]:
+    try:
+        stat = os.stat(video)
+    except OSError:
+        return None
+    key_source = json.dumps([os.path.abspath(video), stat.st_size, stat.st_mtime_ns, is_dvd])
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+def _mediainfo_cache_dir(base_dir: str) -> str:
+    return os.path.join(base_dir, "data", "cache", "mediainfo")
+
+
+def load_cached_mediainfo(base_dir: str, cache_key: str) -> Optional[tuple[str, str]]:
+    cache_file = os.path.join(_mediainfo_cache_dir(base_dir), f"{cache_key}.json")
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+        text_report, json_report = cached["text"], cached["json"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(text_report, str) or not isinstance(json_report, str):
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(cache_file)
+    return text_report, json_report
+
+
+def store_cached_mediainfo(base_dir: str, cache_key: str, text_report: str, json_report: str) -> None:
+    cache_dir = _mediainfo_cache_dir(base_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_file = os.path.join(cache_dir, f"{cache_key}.json")
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"text": text_report, "json": json_report}, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+
+        # Keep the most recently used entries only
+        entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".json")]
+        if len(entries) > MEDIAINFO_CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - MEDIAINFO_CACHE_MAX_ENTRIES]:
+                with contextlib.suppress(OSError):
+                    os.remove(entry.path)
+    except OSError:
+        pass
+
+
 async def mi_resolution(
     res: str,
     guess: dict[str, Any],
@@ -160,7 +305,6 @@ async def mi_resolution(
 
 async def exportInfo(
     video: str,
-    isdir: bool,
     folder_id: str,
     base_dir: str,
     is_dvd: bool = False,
@@ -379,13 +523,10 @@ async def exportInfo(
                 if mediainfo_config["cli"]:
                     mediainfo_cmd = mediainfo_config["cli"]
 
-                # Configure library if available (Linux only)
+                # Check the library if available (Linux only); it's passed to each parse, never set process-wide
                 if mediainfo_config["lib"]:
                     try:
-                        if hasattr(MediaInfo, "_library_file"):
-                            cast(Any, MediaInfo)._library_file = mediainfo_config["lib"]
-
-                        test_parse = MediaInfo.can_parse()
+                        test_parse = MediaInfo.can_parse(library_file=mediainfo_config["lib"])
                         if debug:
                             console.print(f"[green]Configured specialized MediaInfo library (can_parse: {test_parse})[/green]")
 
@@ -407,107 +548,36 @@ async def exportInfo(
 
     if debug:
         console.print("[bold yellow]Exporting MediaInfo...")
-    if not isdir:
-        os.chdir(os.path.dirname(video))
 
-    if mediainfo_cmd and is_dvd:
-        result = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info = result.stdout
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
-        except (subprocess.CalledProcessError, Exception) as e:
-            console.print(f"[bold red]Error getting text from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for text...")
-            media_info = MediaInfo.parse(video, output="STRING", full=False)
+    cache_key = mediainfo_cache_key(video, is_dvd)
+    cached = await asyncio.to_thread(load_cached_mediainfo, base_dir, cache_key) if cache_key else None
+    if cached is not None:
+        if debug:
+            console.print("[green]Using cached MediaInfo for unchanged file[/green]")
+        media_info, media_info_json = cached
     else:
-        media_info = MediaInfo.parse(video, output="STRING", full=False)
+        media_info, media_info_json = await _run_mediainfo(video, is_dvd, mediainfo_cmd, mediainfo_config, debug)
+        if cache_key:
+            await asyncio.to_thread(store_cached_mediainfo, base_dir, cache_key, media_info, media_info_json)
 
     # Filter out unwanted lines from media info regardless of type
     filtered_media_info = "\n".join(line for line in media_info.splitlines() if not line.strip().startswith("ReportBy") and not line.strip().startswith("Report created by "))
+    clean_media_info = filtered_media_info.replace(video, os.path.basename(video))
 
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO.txt", "w", newline="", encoding="utf-8") as export:
-        await export.write(filtered_media_info.replace(video, os.path.basename(video)))
+        await export.write(clean_media_info)
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MEDIAINFO_CLEANPATH.txt", "w", newline="", encoding="utf-8") as export_cleanpath:
-        await export_cleanpath.write(filtered_media_info.replace(video, os.path.basename(video)))
+        await export_cleanpath.write(clean_media_info)
     if debug:
         console.print("[bold green]MediaInfo Exported.")
 
-    if mediainfo_cmd and is_dvd:
-        result: Optional[subprocess.CompletedProcess[str]] = None
-        try:
-            # Validate and sanitize the video path
-            safe_video_path = validate_file_path(video)
-            safe_mediainfo_cmd = validate_file_path(mediainfo_cmd)
-            cmd = [safe_mediainfo_cmd, "--Output=JSON", safe_video_path]
-            result = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0 and result.stdout:
-                media_info_json = result.stdout
-                media_info_dict = json.loads(media_info_json)
-            else:
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-        except ValueError as e:
-            console.print(f"[bold red]Path validation error: {e}[/bold red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except subprocess.TimeoutExpired:
-            console.print("[bold red]Specialized MediaInfo timed out (30s) - falling back to standard MediaInfo[/bold red]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-        except (subprocess.CalledProcessError, json.JSONDecodeError, Exception) as e:
-            console.print(f"[bold red]Error getting JSON from specialized MediaInfo: {e}")
-            if debug and result is not None:
-                console.print(f"[red]Subprocess stderr: {result.stderr}[/red]")
-                console.print(f"[red]Subprocess returncode: {result.returncode}[/red]")
-                if result.stdout:
-                    console.print(f"[red]Subprocess stdout preview: {result.stdout[:200]}...[/red]")
-            console.print("[bold yellow]Falling back to standard MediaInfo for JSON...[/bold yellow]")
-            media_info_json = MediaInfo.parse(video, output="JSON")
-            media_info_dict = json.loads(media_info_json)
-    else:
-        # Use standard MediaInfo library for non-DVD or when specialized CLI not available
-        media_info_json = MediaInfo.parse(video, output="JSON")
-        media_info_dict = json.loads(media_info_json)
-
-    filtered_info = filter_mediainfo(media_info_dict)
+    mi = filter_mediainfo(cast(dict[str, Any], json.loads(media_info_json)))
 
     async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", "w", encoding="utf-8") as export:
-        await export.write(json.dumps(filtered_info, indent=4))
+        await export.write(json.dumps(mi, indent=4))
         if debug:
             console.print(f"[green]JSON file written to: {base_dir}/tmp/{folder_id}/MediaInfo.json[/green]")
 
-    async with aiofiles.open(f"{base_dir}/tmp/{folder_id}/MediaInfo.json", encoding="utf-8") as f:
-        mi = cast(dict[str, Any], json.loads(await f.read()))
-
-    # Cleanup: Reset library configuration if we modified it
-    if is_dvd and platform.system().lower() in ["linux", "windows"]:
-        # Reset MediaInfo library file to default (Linux only)
-        if hasattr(MediaInfo, "_library_file"):
-            cast(Any, MediaInfo)._library_file = None
-        if debug:
-            console.print("[blue]Reset MediaInfo library configuration[/blue]")
-
     return mi
 
 
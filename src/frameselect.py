@@ -0,0 +1,212 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Content-aware screenshot times.
+
+Evenly spaced screenshot times regularly land on black frames, fades and title cards, which
+the size checks in ``screenshots`` then retake with further full-resolution captures.
+``select_frames`` instead samples a handful of candidate keyframes around each evenly spaced
+slot as tiny grey thumbnails (only keyframes are decoded, scaled to 64x36) and scores them
+in bulk: mean brightness (near-black or blown-out frames lose), histogram entropy (flat
+frames lose) and the difference to the next keyframe (a large jump means a scene cut right
+after the frame). The best candidate of each slot is captured at its exact keyframe time.
+
+Candidates are reached by seeking, so a 60 GB remux is not read end to end, and are batched:
+each ffmpeg process opens the file once per candidate it samples (``-ss`` plus a short ``-t``
+window), trims every input to two keyframes and concatenates the thumbnails into one rawvideo
+pipe, so only ``limit`` processes are started. NumPy is used for the scoring when it is
+installed; the pure Python fallback gives the same scores.
+"""
+import asyncio
+import math
+import re
+from collections import Counter
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, cast
+
+import ffmpeg
+
+from src.console import console
+
+try:
+    import numpy as np  # pyright: ignore[reportMissingImports]
+except ImportError:
+    np = None
+
+THUMB_WIDTH = 64
+THUMB_HEIGHT = 36
+THUMB_SIZE = THUMB_WIDTH * THUMB_HEIGHT
+# Candidates sampled per screenshot, and overall
+CANDIDATES_PER_SCREEN = 6
+MAX_CANDIDATES = 72
+# Seconds read after each candidate time, at most; the keyframes have to be within it
+KEYFRAME_WINDOW = 10.0
+# Frames darker/brighter than this (mean, 0-1) or flatter than this (bits) are never picked
+MIN_BRIGHTNESS = 0.06
+MAX_BRIGHTNESS = 0.94
+MIN_ENTROPY = 3.0
+
+# showinfo of input N is named ``showinfo@cN``, so its frames can be told apart in the log
+_SHOWINFO_RE = re.compile(r'@c(\d+) @ [^\]]*\][^\n]*?\bpts_time:\s*(-?[\d.]+)')
+
+FfmpegRunner = Callable[[Any], Awaitable[tuple[Optional[int], bytes, bytes]]]
+
+
+def _score_frames_numpy(first: bytes, second: bytes, count: int) -> list[float]:
+    assert np is not None  # nosec B101 - only called when NumPy is available
+    frames = np.frombuffer(first, dtype=np.uint8).reshape(count, THUMB_SIZE).astype(np.int32)
+    following = np.frombuffer(second, dtype=np.uint8).reshape(count, THUMB_SIZE).astype(np.int32)
+
+    brightness = frames.mean(axis=1) / 255.0
+    # Per-frame 256 bin histograms in one bincount by offsetting each frame's values
+    offsets = (np.arange(count, dtype=np.int32) * 256)[:, None]
+    histograms = np.bincount((frames + offsets).ravel(), minlength=count * 256).reshape(count, 256) / THUMB_SIZE
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropy = -np.nansum(np.where(histograms > 0, histograms * np.log2(histograms), 0.0), axis=1)
+    cut = np.abs(following - frames).mean(axis=1) / 255.0
+    return [_combine(float(b), float(e), float(c)) for b, e, c in zip(brightness, entropy, cut)]
+
+
+def _score_frames_python(first: bytes, second: bytes, count: int) -> list[float]:
+    scores: list[float] = []
+    for index in range(count):
+        frame = first[index * THUMB_SIZE:(index + 1) * THUMB_SIZE]
+        following = second[index * THUMB_SIZE:(index + 1) * THUMB_SIZE]
+        brightness = sum(frame) / (THUMB_SIZE * 255.0)
+        entropy = -sum((n / THUMB_SIZE) * math.log2(n / THUMB_SIZE) for n in Counter(frame).values())
+        cut = sum(abs(a - b) for a, b in zip(frame, following)) / (THUMB_SIZE * 255.0)
+        scores.append(_combine(brightness, entropy, cut))
+    return scores
+
+
+def _combine(brightness: float, entropy: float, cut: float) -> float:
+    """Weighted score in 0..1; -1 for frames that should never be picked."""
+    if brightness < MIN_BRIGHTNESS or brightness > MAX_BRIGHTNESS or entropy < MIN_ENTROPY:
+        return -1.0
+    exposure = max(0.0, 1.0 - abs(brightness - 0.45) / 0.45)
+    return 0.6 * (entropy / 8.0) + 0.3 * exposure + 0.1 * (1.0 - min(1.0, cut * 4.0))
+
+
+def score_frames(first: bytes, second: bytes, count: int) -> list[float]:
+    """Scores of ``count`` grey thumbnails in ``first``; ``second`` holds the keyframe after each."""
+    if np is not None:
+        return _score_frames_numpy(first, second, count)
+    return _score_frames_python(first, second, count)
+
+
+def _batch_command(path: str, times: list[float], window: float) -> Any:
+    """One ffmpeg command sampling the first two keyframes at/after each of ``times``."""
+    ffmpeg_module = cast(Any, ffmpeg)
+    streams = [
+        ffmpeg_module.input(path, ss=ss_time, t=window, skip_frame='nokey')['v:0']
+        .filter('scale', THUMB_WIDTH, THUMB_HEIGHT)
+        .filter('format', 'gray')
+        .filter('trim', end_frame=2)
+        .filter(f'showinfo@c{index}')
+        for index, ss_time in enumerate(times)
+    ]
+    return (
+        ffmpeg_module.concat(*streams, v=1, a=0)
+        .output('pipe:', format='rawvideo', vsync='passthrough')
+        .global_args('-nostdin', '-loglevel', 'info')
+    )
+
+
+def _parse_batch(times: list[float], stdout: bytes, stderr: bytes) -> list[Optional[tuple[float, bytes, bytes]]]:
+    """Exact time and thumbnails of the first keyframe at/after each of ``times`` and of the keyframe after it."""
+    pts_times: list[list[float]] = [[] for _ in times]
+    for match in _SHOWINFO_RE.finditer(stderr.decode('utf-8', errors='replace')):
+        index = int(match.group(1))
+        if index < len(times):
+            pts_times[index].append(float(match.group(2)))
+    # The thumbnails are concatenated in input order
+    if sum(len(found) for found in pts_times) * THUMB_SIZE != len(stdout):
+        return [None] * len(times)
+
+    samples: list[Optional[tuple[float, bytes, bytes]]] = []
+    offset = 0
+    for ss_time, found in zip(times, pts_times):
+        if not found:
+            samples.append(None)
+            continue
+        first = stdout[offset:offset + THUMB_SIZE]
+        second = stdout[offset + THUMB_SIZE:offset + 2 * THUMB_SIZE] if len(found) > 1 else first
+        samples.append((ss_time + max(0.0, found[0]), first, second))
+        offset += len(found) * THUMB_SIZE
+    return samples
+
+
+async def _sample_batch(path: str, times: list[float], window: float, run_ffmpeg: FfmpegRunner) -> list[Optional[tuple[float, bytes, bytes]]]:
+    returncode, stdout, stderr = await run_ffmpeg(_batch_command(path, times, window))
+    if returncode != 0:
+        return [None] * len(times)
+    return _parse_batch(times, stdout, stderr)
+
+
+async def select_frames(
+    path: str,
+    num_screens: int,
+    length: float,
+    meta: dict[str, Any],
+    run_ffmpeg: FfmpegRunner,
+    limit: int = 1,
+) -> Optional[list[str]]:
+    """Screenshot times (seconds, as strings) picked by content, one per evenly spaced slot; None on failure."""
+    if num_screens <= 0 or length <= 0:
+        return None
+    start, end = length * 0.05, length * 0.9
+    slot_length = (end - start) / num_screens
+    per_slot = max(1, min(CANDIDATES_PER_SCREEN, MAX_CANDIDATES // num_screens))
+    candidates: list[tuple[int, float]] = [
+        (slot, start + slot * slot_length + slot_length * (n + 0.5) / per_slot)
+        for slot in range(num_screens)
+        for n in range(per_slot)
+    ]
+
+    # Neighbouring candidates share a process, so each one only seeks forward
+    window = min(KEYFRAME_WINDOW, slot_length)
+    batch_count = max(1, min(limit, len(candidates)))
+    batch_size = math.ceil(len(candidates) / batch_count)
+    batches = [[ss_time for _slot, ss_time in candidates[i:i + batch_size]] for i in range(0, len(candidates), batch_size)]
+
+    async def sample(times: list[float]) -> list[Optional[tuple[float, bytes, bytes]]]:
+        try:
+            return await _sample_batch(path, times, window, run_ffmpeg)
+        except Exception as e:
+            if meta.get('debug'):
+                console.print(f"[yellow]Frame selection: sampling {times[0]:.2f}s-{times[-1]:.2f}s failed: {e}")
+            return [None] * len(times)
+
+    samples = [result for batch in await asyncio.gather(*[sample(times) for times in batches]) for result in batch]
+    found: list[tuple[int, float]] = []
+    first_frames: list[bytes] = []
+    second_frames: list[bytes] = []
+    for (slot, _ss_time), result in zip(candidates, samples):
+        # Keyframes past the slot (long GOPs) belong to the next slot's candidates
+        if result is None or result[0] >= start + (slot + 1) * slot_length:
+            continue
+        found.append((slot, result[0]))
+        first_frames.append(result[1])
+        second_frames.append(result[2])
+    if not found:
+        return None
+
+    scores = score_frames(b''.join(first_frames), b''.join(second_frames), len(found))
+    best: dict[int, tuple[float, float]] = {}
+    for (slot, frame_time), score in zip(found, scores):
+        if score >= 0 and (slot not in best or score > best[slot][0]):
+            best[slot] = (score, frame_time)
+
+    times: list[str] = []
+    for slot in range(num_screens):
+        if slot in best:
+            times.append(str(best[slot][1]))
+        else:
+            # Nothing usable in this slot; fall back to its evenly spaced time
+            times.append(str(start + slot * slot_length))
+    if meta.get('debug'):
+        console.print(f"[cyan]Frame selection: {len(found)}/{len(candidates)} keyframes sampled, {len(best)}/{num_screens} slots picked by content")
+        for slot in range(num_screens):
+            if slot in best:
+                console.print(f"[cyan]  slot {slot}: {float(times[slot]):.2f}s (score {best[slot][0]:.3f})")
+    return times
+
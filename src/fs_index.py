@@ -0,0 +1,378 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent file name index for the web UI browse search and the Discord search commands.
+
+Walking every browse root on each query is slow on large libraries (spinning disks, NFS).
+``FileIndex`` keeps a per-root snapshot of every directory listing together with the
+directory's mtime, persisted under ``data/cache/fs_index``. Refreshing only re-lists the
+directories whose mtime changed, everything else costs a single ``stat``. Refreshes run in
+a background thread once the snapshot is older than ``search_index_refresh_interval``, so
+queries are answered from memory. When ``watchdog`` is installed and ``search_index_watch``
+is enabled, filesystem events schedule a refresh immediately. ``prime`` loads or builds the
+index of a set of roots in the background, so a server can have it ready before the first query.
+
+Names are tokenized on whitespace, dots, dashes and underscores and kept in an inverted
+index, so whole-word ordered-token queries only look at entries holding the rarest token.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any, Callable, NamedTuple, Optional, cast
+
+from src.console import console
+
+INDEX_VERSION = 1
+DEFAULT_REFRESH_INTERVAL = 60.0
+
+# Splits file names on common separators (dots, dashes, underscores, spaces)
+TOKEN_SEP_RE = re.compile(r'[\s.\-_]+')
+
+
+def tokenize(name: str) -> tuple[str, ...]:
+    return tuple(t for t in TOKEN_SEP_RE.split(name.lower()) if t)
+
+
+def tokens_in_order(query_tokens: Iterable[str], name_tokens: tuple[str, ...]) -> bool:
+    """Check if query tokens appear as a whole-word ordered subsequence of the name tokens."""
+    remaining = iter(name_tokens)
+    return all(qt in remaining for qt in query_tokens)
+
+
+class IndexEntry(NamedTuple):
+    name: str
+    path: str
+    is_dir: bool
+    # True when the entry or one of its parents below the root starts with a dot
+    hidden: bool
+
+
+class _DirRecord(NamedTuple):
+    mtime_ns: int
+    dirs: list[str]
+    files: list[str]
+    # Subdirectories that are symlinks; listed like os.walk does, but not descended into
+    links: list[str]
+
+
+class _RootIndex:
+    def __init__(self, root: str, dirs: dict[str, _DirRecord], scanned_at: float) -> None:
+        self.root = root
+        self.dirs = dirs
+        self.scanned_at = scanned_at
+        self.entries: list[IndexEntry] = []
+        self.lower_names: list[str] = []
+        self.tokens: list[tuple[str, ...]] = []
+        self.postings: dict[str, list[int]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        hidden_dirs: set[str] = set()
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            record = self.dirs.get(path)
+            if record is None:
+                continue
+            parent_hidden = path in hidden_dirs
+            for name in record.dirs:
+                child = os.path.join(path, name)
+                hidden = parent_hidden or name.startswith('.')
+                if hidden:
+                    hidden_dirs.add(child)
+                self._add(IndexEntry(name, child, True, hidden))
+                if name not in record.links:
+                    stack.append(child)
+            for name in record.files:
+                self._add(IndexEntry(name, os.path.join(path, name), False, parent_hidden or name.startswith('.')))
+
+    def _add(self, entry: IndexEntry) -> None:
+        entry_id = len(self.entries)
+        tokens = tokenize(entry.name)
+        self.entries.append(entry)
+        self.lower_names.append(entry.name.lower())
+        self.tokens.append(tokens)
+        for token in set(tokens):
+            self.postings.setdefault(token, []).append(entry_id)
+
+
+class FileIndex:
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.cache_dir = cache_dir or os.path.join(base_dir, 'data', 'cache', 'fs_index')
+        self.refresh_interval = DEFAULT_REFRESH_INTERVAL
+        self.watch = False
+        self._roots: dict[str, _RootIndex] = {}
+        self._refreshing: set[str] = set()
+        self._building: set[str] = set()
+        self._dirty: set[str] = set()
+        self._observers: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        with contextlib.suppress(TypeError, ValueError):
+            self.refresh_interval = max(0.0, float(default_cfg.get('search_index_refresh_interval', DEFAULT_REFRESH_INTERVAL)))
+        self.watch = bool(default_cfg.get('search_index_watch', False))
+
+    # Queries
+
+    def match_tokens(
+        self,
+        roots: Iterable[str],
+        query: str,
+        include_hidden: bool = False,
+        accept: Optional[Callable[[IndexEntry], bool]] = None,
+        limit: Optional[int] = None,
+        block: bool = True,
+    ) -> list[IndexEntry]:
+        """Entries whose name contains the query tokens as whole words, in order.
+
+        Without ``block``, a root that has never been indexed is built in the background and
+        skipped (see ``ready``) instead of being scanned before returning.
+        """
+        query_tokens = tokenize(query)
+        results: list[IndexEntry] = []
+        if not query_tokens:
+            return results
+        for root in roots:
+            index = self._get_root(root, block)
+            if index is None:
+                continue
+            postings = [index.postings.get(token) for token in set(query_tokens)]
+            if not all(postings):
+                continue
+            candidates = min(cast(list[list[int]], postings), key=len)
+            for entry_id in candidates:
+                entry = index.entries[entry_id]
+                if entry.hidden and not include_hidden:
+                    continue
+                if not tokens_in_order(query_tokens, index.tokens[entry_id]):
+                    continue
+                if accept is not None and not accept(entry):
+                    continue
+                results.append(entry)
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+    def match_substrings(
+        self,
+        roots: Iterable[str],
+        words: list[str],
+        is_dir: bool,
+        include_hidden: bool = True,
+        accept: Optional[Callable[[IndexEntry], bool]] = None,
+    ) -> list[IndexEntry]:
+        """Entries whose lower-cased name contains every word anywhere (Discord search semantics)."""
+        words = [word.lower() for word in words]
+        results: list[IndexEntry] = []
+        for root in roots:
+            index = self._get_root(root)
+            if index is None:
+                continue
+            for entry_id, lower_name in enumerate(index.lower_names):
+                if not all(word in lower_name for word in words):
+                    continue
+                entry = index.entries[entry_id]
+                if entry.is_dir != is_dir or (entry.hidden and not include_hidden):
+                    continue
+                if accept is not None and not accept(entry):
+                    continue
+                results.append(entry)
+        return results
+
+    def ready(self, roots: Iterable[str]) -> bool:
+        """Whether every existing root of ``roots`` is loaded and can be queried without a scan."""
+        with self._lock:
+            loaded = set(self._roots)
+        return all(os.path.abspath(root) in loaded or not os.path.isdir(root) for root in roots)
+
+    # Index maintenance
+
+    def prime(self, roots: Iterable[str]) -> None:
+        """Load or build the index of ``roots`` in a background thread."""
+        pending = [os.path.abspath(root) for root in roots]
+
+        def worker() -> None:
+            for root in pending:
+                try:
+                    self._get_root(root)
+                except Exception as e:  # noqa: PERF203 - one failing root must not stop the others
+                    console.print(f"[yellow]File index build failed for {root}: {e}[/yellow]")
+
+        threading.Thread(target=worker, name="fs-index-prime", daemon=True).start()
+
+    def _get_root(self, root: str, block: bool = True) -> Optional[_RootIndex]:
+        root = os.path.abspath(root)
+        with self._lock:
+            index = self._roots.get(root)
+            building = root in self._building
+        if index is None:
+            if building and not block:
+                return None
+            if not os.path.isdir(root):
+                return None
+            index = self._load(root)
+            if index is None:
+                if not block:
+                    self.prime([root])
+                    return None
+                # First query for this root ever: nothing to serve yet, so build synchronously
+                with self._lock:
+                    self._building.add(root)
+                try:
+                    index = self.refresh(root)
+                finally:
+                    with self._lock:
+                        self._building.discard(root)
+            else:
+                with self._lock:
+                    self._roots[root] = index
+                self._refresh_in_background(root)
+            self._start_watch(root)
+        elif root in self._dirty or time.time() - index.scanned_at >= self.refresh_interval:
+            self._refresh_in_background(root)
+        return index
+
+    def refresh(self, root: str) -> _RootIndex:
+        """Rescan ``root`` (only directories whose mtime changed are re-listed) and persist it."""
+        root = os.path.abspath(root)
+        with self._lock:
+            previous = self._roots.get(root)
+            self._dirty.discard(root)
+        old_dirs = previous.dirs if previous is not None else {}
+        started = time.time()
+        index = _RootIndex(root, self._scan(root, old_dirs), started)
+        with self._lock:
+            self._roots[root] = index
+        self._save(index)
+        return index
+
+    def _refresh_in_background(self, root: str) -> None:
+        with self._lock:
+            if root in self._refreshing:
+                return
+            self._refreshing.add(root)
+
+        def worker() -> None:
+            try:
+                self.refresh(root)
+            except Exception as e:
+                console.print(f"[yellow]File index refresh failed for {root}: {e}[/yellow]")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(root)
+
+        threading.Thread(target=worker, name="fs-index-refresh", daemon=True).start()
+
+    @staticmethod
+    def _scan(root: str, old_dirs: dict[str, _DirRecord]) -> dict[str, _DirRecord]:
+        dirs: dict[str, _DirRecord] = {}
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            record = old_dirs.get(path)
+            if record is None or record.mtime_ns != mtime_ns:
+                subdirs: list[str] = []
+                files: list[str] = []
+                links: list[str] = []
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            try:
+                                is_dir = entry.is_dir()
+                            except OSError:
+                                is_dir = False
+                            if is_dir:
+                                subdirs.append(entry.name)
+                                with contextlib.suppress(OSError):
+                                    if entry.is_symlink():
+                                        links.append(entry.name)
+                            else:
+                                files.append(entry.name)
+                except OSError:
+                    continue
+                record = _DirRecord(mtime_ns, sorted(subdirs), sorted(files), links)
+            dirs[path] = record
+            stack.extend(os.path.join(path, name) for name in reversed(record.dirs) if name not in record.links)
+        return dirs
+
+    # Persistence
+
+    def _snapshot_path(self, root: str) -> str:
+        digest = hashlib.sha1(root.encode('utf-8'), usedforsecurity=False).hexdigest()  # nosec B324
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load(self, root: str) -> Optional[_RootIndex]:
+        try:
+            with open(self._snapshot_path(root), encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != INDEX_VERSION or data.get('root') != root:
+                return None
+            dirs = {path: _DirRecord(int(rec[0]), rec[1], rec[2], rec[3]) for path, rec in data['dirs'].items()}
+            return _RootIndex(root, dirs, float(data.get('scanned_at', 0)))
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            return None
+
+    def _save(self, index: _RootIndex) -> None:
+        path = self._snapshot_path(index.root)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data = {
+            'version': INDEX_VERSION,
+            'root': index.root,
+            'scanned_at': index.scanned_at,
+            'dirs': {p: [rec.mtime_ns, rec.dirs, rec.files, rec.links] for p, rec in index.dirs.items()},
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save file index for {index.root}: {e}[/yellow]")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    # Optional filesystem watching
+
+    def _start_watch(self, root: str) -> None:
+        if not self.watch:
+            return
+        with self._lock:
+            if root in self._observers:
+                return
+            self._observers[root] = None
+        try:
+            from watchdog.events import FileSystemEventHandler  # pyright: ignore[reportMissingImports]
+            from watchdog.observers import Observer  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            console.print("[yellow]search_index_watch is enabled but watchdog is not installed, using periodic refresh only")
+            return
+
+        file_index = self
+
+        class _Handler(FileSystemEventHandler):  # type: ignore[misc,valid-type]
+            def on_any_event(self, event: Any) -> None:
+                if getattr(event, 'event_type', '') in ('opened', 'closed', 'closed_no_write'):
+                    return
+                with file_index._lock:
+                    file_index._dirty.add(root)
+
+        observer = Observer()
+        observer.schedule(_Handler(), root, recursive=True)
+        observer.daemon = True
+        observer.start()
+        with self._lock:
+            self._observers[root] = observer
+
+
+fs_index = FileIndex()
@@ -15,7 +15,9 @@ from pymediainfo import MediaInfo
 
 from src.bbcode import BBCODE
 from src.console import console
+from src.http_pool import http_pool
 from src.languages import languages_manager
+from src.metastore import meta_store
 from src.takescreens import TakeScreensManager
 from src.trackers.COMMON import COMMON
 from src.uploadscreens import UploadScreensManager
@@ -148,7 +150,7 @@ async def gen_desc(
                 path=f"{split[0]}/raw/{split[1]}" if split[0] != "/" else f"/raw{parsed.path}"
             )
             raw_url = urllib.parse.urlunparse(raw)
-            async with httpx.AsyncClient(timeout=20.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=20.0) as client:
                 response = await client.get(raw_url)
             description_link_content = response.text
             cleaned_content = clean_text(description_link_content)
@@ -891,9 +893,7 @@ class DescriptionBuilder:
                                     desc_parts.append(image_str)
                                 desc_parts.append("[/center]\n\n")
 
-                            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                            async with aiofiles.open(meta_filename, "w") as f:
-                                await f.write(json.dumps(meta, indent=4))
+                            await meta_store.save(meta)
 
         # Handle multiple discs case
         elif len(discs) > 1:
@@ -1091,9 +1091,7 @@ class DescriptionBuilder:
                                 desc_parts.append("[/center]\n\n")
 
                             # Save the updated meta to `meta.json` after upload
-                            meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-                            async with aiofiles.open(meta_filename, "w") as f:
-                                await f.write(json.dumps(meta, indent=4))
+                            await meta_store.save(meta)
                         console.print()
 
         # Handle single file case
@@ -1244,9 +1242,7 @@ class DescriptionBuilder:
                 await asyncio.sleep(0.05)
 
         # Save updated meta
-        meta_filename = f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json"
-        async with aiofiles.open(meta_filename, "w") as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
         await asyncio.sleep(0.1)
 
         # Second Pass: Process MediaInfo and Write Descriptions
@@ -0,0 +1,234 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Process-wide pooled HTTP connections for trackers, image hosts and metadata providers.
+
+Call sites keep creating short-lived ``httpx.AsyncClient`` objects with their own
+headers, cookies and timeouts, but pass ``transport=http_pool.transport()`` so every
+client shares one keep-alive connection pool per event loop. Requests are limited per
+host, with optional per-host timeout overrides from the config.
+
+``http_pool.observe(callback)`` reports the status and headers of every response received in
+the current context (and tasks created from it), e.g. for the image upload limiter.
+
+An explicit transport keeps httpx from reading ``HTTP_PROXY``/``HTTPS_PROXY``/``ALL_PROXY``,
+so the pools do it themselves: requests go through a proxied pool per scheme unless
+``NO_PROXY`` matches the host.
+"""
+import asyncio
+import contextlib
+import contextvars
+import urllib.request
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Callable, Optional, cast
+
+import aiohttp
+import httpx
+
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+ResponseObserver = Callable[[httpx.Response], None]
+_response_observer: contextvars.ContextVar[Optional[ResponseObserver]] = contextvars.ContextVar('http_pool_response_observer', default=None)
+
+
+def _environment_proxies() -> dict[str, str]:
+    """Proxy URL per request scheme from the environment, as httpx clients without a transport use them."""
+    proxies = urllib.request.getproxies_environment()
+    found: dict[str, str] = {}
+    for scheme in ('http', 'https'):
+        url = proxies.get(scheme) or proxies.get('all')
+        if url:
+            # A proxy given without a scheme is a plain HTTP proxy
+            found[scheme] = url if '://' in url else f"http://{url}"
+    return found
+
+
+class _LoopPools:
+    """Connection pools and host semaphores bound to a single event loop."""
+
+    def __init__(self, max_connections: int, max_per_host: int, keepalive_expiry: float) -> None:
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.transport = httpx.AsyncHTTPTransport(limits=limits)
+        self.proxy_transports = {
+            scheme: httpx.AsyncHTTPTransport(limits=limits, proxy=proxy)
+            for scheme, proxy in _environment_proxies().items()
+        }
+        self.max_per_host = max_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+        self.connector: Optional[aiohttp.TCPConnector] = None
+
+    def semaphore(self, host: str, limit: int) -> asyncio.Semaphore:
+        semaphore = self.semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self.semaphores[host] = semaphore
+        return semaphore
+
+    def transport_for(self, url: httpx.URL) -> httpx.AsyncHTTPTransport:
+        proxied = self.proxy_transports.get(url.scheme)
+        if proxied is None or urllib.request.proxy_bypass_environment(url.host):
+            return self.transport
+        return proxied
+
+    def aiohttp_connector(self) -> aiohttp.TCPConnector:
+        if self.connector is None or self.connector.closed:
+            self.connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.max_per_host,
+                keepalive_timeout=self.keepalive_expiry,
+            )
+        return self.connector
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+        for transport in self.proxy_transports.values():
+            await transport.aclose()
+        if self.connector is not None and not self.connector.closed:
+            await self.connector.close()
+
+
+class HttpPool:
+    def __init__(self) -> None:
+        self.max_per_host = DEFAULT_MAX_PER_HOST
+        self.max_connections = DEFAULT_MAX_CONNECTIONS
+        self.keepalive_expiry = DEFAULT_KEEPALIVE_EXPIRY
+        # host -> {'limit': int, 'timeout': float}
+        self.host_settings: dict[str, dict[str, Any]] = {}
+        self._pools: dict[int, tuple[asyncio.AbstractEventLoop, _LoopPools]] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        with contextlib.suppress(TypeError, ValueError):
+            self.max_per_host = max(1, int(default_cfg.get('http_max_per_host', DEFAULT_MAX_PER_HOST)))
+        with contextlib.suppress(TypeError, ValueError):
+            self.keepalive_expiry = float(default_cfg.get('http_keepalive_expiry', DEFAULT_KEEPALIVE_EXPIRY))
+        host_limits = default_cfg.get('http_host_limits', {})
+        if isinstance(host_limits, dict):
+            self.host_settings = {
+                str(host).lower(): cast(dict[str, Any], settings)
+                for host, settings in cast(dict[Any, Any], host_limits).items()
+                if isinstance(settings, dict)
+            }
+
+    def _loop_pools(self) -> _LoopPools:
+        loop = asyncio.get_running_loop()
+        entry = self._pools.get(id(loop))
+        if entry is None or entry[0] is not loop:
+            # Drop pools that belonged to loops which have since been closed
+            for key, (other_loop, _) in list(self._pools.items()):
+                if other_loop.is_closed():
+                    del self._pools[key]
+            entry = (loop, _LoopPools(self.max_connections, self.max_per_host, self.keepalive_expiry))
+            self._pools[id(loop)] = entry
+        return entry[1]
+
+    def _host_limit(self, host: str) -> int:
+        settings = self.host_settings.get(host.lower(), {})
+        try:
+            return max(1, int(settings.get('limit', self.max_per_host)))
+        except (TypeError, ValueError):
+            return self.max_per_host
+
+    def _host_timeout(self, host: str) -> Optional[float]:
+        settings = self.host_settings.get(host.lower(), {})
+        try:
+            return float(settings['timeout']) if 'timeout' in settings else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    @contextlib.contextmanager
+    def observe(callback: ResponseObserver) -> Iterator[None]:
+        """Call ``callback(response)`` for responses received in this context, before their body is read."""
+        token = _response_observer.set(callback)
+        try:
+            yield
+        finally:
+            _response_observer.reset(token)
+
+    def transport(self) -> "SharedTransport":
+        """Transport for ``httpx.AsyncClient(transport=...)``; closing the client leaves the pool open."""
+        return SharedTransport(self)
+
+    def aiohttp_connector(self) -> aiohttp.TCPConnector:
+        """Shared connector for ``aiohttp.ClientSession(connector=..., connector_owner=False)``."""
+        return self._loop_pools().aiohttp_connector()
+
+    async def aclose(self) -> None:
+        """Close the pools of the running loop. Call once before the loop shuts down."""
+        with contextlib.suppress(RuntimeError):
+            loop = asyncio.get_running_loop()
+            entry = self._pools.pop(id(loop), None)
+            if entry is not None:
+                await entry[1].aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Keeps the host slot held until a (possibly streamed) response body is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Any) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, pool: HttpPool) -> None:
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        pools = self.pool._loop_pools()
+        host = request.url.host
+        host_timeout = self.pool._host_timeout(host)
+        if host_timeout is not None:
+            request.extensions['timeout'] = httpx.Timeout(host_timeout).as_dict()
+
+        semaphore = pools.semaphore(host, self.pool._host_limit(host))
+        await semaphore.acquire()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        try:
+            response = await pools.transport_for(request.url).handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        observer = _response_observer.get()
+        if observer is not None:
+            with contextlib.suppress(Exception):
+                observer(response)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(cast(httpx.AsyncByteStream, response.stream), release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        # The pool outlives individual clients, see HttpPool.aclose
+        return None
+
+
+http_pool = HttpPool()
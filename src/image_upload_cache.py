@@ -0,0 +1,108 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Content-addressed record of images already uploaded to each image host.
+
+The same screenshot is often uploaded more than once: a tracker that only accepts other
+hosts triggers a re-upload of the same PNG, and re-running an upload without
+``--keep-meta`` takes and uploads the screenshots again. Uploads are keyed by the BLAKE2b
+digest of the image bytes and the host. Their URLs are kept in the metadata cache
+(``imghost`` namespace), so identical bytes are sent to a host only once, across trackers
+and runs, until the entry expires (``image_upload_cache_days``).
+"""
+import asyncio
+import hashlib
+import os
+import threading
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, cast
+
+from src.console import console
+from src.metadata_cache import DAY, MetadataCache, metadata_cache
+
+NAMESPACE = 'imghost'
+DEFAULT_DAYS = 30
+URL_KEYS = ('img_url', 'raw_url', 'web_url')
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ImageUploadCache:
+    def __init__(self, cache: MetadataCache = metadata_cache) -> None:
+        self.cache = cache
+        self.ttl = DEFAULT_DAYS * DAY
+        # (path, size, mtime_ns) -> digest, so a screenshot is hashed once per run
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        try:
+            self.ttl = max(0, int(default_cfg.get('image_upload_cache_days', DEFAULT_DAYS))) * DAY
+        except (TypeError, ValueError):
+            self.ttl = DEFAULT_DAYS * DAY
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache.enabled and self.ttl > 0
+
+    def digest(self, path: str) -> str:
+        """BLAKE2b digest of the file at ``path``. Blocking."""
+        stat = os.stat(path)
+        memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=32)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            with self._lock:
+                self._digests[memo_key] = digest
+        return digest
+
+    async def lookup(self, digest: str, img_host: str) -> Optional[dict[str, str]]:
+        cached = await self.cache.get_json(NAMESPACE, img_host, digest)
+        if not isinstance(cached, dict):
+            return None
+        urls = cast(dict[str, Any], cached)
+        if not all(isinstance(urls.get(key), str) and urls.get(key) for key in URL_KEYS):
+            return None
+        return {key: str(urls[key]) for key in URL_KEYS}
+
+    async def store(self, digest: str, img_host: str, result: dict[str, Any]) -> None:
+        urls = {key: result.get(key) for key in URL_KEYS}
+        if all(isinstance(url, str) and url for url in urls.values()):
+            await self.cache.put_json(NAMESPACE, img_host, digest, urls, ttl=self.ttl)
+
+    async def cached_upload(
+        self,
+        path: str,
+        img_host: str,
+        upload: Callable[[], Awaitable[dict[str, Any]]],
+        debug: bool = False,
+    ) -> dict[str, Any]:
+        """Result of ``upload()`` for ``path`` on ``img_host``, or the URLs of an earlier upload of the same bytes.
+
+        Concurrent uploads of the same bytes to the same host wait for the first one.
+        Only successful uploads are recorded.
+        """
+        if not self.enabled:
+            return await upload()
+        try:
+            digest = await asyncio.to_thread(self.digest, path)
+        except OSError:
+            return await upload()
+
+        async with self.cache.key_locked(self.cache.make_key(NAMESPACE, 'CALL', img_host, digest)):
+            urls = await self.lookup(digest, img_host)
+            if urls is not None:
+                if debug:
+                    console.print(f"[cyan]Image upload cache hit: {os.path.basename(path)} on {img_host} -> {urls['raw_url']}[/cyan]")
+                return {'status': 'success', **urls, 'local_file_path': path, 'cached': True}
+            result = await upload()
+            if result.get('status') == 'success':
+                await self.store(digest, img_host, result)
+            return result
+
+
+image_upload_cache = ImageUploadCache()
@@ -0,0 +1,199 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Read the dimensions of remote images without downloading them.
+
+PNG, GIF, JPEG and WebP store their size near the start of the file, so ``probe_image``
+asks for the first few KB with an HTTP Range request (servers that ignore Range are read
+incrementally and the connection is dropped once the header is parsed). The last few bytes
+are then fetched with a suffix Range request, so an image cut short on the host (no PNG
+IEND chunk, JPEG EOI marker or GIF trailer, or a WebP shorter than its RIFF size) is still
+rejected, as PIL's ``verify`` did. Only when the header cannot be parsed, or the host
+ignores suffix ranges, is the whole image downloaded, decoded and verified with PIL.
+"""
+import re
+import struct
+from io import BytesIO
+from typing import NamedTuple, Optional
+
+import aiohttp
+from PIL import Image
+
+PROBE_BYTES = 16 * 1024
+# JPEG headers can sit behind large EXIF/ICC segments
+MAX_PROBE_BYTES = 256 * 1024
+# End of the file checked for the format's trailer
+TRAILER_BYTES = 64
+
+_CONTENT_RANGE_TOTAL_RE = re.compile(r'/(\d+)\s*$')
+# JPEG start-of-frame markers carrying the frame size (DHT 0xC4, JPG 0xC8 and DAC 0xCC are not frames)
+_JPEG_SOF_MARKERS = frozenset({0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF})
+
+
+class ImageProbeError(Exception):
+    pass
+
+
+class ImageProbe(NamedTuple):
+    width: int
+    height: int
+    # Full size of the image in bytes, when the server reported it
+    size: Optional[int]
+    # Whole image body, only set when a full download was needed
+    content: Optional[bytes]
+
+
+def _png_size(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) >= 24 and data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', data[16:24])
+        return width, height
+    return None
+
+
+def _gif_size(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) >= 10 and data[:6] in (b'GIF87a', b'GIF89a'):
+        width, height = struct.unpack('<HH', data[6:10])
+        return width, height
+    return None
+
+
+def _webp_size(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) < 30 or data[:4] != b'RIFF' or data[8:12] != b'WEBP':
+        return None
+    chunk = data[12:16]
+    if chunk == b'VP8 ' and data[23:26] == b'\x9d\x01\x2a':
+        width, height = struct.unpack('<HH', data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and data[20] == 0x2F:
+        bits = int.from_bytes(data[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X':
+        return int.from_bytes(data[24:27], 'little') + 1, int.from_bytes(data[27:30], 'little') + 1
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) < 4 or data[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 9 < len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte
+            pos += 1
+            continue
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            # Markers without a length field
+            pos += 2
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack('>HH', data[pos + 5:pos + 9])
+            return width, height
+        segment_length = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        pos += 2 + segment_length
+    return None
+
+
+def image_dimensions(data: bytes) -> Optional[tuple[int, int]]:
+    """Width and height from the start of a PNG, GIF, JPEG or WebP file; None if not (yet) parseable."""
+    for parser in (_png_size, _jpeg_size, _webp_size, _gif_size):
+        size = parser(data)
+        if size is not None:
+            return size
+    return None
+
+
+def _complete(head: bytes, tail: bytes, total_size: Optional[int]) -> bool:
+    """Whether ``tail`` (the end of the file) shows the image starting with ``head`` was not cut short."""
+    if head[:8] == b'\x89PNG\r\n\x1a\n':
+        return b'IEND' in tail
+    if head[:2] == b'\xff\xd8':
+        return b'\xff\xd9' in tail
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return tail.endswith(b';')
+    if head[:4] == b'RIFF':
+        return total_size is not None and total_size >= int.from_bytes(head[4:8], 'little') + 8
+    return True
+
+
+def _total_size(response: aiohttp.ClientResponse) -> Optional[int]:
+    if response.status == 206:
+        match = _CONTENT_RANGE_TOTAL_RE.search(response.headers.get('Content-Range', ''))
+        return int(match.group(1)) if match else None
+    return response.content_length
+
+
+async def probe_image(session: aiohttp.ClientSession, url: str, ssl: bool = True) -> ImageProbe:
+    """Dimensions (and size) of the image at ``url``; raises ImageProbeError when it is not a usable image."""
+    head = bytearray()
+    dimensions: Optional[tuple[int, int]] = None
+    total_size: Optional[int] = None
+    # A small range covers PNG/GIF/WebP and most JPEGs, the second one JPEGs behind large EXIF/ICC data
+    for range_end in (PROBE_BYTES, MAX_PROBE_BYTES):
+        async with session.get(url, headers={'Range': f'bytes={len(head)}-{range_end - 1}'}, ssl=ssl) as response:
+            if response.status not in (200, 206):
+                raise ImageProbeError(f"status code: {response.status}")
+            content_type = response.headers.get('Content-Type', '').lower()
+            if 'image' not in content_type:
+                raise ImageProbeError(f"content type is not an image: {content_type or 'unknown'}")
+            if response.status == 200:
+                # Range ignored: read the body until the header parses and drop the rest
+                head = bytearray()
+            total_size = _total_size(response)
+            async for chunk in response.content.iter_chunked(PROBE_BYTES):
+                head.extend(chunk)
+                dimensions = image_dimensions(bytes(head))
+                if dimensions is not None or len(head) >= MAX_PROBE_BYTES:
+                    break
+            if dimensions is not None:
+                break
+            if response.status == 200:
+                if response.content.at_eof():
+                    return _decode(bytes(head))
+                break
+            if total_size is not None and len(head) >= total_size:
+                return _decode(bytes(head))
+
+    if dimensions is not None:
+        return await _check_end(session, url, ssl, bytes(head), dimensions, total_size)
+
+    # Header not parseable from the probe; fall back to downloading and decoding the whole image
+    async with session.get(url, ssl=ssl) as response:
+        if response.status != 200:
+            raise ImageProbeError(f"status code: {response.status}")
+        return _decode(await response.read())
+
+
+async def _check_end(
+    session: aiohttp.ClientSession,
+    url: str,
+    ssl: bool,
+    head: bytes,
+    dimensions: tuple[int, int],
+    total_size: Optional[int],
+) -> ImageProbe:
+    """The probe for ``dimensions`` read from ``head``, once the end of the image shows it is complete."""
+    tail = head
+    if total_size is None or len(head) < total_size:
+        async with session.get(url, headers={'Range': f'bytes=-{TRAILER_BYTES}'}, ssl=ssl) as response:
+            if response.status == 200:
+                # Suffix range ignored, so this is the whole image
+                return _decode(await response.read())
+            if response.status != 206:
+                raise ImageProbeError(f"status code: {response.status}")
+            total_size = _total_size(response) or total_size
+            tail = await response.read()
+    if not _complete(head, tail, total_size):
+        raise ImageProbeError("corrupt image: truncated")
+    return ImageProbe(dimensions[0], dimensions[1], total_size, None)
+
+
+def _decode(content: bytes) -> ImageProbe:
+    try:
+        with Image.open(BytesIO(content)) as image:
+            width, height = image.size
+            image.verify()
+    except Exception as e:
+        raise ImageProbeError(f"corrupt image: {e}") from e
+    return ImageProbe(width, height, len(content), content)
@@ -14,6 +14,7 @@ import httpx
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.metadata_cache import metadata_cache
 
 anitopy_parse_fn: Any = cast(Any, anitopy).parse
 guessit_module: Any = cast(Any, guessit)
@@ -268,7 +269,7 @@ class ImdbManager:
             """
         }
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=metadata_cache.transport('imdb', cache_post=True)) as client:
             try:
                 response = await client.post(
                     "https://api.graphql.imdb.com/",
@@ -574,7 +575,7 @@ class ImdbManager:
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=metadata_cache.transport('imdb', cache_post=True)) as client:
                     response = await client.post(url, json=query, headers={"Content-Type": "application/json"}, timeout=10)
                     response.raise_for_status()
                     data = response.json()
@@ -944,7 +945,7 @@ class ImdbManager:
             """
         }
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=metadata_cache.transport('imdb', cache_post=True)) as client:
             try:
                 response = await client.post(
                     "https://api.graphql.imdb.com/",
@@ -1,6 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import json
+import contextlib
 import os
 import re
 import time
@@ -14,6 +14,8 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 
 from src.console import console
+from src.http_pool import http_pool
+from src.scene_cache import scene_cache
 
 
 class SceneManager:
@@ -47,42 +49,9 @@ class SceneManager:
 
         quoted_base = urllib.parse.quote(base)
 
-        # Define cache directories
-        cache_dir = os.path.join(meta['base_dir'], 'tmp', meta['uuid'], 'srrdb')
-        search_cache_dir = os.path.join(cache_dir, 'search')
-        details_cache_dir = os.path.join(cache_dir, 'details')
-        os.makedirs(search_cache_dir, exist_ok=True)
-        os.makedirs(details_cache_dir, exist_ok=True)
-
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=http_pool.transport()) as client:
             if 'scene' not in meta and not lower and not meta.get('emby_debug', False):
-                # Cache file for search
-                search_cache_file = os.path.join(search_cache_dir, f"{quoted_base}.json")
-                response_json = None
-
-                # Try to load from cache
-                if os.path.exists(search_cache_file):
-                    try:
-                        search_text = await asyncio.to_thread(Path(search_cache_file).read_text, encoding='utf-8')
-                        response_json = json.loads(search_text)
-                        if meta['debug']:
-                            console.print(f"[cyan]SRRDB: Using cached search for {base}")
-                    except Exception:
-                        response_json = None
-
-                if response_json is None:
-                    url = f"https://api.srrdb.com/v1/search/r:{quoted_base}"
-                    if meta['debug']:
-                        console.print("Using SRRDB url", url)
-                    try:
-                        response = await client.get(url, timeout=30.0)
-                        if response.status_code == 200:
-                            response_json = response.json()
-                            # Save to cache
-                            search_text = json.dumps(response_json)
-                            await asyncio.to_thread(Path(search_cache_file).write_text, search_text, encoding='utf-8')
-                    except Exception as e:
-                        console.print(f"[yellow]SRRDB: Search request failed: {e}")
+                response_json = await scene_cache.srrdb_search(client, base, debug=bool(meta['debug']))
 
                 if response_json and int(response_json.get('resultsCount', 0)) > 0:
                     first_result = response_json['results'][0]
@@ -102,24 +71,7 @@ class SceneManager:
                             release = first_result['release']
                             release_lower = release.lower()
 
-                            # Details Cache
-                            details_cache_file = os.path.join(details_cache_dir, f"{release}.json")
-                            release_details_dict = None
-
-                            if os.path.exists(details_cache_file):
-                                try:
-                                    details_text = await asyncio.to_thread(Path(details_cache_file).read_text, encoding='utf-8')
-                                    release_details_dict = json.loads(details_text)
-                                except Exception:
-                                    release_details_dict = None
-
-                            if release_details_dict is None:
-                                release_details_url = f"https://api.srrdb.com/v1/details/{release}"
-                                release_details_response = await client.get(release_details_url, timeout=30.0)
-                                if release_details_response.status_code == 200:
-                                    release_details_dict = release_details_response.json()
-                                    details_text = json.dumps(release_details_dict)
-                                    await asyncio.to_thread(Path(details_cache_file).write_text, details_text, encoding='utf-8')
+                            release_details_dict = await scene_cache.srrdb_details(client, release, debug=bool(meta['debug']))
 
                             if release_details_dict:
                                 try:
@@ -162,14 +114,10 @@ class SceneManager:
                 tag_value = meta.get('tag')
                 tag = tag_value.replace("-", "") if isinstance(tag_value, str) else None
                 if name and tag:
-                    url = f"https://api.srrdb.com/v1/search/start:{name}/group:{tag}"
-
-                    if meta['debug']:
-                        console.print("Using SRRDB url", url)
-
                     try:
-                        response = await client.get(url, timeout=10.0)
-                        response_json = response.json()
+                        response_json = await scene_cache.srrdb_query(client, f"start:{name}/group:{tag}", timeout=10.0, debug=bool(meta['debug']))
+                        if response_json is None:
+                            raise ValueError("no response from SRRDB")
 
                         if int(response_json.get('resultsCount', 0)) > 0:
                             first_result = response_json['results'][0]
@@ -214,11 +162,11 @@ class SceneManager:
                         console.print("[yellow]SRRDB: Missing name or tag for lower/tag search")
                     return video, scene, imdb
 
-        check_predb = bool(self.default_config.get('check_predb', False))
-        if not scene and check_predb and not meta.get('emby_debug', False):
-            if meta['debug']:
-                console.print("[yellow]SRRDB: No scene match found, checking predb")
-            scene = await self.predb_check(meta, video)
+            check_predb = bool(self.default_config.get('check_predb', False))
+            if not scene and check_predb and not meta.get('emby_debug', False):
+                if meta['debug']:
+                    console.print("[yellow]SRRDB: No scene match found, checking predb")
+                scene = await self.predb_check(meta, video, client)
 
         if meta['debug']:
             scene_end_time = time.time()
@@ -226,50 +174,67 @@ class SceneManager:
 
         return video, scene, imdb
 
-    async def predb_check(self, meta: dict[str, Any], video: str) -> bool:
-        url = f"https://predb.pw/search.php?search={urllib.parse.quote(os.path.basename(video))}"
+    def _parse_predb_rows(self, html: str) -> list[dict[str, str]]:
+        """Release name and group of every result row on a predb.pw search page."""
+        rows: list[dict[str, str]] = []
+        soup = BeautifulSoup(html, "lxml")
+        for row in soup.select('table.zebra-striped tbody tr'):
+            tds = row.find_all('td')
+            if len(tds) < 3:
+                continue
+            # The 3rd <td> contains the release name link
+            release_a = tds[2].find('a', title=True)
+            if not release_a:
+                continue
+            release_attr = self._attr_to_string(release_a.get('title')).strip()
+            if not release_attr:
+                continue
+            entry = {'release': release_attr}
+            # The 4th <td> contains the group
+            if len(tds) >= 4:
+                group_a = tds[3].find('a')
+                if group_a:
+                    entry['group'] = self._attr_to_string(group_a.get_text()).strip()
+            rows.append(entry)
+        return rows
+
+    async def predb_check(self, meta: dict[str, Any], video: str, client: Optional[httpx.AsyncClient] = None) -> bool:
+        search = os.path.basename(video)
+        url = f"https://predb.pw/search.php?search={urllib.parse.quote(search)}"
         if meta['debug']:
             console.print("Using predb url", url)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "lxml")
-                found = False
-                video_base = os.path.basename(video).lower()
-                for row in soup.select('table.zebra-striped tbody tr'):
-                    tds = row.find_all('td')
-                    if len(tds) >= 3:
-                        # The 3rd <td> contains the release name link
-                        release_a = tds[2].find('a', title=True)
-                        if release_a:
-                            release_attr = self._attr_to_string(release_a.get('title')).strip()
-                            if not release_attr:
-                                continue
-                            release_name = release_attr.lower()
-                            if meta['debug']:
-                                console.print(f"[yellow]Predb: Checking {release_name} against {video_base}")
-                            if release_name == video_base:
-                                found = True
-                                meta['scene_name'] = release_attr
-                                console.print("[green]Predb: Match found")
-                                # The 4th <td> contains the group
-                                if len(tds) >= 4:
-                                    group_a = tds[3].find('a')
-                                    if group_a:
-                                        group = self._attr_to_string(group_a.get_text()).strip()
-                                        meta['tag'] = f"-{group}" if group and not group.startswith("-") else group
-                                return True
-                if not found:
-                    console.print("[yellow]Predb: No match found")
-                    return False
-            else:
-                console.print(f"[red]Predb: Error {response.status_code} while checking")
+            async with contextlib.AsyncExitStack() as stack:
+                if client is None:
+                    client = await stack.enter_async_context(httpx.AsyncClient(transport=http_pool.transport()))
+
+                async def fetch() -> Optional[list[dict[str, str]]]:
+                    response = await cast(httpx.AsyncClient, client).get(url, timeout=10.0)
+                    if response.status_code != 200:
+                        console.print(f"[red]Predb: Error {response.status_code} while checking")
+                        return None
+                    return self._parse_predb_rows(response.text)
+
+                rows = cast(Optional[list[dict[str, str]]], await scene_cache.lookup('predb', 'search', search, fetch, bool))
+            if rows is None:
                 return False
+            video_base = search.lower()
+            for row in rows:
+                release_name = row['release'].lower()
+                if meta['debug']:
+                    console.print(f"[yellow]Predb: Checking {release_name} against {video_base}")
+                if release_name == video_base:
+                    meta['scene_name'] = row['release']
+                    console.print("[green]Predb: Match found")
+                    if 'group' in row:
+                        group = row['group']
+                        meta['tag'] = f"-{group}" if group and not group.startswith("-") else group
+                    return True
+            console.print("[yellow]Predb: No match found")
+            return False
         except httpx.RequestError as e:
             console.print(f"[red]Predb: Request failed: {e}")
             return False
         except Exception as e:
             console.print(f"[yellow]Predb error: {e}")
             return False
-        return False
@@ -1,7 +1,6 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
 import glob
-import json
 import os
 import re
 import shutil
@@ -15,6 +14,8 @@ import httpx
 from torf import Torrent
 
 from src.console import console
+from src.http_pool import http_pool
+from src.metastore import meta_store
 from src.uploadscreens import UploadScreensManager
 
 
@@ -50,7 +51,7 @@ class ManualPackageManager:
             poster_img = f"{meta['base_dir']}/tmp/{meta['uuid']}/POSTER.png"
             if meta.get('poster') not in ['', None] and not os.path.exists(poster_img):
                 if meta.get('rehosted_poster') is None:
-                    async with httpx.AsyncClient(timeout=30.0) as client:
+                    async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                         response = await client.get(meta['poster'])
                     if response.status_code == 200:
                         console.print("[bold yellow]Rehosting Poster")
@@ -60,9 +61,7 @@ class ManualPackageManager:
                             poster = poster[0]
                             await generic.write(f"TMDB Poster: {poster.get('raw_url', poster.get('img_url'))}\n")
                             meta['rehosted_poster'] = poster.get('raw_url', poster.get('img_url'))
-                        meta_text = json.dumps(meta, indent=4)
-                        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w') as metafile:
-                            await metafile.write(meta_text)
+                        await meta_store.save(meta)
                     else:
                         console.print("[bold yellow]Poster could not be retrieved")
             elif os.path.exists(poster_img) and meta.get('rehosted_poster') is not None:
@@ -101,7 +100,7 @@ class ManualPackageManager:
                 files = {
                     "files[]": (f"{meta['title']}.tar", tar_bytes)
                 }
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                     response = (await client.post("https://uguu.se/upload.php", files=files)).json()
                 if meta['debug']:
                     console.print(f"[cyan]{response}")
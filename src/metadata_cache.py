@@ -0,0 +1,373 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Persistent cross-run response cache for the metadata providers (TMDB, IMDb, TVDB, TVmaze),
+blu-ray.com release pages and parsed Blu-ray playlists.
+
+Responses are stored in a single SQLite database under ``data/cache`` keyed by
+namespace, endpoint and request parameters. Each endpoint has its own TTL, the
+database is bounded in size with least-recently-used eviction, and WAL mode plus
+a busy timeout keeps concurrent runs (queue, web UI, discord bot) safe.
+"""
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any, Callable, Optional, cast
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+from src.console import console
+from src.http_pool import http_pool
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# Fallback TTL (seconds) per namespace
+DEFAULT_TTLS: dict[str, int] = {
+    'tmdb': 3 * DAY,
+    'imdb': 3 * DAY,
+    'tvdb': 1 * DAY,
+    'tvmaze': 1 * DAY,
+    'bluray': 7 * DAY,
+    # Parsed .mpls play items, validated by file size and mtime
+    'mpls': 30 * DAY,
+    # Image host URLs by image digest (see src/image_upload_cache.py)
+    'imghost': 30 * DAY,
+    # Learned image host upload concurrency (see src/upload_limiter.py)
+    'imghost_limits': 30 * DAY,
+}
+
+# Per-endpoint TTLs, first match wins. Searches and anything tied to currently airing
+# seasons go stale quickly, external id lookups practically never change.
+ENDPOINT_TTLS: list[tuple[str, re.Pattern[str], int]] = [
+    ('tmdb', re.compile(r'/search/'), 12 * HOUR),
+    ('tmdb', re.compile(r'/find/'), 7 * DAY),
+    ('tmdb', re.compile(r'/season/'), 12 * HOUR),
+    ('tvmaze', re.compile(r'/search/'), 12 * HOUR),
+    ('tvmaze', re.compile(r'/lookup/'), 7 * DAY),
+    ('tvmaze', re.compile(r'/episodebynumber|/episodesbydate'), 12 * HOUR),
+    ('tvdb', re.compile(r'^search$'), 12 * HOUR),
+    ('tvdb', re.compile(r'^series_episodes$'), 12 * HOUR),
+    ('tvdb', re.compile(r'^episode_extended$'), 3 * DAY),
+    ('tvdb', re.compile(r'^search_by_remote_id$'), 7 * DAY),
+]
+
+# Query parameters that never take part in the cache key
+IGNORED_PARAMS = frozenset({'api_key', 'apikey', 'token'})
+
+DEFAULT_MAX_SIZE_MB = 256
+
+
+class CacheEntry:
+    __slots__ = ('body', 'content_type', 'status')
+
+    def __init__(self, status: int, content_type: str, body: bytes) -> None:
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+
+
+class MetadataCache:
+    def __init__(self, db_path: Optional[str] = None, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> None:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.db_path = db_path or os.path.join(base_dir, 'data', 'cache', 'metadata_cache.db')
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.enabled = True
+        self.debug = False
+        self.ttls: dict[str, int] = dict(DEFAULT_TTLS)
+        self.stats: dict[str, dict[str, int]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._key_locks: dict[tuple[int, str], asyncio.Lock] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        self.enabled = bool(default_cfg.get('metadata_cache', True))
+        try:
+            self.max_bytes = int(default_cfg.get('metadata_cache_size_mb', DEFAULT_MAX_SIZE_MB)) * 1024 * 1024
+        except (TypeError, ValueError):
+            self.max_bytes = DEFAULT_MAX_SIZE_MB * 1024 * 1024
+
+    # Keys and TTLs
+
+    @staticmethod
+    def make_key(namespace: str, method: str, endpoint: str, params: Any = None, body: bytes = b'') -> str:
+        key_source = json.dumps([namespace, method.upper(), endpoint, params], sort_keys=True, default=str)
+        digest = hashlib.sha256(key_source.encode('utf-8'))
+        if body:
+            digest.update(body)
+        return digest.hexdigest()
+
+    def ttl_for(self, namespace: str, endpoint: str) -> int:
+        for rule_namespace, pattern, ttl in ENDPOINT_TTLS:
+            if rule_namespace == namespace and pattern.search(endpoint):
+                return ttl
+        return self.ttls.get(namespace, DAY)
+
+    def _count(self, namespace: str, counter: str) -> None:
+        counters = self.stats.setdefault(namespace, {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0})
+        counters[counter] = counters.get(counter, 0) + 1
+
+    def summary(self) -> str:
+        parts = [
+            f"{namespace}: {c.get('hits', 0)} hits / {c.get('misses', 0)} misses"
+            for namespace, c in sorted(self.stats.items())
+        ]
+        return ", ".join(parts) if parts else "no lookups"
+
+    # Storage
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, status INTEGER NOT NULL, "
+                "content_type TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries (expires)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_entry(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        if not self.enabled:
+            return None
+        now = time.time()
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT status, content_type, body, expires FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[3] >= now:
+                    conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                    conn.commit()
+        except sqlite3.Error as e:
+            if self.debug:
+                console.print(f"[yellow]Metadata cache read failed: {e}[/yellow]")
+            return None
+
+        if row is None or row[3] < now:
+            self._count(namespace, 'misses')
+            return None
+        self._count(namespace, 'hits')
+        return CacheEntry(int(row[0]), str(row[1]), bytes(row[2]))
+
+    def put_entry(self, namespace: str, key: str, entry: CacheEntry, ttl: int) -> None:
+        if not self.enabled or ttl <= 0:
+            return
+        now = time.time()
+        try:
+            with self._db_lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, namespace, status, content_type, body, size, expires, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, namespace, entry.status, entry.content_type, sqlite3.Binary(entry.body), len(entry.body), now + ttl, now),
+                )
+                conn.commit()
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            if self.debug:
+                console.print(f"[yellow]Metadata cache write failed: {e}[/yellow]")
+            return
+        self._count(namespace, 'stores')
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM entries WHERE expires < ?", (now,))
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0])
+        while total > self.max_bytes:
+            victims = conn.execute(
+                "SELECT key, namespace, size FROM entries ORDER BY accessed ASC LIMIT 64"
+            ).fetchall()
+            if not victims:
+                break
+            for victim_key, victim_namespace, size in victims:
+                conn.execute("DELETE FROM entries WHERE key = ?", (victim_key,))
+                self._count(str(victim_namespace), 'evictions')
+                total -= int(size)
+                if total <= self.max_bytes:
+                    break
+        conn.commit()
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._db_lock:
+            conn = self._connect()
+            if namespace:
+                conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            else:
+                conn.execute("DELETE FROM entries")
+            conn.commit()
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                with contextlib.suppress(sqlite3.Error):
+                    self._conn.close()
+                self._conn = None
+
+    # Async API
+
+    def _key_lock(self, key: str) -> asyncio.Lock:
+        # Per event loop: queue prep workers run lookups on their own loops
+        lock_key = (id(asyncio.get_running_loop()), key)
+        lock = self._key_locks.get(lock_key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._key_locks[lock_key] = lock
+        return lock
+
+    def _release_key_lock(self, key: str, lock: asyncio.Lock) -> None:
+        lock_key = (id(asyncio.get_running_loop()), key)
+        if not lock.locked() and self._key_locks.get(lock_key) is lock:
+            del self._key_locks[lock_key]
+
+    @contextlib.asynccontextmanager
+    async def key_locked(self, key: str) -> AsyncIterator[None]:
+        """Hold the per-key lock, so concurrent callers computing the same entry wait for the first."""
+        lock = self._key_lock(key)
+        try:
+            async with lock:
+                yield
+        finally:
+            self._release_key_lock(key, lock)
+
+    async def get_json(self, namespace: str, endpoint: str, params: Any = None) -> Optional[Any]:
+        key = self.make_key(namespace, 'CALL', endpoint, params)
+        entry = await asyncio.to_thread(self.get_entry, namespace, key)
+        if entry is None:
+            return None
+        try:
+            return json.loads(entry.body)
+        except ValueError:
+            return None
+
+    async def put_json(self, namespace: str, endpoint: str, params: Any, value: Any, ttl: Optional[int] = None) -> None:
+        key = self.make_key(namespace, 'CALL', endpoint, params)
+        body = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        entry = CacheEntry(200, 'application/json', body)
+        await asyncio.to_thread(self.put_entry, namespace, key, entry, ttl if ttl is not None else self.ttl_for(namespace, endpoint))
+
+    async def cached_call(
+        self,
+        namespace: str,
+        endpoint: str,
+        params: Any,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """Return the cached value for ``endpoint``/``params`` or await ``fetch`` and store its result.
+
+        Concurrent callers asking for the same key wait for the first fetch instead of
+        repeating it. Empty results are not cached.
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = self.make_key(namespace, 'CALL', endpoint, params)
+        lock = self._key_lock(key)
+        try:
+            async with lock:
+                cached = await self.get_json(namespace, endpoint, params)
+                if cached is not None:
+                    return cached
+                value = await fetch()
+                if value:
+                    await self.put_json(namespace, endpoint, params, value, ttl)
+                return value
+        finally:
+            self._release_key_lock(key, lock)
+
+    def transport(self, namespace: str, cache_post: bool = False) -> "CachingTransport":
+        """Build an httpx transport that serves successful responses from the cache.
+
+        Use a fresh transport per client; the client closes it on exit.
+        """
+        return CachingTransport(self, namespace, cache_post=cache_post)
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        cache: MetadataCache,
+        namespace: str,
+        cache_post: bool = False,
+        wrapped: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.cache = cache
+        self.namespace = namespace
+        self.cache_post = cache_post
+        self.wrapped = wrapped or http_pool.transport()
+
+    def _cacheable(self, request: httpx.Request) -> bool:
+        if not self.cache.enabled:
+            return False
+        return request.method == 'GET' or (self.cache_post and request.method == 'POST')
+
+    def _request_key(self, request: httpx.Request) -> str:
+        params = sorted(
+            (name, value) for name, value in parse_qsl(request.url.query.decode('utf-8'), keep_blank_values=True)
+            if name.lower() not in IGNORED_PARAMS
+        )
+        endpoint = f"{request.url.host}{request.url.path}?{urlencode(params)}"
+        body = request.content if request.method == 'POST' else b''
+        return self.cache.make_key(self.namespace, request.method, endpoint, None, body)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._cacheable(request):
+            return await self.wrapped.handle_async_request(request)
+
+        key = self._request_key(request)
+        lock = self.cache._key_lock(key)
+        try:
+            async with lock:
+                entry = await asyncio.to_thread(self.cache.get_entry, self.namespace, key)
+                if entry is not None:
+                    if self.cache.debug:
+                        console.print(f"[cyan]Metadata cache hit: {request.url.copy_remove_param('api_key')}[/cyan]")
+                    return httpx.Response(
+                        entry.status,
+                        headers={'Content-Type': entry.content_type},
+                        content=entry.body,
+                        request=request,
+                    )
+
+                response = await self.wrapped.handle_async_request(request)
+                if response.status_code != 200:
+                    return response
+
+                content = await response.aread()
+                await response.aclose()
+                content_type = response.headers.get('Content-Type', 'application/json')
+                ttl = self.cache.ttl_for(self.namespace, request.url.path)
+                await asyncio.to_thread(
+                    self.cache.put_entry, self.namespace, key, CacheEntry(200, content_type, content), ttl
+                )
+                # Content was decoded by aread(), so drop the transfer headers that described the raw stream
+                headers = [
+                    (name, value) for name, value in response.headers.multi_items()
+                    if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+                ]
+                return httpx.Response(200, headers=headers, content=content, request=request)
+        finally:
+            self.cache._release_key_lock(key, lock)
+
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
+
+
+metadata_cache = MetadataCache()
@@ -0,0 +1,151 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Debounced, atomic persistence of ``tmp/<uuid>/meta.json``.
+
+``meta_store.save(meta)`` marks the file dirty and schedules a write shortly afterwards, so
+the repeated saves in description and image loops collapse into one write. Each top-level
+key is serialized to a compact JSON fragment. Meta is changed in place all over the code, so
+containers are serialized again on every write; the fragments of strings and numbers (long
+MediaInfo and BDInfo text among them) are kept and reused while the key still holds the very
+same object. The file is written to a temporary name and
+renamed into place, so a reader (``merge_meta`` on the next run) never sees a partial file.
+Call ``flush`` where the file has to be on disk before continuing. Call ``discard`` before removing a tmp
+directory, so a pending write can't recreate it.
+"""
+import asyncio
+import contextlib
+import json
+import os
+from collections.abc import Mapping
+from typing import Any, Optional, Union
+
+from src.console import console
+
+DEFAULT_FLUSH_DELAY = 1.0
+
+# Values that can't change without the key being rebound, so an unchanged identity means an unchanged fragment
+_IMMUTABLE_TYPES = (str, int, float, type(None))
+
+Scalar = Union[str, int, float, None]
+
+
+class _Pending:
+    __slots__ = ('handle', 'meta')
+
+    def __init__(self, meta: Mapping[str, Any]) -> None:
+        self.meta = meta
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class MetaStore:
+    def __init__(self, delay: float = DEFAULT_FLUSH_DELAY) -> None:
+        self.delay = delay
+        self._pending: dict[str, _Pending] = {}
+        self._fragments: dict[str, dict[str, tuple[Scalar, str]]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    @staticmethod
+    def path_for(meta: Mapping[str, Any]) -> str:
+        return os.path.join(str(meta['base_dir']), 'tmp', str(meta['uuid']), 'meta.json')
+
+    async def save(self, meta: Mapping[str, Any], immediate: bool = False) -> None:
+        """Schedule a write of ``meta``."""
+        path = self.path_for(meta)
+        pending = self._pending.get(path)
+        if pending is None:
+            pending = _Pending(meta)
+            self._pending[path] = pending
+        pending.meta = meta
+
+        if immediate or self.delay <= 0:
+            await self.flush(meta)
+            return
+        if pending.handle is None:
+            loop = asyncio.get_running_loop()
+            pending.handle = loop.call_later(self.delay, self._schedule_flush, path)
+
+    def _schedule_flush(self, path: str) -> None:
+        task = asyncio.ensure_future(self._flush_path(path))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self, meta: Optional[Mapping[str, Any]] = None) -> None:
+        """Write pending changes now, for ``meta`` only or for every pending file."""
+        paths = [self.path_for(meta)] if meta is not None else list(self._pending)
+        for path in paths:
+            await self._flush_path(path)
+
+    def forget(self, path: str) -> None:
+        """Drop pending writes and cached fragments, e.g. after meta.json was deleted."""
+        pending = self._pending.pop(path, None)
+        if pending is not None and pending.handle is not None:
+            pending.handle.cancel()
+        self._fragments.pop(path, None)
+
+    def forget_tree(self, directory: str) -> list[str]:
+        """``forget`` every meta.json under ``directory``; returns their paths."""
+        prefix = os.path.join(os.path.abspath(directory), '')
+        paths = [path for path in {*self._pending, *self._fragments} if os.path.abspath(path).startswith(prefix)]
+        for path in paths:
+            self.forget(path)
+        return paths
+
+    async def discard(self, directory: str) -> None:
+        """Forget every meta.json under ``directory`` and wait for writes in progress, before the directory is removed."""
+        for path in self.forget_tree(directory):
+            # A flush that already took its pending write holds the lock until the file is written
+            async with self._lock(path):
+                pass
+
+    def _lock(self, path: str) -> asyncio.Lock:
+        lock = self._locks.get(path)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[path] = lock
+        return lock
+
+    async def _flush_path(self, path: str) -> None:
+        async with self._lock(path):
+            pending = self._pending.pop(path, None)
+            if pending is None:
+                return
+            if pending.handle is not None:
+                pending.handle.cancel()
+            try:
+                # Serialize on the event loop so meta can't change underneath the encoder
+                content = self._serialize(path, pending.meta)
+                await asyncio.to_thread(self._write_atomic, path, content)
+            except Exception as e:
+                # Serialize everything again on the next attempt
+                self._fragments.pop(path, None)
+                console.print(f"[red]Failed to save {path}: {e}[/red]")
+
+    def _serialize(self, path: str, meta: Mapping[str, Any]) -> str:
+        cached = self._fragments.get(path, {})
+        kept: dict[str, tuple[Scalar, str]] = {}
+        fragments: list[str] = []
+        for key, value in meta.items():
+            entry = cached.get(key)
+            fragment = entry[1] if entry is not None and entry[0] is value else json.dumps(value, separators=(',', ':'))
+            if isinstance(value, _IMMUTABLE_TYPES):
+                kept[key] = (value, fragment)
+            fragments.append(f"{json.dumps(str(key))}:{fragment}")
+        self._fragments[path] = kept
+        return '{' + ','.join(fragments) + '}'
+
+    @staticmethod
+    def _write_atomic(path: str, content: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+
+meta_store = MetaStore()
@@ -0,0 +1,115 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Copy-on-write view over the shared upload meta.
+
+Tracker checks run concurrently and each one used to receive a full ``copy.deepcopy``
+of meta, including MediaInfo, BDInfo, image lists and TMDB payloads. ``MetaOverlay``
+instead takes a shallow snapshot of the shared meta (its keys and value references, no
+values are copied) and keeps the tracker's own writes in a private layer. Mutable values
+are copied the first time a task reads them, so nested in-place changes
+(``meta['tracker_status'][tracker]['other'] = True``) stay private exactly as they did
+with a deep copy. Large payloads that tracker checks only read are handed out by
+reference. Nothing reaches the shared meta until ``merge_into`` is called, which stores
+copies, so keys merged by one tracker are not seen by views created before the merge and
+later changes in a view don't reach the shared meta either. Values of the shared meta must
+not be changed in place while views are in use; rebinding keys is fine.
+"""
+import copy
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+# Heavy keys that tracker checks read but never modify in place; shared without copying
+SHARED_READONLY_KEYS = frozenset({
+    'mediainfo',
+    'bdinfo',
+    'discs',
+    'imdb_info',
+    'tmdb_localized_data',
+    'tvdb_episode_data',
+    'tvdb_season_data',
+    'tmdb_season_data',
+    'tmdb_episode_data',
+    'tvmaze_episode_data',
+    'filelist',
+})
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None))
+_MISSING = object()
+
+
+class MetaOverlay(MutableMapping[str, Any]):
+    def __init__(self, base: Mapping[str, Any], shared_keys: Iterable[str] = SHARED_READONLY_KEYS) -> None:
+        # Keys merged into the shared meta by other views must not show up in this one
+        self._base = dict(base)
+        self._local: dict[str, Any] = {}
+        self._deleted: set[str] = set()
+        self._written: set[str] = set()
+        self._shared_keys = frozenset(shared_keys)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._local:
+            return self._local[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        value = self._base[key]
+        if isinstance(value, _IMMUTABLE_TYPES) or key in self._shared_keys:
+            return value
+        # First read of a mutable value: take a private copy so in-place edits stay local
+        value = copy.deepcopy(value)
+        self._local[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._local[key] = value
+        self._deleted.discard(key)
+        self._written.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._local.pop(key, None)
+        self._deleted.add(key)
+        self._written.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._local:
+            return True
+        if key in self._deleted:
+            return False
+        return key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._local
+        for key in self._base:
+            if key not in self._local and key not in self._deleted:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"MetaOverlay(written={sorted(self._written)!r})"
+
+    @property
+    def written_keys(self) -> frozenset[str]:
+        """Keys assigned or deleted through this view (copies made for reading are not writes)."""
+        return frozenset(self._written)
+
+    def changes(self) -> dict[str, Any]:
+        return {key: self._local[key] for key in self._written if key in self._local}
+
+    def merge_into(self, target: MutableMapping[str, Any], keys: Iterable[str], skip_falsy: bool = True) -> None:
+        """Copy this view's values for ``keys`` into ``target``; the caller handles locking.
+
+        Private copies taken on read are included, since they may have been changed in place.
+        Mutable values are copied, so this view's later changes stay private.
+        """
+        for key in keys:
+            value = self._local.get(key, _MISSING)
+            if value is _MISSING or (skip_falsy and not value):
+                continue
+            target[key] = value if isinstance(value, _IMMUTABLE_TYPES) else copy.deepcopy(value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize a plain dict, e.g. for json serialization."""
+        return {key: self[key] for key in self}
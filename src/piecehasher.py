@@ -0,0 +1,155 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Multi-threaded SHA-1 piece hashing for torrents created without mkbrr.
+
+One reader thread streams the files back to back with large sequential ``readinto`` calls
+into a small pool of reusable buffers. Each buffer holds a whole number of pieces and is
+handed to a thread pool for hashing while the reader fills the next one (hashlib releases
+the GIL on large inputs, so the hashers run on all cores). Buffer memory is capped, so
+128 MiB pieces do not turn into gigabytes of queued data.
+"""
+import contextlib
+import errno
+import hashlib
+import math
+import os
+import queue
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+import torf
+
+# Target size of a single read; small pieces are batched up to this size
+READ_SIZE = 16 * 1024 * 1024
+# Upper bound for all read buffers together
+MAX_BUFFER_MEMORY = 512 * 1024 * 1024
+
+# callback(filepath, pieces_done, pieces_total); returning anything but None cancels hashing
+ProgressCallback = Callable[[str, int, int], Any]
+
+
+class _Cancelled(Exception):
+    pass
+
+
+def hash_pieces(
+    files: Sequence[tuple[str, int]],
+    piece_size: int,
+    workers: Optional[int] = None,
+    callback: Optional[ProgressCallback] = None,
+    interval: float = 0.0,
+) -> Optional[bytes]:
+    """
+    Concatenated SHA-1 piece hashes of ``files`` (path, expected size) read back to back.
+
+    Returns None if ``callback`` cancelled hashing. Raises ``torf.ReadError`` when a file
+    can't be read or is shorter than expected.
+    """
+    if piece_size <= 0:
+        raise ValueError(f"Invalid piece size: {piece_size}")
+    workers = workers if workers and workers > 0 else (os.cpu_count() or 1)
+    total_size = sum(size for _, size in files)
+    pieces_total = math.ceil(total_size / piece_size)
+    pieces_per_chunk = max(1, READ_SIZE // piece_size)
+    chunk_size = pieces_per_chunk * piece_size
+    buffer_count = max(2, min(workers * 2, MAX_BUFFER_MEMORY // chunk_size))
+
+    free_buffers: queue.Queue[bytearray] = queue.Queue()
+    for _ in range(buffer_count):
+        free_buffers.put(bytearray(chunk_size))
+
+    chunk_hashes: list[Optional[Future[bytes]]] = [None] * math.ceil(total_size / chunk_size) if total_size else []
+    pieces_done = 0
+    done_lock = threading.Lock()
+    current_path = files[0][0] if files else ""
+    last_report = 0.0
+
+    def hash_chunk(buffer: bytearray, length: int) -> bytes:
+        nonlocal pieces_done
+        try:
+            view = memoryview(buffer)
+            digests = [
+                hashlib.sha1(view[offset:min(offset + piece_size, length)], usedforsecurity=False).digest()  # nosec B324 - BitTorrent v1 piece hashes
+                for offset in range(0, length, piece_size)
+            ]
+            view.release()
+        finally:
+            free_buffers.put(buffer)
+        with done_lock:
+            pieces_done += len(digests)
+        return b''.join(digests)
+
+    def report(force: bool = False) -> None:
+        nonlocal last_report
+        if callback is None:
+            return
+        now = time.monotonic()
+        if not force and now - last_report < interval:
+            return
+        last_report = now
+        if callback(current_path, pieces_done, pieces_total) is not None:
+            raise _Cancelled()
+
+    def next_buffer() -> bytearray:
+        # Waiting for a hasher to hand a buffer back; keep reporting progress meanwhile
+        buffer: Optional[bytearray] = None
+        while buffer is None:
+            with contextlib.suppress(queue.Empty):
+                buffer = free_buffers.get(timeout=max(interval, 0.1))
+            if buffer is None:
+                report()
+        return buffer
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="piece-hasher")
+    try:
+        report(force=True)
+        chunk_index = 0
+        buffer = next_buffer()
+        view = memoryview(buffer)
+        filled = 0
+        for filepath, expected_size in files:
+            current_path = filepath
+            remaining = expected_size
+            try:
+                with open(filepath, 'rb', buffering=0) as f:
+                    while remaining > 0:
+                        want = min(chunk_size - filled, remaining)
+                        got = f.readinto(view[filled:filled + want])
+                        if not got:
+                            raise torf.ReadError(errno.EIO, filepath)
+                        filled += got
+                        remaining -= got
+                        if filled == chunk_size:
+                            view.release()
+                            chunk_hashes[chunk_index] = executor.submit(hash_chunk, buffer, filled)
+                            chunk_index += 1
+                            report()
+                            buffer = next_buffer()
+                            view = memoryview(buffer)
+                            filled = 0
+            except OSError as e:
+                raise torf.ReadError(e.errno or errno.EIO, filepath) from e
+        view.release()
+        if filled:
+            chunk_hashes[chunk_index] = executor.submit(hash_chunk, buffer, filled)
+
+        hashes: list[bytes] = []
+        for future in chunk_hashes:
+            if future is None:
+                continue
+            while not wait([future], timeout=max(interval, 0.1)).done:
+                report()
+            hashes.append(future.result())
+        report(force=True)
+        return b''.join(hashes)
+    except _Cancelled:
+        for future in chunk_hashes:
+            if future is not None:
+                future.cancel()
+        return None
+    finally:
+        with contextlib.suppress(Exception):
+            executor.shutdown(wait=True)
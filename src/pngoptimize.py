@@ -0,0 +1,155 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Lossless PNG recompression of screenshots in a thread pool.
+
+oxipng at the levels used for large captures can take longer than the capture itself, and
+running it on one image after another leaves every other core idle. With ``optimize_images``
+enabled and oxipng installed, each screenshot is handed to a pool of worker threads as
+soon as ffmpeg has written it, so recompression overlaps the remaining captures. oxipng
+releases the GIL while it works, so threads run in parallel without forking a process that
+already has threads of its own. The pool has one worker per available core divided by
+``threads``, the number of threads each oxipng call gets.
+
+Size saved and oxipng time are reported per image.
+"""
+import asyncio
+import contextlib
+import importlib.util
+import os
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional, cast
+
+from src.console import console
+
+# Captures at least this big get the slower, stronger level
+LARGE_IMAGE_SIZE = 16_000_000
+LARGE_IMAGE_LEVEL = 6
+DEFAULT_LEVEL = 3
+
+
+class OptimizeResult(NamedTuple):
+    path: str
+    before: int
+    after: int
+    seconds: float
+
+    @property
+    def saved(self) -> int:
+        return self.before - self.after
+
+
+def _limit_oxipng_threads(threads: int) -> None:
+    # oxipng's thread pool reads this on first use; the pool's workers already run side by side
+    os.environ.setdefault('RAYON_NUM_THREADS', str(max(1, threads)))
+
+
+def _optimize_file(path: str) -> OptimizeResult:
+    """Recompress ``path`` in place. Runs in a worker thread."""
+    import oxipng  # pyright: ignore[reportMissingImports]
+
+    oxipng_module = cast(Any, oxipng)
+    start = time.perf_counter()
+    before = os.path.getsize(path)
+    oxipng_module.optimize(path, level=LARGE_IMAGE_LEVEL if before >= LARGE_IMAGE_SIZE else DEFAULT_LEVEL)
+    return OptimizeResult(path, before, os.path.getsize(path), time.perf_counter() - start)
+
+
+def available_cores() -> int:
+    with contextlib.suppress(AttributeError, OSError):
+        return max(1, len(os.sched_getaffinity(0)))  # pyright: ignore[reportAttributeAccessIssue,reportUnknownArgumentType]
+    return os.cpu_count() or 1
+
+
+class PngOptimizer:
+    def __init__(self) -> None:
+        self.enabled_by_config = False
+        self.threads = 1
+        self.results: list[OptimizeResult] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._available: Optional[bool] = None
+
+    def configure(self, config: Mapping[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        self.enabled_by_config = bool(default_cfg.get('optimize_images', True))
+        try:
+            self.threads = max(1, int(default_cfg.get('threads', 1) or 1))
+        except (TypeError, ValueError):
+            self.threads = 1
+
+    @property
+    def available(self) -> bool:
+        if self._available is None:
+            self._available = importlib.util.find_spec('oxipng') is not None
+        return self._available
+
+    @property
+    def enabled(self) -> bool:
+        return self.enabled_by_config and self.available
+
+    @property
+    def workers(self) -> int:
+        return max(1, available_cores() // self.threads)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            _limit_oxipng_threads(self.threads)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='oxipng')
+        return self._executor
+
+    def submit(self, path: str) -> 'Future[OptimizeResult]':
+        return self._get_executor().submit(_optimize_file, path)
+
+    async def optimize(self, path: str) -> Optional[OptimizeResult]:
+        """Recompress ``path`` in the pool; None when disabled or on failure (the file is left as it was)."""
+        if not self.enabled:
+            return None
+        try:
+            result = await asyncio.wrap_future(self.submit(path))
+        except Exception as e:
+            console.print(f"[yellow]Image optimization failed for {os.path.basename(path)}: {e}")
+            return None
+        self.results.append(result)
+        console.print(f"[cyan]{self.describe(result)}")
+        return result
+
+    def optimize_paths(self, paths: Sequence[str]) -> list[OptimizeResult]:
+        """Recompress ``paths`` in the pool and wait for all of them. Blocking."""
+        if not self.available:
+            return []
+        existing = [path for path in paths if os.path.exists(path)]
+        futures = [self.submit(path) for path in existing]
+        results: list[OptimizeResult] = []
+        for path, future in zip(existing, futures):
+            try:
+                results.append(future.result())
+                console.print(self.describe(results[-1]), markup=False)
+            except Exception as e:  # noqa: PERF203 - per-image failures are reported and skipped
+                console.print(f"Image optimization failed for {os.path.basename(path)}: {e}", markup=False)
+        self.results.extend(results)
+        return results
+
+    def describe(self, result: OptimizeResult) -> str:
+        return (
+            f"Optimized {os.path.basename(result.path)}: {result.before / 1024 / 1024:.2f} -> {result.after / 1024 / 1024:.2f} MiB "
+            f"(-{result.saved / max(1, result.before) * 100:.1f}%) in {result.seconds:.2f}s"
+        )
+
+    def summary(self, results: Optional[Sequence[OptimizeResult]] = None) -> str:
+        results = self.results if results is None else results
+        before = sum(result.before for result in results)
+        saved = sum(result.saved for result in results)
+        seconds = sum(result.seconds for result in results)
+        return (
+            f"{len(results)} image(s) optimized with {self.workers} worker(s): {saved / 1024 / 1024:.2f} MiB saved "
+            f"({saved / max(1, before) * 100:.1f}%), {seconds:.2f}s of oxipng time"
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+png_optimizer = PngOptimizer()
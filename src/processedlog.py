@@ -0,0 +1,183 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Append-only journals of processed queue items (``tmp/<queue>_processed_files.log``).
+
+Each processed path is one JSON string per line, so recording an item is a single append
+instead of re-reading and rewriting the whole list. ``ProcessedLog`` keeps the paths in an
+in-memory set and only reads lines appended since its last look (by this or another run),
+so membership checks stay cheap on queues with tens of thousands of entries. Writes hold an
+exclusive lock on ``<log>.lock``, so concurrent runs on the same queue don't lose entries.
+When duplicate lines pile up (e.g. two runs finishing the same item) the journal is
+compacted into a fresh file and renamed into place.
+
+Logs written by older versions (one JSON array) are read as-is and rewritten in the
+journal format on first use.
+"""
+import contextlib
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
+from typing import Any, Optional, cast
+
+from src.console import console
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        # LK_LOCK gives up after ~10 seconds; keep waiting like flock does
+        while True:
+            with contextlib.suppress(OSError):
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+
+    def _unlock_fd(fd: int) -> None:
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+# Compact once there are more duplicate lines than this, and more than unique entries
+COMPACT_MIN_DUPLICATES = 1000
+
+
+class ProcessedLog:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock_path = f"{path}.lock"
+        # Insertion ordered, so compaction keeps the processing order
+        self._paths: dict[str, None] = {}
+        self._lines = 0
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._ends_with_newline = True
+        self._thread_lock = threading.Lock()
+
+    def load(self) -> set[str]:
+        """Paths recorded so far, including ones appended by other runs since the last call."""
+        with self._locked():
+            self._refresh()
+            return set(self._paths)
+
+    def add(self, path: str) -> None:
+        """Record ``path`` as processed; no-op when it is already in the journal."""
+        with self._locked():
+            self._refresh()
+            if path in self._paths:
+                return
+            line = json.dumps(path) + '\n'
+            if not self._ends_with_newline:
+                # Previous writer died mid-line; don't glue this record onto it
+                line = '\n' + line
+            data = line.encode('utf-8')
+            with open(self.path, 'ab') as f:
+                f.write(data)
+                self._inode = os.fstat(f.fileno()).st_ino
+            self._paths[path] = None
+            self._lines += 1
+            self._offset += len(data)
+            self._ends_with_newline = True
+            duplicates = self._lines - len(self._paths)
+            if duplicates > COMPACT_MIN_DUPLICATES and duplicates > len(self._paths):
+                self._compact()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self._lock_path, 'a+b') as lock_file:
+                lock_file.seek(0)
+                _lock_fd(lock_file.fileno())
+                try:
+                    yield
+                finally:
+                    lock_file.seek(0)
+                    _unlock_fd(lock_file.fileno())
+
+    def _reset(self) -> None:
+        self._paths = {}
+        self._lines = 0
+        self._offset = 0
+        self._inode = None
+        self._ends_with_newline = True
+
+    def _refresh(self) -> None:
+        """Read whatever was appended since the last refresh; caller holds the lock."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # Replaced (compacted by another run) or truncated: start over
+            self._reset()
+        if st.st_size == self._offset:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+            self._inode = os.fstat(f.fileno()).st_ino
+        if self._offset == 0 and data.lstrip()[:1] == b'[':
+            self._load_legacy(data)
+            return
+        self._offset += len(data)
+        self._ends_with_newline = data.endswith(b'\n')
+        for raw in data.splitlines():
+            if not raw.strip():
+                continue
+            self._lines += 1
+            try:
+                entry: Any = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(entry, str):
+                self._paths[entry] = None
+
+    def _load_legacy(self, data: bytes) -> None:
+        try:
+            loaded: Any = json.loads(data)
+        except ValueError as e:
+            console.print(f"[yellow]Warning: Could not load processed files log {self.path}: {e}[/yellow]")
+            loaded = []
+        entries = cast(list[Any], loaded) if isinstance(loaded, list) else []
+        self._paths = {str(entry): None for entry in entries}
+        self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the journal with one line per path; caller holds the lock."""
+        data = ''.join(json.dumps(path) + '\n' for path in self._paths).encode('utf-8')
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+        self._inode = os.stat(self.path).st_ino
+        self._offset = len(data)
+        self._lines = len(self._paths)
+        self._ends_with_newline = True
+
+
+_logs: dict[str, ProcessedLog] = {}
+_logs_lock = threading.Lock()
+
+
+def processed_log(path: str) -> ProcessedLog:
+    """Shared ``ProcessedLog`` for ``path``, so each log is read in full only once per run."""
+    key = os.path.abspath(path)
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = ProcessedLog(key)
+            _logs[key] = log
+        return log
@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import contextlib
 import glob
 import json
 import os
@@ -16,6 +15,7 @@ from rich.style import Style
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.processedlog import processed_log
 
 QueueItem: TypeAlias = dict[str, Any]
 QueueList: TypeAlias = Union[list[str], list[QueueItem]]
@@ -60,11 +60,10 @@ class QueueManager:
         processed_files_log = os.path.join(base_dir, "tmp", f"{site_upload}_processed_paths.log")
         processed_paths: set[str] = set()
 
-        if os.path.exists(processed_files_log):
-            try:
-                processed_paths = set(cast(list[str], await _read_json_file(processed_files_log)))
-            except (json.JSONDecodeError, OSError) as e:
-                console.print(f"[yellow]Warning: Could not load processed files log: {e}[/yellow]")
+        try:
+            processed_paths = await asyncio.to_thread(processed_log(processed_files_log).load)
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not load processed files log: {e}[/yellow]")
 
         # Extract paths and IMDb IDs, filtering out processed paths
         queue: list[QueueItem] = []
@@ -112,20 +111,8 @@ class QueueManager:
 
     @staticmethod
     async def save_processed_path(processed_files_log: str, path: str) -> None:
-        processed_paths: set[str] = set()
-
-        # Load existing processed paths
-        if os.path.exists(processed_files_log):
-            with contextlib.suppress(json.JSONDecodeError, OSError):
-                processed_paths = set(cast(list[str], await _read_json_file(processed_files_log)))
-
-        # Add the new path
-        processed_paths.add(path)
-
-        # Save back to file
         try:
-            os.makedirs(os.path.dirname(processed_files_log), exist_ok=True)
-            await _write_json_file(processed_files_log, list(processed_paths), indent=4)
+            await asyncio.to_thread(processed_log(processed_files_log).add, path)
         except OSError as e:
             console.print(f"[red]Error saving processed path: {e}[/red]")
 
@@ -140,11 +127,9 @@ class QueueManager:
     @staticmethod
     async def load_processed_files(log_file: str) -> set[str]:
         """
-        Loads the list of processed files from the log file.
+        Loads the set of processed files from the log file.
         """
-        if os.path.exists(log_file):
-            return set(cast(list[str], await _read_json_file(log_file)))
-        return set()
+        return await asyncio.to_thread(processed_log(log_file).load)
 
     @staticmethod
     async def gather_files_recursive(
@@ -0,0 +1,101 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Background prep workers for pipelined queue runs.
+
+With ``queue_pipeline`` enabled, the prep stage (``Prep.gather_prep``: MediaInfo, BDInfo,
+metadata lookups) of the next queue items runs while the current item takes screenshots,
+hosts images and uploads. Each worker owns an event loop in its own thread: the per-item
+cleanup in the main loop cancels every task on its loop and kills child processes, so
+prefetched work has to live outside of it (``cleanup_manager.background_job`` keeps the
+child processes alive while a worker is busy). Console output of a prefetched item is held
+back until the main loop reaches that item, so the log still reads item by item.
+"""
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, TypeVar
+
+from src.cleanup import cleanup_manager
+from src.console import OutputBuffer, buffered_output
+from src.http_pool import http_pool
+
+T = TypeVar('T')
+
+
+class PrepWorkerExit(Exception):
+    """A prefetched item called ``sys.exit``; re-raised as SystemExit in the main loop."""
+
+    def __init__(self, code: Any) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+class _Worker:
+    def __init__(self, index: int) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=f"queue-prep-{index}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        if self.loop.is_closed():
+            return
+        with contextlib.suppress(Exception):
+            asyncio.run_coroutine_threadsafe(http_pool.aclose(), self.loop).result(timeout=timeout)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=timeout)
+        if not self.thread.is_alive():
+            self.loop.close()
+
+
+class QueuePipeline:
+    def __init__(self, workers: int) -> None:
+        self.workers = max(1, workers)
+        self._idle = [_Worker(index) for index in range(self.workers)]
+        self._all = list(self._idle)
+        self._lock = threading.Lock()
+
+    @property
+    def has_idle_worker(self) -> bool:
+        with self._lock:
+            return bool(self._idle)
+
+    def submit(self, job: Callable[[], Awaitable[T]]) -> tuple["concurrent.futures.Future[T]", OutputBuffer]:
+        """Run ``job()`` on an idle worker with its console output held back."""
+        with self._lock:
+            worker = self._idle.pop()
+        buffer = OutputBuffer()
+
+        async def run() -> T:
+            with cleanup_manager.background_job(), buffered_output(buffer):
+                try:
+                    return await job()
+                except SystemExit as e:
+                    raise PrepWorkerExit(e.code) from e
+
+        future = asyncio.run_coroutine_threadsafe(run(), worker.loop)
+        future.add_done_callback(lambda _: self._release(worker))
+        return future, buffer
+
+    def _release(self, worker: _Worker) -> None:
+        with self._lock:
+            self._idle.append(worker)
+
+    @staticmethod
+    async def result(future: "concurrent.futures.Future[T]", buffer: Optional[OutputBuffer] = None) -> T:
+        """Print the job's held back output, then wait for it (its later output goes straight through)."""
+        if buffer is not None:
+            buffer.release()
+        try:
+            return await asyncio.wrap_future(future)
+        except PrepWorkerExit as e:
+            raise SystemExit(e.code) from e
+
+    def shutdown(self) -> None:
+        for worker in self._all:
+            worker.stop()
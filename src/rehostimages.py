@@ -9,9 +9,11 @@ from typing import Any, Optional, Union, cast
 from urllib.parse import urlparse
 
 import aiofiles
+import httpx
 from aiofiles import os as aio_os
 
 from src.console import console
+from src.http_pool import http_pool
 from src.takescreens import TakeScreensManager
 from src.type_utils import to_int
 from src.uploadscreens import UploadScreensManager
@@ -31,6 +33,40 @@ def _safe_remove(path: str) -> bool:
     return False
 
 
+async def _download_reused_images(meta: dict[str, Any], screenshots_dir: str) -> None:
+    """Fetch the images of ``meta['image_list']`` that have no local copy yet, so they can be rehosted."""
+    missing: dict[str, str] = {}
+    for image in cast(list[dict[str, str]], meta.get('image_list', [])):
+        for url_key in ['raw_url', 'img_url', 'web_url']:
+            url_value = _as_str(image.get(url_key))
+            if not url_value:
+                continue
+            filename = os.path.basename(urlparse(url_value).path)
+            if filename and filename.lower().endswith('.png'):
+                if not await aio_os.path.exists(os.path.join(screenshots_dir, filename)):
+                    # Handle when pixhost url points to web_url and convert to raw_url
+                    missing[filename] = url_value.replace("https://pixhost.to/show/", "https://img1.pixhost.to/images/", 1)
+                break
+    if not missing:
+        return
+
+    await aio_os.makedirs(screenshots_dir, exist_ok=True)
+    async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0, follow_redirects=True) as client:
+        async def fetch(filename: str, url: str) -> None:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                console.print(f"[yellow]Could not download {url} for rehosting: {e}[/yellow]")
+                return
+            image_filename = os.path.join(screenshots_dir, filename)
+            async with aiofiles.open(image_filename, 'wb') as f:
+                await f.write(response.content)
+            console.print(f"Saved {url} as {image_filename}")
+
+        await asyncio.gather(*[fetch(filename, url) for filename, url in missing.items()])
+
+
 async def match_host(hostname: str, approved_hosts: Iterable[str]) -> str:
     for approved_host in approved_hosts:
         if hostname == approved_host or hostname.endswith(f".{approved_host}"):
@@ -319,8 +355,11 @@ async def _handle_image_upload(
 
     # First check if there are any saved screenshots matching those in the image_list
     if meta.get('image_list') and isinstance(meta['image_list'], list):
+        # Images reused from another tracker are only probed, not downloaded, until they need rehosting
+        await _download_reused_images(meta, screenshots_dir)
+
         # Get all PNG files in the screenshots directory
-        all_png_files: list[str] = [file for file in await aio_os.listdir(screenshots_dir) if file.endswith('.png')]
+        all_png_files: list[str] = [os.path.join(screenshots_dir, file) for file in await aio_os.listdir(screenshots_dir) if file.endswith('.png')]
         if all_png_files and meta.get('debug'):
             console.print(f"[cyan]Found {len(all_png_files)} PNG files in screenshots directory")
 
@@ -386,11 +425,10 @@ async def _handle_image_upload(
 
     # Fallback: glob for indexed screenshots if still not enough
     if len(all_screenshots) < multi_screens:
-        os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob: list[str] = []
         for pattern in image_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(screenshots_dir), pattern))
             image_glob.extend(glob_results)
             if meta['debug']:
                 console.print(f"[cyan]Found {len(image_glob)} files matching pattern: {pattern}")
@@ -398,11 +436,11 @@ async def _handle_image_upload(
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files: set[str] = set()
         for pattern in unwanted_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(screenshots_dir), pattern))
             unwanted_files.update(glob_results)
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                hidden_glob_results = await asyncio.to_thread(glob.glob, hidden_pattern)
+                hidden_glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(screenshots_dir), hidden_pattern))
                 unwanted_files.update(hidden_glob_results)
 
         # Remove unwanted files
@@ -0,0 +1,126 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Cross-upload cache for SRRDB and predb lookups.
+
+Scene releases don't change once they are pred, so lookups are stored in the shared
+metadata cache (``data/cache/metadata_cache.db``) keyed by release name instead of in each
+upload's tmp dir. Misses are cached too, with a short TTL since pres can show up late.
+Looking up an episode also fetches the rest of that group's season in one SRRDB search, so
+the following episodes of a queue (or the other files of a season pack) are cache hits.
+"""
+import re
+import urllib.parse
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, cast
+
+import httpx
+
+from src.console import console
+from src.metadata_cache import DAY, HOUR, metadata_cache
+
+SRRDB_API = "https://api.srrdb.com/v1"
+
+HIT_TTL = 30 * DAY
+MISS_TTL = 12 * HOUR
+# How long a season search counts as done; only used to warm the per-release entries
+SEASON_TTL = 12 * HOUR
+
+# Show.Name.S01E02.1080p.WEB.h264-GROUP -> ('Show.Name.S01', 'GROUP')
+_EPISODE_RE = re.compile(r'^(?P<prefix>.+?\.S\d{2})E\d{2,3}\b.*-(?P<group>[A-Za-z0-9]+)$', re.IGNORECASE)
+
+
+def _results_count(response_json: Any) -> int:
+    try:
+        return int(cast(dict[str, Any], response_json).get('resultsCount', 0) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+class SceneLookupCache:
+    async def lookup(
+        self,
+        namespace: str,
+        endpoint: str,
+        key: Any,
+        fetch: Callable[[], Awaitable[Optional[Any]]],
+        is_hit: Callable[[Any], bool],
+    ) -> Optional[Any]:
+        """Cached value for ``key``, or the result of ``fetch``; None (a failed fetch) is not cached."""
+        cached = await metadata_cache.get_json(namespace, endpoint, key)
+        if cached is not None:
+            return cached
+        value = await fetch()
+        if value is not None:
+            await metadata_cache.put_json(namespace, endpoint, key, value, HIT_TTL if is_hit(value) else MISS_TTL)
+        return value
+
+    async def _srrdb_get(self, client: httpx.AsyncClient, url: str, timeout: float, debug: bool) -> Optional[Any]:
+        if debug:
+            console.print("Using SRRDB url", url)
+        try:
+            response = await client.get(url, timeout=timeout)
+        except httpx.HTTPError as e:
+            console.print(f"[yellow]SRRDB: Request failed: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    async def srrdb_search(self, client: httpx.AsyncClient, release_name: str, debug: bool = False) -> Optional[Any]:
+        """SRRDB ``r:`` search for a release name; None when SRRDB could not be asked."""
+        key = release_name.lower()
+        cached = await metadata_cache.get_json('srrdb', 'release', key)
+        if cached is None and await self._prefetch_season(client, release_name, debug):
+            cached = await metadata_cache.get_json('srrdb', 'release', key)
+        if cached is not None:
+            if debug:
+                console.print(f"[cyan]SRRDB: Using cached search for {release_name}")
+            return cached
+
+        async def fetch() -> Optional[Any]:
+            return await self._srrdb_get(client, f"{SRRDB_API}/search/r:{urllib.parse.quote(release_name)}", 30.0, debug)
+
+        return await self.lookup('srrdb', 'release', key, fetch, lambda value: _results_count(value) > 0)
+
+    async def _prefetch_season(self, client: httpx.AsyncClient, release_name: str, debug: bool) -> bool:
+        """Cache every release of an episode's season and group with one search; True if anything was fetched."""
+        match = _EPISODE_RE.match(release_name)
+        if not match or not metadata_cache.enabled:
+            return False
+        prefix, group = match.group('prefix'), match.group('group')
+        season_key = [prefix.lower(), group.lower()]
+        if await metadata_cache.get_json('srrdb', 'season', season_key) is not None:
+            return False
+
+        url = f"{SRRDB_API}/search/start:{urllib.parse.quote(prefix)}/group:{urllib.parse.quote(group)}"
+        response_json = await self._srrdb_get(client, url, 30.0, debug)
+        if response_json is None:
+            return False
+        results = cast(list[dict[str, Any]], cast(dict[str, Any], response_json).get('results') or [])
+        for result in results:
+            if result.get('release'):
+                entry = {'resultsCount': 1, 'results': [result]}
+                await metadata_cache.put_json('srrdb', 'release', str(result['release']).lower(), entry, HIT_TTL)
+        await metadata_cache.put_json('srrdb', 'season', season_key, {'releases': len(results)}, SEASON_TTL)
+        if debug:
+            console.print(f"[cyan]SRRDB: Cached {len(results)} releases for {prefix} from {group}")
+        return bool(results)
+
+    async def srrdb_details(self, client: httpx.AsyncClient, release: str, debug: bool = False) -> Optional[Any]:
+        async def fetch() -> Optional[Any]:
+            return await self._srrdb_get(client, f"{SRRDB_API}/details/{release}", 30.0, debug)
+
+        return await self.lookup('srrdb', 'details', release, fetch, bool)
+
+    async def srrdb_query(self, client: httpx.AsyncClient, query: str, timeout: float = 10.0, debug: bool = False) -> Optional[Any]:
+        """Any other SRRDB search, e.g. ``start:<name>/group:<tag>``."""
+        async def fetch() -> Optional[Any]:
+            return await self._srrdb_get(client, f"{SRRDB_API}/search/{query}", timeout, debug)
+
+        return await self.lookup('srrdb', 'search', query, fetch, lambda value: _results_count(value) > 0)
+
+
+scene_cache = SceneLookupCache()
@@ -1,8 +1,9 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
-import os
+import asyncio
 from typing import Any, Optional, cast
 
 from src.console import console
+from src.fs_index import fs_index
 
 
 class Search:
@@ -31,19 +32,11 @@ class Search:
             return None
         words = filename.split()
 
-        async def search_file(search_dir: str) -> list[str]:
-            files_total_search: list[str] = []
-            console.print(f"Searching {search_dir}")
-            for root, _dirs, files in os.walk(search_dir, topdown=False):
-                for name in files:
-                    if not name.endswith('.nfo'):
-                        l_name = name.lower()
-                        if await self.file_search(l_name, words):
-                            files_total_search.append(os.path.join(root, name))
-            return files_total_search
+        # Names come from the persistent file index; the lookup runs off the event loop
         for each in self._get_search_dirs():
-            files = await search_file(each)
-            files_total.extend(files)
+            console.print(f"Searching {each}")
+            entries = await asyncio.to_thread(fs_index.match_substrings, [each], words, False, True, lambda entry: not entry.name.endswith('.nfo'))
+            files_total.extend(entry.path for entry in entries)
         return files_total
 
     async def searchFolder(self, foldername: str) -> Optional[list[str]]:
@@ -54,28 +47,9 @@ class Search:
             return None
         words = foldername.split()
 
-        async def search_dir(search_dir: str) -> list[str]:
-            console.print(f"Searching {search_dir}")
-            folders_total_search: list[str] = []
-            for root, dirs, _files in os.walk(search_dir, topdown=False):
-
-                for name in dirs:
-                    l_name = name.lower()
-
-                    if await self.file_search(l_name, words):
-                        folders_total_search.append(os.path.join(root, name))
-
-            return folders_total_search
         for each in self._get_search_dirs():
-            folders = await search_dir(each)
-            folders_total.extend(folders)
+            console.print(f"Searching {each}")
+            entries = await asyncio.to_thread(fs_index.match_substrings, [each], words, True)
+            folders_total.extend(entry.path for entry in entries)
 
         return folders_total
-
-    async def file_search(self, name: str, name_words: list[str]) -> bool:
-        check = True
-        for word in name_words:
-            if word not in name:
-                check = False
-                break
-        return check
@@ -20,6 +20,9 @@ from pymediainfo import MediaInfo
 
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.frameselect import select_frames
+from src.pngoptimize import OptimizeResult, png_optimizer
+from src.uploadscreens import ScreenUploadStream
 
 default_config: dict[str, Any] = {}
 task_limit = 1
@@ -29,14 +32,18 @@ ffmpeg_is_good = False
 use_libplacebo = True
 tone_map = False
 ffmpeg_compression = "6"
+batch_screens = True
+batch_size = 6
 algorithm = "mobius"
 desat = 10.0
+frame_selection = False
 
 
 def _apply_config(config: Mapping[str, Any]) -> None:
     global default_config, task_limit, cutoff
     global ffmpeg_limit, ffmpeg_is_good, use_libplacebo
     global tone_map, ffmpeg_compression, algorithm, desat
+    global batch_screens, batch_size, frame_selection
 
     default_section = config.get('DEFAULT', {})
     default_config = cast(dict[str, Any], default_section) if isinstance(default_section, Mapping) else {}
@@ -56,6 +63,13 @@ def _apply_config(config: Mapping[str, Any]) -> None:
     use_libplacebo = default_config.get('use_libplacebo', True)
     tone_map = default_config.get('tone_map', False)
     ffmpeg_compression = str(default_config.get('ffmpeg_compression', '6'))
+    batch_screens = bool(default_config.get('ffmpeg_batch_screens', True))
+    try:
+        batch_size = max(1, int(default_config.get('ffmpeg_batch_size', 6) or 6))
+    except (TypeError, ValueError):
+        batch_size = 6
+    frame_selection = bool(default_config.get('frame_selection', False))
+    png_optimizer.configure(config)
     algorithm = str(default_config.get('algorithm', 'mobius')).strip()
     try:
         desat = float(default_config.get('desat', 10.0))
@@ -171,8 +185,7 @@ async def disc_screenshots(
     keyframe = 'nokey' if "VC-1" in bdinfo['video'][0]['codec'] or bdinfo['video'][0]['hdr_dv'] != "" else 'none'
     if meta['debug']:
         console.print(f"File: {file_path}, Length: {length}, Frame Rate: {frame_rate}", markup=False)
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
-    existing_screens = glob.glob(f"{sanitized_filename}-*.png")
+    existing_screens = glob.glob(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-*.png")
     total_existing = len(existing_screens) + len(existing_images)
     num_screens = max(0, screens - total_existing) if not force_screenshots else num_screens
 
@@ -576,7 +589,6 @@ async def dvd_screenshots(
         return fallback_duration, 0.0
 
     main_set = meta['discs'][disc_num]['main_set'][1:] if len(meta['discs'][disc_num]['main_set']) > 1 else meta['discs'][disc_num]['main_set']
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
     voblength, _vob_index = await _is_vob_good(0, 0, num_screens)
     ss_times = await valid_ss_time([], num_screens, voblength, frame_rate, meta, retake=retry_cap)
     capture_tasks: list[Awaitable[tuple[int, Optional[str]]]] = []
@@ -858,7 +870,9 @@ async def screenshots(
         num_screens: int = 0,
         force_screenshots: bool = False,
         manual_frames: Union[str, list[str]] = "",
+        upload_stream: Optional[ScreenUploadStream] = None,
 ) -> Union[list[str], None]:
+    """Capture screenshots of ``path``; with ``upload_stream``, each one is queued for upload as soon as it is ready."""
     img_host = await get_image_host(meta)
     screens = meta['screens']
     start_time = time.time() if meta.get('debug') else 0.0
@@ -932,7 +946,6 @@ async def screenshots(
         return None
     meta['frame_rate'] = frame_rate
     loglevel = 'verbose' if meta.get('ffdebug', False) else 'quiet'
-    os.chdir(f"{base_dir}/tmp/{folder_id}")
 
     if manual_frames and meta['debug']:
         console.print(f"[yellow]Using manual frames: {manual_frames}")
@@ -974,6 +987,8 @@ async def screenshots(
 
     num_capture = num_screens - existing_images_count
 
+    if not ss_times and frame_selection and not force_screenshots:
+        ss_times = await select_frames(path, num_capture, length, meta, run_ffmpeg, limit=task_limit) or []
     if not ss_times:
         ss_times = await valid_ss_time([], num_capture, length, frame_rate, meta, retake=force_screenshots)
 
@@ -1041,67 +1056,25 @@ async def screenshots(
     # Create semaphore to limit concurrent tasks
     semaphore = asyncio.Semaphore(num_workers)
 
-    async def capture_with_semaphore(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
-        async with semaphore:
-            return await capture_screenshot(args)
-
-    capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = []
-    for i in range(num_capture):
-        image_index = existing_images_count + i
-        image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{image_index}.png")
-        if not os.path.exists(image_path) or meta.get('retake', False):
-            capture_tasks.append(
-                capture_with_semaphore(
-                    (i, path, float(ss_times[i]), image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
-                )
-            )
-
-    try:
-        results = cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True))
-        # Log any error strings that were returned (these indicate exceptions in capture_screenshot)
-        for r in results:
-            if isinstance(r, Exception):
-                console.print(f"[red]Screenshot capture exception: {r}[/red]")
-        capture_result_tuples: list[tuple[int, Optional[str]]] = [
-            cast(tuple[int, Optional[str]], r)
-            for r in results
-            if isinstance(r, tuple)
-        ]
-        capture_result_tuples.sort(key=lambda x: x[0])
-        capture_results: list[str] = [r[1] for r in capture_result_tuples if r[1] is not None]
-
-    except KeyboardInterrupt:
-        console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        console.print("[red]All tasks cancelled. Exiting.[/red]")
-        gc.collect()
-        cleanup_manager.reset_terminal()
-        sys.exit(1)
-    except asyncio.CancelledError:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        gc.collect()
-        cleanup_manager.reset_terminal()
-        sys.exit(1)
-    except Exception:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        gc.collect()
-        cleanup_manager.reset_terminal()
-        sys.exit(1)
-    finally:
-        await asyncio.sleep(0.1)
-        await kill_all_child_processes()
-        if meta['debug']:
-            console.print("[yellow]All capture tasks finished. Cleaning up...[/yellow]")
-
-    if not force_screenshots and meta['debug']:
-        console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
-
     valid_results: list[str] = []
     remaining_retakes: list[str] = []
-    for image_path in capture_results:
+    optimized: list[OptimizeResult] = []
+    # Each screenshot is optimized, checked (and retaken if needed) as soon as it is captured, while the rest are still being captured
+    finalize_tasks: list[asyncio.Task[None]] = []
+
+    def accept(image_path: str) -> None:
+        valid_results.append(image_path)
+        if upload_stream is not None:
+            upload_stream.put(_screen_index(image_path), image_path)
+
+    async def optimize(image_path: str) -> None:
+        result = await png_optimizer.optimize(image_path)
+        if result is not None:
+            optimized.append(result)
+
+    async def finalize(image_path: str) -> None:
+        # Host size limits apply to the optimized file
+        await optimize(image_path)
         retake = False
         image_size = os.path.getsize(image_path)
         if meta['debug']:
@@ -1132,68 +1105,28 @@ async def screenshots(
                     console.print(f"[red]Unknown image host or image doesn't meet requirements for host: {img_host}, retaking.")
                     retake = True
 
-        if retake:
-            retry_attempts = 5
-            retry_offsets = [5.0, 10.0, -10.0, 100.0, -100.0]
-            frame_rate = meta.get('frame_rate', 24.0)
-            original_index = int(image_path.rsplit('-', 1)[-1].split('.')[0])
-            original_time = ss_times[original_index] if original_index < len(ss_times) else None
-
-            for attempt in range(1, retry_attempts + 1):
-                if original_time is not None:
-                    for offset in retry_offsets:
-                        adjusted_time = max(0, float(original_time) + offset)
-                        console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at {adjusted_time:.2f}s (offset {offset:+.2f}s)[/yellow]")
-                        try:
-                            if os.path.exists(image_path):
-                                os.remove(image_path)
+        if not retake:
+            accept(image_path)
+            return
 
-                            screenshot_response = await capture_screenshot((
-                                original_index, path, adjusted_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
-                            ))
+        retry_attempts = 5
+        retry_offsets = [5.0, 10.0, -10.0, 100.0, -100.0]
+        original_index = _screen_index(image_path)
+        original_time = ss_times[original_index] if original_index < len(ss_times) else None
 
-                            if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
-                                continue
-
-                            _, screenshot_path = screenshot_response
-
-                            if not screenshot_path or not os.path.exists(screenshot_path):
-                                continue
-
-                            new_size = os.path.getsize(screenshot_path)
-                            valid_image = False
-
-                            if img_host and "imgbb" in img_host:
-                                if 75000 < new_size <= 31000000:
-                                    console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                    valid_image = True
-                            elif img_host and img_host in ["imgbox", "pixhost"]:
-                                if 75000 < new_size <= 10000000:
-                                    console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                    valid_image = True
-                            elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
-                                console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
-                                valid_image = True
-
-                            if valid_image:
-                                valid_results.append(screenshot_path)
-                                break
-                        except Exception as e:
-                            console.print(f"[red]Error retaking screenshot for {image_path} at {adjusted_time:.2f}s: {e}[/red]")
-                    else:
-                        continue
-                    break
-                else:
-                    # Fallback: use random time if original_time is not available
-                    random_time = random.uniform(0, length)  # nosec B311 - Random screenshot timing, not cryptographic
-                    console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at random time {random_time:.2f}s[/yellow]")
+        for attempt in range(1, retry_attempts + 1):
+            if original_time is not None:
+                for offset in retry_offsets:
+                    adjusted_time = max(0, float(original_time) + offset)
+                    console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at {adjusted_time:.2f}s (offset {offset:+.2f}s)[/yellow]")
                     try:
                         if os.path.exists(image_path):
                             os.remove(image_path)
 
-                        screenshot_response = await capture_screenshot((
-                            original_index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
-                        ))
+                        async with semaphore:
+                            screenshot_response = await capture_screenshot((
+                                original_index, path, adjusted_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
+                            ))
 
                         if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
                             continue
@@ -1208,25 +1141,164 @@ async def screenshots(
 
                         if img_host and "imgbb" in img_host:
                             if 75000 < new_size <= 31000000:
+                                console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                                 valid_image = True
                         elif img_host and img_host in ["imgbox", "pixhost"]:
                             if 75000 < new_size <= 10000000:
+                                console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                                 valid_image = True
                         elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
+                            console.print(f"[green]Successfully retaken screenshot for: {screenshot_path} ({new_size} bytes)[/green]")
                             valid_image = True
 
                         if valid_image:
-                            valid_results.append(screenshot_path)
-                            break
+                            await optimize(screenshot_path)
+                            accept(screenshot_path)
+                            return
                     except Exception as e:
-                        console.print(f"[red]Error retaking screenshot for {image_path} at random time {random_time:.2f}s: {e}[/red]")
+                        console.print(f"[red]Error retaking screenshot for {image_path} at {adjusted_time:.2f}s: {e}[/red]")
             else:
-                console.print(f"[red]All retry attempts failed for {image_path}. Skipping.[/red]")
-                remaining_retakes.append(image_path)
-                gc.collect()
+                # Fallback: use random time if original_time is not available
+                random_time = random.uniform(0, length)  # nosec B311 - Random screenshot timing, not cryptographic
+                console.print(f"[yellow]Retaking screenshot for: {image_path} (Attempt {attempt}/{retry_attempts}) at random time {random_time:.2f}s[/yellow]")
+                try:
+                    if os.path.exists(image_path):
+                        os.remove(image_path)
 
-        else:
-            valid_results.append(image_path)
+                    async with semaphore:
+                        screenshot_response = await capture_screenshot((
+                            original_index, path, random_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta
+                        ))
+
+                    if not isinstance(screenshot_response, tuple) or len(screenshot_response) != 2:
+                        continue
+
+                    _, screenshot_path = screenshot_response
+
+                    if not screenshot_path or not os.path.exists(screenshot_path):
+                        continue
+
+                    new_size = os.path.getsize(screenshot_path)
+                    valid_image = False
+
+                    if img_host and "imgbb" in img_host:
+                        if 75000 < new_size <= 31000000:
+                            valid_image = True
+                    elif img_host and img_host in ["imgbox", "pixhost"]:
+                        if 75000 < new_size <= 10000000:
+                            valid_image = True
+                    elif img_host and img_host in ["ptpimg", "lensdump", "ptscreens", "onlyimage", "dalexni", "zipline", "passtheimage", "seedpool_cdn", "sharex", "utppm"] and new_size > 75000:
+                        valid_image = True
+
+                    if valid_image:
+                        await optimize(screenshot_path)
+                        accept(screenshot_path)
+                        return
+                except Exception as e:
+                    console.print(f"[red]Error retaking screenshot for {image_path} at random time {random_time:.2f}s: {e}[/red]")
+
+        console.print(f"[red]All retry attempts failed for {image_path}. Skipping.[/red]")
+        remaining_retakes.append(image_path)
+        gc.collect()
+
+    def start_finalize(image_path: str) -> None:
+        finalize_tasks.append(asyncio.create_task(finalize(image_path)))
+
+    async def capture_with_semaphore(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
+        async with semaphore:
+            result = await capture_screenshot(args)
+        if result and result[1]:
+            start_finalize(result[1])
+        return result
+
+    pending: list[tuple[int, float, str]] = []
+    for i in range(num_capture):
+        image_index = existing_images_count + i
+        image_path = os.path.abspath(f"{base_dir}/tmp/{folder_id}/{sanitized_filename}-{image_index}.png")
+        if not os.path.exists(image_path) or meta.get('retake', False):
+            pending.append((i, float(ss_times[i]), image_path))
+
+    async def batch_with_semaphore(batch: list[tuple[int, float, str]]) -> dict[int, str]:
+        async with semaphore:
+            captured = await capture_screenshots_batch(path, batch, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+        for image_path in captured.values():
+            start_finalize(image_path)
+        return captured
+
+    try:
+        batched: dict[int, str] = {}
+        # Frame overlays need per-frame drawtext filters, so they always use the per-frame path
+        if batch_screens and len(pending) > 1 and not meta.get('frame_overlay', False):
+            batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+            for batch_result in await asyncio.gather(*[batch_with_semaphore(batch) for batch in batches], return_exceptions=True):
+                if isinstance(batch_result, dict):
+                    batched.update(batch_result)
+                elif meta['debug']:
+                    console.print(f"[yellow]Batched screenshot capture failed: {batch_result}[/yellow]")
+
+        capture_tasks: list[Awaitable[Optional[tuple[int, Optional[str]]]]] = [
+            capture_with_semaphore((i, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta))
+            for i, ss_time, image_path in pending
+            if i not in batched
+        ]
+        results = cast(list[object], await asyncio.gather(*capture_tasks, return_exceptions=True))
+        results.extend(batched.items())
+        # Log any error strings that were returned (these indicate exceptions in capture_screenshot)
+        for r in results:
+            if isinstance(r, Exception):
+                console.print(f"[red]Screenshot capture exception: {r}[/red]")
+        capture_result_tuples: list[tuple[int, Optional[str]]] = [
+            cast(tuple[int, Optional[str]], r)
+            for r in results
+            if isinstance(r, tuple)
+        ]
+        capture_result_tuples.sort(key=lambda x: x[0])
+        capture_results: list[str] = [r[1] for r in capture_result_tuples if r[1] is not None]
+
+        if not force_screenshots and meta['debug']:
+            console.print(f"[green]Successfully captured {len(capture_results)} screenshots.")
+
+        # Retakes still run ffmpeg, so they finish before the stray process cleanup below
+        for finalize_result in await asyncio.gather(*finalize_tasks, return_exceptions=True):
+            if isinstance(finalize_result, Exception):
+                console.print(f"[red]Screenshot check exception: {finalize_result}[/red]")
+
+    except KeyboardInterrupt:
+        console.print("\n[red]CTRL+C detected. Cancelling capture tasks...[/red]")
+        await asyncio.sleep(0.1)
+        if upload_stream is not None:
+            await upload_stream.cancel()
+        await kill_all_child_processes()
+        console.print("[red]All tasks cancelled. Exiting.[/red]")
+        gc.collect()
+        cleanup_manager.reset_terminal()
+        sys.exit(1)
+    except asyncio.CancelledError:
+        await asyncio.sleep(0.1)
+        if upload_stream is not None:
+            await upload_stream.cancel()
+        await kill_all_child_processes()
+        gc.collect()
+        cleanup_manager.reset_terminal()
+        sys.exit(1)
+    except Exception:
+        await asyncio.sleep(0.1)
+        if upload_stream is not None:
+            await upload_stream.cancel()
+        await kill_all_child_processes()
+        gc.collect()
+        cleanup_manager.reset_terminal()
+        sys.exit(1)
+    finally:
+        await asyncio.sleep(0.1)
+        await kill_all_child_processes()
+        if meta['debug']:
+            console.print("[yellow]All capture tasks finished. Cleaning up...[/yellow]")
+
+    if optimized:
+        console.print(f"[green]{png_optimizer.summary(optimized)}")
+
+    valid_results.sort(key=_screen_index)
 
     if remaining_retakes:
         console.print(f"[red]The following images could not be retaken successfully: {remaining_retakes}[/red]")
@@ -1246,12 +1318,20 @@ async def screenshots(
     elif discs and len(discs) > 1:
         one_disc = False
 
+    if upload_stream is not None:
+        # Cleanup cancels every running task, so the queued uploads are finished first
+        await upload_stream.finish()
+
     if (not meta.get('tv_pack') and one_disc) or multi_screens == 0:
         await cleanup_manager.cleanup()
 
     return valid_results if valid_results else None
 
 
+def _screen_index(image_path: str) -> int:
+    return int(image_path.rsplit('-', 1)[-1].split('.')[0])
+
+
 async def capture_screenshot(args: tuple[int, str, float, str, float, float, float, float, str, bool, dict[str, Any]]) -> Optional[tuple[int, Optional[str]]]:
     index, path, ss_time, image_path, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta = args
 
@@ -1537,6 +1617,121 @@ async def capture_screenshot(args: tuple[int, str, float, str, float, float, flo
         return None
 
 
+def _screenshot_filters(width: float, height: float, w_sar: float, h_sar: float, hdr_tonemap: bool, libplacebo: bool) -> list[tuple[str, list[str], dict[str, str]]]:
+    """Filter chain of capture_screenshot (without frame overlays) as (name, args, kwargs) for ffmpeg-python."""
+    filters: list[tuple[str, list[str], dict[str, str]]] = []
+    if w_sar != 1 or h_sar != 1:
+        filters.append(("scale", [str(int(round(width * w_sar))), str(int(round(height * h_sar)))], {}))
+    if hdr_tonemap:
+        if libplacebo:
+            filters.append(("libplacebo", [], {
+                'tonemapping': 'hable', 'colorspace': 'bt709', 'color_primaries': 'bt709', 'color_trc': 'bt709', 'range': 'tv'
+            }))
+        else:
+            filters.extend([
+                ("zscale", [], {'transfer': 'linear'}),
+                ("tonemap", [], {'tonemap': algorithm, 'desat': str(desat)}),
+                ("zscale", [], {'transfer': 'bt709'}),
+                ("format", ["rgb24"], {}),
+            ])
+    filters.append(("format", ["rgb24"], {}))
+    return filters
+
+
+async def capture_screenshots_batch(
+        path: str,
+        captures: list[tuple[int, float, str]],
+        width: float,
+        height: float,
+        w_sar: float,
+        h_sar: float,
+        loglevel: str,
+        hdr_tonemap: bool,
+        meta: dict[str, Any],
+) -> dict[int, str]:
+    """
+    Capture several frames of one file with a single ffmpeg process.
+
+    Every (index, ss_time, image_path) capture becomes an input-seeked, one frame segment that is
+    concatenated into one filter graph, so process start-up, stream probing and the scale/tonemap
+    (libplacebo/Vulkan) initialisation happen once per batch instead of once per frame.
+    Returns {index: image_path} for the images that were written; the caller captures any
+    missing ones with capture_screenshot.
+    """
+    if not captures or width <= 0 or height <= 0:
+        return {}
+    resolved_path = await asyncio.to_thread(_batch_input_path, path, meta)
+    if resolved_path is None:
+        return {}
+    path = resolved_path
+
+    use_placebo = bool(hdr_tonemap and meta.get('libplacebo', False))
+    if use_placebo and default_config.get('ffmpeg_warmup', False):
+        await libplacebo_warmup(path, meta, loglevel)
+
+    first_image = captures[0][2]
+    # Frames are written to a numbered pattern next to the final images, then moved into place
+    batch_prefix = f"{os.path.splitext(first_image)[0]}.batch-"
+    pattern = f"{batch_prefix.replace('%', '%%')}%d.png"
+    segments = [
+        cast(Any, ffmpeg).input(path, ss=str(ss_time))['v:0'].trim(end_frame=1).setpts('PTS-STARTPTS')
+        for _, ss_time, _ in captures
+    ]
+    stream = cast(Any, ffmpeg).concat(*segments, v=1, a=0) if len(segments) > 1 else segments[0]
+    for name, args, kwargs in _screenshot_filters(width, height, w_sar, h_sar, hdr_tonemap, use_placebo):
+        stream = stream.filter(name, *args, **kwargs)
+
+    global_args = ['-y', '-loglevel', loglevel, '-hide_banner', '-an', '-sn']
+    if use_placebo:
+        global_args += ['-init_hw_device', 'vulkan']
+    if ffmpeg_limit:
+        global_args += ['-threads', '1']
+    info_cmd = stream.output(
+        pattern,
+        vframes=len(captures),
+        start_number=0,
+        vsync='0',
+        compression_level=ffmpeg_compression,
+        pred='mixed',
+    ).global_args(*global_args)
+
+    if loglevel == 'verbose' or meta.get('debug', False):
+        console.print(f"[cyan]Batched FFmpeg command ({len(captures)} frames): {' '.join(info_cmd.compile())}[/cyan]", emoji=False)
+
+    try:
+        returncode, _stdout, stderr = await asyncio.wait_for(run_ffmpeg(info_cmd), timeout=140 + 20 * len(captures))
+    except asyncio.TimeoutError:
+        returncode, stderr = -1, b"Timeout"
+
+    captured = await asyncio.to_thread(_move_batch_images, batch_prefix, captures, returncode == 0)
+
+    if len(captured) < len(captures) and (loglevel == 'verbose' or meta.get('debug', False)):
+        err_txt = (stderr or b"").decode(errors='replace').strip()
+        console.print(f"[yellow]Batched capture wrote {len(captured)}/{len(captures)} images, capturing the rest one by one. {err_txt}[/yellow]")
+    return captured
+
+
+def _batch_input_path(path: str, meta: dict[str, Any]) -> Optional[str]:
+    """The file a batched capture reads, or None when there is no such file."""
+    path = os.path.normpath(path)
+    if os.path.isdir(path) and meta.get('filelist'):
+        path = meta['filelist'][0]
+    return path if os.path.isfile(path) else None
+
+
+def _move_batch_images(batch_prefix: str, captures: list[tuple[int, float, str]], succeeded: bool) -> dict[int, str]:
+    """Move the frames of a batched capture to their final names; partial output of a failed run is removed."""
+    captured: dict[int, str] = {}
+    for position, (index, _, image_path) in enumerate(captures):
+        batch_path = f"{batch_prefix}{position}.png"
+        if succeeded and os.path.exists(batch_path) and os.path.getsize(batch_path) > 0:
+            os.replace(batch_path, image_path)
+            captured[index] = image_path
+        elif os.path.exists(batch_path):
+            os.remove(batch_path)
+    return captured
+
+
 async def valid_ss_time(ss_times: list[str], num_screens: int, length: float, frame_rate: float, meta: dict[str, Any], retake: bool = False) -> list[str]:
     total_screens = num_screens + 1 if meta['is_disc'] else num_screens
     total_frames = int(length * frame_rate)
@@ -1874,8 +2069,9 @@ class TakeScreensManager:
             num_screens: int = 0,
             force_screenshots: bool = False,
             manual_frames: Union[str, list[str]] = "",
+            upload_stream: Optional[ScreenUploadStream] = None,
     ) -> Optional[list[str]]:
-        return await screenshots(path, filename, folder_id, base_dir, meta, num_screens, force_screenshots, manual_frames)
+        return await screenshots(path, filename, folder_id, base_dir, meta, num_screens, force_screenshots, manual_frames, upload_stream)
 
     async def capture_screenshot(
             self,
@@ -1883,6 +2079,20 @@ class TakeScreensManager:
     ) -> Optional[tuple[int, Optional[str]]]:
         return await capture_screenshot(args)
 
+    async def capture_screenshots_batch(
+            self,
+            path: str,
+            captures: list[tuple[int, float, str]],
+            width: float,
+            height: float,
+            w_sar: float,
+            h_sar: float,
+            loglevel: str,
+            hdr_tonemap: bool,
+            meta: dict[str, Any]
+    ) -> dict[int, str]:
+        return await capture_screenshots_batch(path, captures, width, height, w_sar, h_sar, loglevel, hdr_tonemap, meta)
+
     async def valid_ss_time(
             self,
             ss_times: list[str],
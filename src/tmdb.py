@@ -19,7 +19,9 @@ import httpx
 from src.args import Args
 from src.cleanup import cleanup_manager
 from src.console import console
+from src.http_pool import http_pool
 from src.imdb import imdb_manager
+from src.metadata_cache import metadata_cache
 
 default_config: dict[str, Any] = {}
 tmdb_api_key: Optional[str] = None
@@ -312,7 +314,7 @@ async def get_tmdb_from_imdb(
         url = f"{TMDB_BASE_URL}/find/{external_id}"
         params = {"api_key": tmdb_api_key, "external_source": source}
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
             response: Optional[httpx.Response] = None
             try:
                 response = await client.get(url, params=params, timeout=10)
@@ -454,7 +456,7 @@ async def get_tmdb_id(
             final_attempt = False
         if attempted:
             await asyncio.sleep(1)  # Whoa baby, slow down
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
             try:
                 # Primary search attempt with year
                 if category == "MOVIE":
@@ -1066,7 +1068,7 @@ async def tmdb_other_meta(
     year = None
     original_imdb_id = imdb_id
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         # Get main media details first (movie or TV show)
         main_url = f"{TMDB_BASE_URL}/{('movie' if category == 'MOVIE' else 'tv')}/{tmdb_id}"
 
@@ -1362,7 +1364,7 @@ async def get_keywords(tmdb_id: int, category: str) -> str:
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/keywords"
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1411,7 +1413,7 @@ async def get_directors(tmdb_id: int, category: str) -> list[str]:
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/credits"
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             try:
@@ -1527,7 +1529,7 @@ async def get_romaji(tmdb_name: str, mal: Optional[int], meta: dict[str, Any]) -
 
         url = 'https://graphql.anilist.co'
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                 response = await client.post(url, json={'query': query, 'variables': variables})
             json_data = typing_cast(dict[str, Any], response.json())
 
@@ -1687,7 +1689,7 @@ def extract_imdb_id(value: str) -> Optional[int]:
 async def daily_to_tmdb_season_episode(tmdbid: int, date: Union[str, datetime]) -> tuple[int, int]:
     date = datetime.fromisoformat(str(date))
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         # Get TV show information to get seasons
         response = await client.get(
             f"{TMDB_BASE_URL}/tv/{tmdbid}",
@@ -1744,7 +1746,7 @@ async def get_episode_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching episode details for TMDb ID: {tmdb_id}, Season: {season_number}, Episode: {episode_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         try:
             # Get episode details
             response = await client.get(
@@ -1823,7 +1825,7 @@ async def get_season_details(
 ) -> dict[str, Any]:
     if debug:
         console.print(f"[cyan]Fetching season details for TMDb ID: {tmdb_id}, Season: {season_number}[/cyan]")
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         try:
             # Get season details
             response = await client.get(
@@ -1929,7 +1931,7 @@ async def get_logo(
                 console.print("[cyan]Using provided logo_json data instead of making an HTTP request[/cyan]")
         else:
             # Make HTTP request only if logo_json is not provided
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
                 endpoint = "tv" if category == "TV" else "movie"
                 image_response = await client.get(
                     f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/images",
@@ -1984,7 +1986,7 @@ async def get_tmdb_translations(
     endpoint = "movie" if category == "MOVIE" else "tv"
     url = f"{TMDB_BASE_URL}/{endpoint}/{tmdb_id}/translations"
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(transport=metadata_cache.transport('tmdb')) as client:
         try:
             response = await client.get(url, params={"api_key": tmdb_api_key})
             response.raise_for_status()
@@ -2141,7 +2143,7 @@ async def get_tmdb_localized_data(meta: dict[str, Any], data_type: str, language
 
         # Fetch from API if not in cache
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(timeout=10.0, transport=metadata_cache.transport('tmdb')) as client:
                 response = await client.get(url, params=params)
                 if response.status_code == 200:
                     tmdb_data = response.json()
@@ -18,6 +18,7 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.torrent_inventory import client_inventory
 from src.torrentcreate import TorrentCreator
 
 # These have to be global variables to be shared across all instances since a new instance is made every time
@@ -343,6 +344,7 @@ class QbittorrentClientMixin:
 
             # **Step 1: Find correct torrents using content_path**
             best_match: Optional[dict[str, Any]] = None
+            inventory_size: Optional[int] = None
             matching_torrents: list[dict[str, Any]] = []
 
             try:
@@ -400,11 +402,14 @@ class QbittorrentClientMixin:
                     if qbt_client is None:
                         console.print("[bold red]qBittorrent client not initialized")
                         return None
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
+                    inventory = client_inventory(qbt_client)
+                    await self.retry_qbt_operation(
+                        lambda: asyncio.to_thread(inventory.refresh, qbt_client.sync_maindata),
+                        "Sync torrents list",
                         initial_timeout=14.0
                     )
+                    inventory_size = len(inventory)
+                    torrents = self._build_mock_torrents(inventory.by_name(str(meta['uuid'])))
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 return None
@@ -431,7 +436,7 @@ class QbittorrentClientMixin:
 
                 matching_torrents.append({'hash': torrent.hash, 'name': torrent.name})
 
-            console.print(f"[cyan]DEBUG: Checked {torrent_count} total torrents in qBittorrent[/cyan]")
+            console.print(f"[cyan]DEBUG: Checked {inventory_size if inventory_size is not None else torrent_count} total torrents in qBittorrent[/cyan]")
             if not matching_torrents:
                 console.print("[yellow]No matching torrents found in qBittorrent.")
                 return None
@@ -1159,12 +1164,14 @@ class QbittorrentClientMixin:
 
         return [MockTorrent(torrent) for torrent in torrents_data]
 
-    def _torrent_name_matches(self, torrent_name: str, meta: dict[str, Any]) -> bool:
+    def _torrent_match_names(self, meta: dict[str, Any]) -> list[str]:
         is_disc = meta.get('is_disc', "")
         if is_disc in ("", None) and len(meta.get('filelist', [])) == 1:
-            file_name = os.path.basename(meta['filelist'][0])
-            return torrent_name.lower() == file_name.lower() or torrent_name.lower() == meta['uuid'].lower()
-        return torrent_name.lower() == meta['uuid'].lower()
+            return [meta['uuid'], os.path.basename(meta['filelist'][0])]
+        return [meta['uuid']]
+
+    def _torrent_name_matches(self, torrent_name: str, meta: dict[str, Any]) -> bool:
+        return torrent_name.lower() in (name.lower() for name in self._torrent_match_names(meta))
 
     def _extract_tracker_matches(self, torrent: Any, tracker_patterns: dict[str, dict[str, str]], tracker_priority: list[str], has_working_tracker: bool, meta: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
         tracker_found = False
@@ -1336,11 +1343,13 @@ class QbittorrentClientMixin:
                 else:
                     if qbt_client is None:
                         return []
-                    torrents = await self.retry_qbt_operation(
-                        lambda: asyncio.to_thread(qbt_client.torrents_info),
-                        "Get torrents list",
+                    inventory = client_inventory(qbt_client)
+                    await self.retry_qbt_operation(
+                        lambda: asyncio.to_thread(inventory.refresh, qbt_client.sync_maindata),
+                        "Sync torrents list",
                         initial_timeout=14.0
                     )
+                    torrents = self._build_mock_torrents(inventory.by_name(*self._torrent_match_names(meta)))
             except asyncio.TimeoutError:
                 console.print("[bold red]Getting torrents list timed out after retries")
                 if qbt_session:
@@ -1,4 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
 import errno
 import os
 import platform
@@ -15,6 +16,7 @@ from torf import Torrent
 
 from cogs.redaction import Redaction
 from src.console import console
+from src.torrent_inventory import torrent_file_index
 from src.torrentcreate import TorrentCreator
 
 # Secure XML-RPC client using defusedxml to prevent XML attacks
@@ -402,19 +404,12 @@ class RtorrentClientMixin:
             console.print(f"[green]Found matching torrent file: {torrent_path}")
         else:
             # Try to find the torrent file in storage directory (case insensitive)
-            found = False
             console.print(f"[yellow]Searching for torrent file with hash {info_hash_v1} in {torrent_storage_dir}")
-
-            if os.path.exists(torrent_storage_dir):
-                for filename in os.listdir(torrent_storage_dir):
-                    filename_str = str(filename)
-                    if filename_str.lower().endswith(".torrent"):
-                        file_hash = os.path.splitext(filename_str)[0]  # Remove .torrent extension
-                        if file_hash.upper() == info_hash_v1:
-                            torrent_path = os.path.join(torrent_storage_dir, filename_str)
-                            found = True
-                            console.print(f"[green]Found torrent file with matching hash: {filename_str}")
-                            break
+            found_path = await asyncio.to_thread(torrent_file_index.find, torrent_storage_dir, info_hash_v1)
+            found = found_path is not None
+            if found_path is not None:
+                torrent_path = found_path
+                console.print(f"[green]Found torrent file with matching hash: {os.path.basename(found_path)}")
 
             if not found:
                 console.print(f"[bold red]No torrent file found for hash: {info_hash_v1}")
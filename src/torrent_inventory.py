@@ -0,0 +1,167 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Indexed inventories of the torrents in the configured clients, for existing-torrent searches.
+
+Searching qBittorrent for an existing .torrent used to fetch the full ``torrents/info`` list
+on every upload and walk it in Python, which gets slow with tens of thousands of torrents.
+``TorrentInventory`` is filled once per client session from ``sync/maindata`` and then kept
+current with that endpoint's incremental diffs (only what changed since the last ``rid``),
+with dict indexes by infohash, lower-cased name and content path.
+
+``TorrentFileIndex`` does the same for rTorrent's session directory, where ``<HASH>.torrent``
+files are looked up by hash instead of listing the directory on every search.
+"""
+import os
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, Optional, cast
+
+# Searches within this many seconds of the last sync reuse it instead of asking the client again
+MIN_REFRESH_INTERVAL = 2.0
+
+
+def _content_path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+class TorrentInventory:
+    def __init__(self) -> None:
+        self.rid = 0
+        self.last_sync = 0.0
+        self._torrents: dict[str, dict[str, Any]] = {}
+        # Insertion ordered "sets" of hashes, so results keep the client's order
+        self._by_name: dict[str, dict[str, None]] = {}
+        self._by_content_path: dict[str, dict[str, None]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._torrents)
+
+    def refresh(self, fetch: Callable[[int], Mapping[str, Any]], max_age: float = MIN_REFRESH_INTERVAL) -> None:
+        """Apply ``fetch(rid)`` (``sync/maindata``) unless the last sync is younger than ``max_age``. Blocking."""
+        with self._lock:
+            if self.last_sync and time.monotonic() - self.last_sync < max_age:
+                return
+            self.apply(fetch(self.rid))
+            self.last_sync = time.monotonic()
+
+    def apply(self, maindata: Mapping[str, Any]) -> None:
+        """Apply one ``sync/maindata`` response, full or incremental."""
+        if maindata.get('full_update'):
+            self._torrents = {}
+            self._by_name = {}
+            self._by_content_path = {}
+        torrents = cast(Mapping[str, Mapping[str, Any]], maindata.get('torrents') or {})
+        for info_hash, changes in torrents.items():
+            self._update(info_hash, changes)
+        for info_hash in cast(Iterable[str], maindata.get('torrents_removed') or []):
+            self._remove(info_hash)
+        self.rid = int(maindata.get('rid') or 0)
+
+    def _update(self, info_hash: str, changes: Mapping[str, Any]) -> None:
+        torrent = self._torrents.get(info_hash)
+        if torrent is None:
+            torrent = {'hash': info_hash}
+            self._torrents[info_hash] = torrent
+        elif 'name' in changes or 'content_path' in changes:
+            self._unindex(info_hash, torrent)
+        else:
+            # Progress, speeds, peers...: nothing indexed changed
+            torrent.update(changes)
+            return
+        torrent.update(changes)
+        self._index(info_hash, torrent)
+
+    def _remove(self, info_hash: str) -> None:
+        torrent = self._torrents.pop(info_hash, None)
+        if torrent is not None:
+            self._unindex(info_hash, torrent)
+
+    def _index(self, info_hash: str, torrent: Mapping[str, Any]) -> None:
+        name = torrent.get('name')
+        if name:
+            self._by_name.setdefault(str(name).lower(), {})[info_hash] = None
+        content_path = torrent.get('content_path')
+        if content_path:
+            self._by_content_path.setdefault(_content_path_key(str(content_path)), {})[info_hash] = None
+
+    def _unindex(self, info_hash: str, torrent: Mapping[str, Any]) -> None:
+        for index, key in (
+            (self._by_name, str(torrent.get('name') or '').lower()),
+            (self._by_content_path, _content_path_key(str(torrent.get('content_path') or '')) if torrent.get('content_path') else ''),
+        ):
+            hashes = index.get(key)
+            if hashes is not None:
+                hashes.pop(info_hash, None)
+                if not hashes:
+                    del index[key]
+
+    def get(self, info_hash: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            torrent = self._torrents.get(info_hash.lower())
+            return dict(torrent) if torrent is not None else None
+
+    def by_name(self, *names: str) -> list[dict[str, Any]]:
+        """Torrents whose name matches any of ``names`` (case-insensitive)."""
+        return self._lookup(self._by_name, [name.lower() for name in names if name])
+
+    def by_content_path(self, *paths: str) -> list[dict[str, Any]]:
+        """Torrents whose content path (as the client sees it) is one of ``paths``."""
+        return self._lookup(self._by_content_path, [_content_path_key(path) for path in paths if path])
+
+    def _lookup(self, index: dict[str, dict[str, None]], keys: list[str]) -> list[dict[str, Any]]:
+        with self._lock:
+            hashes: dict[str, None] = {}
+            for key in keys:
+                hashes.update(index.get(key, {}))
+            return [dict(self._torrents[info_hash]) for info_hash in hashes]
+
+
+class TorrentFileIndex:
+    """``<infohash>.torrent`` files of session/storage directories, re-listed when a directory changes."""
+
+    def __init__(self) -> None:
+        self._dirs: dict[str, tuple[int, dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def find(self, storage_dir: str, info_hash: str) -> Optional[str]:
+        """Path of the .torrent for ``info_hash`` in ``storage_dir`` (any case), or None."""
+        try:
+            mtime = os.stat(storage_dir).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._dirs.get(storage_dir)
+        if cached is None or cached[0] != mtime:
+            try:
+                files = {
+                    os.path.splitext(filename)[0].upper(): filename
+                    for filename in os.listdir(storage_dir)
+                    if filename.lower().endswith('.torrent')
+                }
+            except OSError:
+                return None
+            cached = (mtime, files)
+            with self._lock:
+                self._dirs[storage_dir] = cached
+        filename = cached[1].get(info_hash.strip().upper())
+        return os.path.join(storage_dir, filename) if filename else None
+
+
+_inventories: "weakref.WeakKeyDictionary[Any, TorrentInventory]" = weakref.WeakKeyDictionary()
+_inventories_lock = threading.Lock()
+
+
+def client_inventory(client: Any) -> TorrentInventory:
+    """Inventory of a logged-in client session; a new session (re-login) starts from a full sync."""
+    with _inventories_lock:
+        inventory = _inventories.get(client)
+        if inventory is None:
+            inventory = TorrentInventory()
+            _inventories[client] = inventory
+        return inventory
+
+
+torrent_file_index = TorrentFileIndex()
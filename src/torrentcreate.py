@@ -14,7 +14,7 @@ import sys
 import time
 from collections.abc import Mapping, MutableMapping, Sequence
 from datetime import datetime, timezone
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import cli_ui
 import torf
@@ -22,6 +22,7 @@ from torf import Torrent
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.piecehasher import hash_pieces
 
 PIECE_SIZE_MIN = 32 * 1024  # 32 KiB
 PIECE_SIZE_MAX = 134_217_728  # 128 MiB
@@ -96,6 +97,32 @@ class CustomTorrent(torf.Torrent):
             self.metainfo['info']['piece length'] = self._precalculated_piece_size
             return
 
+    def generate(self, threads: Optional[int] = None, callback: Optional[Callable[..., Any]] = None, interval: float = 0) -> bool:
+        """Hash pieces with the pipelined hasher in src.piecehasher instead of torf's reader/hasher threads."""
+        if self.path is None:
+            raise RuntimeError('generate() called with no path specified')
+        info = self.metainfo['info']
+        if 'files' in info:
+            files = [(os.path.join(str(self.path), *entry['path']), int(entry['length'])) for entry in info['files']]
+        else:
+            files = [(str(self.path), int(info.get('length', 0)))]
+        if sum(size for _, size in files) < 1:
+            raise torf.PathError(self.path, msg='Empty or all files excluded')
+
+        if threads is None:
+            with contextlib.suppress(TypeError, ValueError):
+                threads = int(self._meta.get('mkbrr_threads', 0) or 0)
+
+        def progress(filepath: str, pieces_done: int, pieces_total: int) -> Any:
+            return callback(self, filepath, pieces_done, pieces_total) if callback is not None else None
+
+        pieces = hash_pieces(files, self.piece_size, workers=threads, callback=progress, interval=interval)
+        if pieces is None:
+            # Cancelled by the callback
+            return False
+        info['pieces'] = pieces
+        return True
+
 
 class TorrentCreator:
     # Limit concurrent torrent creation to avoid heavy parallel hashing
@@ -244,7 +271,6 @@ class TorrentCreator:
                         exclude = []
                     elif not meta.get('tv_pack', False):
                         path_dir = os.fspath(path)
-                        os.chdir(path_dir)
                         globs = [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mkv"))] + [
                             os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.mp4"))
                         ] + [os.path.basename(f) for f in glob.glob(os.path.join(path_dir, "*.ts"))]
@@ -0,0 +1,346 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Local store of each tracker's banned release groups, internal claims and TRaSH groups.
+
+``TrackerLists`` keeps one snapshot per tracker under ``data/cache/tracker_lists``. The
+trackers of a run are refreshed together at startup (``refresh``), and a list is only asked
+for again once it is older than ``tracker_lists_refresh_interval``. Refreshes are conditional:
+
+- Sources that send an ETag or Last-Modified header are asked with If-None-Match /
+  If-Modified-Since, so an unchanged list costs one 304 response.
+- Cursor-paginated APIs resume from the cursor of the last page fetched, so only that page
+  and any newer ones are transferred. That only sees groups appended at the end of the sort
+  order, so the whole list is fetched again once a day (``FULL_REFRESH_INTERVAL``, as often
+  as the lists were refetched before the store), which picks up insertions and removals.
+
+Group checks go through a case-insensitive hash index (``BannedGroups``), and claims are
+indexed by TMDB id.
+"""
+import asyncio
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Callable, NamedTuple, Optional, cast
+
+import httpx
+
+from src.console import console
+from src.http_pool import http_pool
+
+JsonDict = dict[str, Any]
+
+STORE_VERSION = 1
+DEFAULT_REFRESH_INTERVAL = 3600.0
+FULL_REFRESH_INTERVAL = 24 * 3600.0
+PER_PAGE = 100
+
+BANNED = 'banned'
+CLAIMS = 'claims'
+TRASH = 'trash'
+
+
+class ListSource(NamedTuple):
+    """Where a list comes from.
+
+    ``parse`` turns a whole response body into items (TRaSH); without it the body is a
+    plain list, or a UNIT3D style page with ``data`` and ``meta.next_cursor``.
+    """
+
+    url: str
+    headers: Optional[Mapping[str, str]] = None
+    paginated: bool = True
+    parse: Optional[Callable[[Any], list[JsonDict]]] = None
+
+
+class BannedGroups:
+    """Case-insensitive set of group names, each with an optional note."""
+
+    def __init__(self, entries: Iterable[Any] = ()) -> None:
+        self._notes: dict[str, str] = {}
+        self.add(entries)
+
+    def add(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            if isinstance(entry, (list, tuple)):
+                values = [str(value) for value in cast(Sequence[Any], entry)]
+                if not values:
+                    continue
+                name, note = values[0], values[1] if len(values) > 1 else ''
+            else:
+                name, note = str(entry), ''
+            key = name.strip().lower()
+            if key and (key not in self._notes or (note and not self._notes[key])):
+                self._notes[key] = note
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.strip().lower() in self._notes
+
+    def __len__(self) -> int:
+        return len(self._notes)
+
+    def note(self, name: str) -> str:
+        return self._notes.get(name.strip().lower(), '')
+
+
+class ListState:
+    __slots__ = ('cursor', 'etag', 'full_at', 'items', 'last_modified', 'last_page_count', 'refreshed_at', 'validated_cursor')
+
+    def __init__(self) -> None:
+        self.items: list[JsonDict] = []
+        # Cursor of the last page fetched and how many items came from it
+        self.cursor: Optional[str] = None
+        self.last_page_count = 0
+        # Validators of the first request of the last refresh, which started at validated_cursor
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.validated_cursor: Optional[str] = None
+        self.refreshed_at = 0.0
+        self.full_at = 0.0
+
+    def to_json(self) -> JsonDict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def copy(self) -> 'ListState':
+        return ListState.from_json(self.to_json())
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> 'ListState':
+        state = cls()
+        for name in cls.__slots__:
+            if name in data:
+                setattr(state, name, data[name])
+        state.items = [item for item in cast(list[Any], state.items or []) if isinstance(item, dict)]
+        return state
+
+
+def _banned_items(page: Iterable[Any]) -> list[JsonDict]:
+    return [{'name': str(item['name'])} for item in page if isinstance(item, dict) and item.get('name')]
+
+
+def _claim_items(page: Iterable[Any]) -> list[JsonDict]:
+    claims: list[JsonDict] = []
+    for item in page:
+        if not isinstance(item, dict) or not isinstance(item.get('attributes'), dict):
+            continue
+        attributes = cast(JsonDict, item['attributes'])
+        claims.append({
+            'title': attributes.get('title', 'Unknown'),
+            'season': attributes.get('season', 'Unknown'),
+            'tmdb_id': attributes.get('tmdb_id', 'Unknown'),
+            'resolutions': attributes.get('resolutions', []),
+            'types': attributes.get('types', []),
+        })
+    return claims
+
+
+NORMALIZERS: dict[str, Callable[[Iterable[Any]], list[JsonDict]]] = {BANNED: _banned_items, CLAIMS: _claim_items, TRASH: _banned_items}
+
+
+class TrackerStore:
+    def __init__(self, tracker: str, path: str) -> None:
+        self.tracker = tracker
+        self.path = path
+        self.lists: dict[str, ListState] = {}
+        # Kinds whose last refresh in this run failed
+        self.failed: set[str] = set()
+        self._groups: Optional[BannedGroups] = None
+        self._claims: Optional[dict[Any, list[JsonDict]]] = None
+
+    def has(self, kind: str) -> bool:
+        return kind in self.lists and kind not in self.failed
+
+    def invalidate(self) -> None:
+        self._groups = None
+        self._claims = None
+
+    def banned_groups(self) -> BannedGroups:
+        """Groups of the tracker's banned list and of the TRaSH list, if it has one."""
+        if self._groups is None:
+            groups = BannedGroups()
+            for kind in (BANNED, TRASH):
+                if kind in self.lists:
+                    groups.add(item['name'] for item in self.lists[kind].items)
+            self._groups = groups
+        return self._groups
+
+    def claims(self, tmdb_id: Any) -> list[JsonDict]:
+        if self._claims is None:
+            index: dict[Any, list[JsonDict]] = {}
+            for item in self.lists[CLAIMS].items if CLAIMS in self.lists else []:
+                index.setdefault(item.get('tmdb_id'), []).append(item)
+            self._claims = index
+        return self._claims.get(tmdb_id, [])
+
+    def load(self) -> None:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != STORE_VERSION or data.get('tracker') != self.tracker:
+                return
+            self.lists = {kind: ListState.from_json(state) for kind, state in data['lists'].items() if isinstance(state, dict)}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self.lists = {}
+        self.invalidate()
+
+    def save(self) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        data = {'version': STORE_VERSION, 'tracker': self.tracker, 'lists': {kind: state.to_json() for kind, state in self.lists.items()}}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            console.print(f"[yellow]Could not save the banned groups and claims of {self.tracker}: {e}[/yellow]")
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
+class TrackerLists:
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.cache_dir = cache_dir or os.path.join(base_dir, 'data', 'cache', 'tracker_lists')
+        self.refresh_interval = DEFAULT_REFRESH_INTERVAL
+        self._stores: dict[str, TrackerStore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        with contextlib.suppress(TypeError, ValueError):
+            self.refresh_interval = max(0.0, float(default_cfg.get('tracker_lists_refresh_interval', DEFAULT_REFRESH_INTERVAL)))
+
+    async def store(self, tracker: str) -> TrackerStore:
+        """The snapshot of ``tracker``, loaded from disk on first use. Not refreshed."""
+        tracker = tracker.upper()
+        store = self._stores.get(tracker)
+        if store is None:
+            store = TrackerStore(tracker, os.path.join(self.cache_dir, f"{tracker}.json"))
+            await asyncio.to_thread(store.load)
+            self._stores[tracker] = store
+        return store
+
+    def _stale(self, store: TrackerStore, kinds: Iterable[str]) -> bool:
+        now = time.time()
+        return any(kind not in store.lists or now - store.lists[kind].refreshed_at >= self.refresh_interval for kind in kinds)
+
+    async def ensure(self, tracker: str, sources: Mapping[str, ListSource], debug: bool = False) -> TrackerStore:
+        """The snapshot of ``tracker`` with every list of ``sources`` refreshed if it is stale."""
+        tracker = tracker.upper()
+        lock = self._locks.setdefault(tracker, asyncio.Lock())
+        async with lock:
+            store = await self.store(tracker)
+            if sources and self._stale(store, sources):
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
+                    await self._refresh_store(client, store, sources, debug)
+            return store
+
+    async def refresh(self, sources: Mapping[str, Mapping[str, ListSource]], debug: bool = False) -> None:
+        """Refresh the stale lists of every tracker in ``sources`` in parallel, over one client."""
+        sources = {tracker.upper(): tracker_sources for tracker, tracker_sources in sources.items() if tracker_sources}
+        if not sources:
+            return
+        start = time.perf_counter()
+        async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
+
+            async def refresh_tracker(tracker: str, tracker_sources: Mapping[str, ListSource]) -> None:
+                async with self._locks.setdefault(tracker, asyncio.Lock()):
+                    store = await self.store(tracker)
+                    if self._stale(store, tracker_sources):
+                        await self._refresh_store(client, store, tracker_sources, debug)
+
+            await asyncio.gather(*(refresh_tracker(tracker, tracker_sources) for tracker, tracker_sources in sources.items()))
+        if debug:
+            console.print(f"[cyan]Refreshed banned groups and claims of {', '.join(sources)} in {time.perf_counter() - start:.2f}s[/cyan]")
+
+    async def _refresh_store(self, client: httpx.AsyncClient, store: TrackerStore, sources: Mapping[str, ListSource], debug: bool) -> None:
+        results = await asyncio.gather(*(self._refresh_list(client, store, kind, source, debug) for kind, source in sources.items()))
+        store.failed = {kind for kind, ok in zip(sources, results) if not ok}
+        store.invalidate()
+        await asyncio.to_thread(store.save)
+
+    async def _refresh_list(self, client: httpx.AsyncClient, store: TrackerStore, kind: str, source: ListSource, debug: bool) -> bool:
+        """Bring one list up to date; False when it could not be read, leaving the old snapshot as it was."""
+        previous = store.lists.get(kind)
+        # Only replaces the stored state once every page has been read
+        state = previous.copy() if previous is not None else ListState()
+        now = time.time()
+        full = not source.paginated or state.cursor is None or now - state.full_at >= FULL_REFRESH_INTERVAL
+        cursor = None if full else state.cursor
+        conditional: dict[str, str] = {}
+        if state.validated_cursor == cursor and state.items:
+            if state.etag:
+                conditional['If-None-Match'] = state.etag
+            if state.last_modified:
+                conditional['If-Modified-Since'] = state.last_modified
+
+        normalize = NORMALIZERS[kind]
+        items: list[JsonDict] = []
+        page_cursor = cursor
+        page_count = 0
+        first = True
+        try:
+            while True:
+                params: Optional[JsonDict] = None
+                if source.paginated:
+                    params = {'per_page': PER_PAGE, 'cursor': page_cursor} if page_cursor else {'per_page': PER_PAGE}
+                response = await client.get(source.url, headers={**(source.headers or {}), **(conditional if first else {})}, params=params)
+                if first and response.status_code == 304:
+                    state.refreshed_at = now
+                    store.lists[kind] = state
+                    if debug:
+                        console.print(f"[cyan]{store.tracker} {kind} list unchanged ({len(state.items)} entries)[/cyan]")
+                    return True
+                if response.status_code != 200:
+                    console.print(f"[red]Error: Received status code {response.status_code} for the {kind} list of '{store.tracker}'.[/red]")
+                    return False
+                if first:
+                    state.etag = response.headers.get('ETag')
+                    state.last_modified = response.headers.get('Last-Modified')
+                    state.validated_cursor = cursor
+                    first = False
+
+                body = response.json()
+                next_cursor: Optional[str] = None
+                if source.parse is not None:
+                    page = source.parse(body)
+                elif isinstance(body, list):
+                    page = cast(list[Any], body)
+                elif isinstance(body, dict) and isinstance(body.get('data', []), list):
+                    body_dict = cast(JsonDict, body)
+                    page = cast(list[Any], body_dict.get('data', []))
+                    meta_info = body_dict.get('meta')
+                    next_cursor = cast(Optional[str], cast(JsonDict, meta_info).get('next_cursor')) if isinstance(meta_info, dict) else None
+                else:
+                    console.print(f"[red]Unexpected response format for the {kind} list of '{store.tracker}': {type(body)}[/red]")
+                    return False
+
+                normalized = normalize(page)
+                items.extend(normalized)
+                page_count = len(normalized)
+                if not source.paginated or not next_cursor:
+                    break
+                page_cursor = next_cursor
+        except (httpx.RequestError, ValueError) as e:
+            console.print(f"[red]Failed to fetch the {kind} list of '{store.tracker}': {e}[/red]")
+            return False
+
+        if full:
+            state.items = items
+            state.full_at = now
+        else:
+            # The last page is fetched again, with whatever was added to it and after it
+            state.items = state.items[:max(0, len(state.items) - state.last_page_count)] + items
+        state.cursor = page_cursor if source.paginated else None
+        state.last_page_count = page_count
+        state.refreshed_at = now
+        store.lists[kind] = state
+        if debug:
+            mode = "fetched" if full else "resumed"
+            console.print(f"[cyan]{store.tracker} {kind} list {mode}: {len(items)} new or updated, {len(state.items)} entries[/cyan]")
+        return True
+
+
+tracker_lists = TrackerLists()
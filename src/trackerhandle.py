@@ -13,8 +13,6 @@ from cogs.redaction import Redaction
 from src.cleanup import cleanup_manager
 from src.get_desc import DescriptionBuilder
 from src.manualpackage import ManualPackageManager
-from src.trackers.PTP import PTP
-from src.trackers.THR import THR
 from src.trackersetup import TRACKER_SETUP
 
 Meta: TypeAlias = dict[str, Any]
@@ -259,7 +257,7 @@ async def process_trackers(
             tracker_status = cast(StatusDict, meta.get('tracker_status') or {})
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
-                thr = THR(config=config)
+                thr = tracker_class_map['THR'](config=config)
                 thr_any = cast(Any, thr)
                 is_uploaded = False
                 try:
@@ -285,7 +283,7 @@ async def process_trackers(
             upload_status = cast(Mapping[str, Any], tracker_status.get(tracker, {})).get('upload', False)
             if upload_status:
                 try:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     groupID = meta.get('ptp_groupID', None)
                     ptpUrl, ptpData = await ptp.fill_upload_form(groupID, meta)
                     is_uploaded = False
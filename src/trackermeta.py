@@ -4,7 +4,6 @@ import io
 import os
 import sys
 from collections.abc import Mapping, MutableMapping, Sequence
-from io import BytesIO
 from pathlib import Path
 from typing import Any, Optional, cast
 
@@ -17,6 +16,8 @@ from typing_extensions import TypeAlias
 from src.bbcode import BBCODE
 from src.btnid import BtnIdManager
 from src.console import console
+from src.http_pool import http_pool
+from src.imageprobe import ImageProbeError, probe_image
 from src.trackers.COMMON import COMMON
 from src.type_utils import to_int
 
@@ -140,7 +141,7 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
 
     timeout = aiohttp.ClientTimeout(total=15, connect=5, sock_connect=5, sock_read=5)
 
-    async def check_and_collect(image_dict: ImageDict) -> Optional[ImageDict]:
+    async def check_and_collect(session: aiohttp.ClientSession, image_dict: ImageDict) -> Optional[ImageDict]:
         img_url = cast(Optional[str], image_dict.get('raw_url'))
         if not img_url:
             return None
@@ -154,76 +155,60 @@ async def check_images_concurrently(imagelist: Sequence[ImageDict], meta: Meta)
         if img_url.startswith("https://pixhost.to/show/"):
             img_url = img_url.replace("https://pixhost.to/show/", "https://img1.pixhost.to/images/", 1)
 
-        # Verify the image link
+        # Read the resolution from the image header; the whole image is only fetched if that fails
         try:
-            if await check_image_link(img_url, timeout):
-                try:
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        try:
-                            async with session.get(img_url) as response:
-                                if response.status == 200:
-                                    image_content = await response.read()
-
-                                    try:
-                                        image = Image.open(BytesIO(image_content))
-                                        vertical_resolution = image.height
-                                        lower_bound = expected_vertical_resolution * 0.70
-                                        upper_bound = expected_vertical_resolution * (1.30 if meta.get('is_disc') == "DVD" else 1.00)
-
-                                        if not (lower_bound <= vertical_resolution <= upper_bound):
-                                            console.print(
-                                                f"[red]Image {img_url} resolution ({vertical_resolution}p) "
-                                                f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
-                                            )
-                                            return None
-
-                                        # Save image
-                                        os.makedirs(save_directory, exist_ok=True)
-                                        image_filename = os.path.join(save_directory, os.path.basename(img_url))
-                                        await asyncio.to_thread(Path(image_filename).write_bytes, image_content)
-
-                                        console.print(f"Saved {img_url} as {image_filename}")
-
-                                        meta['image_sizes'][img_url] = len(image_content)
-
-                                        if meta['debug']:
-                                            console.print(
-                                                f"Valid image {img_url} with resolution {image.width}x{image.height} "
-                                                f"and size {len(image_content) / 1024:.2f} KiB"
-                                            )
-                                        return image_dict
-                                    except Exception as e:
-                                        console.print(f"[red]Failed to process image {img_url}: {e}")
-                                        return None
-                                else:
-                                    console.print(f"[red]Failed to fetch image {img_url}. Status: {response.status}. Skipping.")
-                                    return None
-                        except asyncio.TimeoutError:
-                            console.print(f"[red]Timeout downloading image: {img_url}")
-                            return None
-                        except aiohttp.ClientError as e:
-                            console.print(f"[red]Client error downloading image: {img_url} - {e}")
-                            return None
-                except Exception as e:
-                    console.print(f"[red]Session error for image: {img_url} - {e}")
-                    return None
-            else:
-                return None
+            probe = await probe_image(session, img_url, ssl=False)
+        except ImageProbeError as e:
+            console.print(f"[red]Failed to fetch image {img_url}: {e}. Skipping.")
+            return None
+        except asyncio.TimeoutError:
+            console.print(f"[red]Timeout checking image: {img_url}")
+            return None
+        except aiohttp.ClientError as e:
+            console.print(f"[red]Client error checking image: {img_url} - {e}")
+            return None
         except Exception as e:
             console.print(f"[red]Error checking image: {img_url} - {e}")
             return None
 
+        vertical_resolution = probe.height
+        lower_bound = expected_vertical_resolution * 0.70
+        upper_bound = expected_vertical_resolution * (1.30 if meta.get('is_disc') == "DVD" else 1.00)
+
+        if not (lower_bound <= vertical_resolution <= upper_bound):
+            console.print(
+                f"[red]Image {img_url} resolution ({vertical_resolution}p) "
+                f"is outside the allowed range ({int(lower_bound)}-{int(upper_bound)}p). Skipping.[/red]"
+            )
+            return None
+
+        if probe.content is not None:
+            # Keep the local copy when the image had to be downloaded anyway
+            os.makedirs(save_directory, exist_ok=True)
+            image_filename = os.path.join(save_directory, os.path.basename(img_url))
+            await asyncio.to_thread(Path(image_filename).write_bytes, probe.content)
+            console.print(f"Saved {img_url} as {image_filename}")
+
+        if probe.size is not None:
+            meta['image_sizes'][img_url] = probe.size
+
+        if meta['debug']:
+            size_text = f"{probe.size / 1024:.2f} KiB" if probe.size is not None else "unknown size"
+            console.print(f"Valid image {img_url} with resolution {probe.width}x{probe.height} and {size_text}")
+        return image_dict
+
     # Run image verification concurrently but with a limit to prevent too many simultaneous connections
     semaphore = asyncio.Semaphore(2)  # Limit concurrent requests to 2
 
-    async def bounded_check(image_dict: ImageDict) -> Optional[ImageDict]:
+    async def bounded_check(session: aiohttp.ClientSession, image_dict: ImageDict) -> Optional[ImageDict]:
         async with semaphore:
-            return await check_and_collect(image_dict)
-
-    tasks = [bounded_check(image_dict) for image_dict in unique_images]
+            return await check_and_collect(session, image_dict)
 
     try:
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        # One session on the shared keep-alive connector for every probe
+        async with aiohttp.ClientSession(timeout=timeout, connector=http_pool.aiohttp_connector(), connector_owner=False) as session:
+            tasks = [bounded_check(session, image_dict) for image_dict in unique_images]
+            results = await asyncio.gather(*tasks, return_exceptions=False)
     except Exception as e:
         console.print(f"[red]Error during image processing: {e}")
         results = []
@@ -9,8 +9,9 @@ from typing import Any
 import aiofiles
 import httpx
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE
 from src.console import console
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 
@@ -249,7 +250,7 @@ class ACM:
         }
 
         if meta['debug'] is False:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                 response = await client.post(url=self.upload_url, files=files, data=data, headers=headers, params=params)
                 try:
                     response_data = response.json()
@@ -294,7 +295,7 @@ class ACM:
         }
         # Adding Name to search seems to override tmdb
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=5.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -382,8 +383,7 @@ class ACM:
                             )
 
             desc = re.sub(r'\[center\]\[spoiler=Scene NFO:\].*?\[/center\]', '', base, flags=re.DOTALL)
-            desc = bbcode.convert_pre_to_code(desc)
-            desc = bbcode.convert_hide_to_spoiler(desc)
+            desc = bbcode.apply(desc, PRE_TO_CODE, HIDE_TO_SPOILER)
             desc = bbcode.convert_comparison_to_collapse(desc, 1000)
             desc = desc.replace('[img]', '[img=300]')
 
@@ -12,9 +12,10 @@ import aiofiles
 import cli_ui
 import httpx
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, CONVERT_TO_ALIGN, REMOVE_IMG_RESIZE, REMOVE_LIST, REMOVE_SUB, REMOVE_SUP
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.torrentcreate import TorrentCreator
 from src.trackers.COMMON import COMMON
 
@@ -247,7 +248,7 @@ class ANT:
 
         try:
             if not meta['debug']:
-                async with httpx.AsyncClient(timeout=40) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=40) as client:
                     response = await client.post(url=self.upload_url, files=files, data=data, headers=headers)
                     try:
                         response_data: dict[str, Any] = response.json()
@@ -443,11 +444,7 @@ class ANT:
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.apply(description, CONVERT_TO_ALIGN, REMOVE_IMG_RESIZE, REMOVE_SUP, REMOVE_SUB, REMOVE_LIST)
         description = description.replace('•', '-').replace('’', "'").replace('–', '-')
         description = bbcode.remove_extra_lines(description)
         description = description.strip()
@@ -488,7 +485,7 @@ class ANT:
             params['imdb'] = meta['imdb']
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=15.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     try:
@@ -571,7 +568,7 @@ class ANT:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=15.0) as client:
                 response = await client.get(url=self.search_url, params=params)
                 if response.status_code == 200:
                     try:
@@ -18,10 +18,11 @@ import pycountry
 from bs4 import BeautifulSoup, Tag
 from langcodes.tag_parser import LanguageTagError
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, CONVERT_TO_ALIGN, NAMED_SPOILER_TO_NAMED_HIDE, REMOVE_IMG_RESIZE, REMOVE_LIST, SPOILER_TO_HIDE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
@@ -45,7 +46,7 @@ class BJS:
         self.torrent_url = 'https://bj-share.info/torrents.php?torrentid='
         self.requests_url = f'{self.base_url}/requests.php?'
         self.auth_token = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': f'Upload Assistant ({platform.system()} {platform.release()})'
         }, timeout=60.0)
         self.main_tmdb_data: dict[str, Any] = {}
@@ -365,11 +366,7 @@ class BJS:
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.convert_named_spoiler_to_named_hide(description)
-        description = bbcode.convert_spoiler_to_hide(description)
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.apply(description, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE, REMOVE_IMG_RESIZE, CONVERT_TO_ALIGN, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as description_file:
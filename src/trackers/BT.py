@@ -14,10 +14,11 @@ import langcodes
 from bs4 import BeautifulSoup
 from langcodes.tag_parser import LanguageTagError
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_IMG_RESIZE, REMOVE_LIST
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 from src.tmdb import TmdbManager
 from src.trackers.COMMON import COMMON
@@ -40,7 +41,7 @@ class BT:
         self.auth_token: Optional[str] = None
         self.main_tmdb_data: dict[str, Any] = {}
         self.episode_tmdb_data: dict[str, Any] = {}
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': f'Upload Assistant ({platform.system()} {platform.release()})'
         }, timeout=60.0)
 
@@ -401,8 +402,7 @@ class BT:
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.apply(description, REMOVE_IMG_RESIZE, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as description_file:
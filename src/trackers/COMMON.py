@@ -21,7 +21,9 @@ from torf import Torrent
 from src.bbcode import BBCODE
 from src.console import console
 from src.exportmi import exportInfo
+from src.http_pool import http_pool
 from src.languages import languages_manager
+from src.metastore import meta_store
 
 
 class COMMON:
@@ -189,7 +191,7 @@ class COMMON:
         path = f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}_cross].torrent" if cross else f"{meta['base_dir']}/tmp/{meta['uuid']}/[{tracker}].torrent"
         if downurl:
             try:
-                async with httpx.AsyncClient(headers=headers, params=params, timeout=30.0) as session, session.stream("GET", downurl) as r:
+                async with httpx.AsyncClient(transport=http_pool.transport(), headers=headers, params=params, timeout=30.0) as session, session.stream("GET", downurl) as r:
                     r.raise_for_status()
                     async with aiofiles.open(path, "wb") as f:
                         async for chunk in r.aiter_bytes():
@@ -507,7 +509,7 @@ class COMMON:
         params: dict[str, str] = {'api_token': api_key}
         url = f"{torrent_url}{id}"
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                 response = await client.get(url=url, params=params)
                 json_response = response.json()
         except (httpx.RequestError, httpx.TimeoutException) as e:
@@ -621,7 +623,7 @@ class COMMON:
 
         # Make the GET request with proper encoding handled by 'params'
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                 response = await client.get(url=url, params=params)
                 json_response = response.json()
         except (httpx.RequestError, httpx.TimeoutException) as e:
@@ -775,7 +777,7 @@ class COMMON:
                 return None
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                 # get douban url
                 if int(meta.get('imdb_id', 0)) != 0:
                     data['search'] = f"tt{meta['imdb_id']}"
@@ -814,8 +816,7 @@ class COMMON:
                     return ""
 
                 meta['ptgen'] = ptgen_json
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(meta, indent=4))
+                await meta_store.save(meta)
 
                 ptgen_text = ptgen_json.get('format', '')
                 if "[/img]" in ptgen_text:
@@ -1100,7 +1101,6 @@ class COMMON:
                 path = meta['discs'][0]['playlists'][0]['path']
                 await exportInfo(
                     path,
-                    False,
                     meta['uuid'],
                     meta['base_dir'],
                     is_dvd=False,
@@ -1142,7 +1142,6 @@ class COMMON:
 
                         await exportInfo(
                             largest_m2ts,
-                            False,
                             meta['uuid'],
                             meta['base_dir'],
                             is_dvd=False,
@@ -9,6 +9,7 @@ import httpx
 from cogs.redaction import Redaction
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -26,7 +27,7 @@ class DC:
         self.banned_groups = ['']
         self.approved_image_hosts = ['imgbox', 'imgbb', 'bhd', 'imgur', 'postimg', 'sharex']
         self.api_key = self.config['TRACKERS'][self.tracker].get('api_key')
-        self.session = httpx.AsyncClient(headers={'X-API-KEY': self.api_key}, timeout=30.0)
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={'X-API-KEY': self.api_key}, timeout=30.0)
 
     async def mediainfo(self, meta: Meta) -> str:
         if meta.get('is_disc') == 'BDMV':
@@ -104,14 +105,13 @@ class DC:
 
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, REMOVE_SUB, REMOVE_SUP
         bbcode = BBCODE()
         description = description.replace('[user]', '').replace('[/user]', '')
         description = description.replace('[align=left]', '').replace('[/align]', '')
         description = description.replace('[right]', '').replace('[/right]', '')
         description = description.replace('[align=right]', '').replace('[/align]', '')
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
+        description = bbcode.apply(description, REMOVE_SUP, REMOVE_SUB)
         description = description.replace('[alert]', '').replace('[/alert]', '')
         description = description.replace('[note]', '').replace('[/note]', '')
         description = description.replace('[hr]', '').replace('[/hr]', '')
@@ -10,10 +10,11 @@ import aiofiles
 import httpx
 from bs4 import BeautifulSoup
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_SUB, REMOVE_SUP
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 
 
@@ -29,7 +30,7 @@ class FF:
         self.torrent_url = f"{self.base_url}/details.php?id="
         self.requests_url = f"{self.base_url}/requests.php"
         self.auth_token = None
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=30.0)
 
@@ -263,8 +264,7 @@ class FF:
         description = description.replace("[align=left]", "").replace("[/align]", "")
         description = description.replace("[right]", "").replace("[/right]", "")
         description = description.replace("[align=right]", "").replace("[/align]", "")
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
+        description = bbcode.apply(description, REMOVE_SUB, REMOVE_SUP)
         description = description.replace("[alert]", "").replace("[/alert]", "")
         description = description.replace("[note]", "").replace("[/note]", "")
         description = description.replace("[hr]", "").replace("[/hr]", "")
@@ -563,7 +563,7 @@ class FF:
 
         poster_file = None
         if poster_url:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                 response = await client.get(poster_url)
                 if response.status_code == 200:
                     poster_ext = os.path.splitext(poster_url)[1] or ".jpg"
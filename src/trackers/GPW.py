@@ -12,9 +12,10 @@ import httpx
 from bs4 import BeautifulSoup
 
 from cogs.redaction import Redaction
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, CONVERT_TO_ALIGN, REMOVE_LIST, REMOVE_SUB, REMOVE_SUP
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 from src.rehostimages import RehostImagesManager
 from src.tmdb import TmdbManager
@@ -283,10 +284,7 @@ class GPW:
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_sup(description)
-        description = bbcode.remove_sub(description)
-        description = bbcode.convert_to_align(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.apply(description, REMOVE_SUP, REMOVE_SUB, CONVERT_TO_ALIGN, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         if meta["debug"]:
@@ -381,7 +379,7 @@ class GPW:
         if not cookies:
             search_url = f'{self.base_url}/api.php?api_key={self.api_key}&action=torrent&imdbID={imdb}'
             try:
-                async with httpx.AsyncClient(timeout=30) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30) as client:
                     response = await client.get(search_url)
                     response.raise_for_status()
                     data = response.json()
@@ -418,7 +416,7 @@ class GPW:
             found_items: list[dict[str, Any]] = []
 
             try:
-                async with httpx.AsyncClient(cookies=cookies, timeout=30, headers={'User-Agent': 'Upload Assistant/2.3'}) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), cookies=cookies, timeout=30, headers={'User-Agent': 'Upload Assistant/2.3'}) as client:
                     response = await client.get(search_url)
                     response.raise_for_status()
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -683,7 +681,7 @@ class GPW:
         search_url = f"{self.base_url}/api.php?api_key={self.api_key}&action=torrent&req=group&imdbID={meta.get('imdb_info', {}).get('imdbID')}"
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30) as client:
                 response = await client.get(search_url)
                 response.raise_for_status()
 
@@ -937,7 +935,7 @@ class GPW:
                     cookies = await self.load_cookies(meta)
 
                 request_cookies = cookies if use_cookies and cookies else None
-                async with httpx.AsyncClient(timeout=15, cookies=request_cookies, headers={'User-Agent': 'Upload Assistant/2.3'}) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=15, cookies=request_cookies, headers={'User-Agent': 'Upload Assistant/2.3'}) as client:
                     if method == "post":
                         response = await client.post(url, data=params)
                     else:
@@ -1139,7 +1137,7 @@ class GPW:
             files = {'file_input': (f'{self.tracker}.placeholder.torrent', torrent_bytes, 'application/x-bittorrent')}
 
             try:
-                async with httpx.AsyncClient(timeout=30) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30) as client:
                     def _extract_torrent_id(payload: Any) -> str:
                         if isinstance(payload, dict):
                             torrent_id_value = payload.get('torrent_id')
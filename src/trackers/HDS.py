@@ -9,10 +9,11 @@ import aiofiles
 import httpx
 from bs4 import BeautifulSoup, Tag
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_HIDE, REMOVE_IMG_RESIZE, REMOVE_SUB, REMOVE_SUP
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -29,7 +30,7 @@ class HDS:
         self.base_url = 'https://hd-space.org'
         self.torrent_url = f'{self.base_url}/index.php?page=torrent-details&id='
         self.requests_url = f'{self.base_url}/index.php?page=viewrequests'
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': f"Upload Assistant/2.3 ({platform.system()} {platform.release()})"
         }, timeout=30)
 
@@ -151,8 +152,7 @@ class HDS:
         description = description.replace('[align=left]', '').replace('[/align]', '')
         description = description.replace('[right]', '').replace('[/right]', '')
         description = description.replace('[align=right]', '').replace('[/align]', '')
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
+        description = bbcode.apply(description, REMOVE_SUB, REMOVE_SUP)
         description = description.replace('[alert]', '').replace('[/alert]', '')
         description = description.replace('[note]', '').replace('[/note]', '')
         description = description.replace('[hr]', '').replace('[/hr]', '')
@@ -161,8 +161,7 @@ class HDS:
         description = description.replace('[h3]', '[u][b]').replace('[/h3]', '[/b][/u]')
         description = description.replace('[ul]', '').replace('[/ul]', '')
         description = description.replace('[ol]', '').replace('[/ol]', '')
-        description = bbcode.remove_hide(description)
-        description = bbcode.remove_img_resize(description)
+        description = bbcode.apply(description, REMOVE_HIDE, REMOVE_IMG_RESIZE)
         description = bbcode.convert_comparison_to_centered(description, 1000)
         description = bbcode.remove_spoiler(description)
         description = bbcode.remove_extra_lines(description)
@@ -10,10 +10,11 @@ import aiofiles
 import httpx
 from bs4 import BeautifulSoup
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, REMOVE_IMG_RESIZE, REMOVE_LIST, REMOVE_SPOILER, REMOVE_SUB, REMOVE_SUP, SPOILER_TO_HIDE
 from src.console import console
 from src.cookie_auth import CookieAuthUploader, CookieValidator
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 
 Meta = dict[str, Any]
 Config = dict[str, Any]
@@ -40,7 +41,7 @@ class HDT:
         self.torrent_url = f'{self.base_url}/details.php?id='
         self.announce_url = str(tracker_config_dict.get('announce_url', ''))
         self.banned_groups = []
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': f'Upload Assistant ({platform.system()} {platform.release()})'
         }, timeout=60.0)
 
@@ -203,8 +204,7 @@ class HDT:
         description = description.replace('[user]', '').replace('[/user]', '')
         description = description.replace('[align=left]', '').replace('[/align]', '')
         description = description.replace('[align=right]', '').replace('[/align]', '')
-        description = bbcode.remove_sub(description)
-        description = bbcode.remove_sup(description)
+        description = bbcode.apply(description, REMOVE_SUB, REMOVE_SUP)
         description = description.replace('[alert]', '').replace('[/alert]', '')
         description = description.replace('[note]', '').replace('[/note]', '')
         description = description.replace('[hr]', '').replace('[/hr]', '')
@@ -213,11 +213,9 @@ class HDT:
         description = description.replace('[h3]', '[u][b]').replace('[/h3]', '[/b][/u]')
         description = description.replace('[ul]', '').replace('[/ul]', '')
         description = description.replace('[ol]', '').replace('[/ol]', '')
-        description = bbcode.convert_spoiler_to_hide(description)
-        description = bbcode.remove_img_resize(description)
+        description = bbcode.apply(description, SPOILER_TO_HIDE, REMOVE_IMG_RESIZE)
         description = bbcode.convert_comparison_to_centered(description, 1000)
-        description = bbcode.remove_spoiler(description)
-        description = bbcode.remove_list(description)
+        description = bbcode.apply(description, REMOVE_SPOILER, REMOVE_LIST)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as description_file:
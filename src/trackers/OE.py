@@ -5,7 +5,7 @@ from typing import Any, Optional, cast
 
 import aiofiles
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE
 from src.console import console
 from src.languages import languages_manager
 from src.rehostimages import RehostImagesManager
@@ -100,8 +100,7 @@ class OE(UNIT3D):
                             await descfile.write(f"[spoiler={os.path.basename(each['largest_evo'])}][code][{each['evo_mi']}[/code][/spoiler]\n\n")
 
             desc = str(base)
-            desc = str(bbcode.convert_pre_to_code(desc))
-            desc = str(bbcode.convert_hide_to_spoiler(desc))
+            desc = str(bbcode.apply(desc, PRE_TO_CODE, HIDE_TO_SPOILER))
             desc = str(bbcode.convert_comparison_to_collapse(desc, 1000))
             try:
                 tonemapped_header = self.config['DEFAULT'].get('tonemapped_header')
@@ -6,6 +6,7 @@ from typing import Any, Optional, cast
 import httpx
 
 from src.console import console
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 from src.trackers.UNIT3D import UNIT3D
 
@@ -122,7 +123,7 @@ class R4E(UNIT3D):
         if meta.get('edition', "") != "":
             params['name'] = str(params['name']) + str(meta['edition'])
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=5.0) as client:
                 response = await client.get(url=url, params=params)
                 if response.status_code == 200:
                     data = cast(dict[str, Any], response.json())
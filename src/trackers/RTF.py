@@ -11,6 +11,7 @@ import httpx
 
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 
@@ -98,7 +99,7 @@ class RTF:
 
         if meta['debug'] is False:
             try:
-                async with httpx.AsyncClient(timeout=40.0) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=40.0) as client:
                     response = await client.post(url=self.upload_url, json=json_data, headers=headers)
 
                     # Handle successful upload (201)
@@ -320,7 +321,7 @@ class RTF:
             return torrent_url
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=5.0) as client:
                 response = await client.get(self.search_url, params=params, headers=headers)
                 if response.status_code == 200:
                     data = cast(list[dict[str, Any]], response.json())
@@ -366,7 +367,7 @@ class RTF:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                 response = await client.get('https://retroflix.club/api/test', headers=headers)
 
                 if response.status_code != 200:
@@ -409,7 +410,7 @@ class RTF:
         config_path = f"{base_dir}/data/config.py"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                 response = await client.post('https://retroflix.club/api/login', headers=headers, json=json_data)
 
             if response.status_code == 201:
@@ -11,9 +11,10 @@ import aiofiles
 import httpx
 
 from cogs.redaction import Redaction
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, NAMED_SPOILER_TO_NORMAL_SPOILER, REMOVE_IMG_RESIZE
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.languages import languages_manager
 
 from .COMMON import COMMON
@@ -33,7 +34,7 @@ class SPD:
         self.banned_groups = []
         self.banned_url = 'https://speedapp.io/api/torrent/release-group/blacklist'
         api_key = str(self.config['TRACKERS'][self.tracker]['api_key'])
-        self.session = httpx.AsyncClient(headers={
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), headers={
             'User-Agent': "Upload Assistant",
             'accept': 'application/json',
             'Authorization': api_key,
@@ -237,8 +238,7 @@ class SPD:
         description = '\n\n'.join(part for part in desc_parts if part.strip())
 
         bbcode = BBCODE()
-        description = bbcode.remove_img_resize(description)
-        description = bbcode.convert_named_spoiler_to_normal_spoiler(description)
+        description = bbcode.apply(description, REMOVE_IMG_RESIZE, NAMED_SPOILER_TO_NORMAL_SPOILER)
         description = bbcode.remove_extra_lines(description)
 
         async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/[{self.tracker}]DESCRIPTION.txt", 'w', encoding='utf-8') as description_file:
@@ -15,8 +15,9 @@ from bs4 import BeautifulSoup
 from bs4.element import AttributeValueList
 from unidecode import unidecode
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, CODE_TO_PRE, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE
 from src.console import console
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -109,7 +110,7 @@ class THR:
                 if cookies:
                     console.print("[green]Using authenticated session for upload")
 
-                    async with httpx.AsyncClient(cookies=cookies, follow_redirects=True) as session:
+                    async with httpx.AsyncClient(transport=http_pool.transport(), cookies=cookies, follow_redirects=True) as session:
                         response = await session.post(url=url, files=files, data=payload, headers=headers)
 
                         if meta.get('debug'):
@@ -247,9 +248,7 @@ class THR:
 
         if base:
             # replace unsupported bbcode tags
-            base = bbcode.convert_named_spoiler_to_named_hide(base)
-            base = bbcode.convert_spoiler_to_hide(base)
-            base = bbcode.convert_code_to_pre(base)
+            base = bbcode.apply(base, NAMED_SPOILER_TO_NAMED_HIDE, SPOILER_TO_HIDE, CODE_TO_PRE)
             # fix alignment for NFO content inherited from centering the spoiler
             base = re.sub(r'(?P<open>\[hide=(Scene|FraMeSToR) NFO:\]\[pre\])(?P<content>.*?)(?P<close>\[/pre\]\[/hide\])',
                           r'\g<open>[align=left]\g<content>[/align]\g<close>',
@@ -274,7 +273,7 @@ class THR:
             image_glob = [file for file in image_glob if file not in unwanted_files]
             image_glob = list(set(image_glob))
         image_list: list[str] = []
-        async with httpx.AsyncClient(timeout=30.0) as image_client:
+        async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as image_client:
             for image in image_glob:
                 url = "https://img2.torrenthr.org/api/1/upload"
                 data: dict[str, Any] = {
@@ -318,7 +317,7 @@ class THR:
                     'theme': self.config['TRACKERS']['THR'].get('pronfo_theme', 'gray'),
                     'rapi': self.config['TRACKERS']['THR'].get('pronfo_rapi_id')
                 }
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                 response = await client.post(pronfo_url, data=data)
             try:
                 response_data = response.json()
@@ -369,7 +368,7 @@ class THR:
                 console.print("[red]Failed to log in to THR for search")
                 return dupes
 
-            async with httpx.AsyncClient(**client_args) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), **client_args) as client:
                 # Start with first page (page 0 in THR's system)
                 current_page = 0
                 more_pages = True
@@ -520,7 +519,7 @@ class THR:
             'Referer': 'https://www.torrenthr.org/login.php'
         }
 
-        async with httpx.AsyncClient(follow_redirects=True) as session:
+        async with httpx.AsyncClient(transport=http_pool.transport(), follow_redirects=True) as session:
             try:
                 login_page = await session.get('https://www.torrenthr.org/login.php')
                 login_soup = BeautifulSoup(login_page.text, 'html.parser')
@@ -12,6 +12,7 @@ from cogs.redaction import Redaction
 from src.bbcode import BBCODE
 from src.console import console
 from src.get_desc import DescriptionBuilder
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -29,7 +30,7 @@ class TL:
         self.api_upload_url = f'{self.base_url}/torrents/upload/apiupload'
         self.torrent_url = f'{self.base_url}/torrent/'
         self.banned_groups = []
-        self.session = httpx.AsyncClient(timeout=60.0)
+        self.session = httpx.AsyncClient(transport=http_pool.transport(), timeout=60.0)
         self.tracker_config: dict[str, Any] = self.config['TRACKERS'][self.tracker]
         self.api_upload: bool = bool(self.tracker_config.get('api_upload', False))
         self.passkey: str = str(self.tracker_config.get('passkey', ''))
@@ -337,7 +338,7 @@ class TL:
         '''
         variables = {'idMal': meta.get('mal_id')}
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
             response = await client.post(url, json={'query': query, 'variables': variables})
             response.raise_for_status()
             data = cast(dict[str, Any], response.json())
@@ -14,6 +14,7 @@ from unidecode import unidecode
 from src.console import console
 from src.cookie_auth import CookieValidator
 from src.exceptions import *  # noqa #F405
+from src.http_pool import http_pool
 from src.trackers.COMMON import COMMON
 
 Meta = dict[str, Any]
@@ -189,7 +190,7 @@ class TTG:
             cookiefile = os.path.abspath(f"{meta['base_dir']}/data/cookies/TTG.json")
             raw_cookies = self.cookie_validator._load_cookies_dict_secure(cookiefile)  # type: ignore[reportPrivateUsage]
             cookies = {name: str(data.get('value', '')) for name, data in raw_cookies.items()}
-            async with httpx.AsyncClient(cookies=cookies, follow_redirects=True, timeout=60.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), cookies=cookies, follow_redirects=True, timeout=60.0) as client:
                 up = await client.post(url=url, data=data, files=files)
 
             if str(up.url).startswith("https://totheglory.im/details.php?id="):
@@ -229,7 +230,7 @@ class TTG:
         search_url = f"https://totheglory.im/browse.php?search_field= {imdb} {res_type}"
 
         try:
-            async with httpx.AsyncClient(cookies=cookies, timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), cookies=cookies, timeout=10.0) as client:
                 response = await client.get(search_url)
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
@@ -278,7 +279,7 @@ class TTG:
         if os.path.exists(cookiefile):
             raw_cookies = self.cookie_validator._load_cookies_dict_secure(cookiefile)  # type: ignore[reportPrivateUsage]
             cookies = {name: str(data.get('value', '')) for name, data in raw_cookies.items()}
-            async with httpx.AsyncClient(cookies=cookies, timeout=30.0, follow_redirects=True) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), cookies=cookies, timeout=30.0, follow_redirects=True) as client:
                 resp = await client.get(url=url)
                 if meta.get('debug'):
                     console.print('[cyan]Cookies:')
@@ -295,7 +296,7 @@ class TTG:
             'passid': self.passid,
             'passan': self.passan
         }
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0, follow_redirects=True) as client:
             response = await client.post(url, data=data)
             await asyncio.sleep(0.5)
             if str(response.url).endswith('2fa.php'):
@@ -329,7 +330,7 @@ class TTG:
         ) as base_file:
             base = await base_file.read()
 
-        from src.bbcode import BBCODE
+        from src.bbcode import BBCODE, CODE_TO_QUOTE, SPOILER_TO_HIDE
         from src.trackers.COMMON import COMMON
         common = COMMON(config=self.config)
 
@@ -367,8 +368,7 @@ class TTG:
             parts.append(f"[quote=MediaInfo]{mi}[/quote]")
             parts.append("\n")
         desc = base
-        desc = bbcode.convert_code_to_quote(desc)
-        desc = bbcode.convert_spoiler_to_hide(desc)
+        desc = bbcode.apply(desc, CODE_TO_QUOTE, SPOILER_TO_HIDE)
         desc = bbcode.convert_comparison_to_centered(desc, 1000)
         desc = desc.replace('[img]', '[img]')
         desc = re.sub(r"(\[img=\d+)]", "[img]", desc, flags=re.IGNORECASE)
@@ -397,7 +397,7 @@ class TTG:
 
     async def download_new_torrent(self, id: str, torrent_path: str) -> None:
         download_url = f"https://totheglory.im/dl/{id}/{self.passkey}"
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
             r = await client.get(url=download_url)
         if r.status_code == 200:
             async with aiofiles.open(torrent_path, "wb") as tor:
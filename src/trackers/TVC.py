@@ -14,8 +14,9 @@ import httpx
 import requests
 import tmdbsimple as tmdb
 
-from src.bbcode import BBCODE
+from src.bbcode import BBCODE, HIDE_TO_SPOILER, PRE_TO_CODE
 from src.console import console
+from src.http_pool import http_pool
 from src.rehostimages import RehostImagesManager
 from src.trackers.COMMON import COMMON
 
@@ -331,8 +332,7 @@ class TVC:
     def _apply_bbcode_transforms(self, desc: str, comparison: bool) -> str:
         """Apply BBCode transformations."""
         bbcode = BBCODE()
-        desc = bbcode.convert_pre_to_code(desc)
-        desc = bbcode.convert_hide_to_spoiler(desc)
+        desc = bbcode.apply(desc, PRE_TO_CODE, HIDE_TO_SPOILER)
 
         if not comparison:
             desc = bbcode.convert_comparison_to_collapse(
@@ -638,7 +638,7 @@ class TVC:
         if meta['debug'] is False:
             response = None
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=30.0) as client:
                     async with aiofiles.open(torrent_path, "rb") as open_torrent:
                         torrent_bytes = await open_torrent.read()
                     files = {'torrent': (os.path.basename(torrent_path), torrent_bytes)}
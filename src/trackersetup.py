@@ -1,11 +1,12 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
+import importlib
 import json
 import os
 import re
 import sys
-from datetime import datetime, timedelta, timezone
-from pathlib import Path
+import time
+from collections.abc import Iterator, Mapping
 from typing import Any, Optional, Union, cast
 
 import aiofiles
@@ -14,79 +15,50 @@ import httpx
 
 from src.cleanup import cleanup_manager
 from src.console import console
-from src.trackers.A4K import A4K
-from src.trackers.ACM import ACM
-from src.trackers.AITHER import AITHER
-from src.trackers.ANT import ANT
-from src.trackers.AR import AR
-from src.trackers.ASC import ASC
-from src.trackers.AZ import AZ
-from src.trackers.BHD import BHD
-from src.trackers.BHDTV import BHDTV
-from src.trackers.BJS import BJS
-from src.trackers.BLU import BLU
-from src.trackers.BT import BT
-from src.trackers.CBR import CBR
+from src.http_pool import http_pool
+from src.tracker_lists import BANNED, CLAIMS, TRASH, BannedGroups, ListSource, tracker_lists
 from src.trackers.COMMON import COMMON
-from src.trackers.CZ import CZ
-from src.trackers.DC import DC
-from src.trackers.DP import DP
-from src.trackers.DT import DT
-from src.trackers.EMUW import EMUW
-from src.trackers.FF import FF
-from src.trackers.FL import FL
-from src.trackers.FNP import FNP
-from src.trackers.FRIKI import FRIKI
-from src.trackers.GPW import GPW
-from src.trackers.HDB import HDB
-from src.trackers.HDS import HDS
-from src.trackers.HDT import HDT
-from src.trackers.HHD import HHD
-from src.trackers.HUNO import HUNO
-from src.trackers.IHD import IHD
-from src.trackers.IS import IS
-from src.trackers.ITT import ITT
-from src.trackers.LCD import LCD
-from src.trackers.LDU import LDU
-from src.trackers.LST import LST
-from src.trackers.LT import LT
-from src.trackers.LUME import LUME
-from src.trackers.MTV import MTV
-from src.trackers.NBL import NBL
-from src.trackers.OE import OE
-from src.trackers.OTW import OTW
-from src.trackers.PHD import PHD
-from src.trackers.PT import PT
-from src.trackers.PTER import PTER
-from src.trackers.PTP import PTP
-from src.trackers.PTS import PTS
-from src.trackers.PTT import PTT
-from src.trackers.R4E import R4E
-from src.trackers.RAS import RAS
-from src.trackers.RF import RF
-from src.trackers.RTF import RTF
-from src.trackers.SAM import SAM
-from src.trackers.SHRI import SHRI
-from src.trackers.SN import SN
-from src.trackers.SP import SP
-from src.trackers.SPD import SPD
-from src.trackers.STC import STC
-from src.trackers.THR import THR
-from src.trackers.TIK import TIK
-from src.trackers.TL import TL
-from src.trackers.TLZ import TLZ
-from src.trackers.TOS import TOS
-from src.trackers.TTG import TTG
-from src.trackers.TTR import TTR
-from src.trackers.TVC import TVC
-from src.trackers.ULCX import ULCX
-from src.trackers.UTP import UTP
-from src.trackers.YOINK import YOINK
-from src.trackers.YUS import YUS
 
 JsonDict = dict[str, Any]
 Meta = dict[str, Any]
 
+TRASH_GROUPS_URL = "https://raw.githubusercontent.com/TRaSH-Guides/Guides/refs/heads/master/docs/json/radarr/cf/lq.json"
+# Indexes of the banned group lists built into the tracker classes
+_STATIC_BANNED_GROUPS: dict[tuple[str, int], BannedGroups] = {}
+
+
+def parse_trash_groups(data: Any) -> list[JsonDict]:
+    """Release group names of the TRaSH LQ specifications.
+
+    Group names are extracted from the ``ReleaseGroupSpecification`` fields.
+    """
+    specs = cast(list[JsonDict], cast(JsonDict, data).get('specifications', [])) if isinstance(data, dict) else []
+    groups: dict[str, None] = {}
+
+    for spec in specs:
+        try:
+            if spec.get('implementation') != 'ReleaseGroupSpecification':
+                continue
+            fields = cast(JsonDict, spec.get('fields') or {})
+            val = str(fields.get('value', '') or '')
+            # Prefer a captured group if present: e.g. ^(GROUP)$ or \b(GROUP)\b
+            m = re.search(r"\(([^)]+)\)", val)
+            if m:
+                name = m.group(1)
+            else:
+                # Fallback: strip common regex anchors and escapes
+                name = re.sub(r"[\\\^\$\\b]", "", val)
+                name = re.sub(r"[\(\)\[\]\|]", "", name).strip()
+
+            # Handle alternation inside the captured name
+            for part in name.split('|'):
+                if part.strip():
+                    groups[part.strip()] = None
+        except (KeyError, TypeError, ValueError, AttributeError, re.error):
+            continue
+
+    return [{"name": g} for g in groups]
+
 
 class TRACKER_SETUP:
     def __init__(self, config: dict[str, Any]):
@@ -121,205 +93,63 @@ class TRACKER_SETUP:
 
         return valid_trackers
 
-    async def get_banned_groups(self, meta: Meta, tracker: str) -> Optional[str]:
-        file_path = os.path.join(meta['base_dir'], 'data', 'banned', f'{tracker}_banned_groups.json')
-
+    def list_sources(self, tracker: str) -> dict[str, ListSource]:
+        """Remote banned group, claim and TRaSH lists of ``tracker`` by kind."""
+        tracker = tracker.upper()
         tracker_instance = self._create_tracker_instance(tracker)
         if tracker_instance is None:
-            return None
-        if tracker.upper() == "LUME":
-            # LUME doesn't expose a banned_url; sync TRaSH groups and use the file if present
-            await self.sync_trash_groups(meta, file_path)
-            if os.path.exists(file_path):
-                return file_path
-        banned_url = getattr(tracker_instance, 'banned_url', None)
-        if not isinstance(banned_url, str):
-            return None
-
-        # Check if we need to update
-        if not await self.should_update(file_path):
-            return file_path
-
+            return {}
+        sources: dict[str, ListSource] = {}
+        if tracker == "LUME":
+            # LUME doesn't expose a banned_url; the TRaSH groups stand in for it
+            sources[TRASH] = ListSource(TRASH_GROUPS_URL, paginated=False, parse=parse_trash_groups)
+        tracker_config = cast(JsonDict, self.config['TRACKERS'].get(tracker, {}))
         headers = {
-            'Authorization': f"Bearer {self.config['TRACKERS'][tracker]['api_key'].strip()}",
+            'Authorization': f"Bearer {str(tracker_config.get('api_key', '')).strip()}",
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        for kind, attribute in ((BANNED, 'banned_url'), (CLAIMS, 'claims_url')):
+            url = getattr(tracker_instance, attribute, None)
+            if isinstance(url, str):
+                sources[kind] = ListSource(url, headers)
+        return sources
+
+    async def refresh_tracker_lists(self, meta: Meta) -> None:
+        """Refresh the banned groups and claims of the run's trackers in parallel. Called once at startup."""
+        trackers_value = meta['trackers'] if meta.get('trackers') is not None else self.config['TRACKERS'].get('default_trackers', '')
+        if isinstance(trackers_value, str):
+            trackers_list = trackers_value.split(',')
+        elif isinstance(trackers_value, list):
+            trackers_list = [str(s) for s in cast(list[Any], trackers_value)]
+        else:
+            trackers_list = []
+        trackers = {str(s).strip().upper() for s in trackers_list} & set(tracker_class_map)
+        await tracker_lists.refresh({tracker: self.list_sources(tracker) for tracker in sorted(trackers)}, debug=bool(meta.get('debug')))
 
-        all_data: list[JsonDict] = []
-        next_cursor: Optional[str] = None
-
-        async with httpx.AsyncClient() as client:
-            while True:
-                try:
-                    # Add query parameters for pagination
-                    params: JsonDict = {'cursor': next_cursor, 'per_page': 100} if next_cursor else {'per_page': 100}
-                    response = await client.get(url=banned_url, headers=headers, params=params)
-
-                    if response.status_code == 200:
-                        response_json = response.json()
-
-                        if isinstance(response_json, list):
-                            # Directly add the list if it's the entire response
-                            all_data.extend(cast(list[JsonDict], response_json))
-                            break  # No pagination in this case
-                        if isinstance(response_json, dict):
-                            response_dict = cast(JsonDict, response_json)
-                            page_data_any = response_dict.get('data', [])
-                            if not isinstance(page_data_any, list):
-                                console.print(f"[red]Unexpected 'data' format: {type(page_data_any)}[/red]")
-                                return None
-
-                            page_data = cast(list[JsonDict], page_data_any)
-                            all_data.extend(page_data)
-                            meta_info_any = response_dict.get('meta', {})
-                            if not isinstance(meta_info_any, dict):
-                                console.print(f"[red]Unexpected 'meta' format: {type(meta_info_any)}[/red]")
-                                return None
-
-                            meta_info = cast(JsonDict, meta_info_any)
-
-                            # Check if there is a next page
-                            next_cursor_value = cast(Optional[str], meta_info.get('next_cursor'))
-                            next_cursor = next_cursor_value if next_cursor_value else None
-                            if not next_cursor:
-                                break  # Exit loop if there are no more pages
-                        else:
-                            console.print(f"[red]Unexpected response format: {type(response_json)}[/red]")
-                            return None
-                    elif response.status_code == 404:
-                        console.print(f"Error: Tracker '{tracker}' returned 404 for the banned groups API.")
-                        return None
-                    else:
-                        console.print(f"Error: Received status code {response.status_code} for tracker '{tracker}'.")
-                        return None
-
-                except httpx.RequestError as e:
-                    console.print(f"[red]HTTP Request failed for tracker '{tracker}': {e}[/red]")
-                    return None
-                except Exception as e:
-                    console.print(f"[red]An unexpected error occurred: {e}[/red]")
-                    return None
-
-        if meta['debug']:
-            console.print("Total banned groups retrieved:", len(all_data))
-
-        if not all_data:
-            return "empty"
-
-        await self.write_banned_groups_to_file(file_path, all_data, debug=meta['debug'])
-
-        return file_path
-
-    async def write_banned_groups_to_file(self, file_path: str, json_data: list[JsonDict], debug: bool = False) -> None:
-        try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            # Extract 'name' values from the list
-            names: list[str] = [str(item['name']) for item in json_data if 'name' in item]
-            names_csv = ', '.join(names)
-            file_content = {
-                "last_updated": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                "banned_groups": names_csv,
-                "raw_data": json_data
-            }
-
-            await asyncio.to_thread(self._write_file, file_path, file_content)
-            if debug:
-                console.print(f"File '{file_path}' updated successfully with {len(names)} groups.")
-        except Exception as e:
-            console.print(f"An error occurred: {e}")
-
-    async def sync_trash_groups(self, meta: Meta, file_path: str) -> None:
-        """Fetch TRaSH guide JSON and extract release group names to ban file.
-
-        This downloads the TRaSH LQ release-group specifications, extracts
-        group names from `ReleaseGroupSpecification` fields, and writes them
-        via `write_banned_groups_to_file` into the tracker's banned file.
-        """
-        url = (
-            "https://raw.githubusercontent.com/TRaSH-Guides/Guides/refs/heads/master/docs/json/radarr/cf/lq.json"
-        )
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url)
-                if response.status_code != 200:
-                    console.print(f"[red]Failed to fetch TRaSH groups: HTTP {response.status_code}[/red]")
-                    return
-                data = response.json()
-                data = cast(JsonDict, data)
-        except Exception as e:
-            console.print(f"[red]Failed to fetch TRaSH groups: {e}[/red]")
-            return
-
-        specs = cast(list[JsonDict], data.get('specifications', []))
-        groups: list[str] = []
-
-        for spec in specs:
-            try:
-                if spec.get('implementation') != 'ReleaseGroupSpecification':
-                    continue
-                fields = cast(JsonDict, spec.get('fields') or {})
-                val = str(fields.get('value', '') or '')
-                # Prefer a captured group if present: e.g. ^(GROUP)$ or \b(GROUP)\b
-                m = re.search(r"\(([^)]+)\)", val)
-                if m:
-                    name = m.group(1)
-                else:
-                    # Fallback: strip common regex anchors and escapes
-                    name = re.sub(r"[\\\^\$\\b]", "", val)
-                    name = re.sub(r"[\(\)\[\]\|]", "", name).strip()
-
-                if not name:
-                    continue
-
-                # Handle alternation inside the captured name
-                if '|' in name:
-                    parts = [p.strip() for p in name.split('|') if p.strip()]
-                    for p in parts:
-                        if p not in groups:
-                            groups.append(p)
-                else:
-                    if name not in groups:
-                        groups.append(name)
-            except (KeyError, TypeError, ValueError, AttributeError, re.error) as e:
-                if meta.get('debug'):
-                    console.print(f"[yellow]Skipped invalid TRaSH specification: {e}[/yellow]")
-                continue
-
-        json_data = [{"name": g} for g in groups]
-
-        if not json_data:
-            if meta.get('debug'):
-                console.print("[yellow]No groups extracted from TRaSH data.[/yellow]")
-            return
-
-        await self.write_banned_groups_to_file(file_path, json_data, debug=meta.get('debug', False))
-
-    def _write_file(self, file_path: str, data: JsonDict) -> None:
-        """ Blocking file write operation, runs in a background thread """
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
-
-    async def should_update(self, file_path: str) -> bool:
-        try:
-            content = await asyncio.to_thread(self._read_file, file_path)
-            data = cast(JsonDict, json.loads(content))
-            last_updated = datetime.strptime(str(data['last_updated']), "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            return datetime.now(timezone.utc) >= last_updated + timedelta(days=1)
-        except FileNotFoundError:
-            return True
-        except Exception as e:
-            console.print(f"Error reading file: {e}")
-            return True
-
-    def _read_file(self, file_path: str) -> str:
-        """ Helper function to read the file in a blocking thread """
-        with open(file_path, encoding="utf-8") as file:
-            return file.read()
+    async def get_banned_groups(self, meta: Meta, tracker: str) -> Optional[BannedGroups]:
+        """Banned groups of ``tracker``'s remote lists; None if it has none or they could not be read."""
+        sources = {kind: source for kind, source in self.list_sources(tracker).items() if kind in (BANNED, TRASH)}
+        if not sources:
+            return None
+        store = await tracker_lists.ensure(tracker, sources, debug=bool(meta.get('debug')))
+        if not any(kind in store.lists for kind in sources):
+            return None
+        if store.failed & set(sources):
+            console.print(f"[yellow]Using the last saved banned groups for '{tracker}'.[/yellow]")
+        groups = store.banned_groups()
+        if meta.get('debug'):
+            console.print(f"Total banned groups for {tracker}: {len(groups)}")
+        return groups
+
+    def _static_banned_groups(self, tracker: str, banned_group_list: list[Any]) -> BannedGroups:
+        key = (tracker.upper(), len(banned_group_list))
+        groups = _STATIC_BANNED_GROUPS.get(key)
+        if groups is None:
+            groups = _STATIC_BANNED_GROUPS[key] = BannedGroups(banned_group_list)
+        return groups
 
     async def check_banned_group(self, tracker: str, banned_group_list: list[Any], meta: Meta) -> bool:
-        result = False
         if not meta['tag']:
             return False
 
@@ -327,172 +157,48 @@ class TRACKER_SETUP:
         if 'taoe' in group_tags:
             group_tags = 'taoe'
 
-        if tracker.upper() in ("AITHER", "LST", "LUME", "SPD"):
-            file_path = await self.get_banned_groups(meta, tracker)
-            if file_path == "empty":
-                console.print(f"[bold red]No banned groups found for '{tracker}'.")
-                return False
-            if not file_path:
+        if any(kind in (BANNED, TRASH) for kind in self.list_sources(tracker)):
+            groups = await self.get_banned_groups(meta, tracker)
+            if groups is None:
                 console.print(f"[bold red]Failed to load banned groups for '{tracker}'.")
                 return False
-
-            # Load the banned groups from the file
-            try:
-                content = await asyncio.to_thread(self._read_file, file_path)
-                data = json.loads(content)
-                banned_groups = data.get("banned_groups", "")
-                if banned_groups:
-                    banned_group_list = banned_groups.split(", ")
-
-            except FileNotFoundError:
-                console.print(f"[bold red]Banned group file for '{tracker}' not found.")
-                return False
-            except json.JSONDecodeError:
-                console.print(f"[bold red]Failed to parse banned group file for '{tracker}'.")
+            if not groups:
+                console.print(f"[bold red]No banned groups found for '{tracker}'.")
                 return False
+        else:
+            groups = self._static_banned_groups(tracker, banned_group_list)
 
-        for tag in banned_group_list:
-            if isinstance(tag, list):
-                tag_list = [str(item) for item in cast(list[Any], tag)]
-                if not tag_list:
-                    continue
-                tag_name = tag_list[0]
-                if group_tags == tag_name.lower():
-                    console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
-                    if len(tag_list) > 1:
-                        console.print(f"[bold red]NOTE: [bold yellow]{tag_list[1]}")
-                    result = True
-            else:
-                tag_name = str(tag)
-                if group_tags == tag_name.lower():
-                    console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
-                    result = True
+        if group_tags not in groups:
+            return False
 
-        if result:
-            if not meta['unattended'] or meta.get('unattended_confirm', False):
-                try:
-                    if not cli_ui.ask_yes_no(cli_ui.red, "Do you want to continue anyway?", default=False):
-                        return False
-                except EOFError:
-                    console.print("\n[red]Exiting on user request (Ctrl+C)[/red]")
-                    await cleanup_manager.cleanup()
-                    cleanup_manager.reset_terminal()
-                    sys.exit(1)
-                return True
+        console.print(f"[bold yellow]{meta['tag'][1:]}[/bold yellow][bold red] was found on [bold yellow]{tracker}'s[/bold yellow] list of banned groups.")
+        note = groups.note(group_tags)
+        if note:
+            console.print(f"[bold red]NOTE: [bold yellow]{note}")
 
+        if not meta['unattended'] or meta.get('unattended_confirm', False):
+            try:
+                if not cli_ui.ask_yes_no(cli_ui.red, "Do you want to continue anyway?", default=False):
+                    return False
+            except EOFError:
+                console.print("\n[red]Exiting on user request (Ctrl+C)[/red]")
+                await cleanup_manager.cleanup()
+                cleanup_manager.reset_terminal()
+                sys.exit(1)
             return True
 
-        return False
-
-    async def write_internal_claims_to_file(self, file_path: str, data: list[JsonDict], debug: bool = False) -> None:
-        try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-            extracted_data: list[JsonDict] = []
-            for item in data:
-                if 'attributes' not in item:
-                    console.print(f"Skipping invalid item: {item}")
-                    continue
-
-                attributes = cast(JsonDict, item['attributes'])
-                extracted_data.append({
-                    "title": attributes.get('title', 'Unknown'),
-                    "season": attributes.get('season', 'Unknown'),
-                    "tmdb_id": attributes.get('tmdb_id', 'Unknown'),
-                    "resolutions": attributes.get('resolutions', []),
-                    "types": attributes.get('types', [])
-                })
-
-            if not extracted_data:
-                if debug:
-                    console.print("No valid claims found to write.")
-                return
-
-            titles_csv = ', '.join([str(entry.get('title', '')) for entry in extracted_data])
-
-            file_content = {
-                "last_updated": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                "titles_csv": titles_csv,
-                "extracted_data": extracted_data,
-                "raw_data": data
-            }
-
-            await asyncio.to_thread(self._write_file, file_path, file_content)
-            if debug:
-                console.print(f"File '{file_path}' updated successfully with {len(extracted_data)} claims.")
-        except Exception as e:
-            console.print(f"An error occurred: {e}")
+        return True
 
     async def get_torrent_claims(self, meta: Meta, tracker: str) -> Optional[bool]:
-        file_path = os.path.join(meta['base_dir'], 'data', 'banned', f'{tracker}_claimed_releases.json')
-        tracker_instance = self._create_tracker_instance(tracker)
-        if tracker_instance is None:
+        sources = {kind: source for kind, source in self.list_sources(tracker).items() if kind == CLAIMS}
+        if not sources:
             return None
-        claims_url = getattr(tracker_instance, 'claims_url', None)
-        if not isinstance(claims_url, str):
-            return None
-
-        # Check if we need to update
-        if not await self.should_update(file_path):
-            return await self.check_tracker_claims(meta, tracker)
-
-        headers = {
-            'Authorization': f"Bearer {self.config['TRACKERS'][tracker]['api_key'].strip()}",
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-
-        all_data: list[JsonDict] = []
-        next_cursor: Optional[str] = None
-
-        async with httpx.AsyncClient() as client:
-            while True:
-                try:
-                    # Add query parameters for pagination
-                    params: JsonDict = {'cursor': next_cursor, 'per_page': 100} if next_cursor else {'per_page': 100}
-                    response = await client.get(url=claims_url, headers=headers, params=params)
-
-                    if response.status_code == 200:
-                        response_json = response.json()
-                        if not isinstance(response_json, dict):
-                            console.print(f"[red]Unexpected response format: {type(response_json)}[/red]")
-                            return False
-                        response_dict = cast(JsonDict, response_json)
-                        page_data_any = response_dict.get('data', [])
-                        if not isinstance(page_data_any, list):
-                            console.print(f"[red]Unexpected 'data' format: {type(page_data_any)}[/red]")
-                            return False
-                        page_data = cast(list[JsonDict], page_data_any)
-
-                        all_data.extend(page_data)
-                        meta_info_any = response_dict.get('meta', {})
-                        if not isinstance(meta_info_any, dict):
-                            console.print(f"[red]Unexpected 'meta' format: {type(meta_info_any)}[/red]")
-                            return False
-                        meta_info = cast(JsonDict, meta_info_any)
-
-                        # Check if there is a next page
-                        next_cursor = cast(Optional[str], meta_info.get('next_cursor'))
-                        if not next_cursor:
-                            break  # Exit loop if there are no more pages
-                    else:
-                        console.print(f"[red]Error: Received status code {response.status_code}[/red]")
-                        return False
-
-                except httpx.RequestError as e:
-                    console.print(f"[red]HTTP Request failed: {e}[/red]")
-                    return False
-                except Exception as e:
-                    console.print(f"[red]An unexpected error occurred: {e}[/red]")
-                    return False
-
-        if meta['debug']:
-            console.print("Total claims retrieved:", len(all_data))
 
-        if not all_data:
+        store = await tracker_lists.ensure(tracker, sources, debug=bool(meta.get('debug')))
+        if CLAIMS not in store.lists:
             return False
-
-        await self.write_internal_claims_to_file(file_path, all_data, debug=meta['debug'])
+        if meta['debug']:
+            console.print(f"Total claims for {tracker}: {len(store.lists[CLAIMS].items)}")
 
         return await self.check_tracker_claims(meta, tracker)
 
@@ -534,16 +240,12 @@ class TRACKER_SETUP:
                 metaseason = meta.get('season_int')
                 if metaseason:
                     seasonint = int(metaseason)
-                file_path = os.path.join(meta['base_dir'], 'data', 'banned', f'{tracker_name}_claimed_releases.json')
-                if not os.path.exists(file_path):
-                    console.print(f"[red]No claim data file found for {tracker_name}[/red]")
+                store = await tracker_lists.store(tracker_name)
+                if CLAIMS not in store.lists:
+                    console.print(f"[red]No claim data found for {tracker_name}[/red]")
                     return False
 
-                file_content = await asyncio.to_thread(Path(file_path).read_text, encoding="utf-8")
-                extracted_data = cast(JsonDict, json.loads(file_content)).get('extracted_data', [])
-                extracted_data = cast(list[JsonDict], extracted_data)
-
-                for item in extracted_data:
+                for item in (claim for tmdb in tmdb_id for claim in store.claims(tmdb)):
                     title = item.get('title')
                     season = item.get('season')
                     api_tmdb_id = item.get('tmdb_id')
@@ -551,8 +253,7 @@ class TRACKER_SETUP:
                     api_types = cast(list[Any], item.get('types', []))
 
                     if (
-                        api_tmdb_id in tmdb_id
-                        and (meta['category'] == "MOVIE" or season == seasonint)
+                        (meta['category'] == "MOVIE" or season == seasonint)
                         and all(res in api_resolutions for res in resolution_ids)
                         and all(typ in api_types for typ in type_ids)
                     ):
@@ -584,7 +285,7 @@ class TRACKER_SETUP:
             'tmdb': meta['tmdb'],
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                 response = await client.get(url=url, headers=headers, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -644,7 +345,7 @@ class TRACKER_SETUP:
             'tmdb_id': f"{meta['category'].lower()}/{meta['tmdb_id']}",
         }
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                 response = await client.post(url=url, params=params)
                 if response.status_code == 200:
                     data = response.json()
@@ -1128,7 +829,7 @@ class TRACKER_SETUP:
         next_cursor: Optional[str] = None
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                 while True:
                     try:
                         # Add pagination cursor to params if we have one
@@ -1311,7 +1012,7 @@ class TRACKER_SETUP:
 
         if not meta.get('debug', False):
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
+                async with httpx.AsyncClient(transport=http_pool.transport(), timeout=10.0) as client:
                     response = await client.post(url=create_url, headers=headers, json=payload)
                     if response.status_code in (200, 201):
                         console.print(f"[bold green]Successfully created trump report on {tracker}[/bold green]")
@@ -1336,13 +1037,57 @@ class TRACKER_SETUP:
             return True
 
 
-tracker_class_map: dict[str, type[Any]] = {
-    'A4K': A4K, 'ACM': ACM, 'AITHER': AITHER, 'ANT': ANT, 'AR': AR, 'ASC': ASC, 'AZ': AZ, 'BHD': BHD, 'BHDTV': BHDTV, 'BJS': BJS, 'BLU': BLU, 'BT': BT, 'CBR': CBR,
-    'CZ': CZ, 'DC': DC, 'DP': DP, 'DT': DT, 'EMUW': EMUW, 'FNP': FNP, 'FF': FF, 'FL': FL, 'FRIKI': FRIKI, 'GPW': GPW, 'HDB': HDB, 'HDS': HDS, 'HDT': HDT, 'HHD': HHD, 'HUNO': HUNO, 'ITT': ITT,
-    'IHD': IHD, 'IS': IS, 'LCD': LCD, 'LDU': LDU, 'LST': LST, 'LT': LT, 'LUME': LUME, 'MTV': MTV, 'NBL': NBL, 'OE': OE, 'OTW': OTW, 'PHD': PHD, 'PT': PT, 'PTP': PTP, 'PTER': PTER, 'PTS': PTS, 'PTT': PTT,
-    'R4E': R4E, 'RAS': RAS, 'RF': RF, 'RTF': RTF, 'SAM': SAM, 'SHRI': SHRI, 'SN': SN, 'SP': SP, 'SPD': SPD, 'STC': STC, 'THR': THR,
-    'TIK': TIK, 'TL': TL, 'TLZ': TLZ, 'TOS': TOS, 'TVC': TVC, 'TTG': TTG, 'TTR': TTR, 'ULCX': ULCX, 'UTP': UTP, 'YOINK': YOINK, 'YUS': YUS
-}
+tracker_names: tuple[str, ...] = (
+    'A4K', 'ACM', 'AITHER', 'ANT', 'AR', 'ASC', 'AZ', 'BHD', 'BHDTV', 'BJS', 'BLU', 'BT', 'CBR',
+    'CZ', 'DC', 'DP', 'DT', 'EMUW', 'FNP', 'FF', 'FL', 'FRIKI', 'GPW', 'HDB', 'HDS', 'HDT', 'HHD', 'HUNO', 'ITT',
+    'IHD', 'IS', 'LCD', 'LDU', 'LST', 'LT', 'LUME', 'MTV', 'NBL', 'OE', 'OTW', 'PHD', 'PT', 'PTP', 'PTER', 'PTS', 'PTT',
+    'R4E', 'RAS', 'RF', 'RTF', 'SAM', 'SHRI', 'SN', 'SP', 'SPD', 'STC', 'THR',
+    'TIK', 'TL', 'TLZ', 'TOS', 'TVC', 'TTG', 'TTR', 'ULCX', 'UTP', 'YOINK', 'YUS'
+)
+
+
+class LazyTrackerClassMap(Mapping[str, type[Any]]):
+    """Read-only tracker registry that imports ``src.trackers.<NAME>`` on first lookup.
+
+    Membership tests and iteration only use the tracker names, so code that just
+    validates or lists trackers never pays the import cost of the tracker modules.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        self._names: tuple[str, ...] = names
+        self._known: frozenset[str] = frozenset(names)
+        self._classes: dict[str, type[Any]] = {}
+        # Seconds spent importing each tracker module, in load order
+        self.import_times: dict[str, float] = {}
+
+    def __getitem__(self, name: str) -> type[Any]:
+        tracker_class = self._classes.get(name)
+        if tracker_class is not None:
+            return tracker_class
+        if name not in self._known:
+            raise KeyError(name)
+
+        start = time.perf_counter()
+        module = importlib.import_module(f"src.trackers.{name}")
+        tracker_class = cast(type[Any], getattr(module, name))
+        self.import_times[name] = time.perf_counter() - start
+        self._classes[name] = tracker_class
+        return tracker_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._known
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._classes
+
+
+tracker_class_map = LazyTrackerClassMap(tracker_names)
 
 api_trackers = {
     'A4K', 'ACM', 'AITHER', 'BHD', 'BLU', 'CBR', 'DP', 'DT', 'EMUW', 'FNP', 'FRIKI', 'HHD', 'HUNO', 'IHD', 'ITT', 'LCD', 'LDU', 'LST', 'LT', 'LUME',
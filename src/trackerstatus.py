@@ -1,6 +1,5 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
-import copy
 import os
 import sys
 from collections.abc import Mapping, MutableMapping
@@ -15,8 +14,8 @@ from src.clients import Clients
 from src.console import console
 from src.dupe_checking import DupeChecker
 from src.imdb import imdb_manager
+from src.metaview import MetaOverlay
 from src.torrentcreate import TorrentCreator
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, tracker_class_map
 from src.uphelper import UploadHelper
 
@@ -44,7 +43,9 @@ class TrackerStatusManager:
 
         async def process_single_tracker(tracker_name: str, shared_meta: Meta) -> tuple[str, dict[str, bool]]:
             nonlocal successful_trackers
-            local_meta = copy.deepcopy(shared_meta)  # Ensure each task gets its own copy of meta
+            # Each task reads the shared meta and keeps its own writes private until merged back
+            meta_view = MetaOverlay(shared_meta)
+            local_meta: Meta = meta_view
             local_tracker_status = {'banned': False, 'skipped': False, 'dupe': False, 'upload': False, 'other': False}
             disctype = local_meta.get('disctype', None)
             we_already_asked = False
@@ -111,7 +112,7 @@ class TrackerStatusManager:
                         if local_meta['tracker_status'][tracker_name].get('other', False):
                             local_tracker_status['other'] = True
                     elif tracker_name == "PTP":
-                        ptp: Any = PTP(config=self.config)
+                        ptp: Any = tracker_class_map['PTP'](config=self.config)
                         groupID = await ptp.get_group_by_imdb(local_meta['imdb'])
                         async with meta_lock:
                             meta['ptp_groupID'] = groupID
@@ -131,31 +132,12 @@ class TrackerStatusManager:
                         if is_dupe:
                             local_tracker_status['dupe'] = True
 
-                        matched_episode_ids = local_meta.get(f'{tracker_name}_matched_episode_ids', [])
-                        trumpable_id = local_meta.get('trumpable_id')
-                        cross_seed_key = f'{tracker_name}_cross_seed'
-                        cross_seed_value = local_meta.get(cross_seed_key) if cross_seed_key in local_meta else None
-
-                        # Only shared-state writes go under the lock
-                        async with meta_lock:
-                            if matched_episode_ids:
-                                meta[f'{tracker_name}_matched_episode_ids'] = matched_episode_ids
-                            if trumpable_id:
-                                meta['trumpable_id'] = trumpable_id
-                            if cross_seed_key in local_meta and cross_seed_value:
-                                meta[cross_seed_key] = cross_seed_value
-
+                        # Merge back only the results other stages need; shared-state writes go under the lock
+                        merge_keys = [f'{tracker_name}_matched_episode_ids', 'trumpable_id', f'{tracker_name}_cross_seed']
                         if tracker_name in ["AITHER", "LST"]:
-                            were_trumping = local_meta.get('were_trumping', False)
-                            trump_reason = local_meta.get('trump_reason')
-                            trumpable_id_after_dupe_check = local_meta.get(f'{tracker_name}_trumpable_id')
-                            async with meta_lock:
-                                if were_trumping:
-                                    meta['were_trumping'] = were_trumping
-                                if trump_reason:
-                                    meta['trump_reason'] = trump_reason
-                                if trumpable_id_after_dupe_check:
-                                    meta[f'{tracker_name}_trumpable_id'] = trumpable_id_after_dupe_check
+                            merge_keys.extend(['were_trumping', 'trump_reason', f'{tracker_name}_trumpable_id'])
+                        async with meta_lock:
+                            meta_view.merge_into(meta, merge_keys)
 
                     elif 'skipping' in local_meta:
                         local_tracker_status['skipped'] = True
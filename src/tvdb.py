@@ -3,17 +3,19 @@
 import asyncio
 import base64
 import contextlib
+import functools
 import json
 import os
 import re
 import ssl
 from pathlib import Path
-from typing import Any, Optional, Union, cast
+from typing import Any, Callable, Optional, Union, cast
 from urllib.error import URLError
 
 from tvdb_v4_official import TVDB
 
 from src.console import console
+from src.metadata_cache import metadata_cache
 
 
 def _get_tvdb_k() -> str:
@@ -101,6 +103,14 @@ except Exception as e:
     _tvdb_init_error = e
 
 
+async def _tvdb_cached(endpoint: str, params: dict[str, Any], call: Callable[[], Any]) -> Any:
+    """Run a blocking TVDB client call off the event loop, served from the metadata cache when possible."""
+    async def fetch() -> Any:
+        return await asyncio.to_thread(call)
+
+    return await metadata_cache.cached_call('tvdb', endpoint, params, fetch)
+
+
 def _get_tvdb_or_warn() -> Optional[TVDB]:
     global _tvdb_error_reported
 
@@ -142,7 +152,11 @@ class tvdb_data:
         if client is None:
             return None, None
 
-        results = _as_dict_list(cast(Any, client).search({filename}, year=year, type="series", lang="eng"))
+        results = _as_dict_list(await _tvdb_cached(
+            'search',
+            {'query': filename, 'year': year, 'type': 'series'},
+            lambda: cast(Any, client).search({filename}, year=year, type="series", lang="eng"),
+        ))
         await asyncio.sleep(0.1)
         try:
             if results and len(results) > 0:
@@ -317,11 +331,16 @@ class tvdb_data:
                     console.print(f"[cyan]Fetching TVDB episodes page {page + 1}[/cyan]")
 
                 try:
-                    episodes_response = cast(Any, client).get_series_episodes(
-                        series_id_int,
-                        season_type="default",
-                        page=page,
-                        lang="eng"
+                    episodes_response = await _tvdb_cached(
+                        'series_episodes',
+                        {'series_id': series_id_int, 'page': page},
+                        functools.partial(
+                            cast(Any, client).get_series_episodes,
+                            series_id_int,
+                            season_type="default",
+                            page=page,
+                            lang="eng"
+                        ),
                     )
 
                     # Handle both dict response and direct episodes list
@@ -379,7 +398,11 @@ class tvdb_data:
             try:
                 if all_episodes:
                     # Get series details for aliases
-                    series_info = cast(dict[str, Any], cast(Any, client).get_series_extended(series_id_int))
+                    series_info = cast(dict[str, Any], await _tvdb_cached(
+                        'series_extended',
+                        {'series_id': series_id_int},
+                        lambda: cast(Any, client).get_series_extended(series_id_int),
+                    ))
                     if 'aliases' in series_info:
                         episodes_data['aliases'] = series_info['aliases']
             except Exception as alias_error:
@@ -453,7 +476,10 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with IMDB ID: {imdb_formatted}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(imdb_formatted))
+                results = _as_dict_list(await _tvdb_cached(
+                    'search_by_remote_id', {'remote_id': imdb_formatted},
+                    lambda: cast(Any, client).search_by_remote_id(imdb_formatted),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -506,7 +532,10 @@ class tvdb_data:
                 if debug:
                     console.print(f"[cyan]Trying TVDB lookup with TMDB ID: {tmdb_str}[/cyan]")
 
-                results = _as_dict_list(cast(Any, client).search_by_remote_id(tmdb_str))
+                results = _as_dict_list(await _tvdb_cached(
+                    'search_by_remote_id', {'remote_id': tmdb_str},
+                    lambda: cast(Any, client).search_by_remote_id(tmdb_str),
+                ))
                 await asyncio.sleep(0.1)
 
                 if results and len(results) > 0:
@@ -572,7 +601,11 @@ class tvdb_data:
                     console.print(f"[yellow]Invalid TVDB episode ID: {episode_id}[/yellow]")
                 return None
 
-            episode_data = cast(dict[str, Any], cast(Any, client).get_episode_extended(episode_id_int))
+            episode_data = cast(dict[str, Any], await _tvdb_cached(
+                'episode_extended',
+                {'episode_id': episode_id_int},
+                lambda: cast(Any, client).get_episode_extended(episode_id_int),
+            ))
             if debug:
                 console.print(f"[yellow]Episode data retrieved for episode ID {episode_id}[/yellow]")
 
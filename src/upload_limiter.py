@@ -0,0 +1,241 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+Adaptive per-host concurrency for image uploads.
+
+Each image host gets an AIMD controller instead of a fixed worker count. The number of
+concurrent uploads grows by one per window of clean uploads. It shrinks multiplicatively:
+
+- halved on 429, 5xx responses or timeouts;
+- by a quarter when upload latency climbs well above the host's baseline.
+
+A ``Retry-After`` header pauses new uploads to that host until it has passed.
+
+HTTP responses are seen through ``http_pool.observe`` while an upload holds its slot. The
+learned limit and baseline latency are kept in the metadata cache (``imghost_limits``), so
+the next run starts where the last one left off. ``upload_limiter.summary()`` reports
+throughput and error counts per host.
+"""
+import asyncio
+import contextlib
+import email.utils
+import os
+import time
+from collections.abc import AsyncIterator
+from typing import Any, Optional, cast
+
+import httpx
+
+from src.metadata_cache import metadata_cache
+
+NAMESPACE = 'imghost_limits'
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_INITIAL_LIMIT = 4.0
+# Starting points for hosts without a learned limit yet
+INITIAL_LIMITS: dict[str, float] = {"onlyimage": 6.0, "ptscreens": 6.0, "lensdump": 1.0, "passtheimage": 6.0}
+# Latency above this multiple of the baseline counts as congestion
+LATENCY_CONGESTION_FACTOR = 3.0
+MAX_RETRY_AFTER = 120.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delay-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(MAX_RETRY_AFTER, float(value))
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return min(MAX_RETRY_AFTER, max(0.0, retry_at.timestamp() - time.time()))
+
+
+class UploadSlot:
+    """One upload attempt holding a slot; collects what the host answered."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.throttled = False
+        self.server_error = False
+        self.retry_after: Optional[float] = None
+        self.responses = 0
+        self.result: Optional[dict[str, Any]] = None
+
+    def observe(self, response: httpx.Response) -> None:
+        self.responses += 1
+        if response.status_code == 429:
+            self.throttled = True
+        elif response.status_code >= 500:
+            self.server_error = True
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is not None and (response.status_code == 429 or response.status_code >= 500):
+            self.retry_after = max(self.retry_after or 0.0, retry_after)
+
+
+class HostController:
+    def __init__(self, host: str, max_limit: int) -> None:
+        self.host = host
+        self.max_limit = float(max(1, max_limit))
+        self.limit = min(self.max_limit, INITIAL_LIMITS.get(host, DEFAULT_INITIAL_LIMIT))
+        self.baseline: Optional[float] = None
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.loaded = False
+        self.stats: dict[str, float] = {
+            'uploads': 0, 'failures': 0, 'throttled': 0, 'server_errors': 0, 'timeouts': 0,
+            'cached': 0, 'bytes': 0, 'busy_seconds': 0.0, 'latency_total': 0.0,
+        }
+        self._busy_since = 0.0
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def concurrency(self) -> int:
+        return max(1, int(self.limit))
+
+    async def acquire(self) -> None:
+        while True:
+            wait = self.blocked_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            if self.in_flight < self.concurrency:
+                if self.in_flight == 0:
+                    self._busy_since = time.monotonic()
+                self.in_flight += 1
+                return
+            if self._wakeup is None:
+                self._wakeup = asyncio.Event()
+            await self._wakeup.wait()
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self.stats['busy_seconds'] += time.monotonic() - self._busy_since
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._wakeup = None
+
+    def _decrease(self, factor: float) -> None:
+        now = time.monotonic()
+        # At most once per round trip, so one burst of errors from the same window counts once
+        window = self.baseline or 1.0
+        if now - self.last_decrease >= window:
+            self.limit = max(1.0, self.limit * factor)
+            self.last_decrease = now
+
+    def record(self, slot: UploadSlot, timed_out: bool = False) -> None:
+        result = slot.result or {}
+        latency = time.monotonic() - slot.started
+        if slot.retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + slot.retry_after)
+        if result.get('cached'):
+            self.stats['cached'] += 1
+            return
+
+        reason = str(result.get('reason', '')).lower()
+        timed_out = timed_out or 'timed out' in reason or 'timeout' in reason
+        self.stats['throttled'] += slot.throttled
+        self.stats['server_errors'] += slot.server_error
+        self.stats['timeouts'] += timed_out
+        if slot.throttled or slot.server_error or timed_out:
+            self.stats['failures'] += 1
+            self._decrease(0.5)
+            return
+        if result.get('status') != 'success':
+            # Rejected for its own reasons (API key, duplicate, bad response): not a load signal
+            self.stats['failures'] += 1
+            return
+
+        self.stats['uploads'] += 1
+        self.stats['latency_total'] += latency
+        local_file_path = result.get('local_file_path')
+        if isinstance(local_file_path, str):
+            with contextlib.suppress(OSError):
+                self.stats['bytes'] += os.stat(local_file_path).st_size
+        if self.baseline is None or latency < self.baseline:
+            self.baseline = latency
+        else:
+            # Let the baseline follow slow drifts (bigger images, another route)
+            self.baseline += (latency - self.baseline) * 0.05
+        if latency > self.baseline * LATENCY_CONGESTION_FACTOR:
+            self._decrease(0.75)
+        else:
+            # Additive increase: about +1 per window of successful uploads
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def summary(self) -> str:
+        s = self.stats
+        busy = s['busy_seconds'] or 0.0
+        rate = f"{s['uploads'] / busy:.2f} img/s, {s['bytes'] / busy / 1024 / 1024:.2f} MB/s" if busy > 0 else "n/a"
+        latency = f"{s['latency_total'] / s['uploads']:.2f}s" if s['uploads'] else "n/a"
+        return (
+            f"{self.host}: limit {self.limit:.1f} (max {self.max_limit:.0f}), {int(s['uploads'])} uploaded, {int(s['cached'])} cached, "
+            f"{int(s['failures'])} failed (429: {int(s['throttled'])}, 5xx: {int(s['server_errors'])}, timeouts: {int(s['timeouts'])}), "
+            f"{rate}, avg latency {latency}"
+        )
+
+
+class UploadLimiter:
+    def __init__(self) -> None:
+        self.max_concurrency = DEFAULT_MAX_CONCURRENCY
+        self.hosts: dict[str, HostController] = {}
+
+    def configure(self, config: dict[str, Any]) -> None:
+        default_cfg = cast(dict[str, Any], config.get('DEFAULT', {}))
+        try:
+            self.max_concurrency = max(1, int(default_cfg.get('image_upload_max_concurrency', DEFAULT_MAX_CONCURRENCY)))
+        except (TypeError, ValueError):
+            self.max_concurrency = DEFAULT_MAX_CONCURRENCY
+
+    async def host(self, img_host: str) -> HostController:
+        """Controller of ``img_host``, starting from the limit learned in earlier runs."""
+        controller = self.hosts.get(img_host)
+        if controller is None:
+            controller = HostController(img_host, self.max_concurrency)
+            self.hosts[img_host] = controller
+        if not controller.loaded:
+            controller.loaded = True
+            saved = await metadata_cache.get_json(NAMESPACE, img_host)
+            if isinstance(saved, dict):
+                state = cast(dict[str, Any], saved)
+                with contextlib.suppress(TypeError, ValueError):
+                    controller.limit = min(controller.max_limit, max(1.0, float(state.get('limit', controller.limit))))
+                with contextlib.suppress(TypeError, ValueError):
+                    baseline = state.get('baseline')
+                    controller.baseline = float(baseline) if baseline else None
+        return controller
+
+    async def save(self, img_host: str) -> None:
+        controller = self.hosts.get(img_host)
+        if controller is not None:
+            await metadata_cache.put_json(NAMESPACE, img_host, None, {'limit': controller.limit, 'baseline': controller.baseline})
+
+    @contextlib.asynccontextmanager
+    async def slot(self, controller: HostController) -> AsyncIterator[UploadSlot]:
+        """Hold an upload slot on ``controller``; set ``slot.result`` to the upload's result dict."""
+        await controller.acquire()
+        slot = UploadSlot()
+        try:
+            yield slot
+        except asyncio.TimeoutError:
+            controller.record(slot, timed_out=True)
+            raise
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            controller.record(slot)
+            raise
+        else:
+            controller.record(slot)
+        finally:
+            controller.release()
+
+    def summary(self) -> str:
+        return "; ".join(controller.summary() for controller in self.hosts.values()) or "no uploads"
+
+
+upload_limiter = UploadLimiter()
@@ -1,6 +1,7 @@
 # Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
 import asyncio
 import base64
+import bisect
 import contextlib
 import gc
 import glob
@@ -17,6 +18,9 @@ import pyimgbox
 from typing_extensions import TypeAlias
 
 from src.console import console
+from src.http_pool import http_pool
+from src.image_upload_cache import image_upload_cache
+from src.upload_limiter import HostController, upload_limiter
 
 Meta: TypeAlias = dict[str, Any]
 ImageDict: TypeAlias = dict[str, Any]
@@ -53,8 +57,114 @@ class UploadScreensManager:
             allowed_hosts=allowed_hosts,
         )
 
+    def screen_stream(self, meta: Meta, img_host: str) -> 'ScreenUploadStream':
+        return ScreenUploadStream(self.config, meta, img_host)
+
+
+class ScreenUploadStream:
+    """Uploads screenshots to one image host while the rest are still being captured.
+
+    ``put`` queues a finished screenshot, and consumers upload the queue with the retries and
+    per-host concurrency of ``upload_screens``. Results go into ``meta['image_list']`` in
+    screenshot order as they arrive. If any screenshot fails to upload, ``finish`` takes the
+    streamed entries back out, so the regular upload (with its host fallback) runs instead.
+    """
+
+    def __init__(self, config: dict[str, Any], meta: Meta, img_host: str) -> None:
+        self.config = config
+        self.meta = meta
+        self.img_host = img_host
+        self.queue: asyncio.Queue[Optional[tuple[int, str]]] = asyncio.Queue()
+        self.queued: set[int] = set()
+        self.failed: list[int] = []
+        self._indices: list[int] = []
+        self._base = 0
+        self._host_controller: Optional[HostController] = None
+        self._consumers: list[asyncio.Task[None]] = []
+        self._running_tasks: set[asyncio.Task[dict[str, Any]]] = set()
+        self._start_time = 0.0
+
+    @property
+    def image_list(self) -> list[ImageDict]:
+        return cast(list[ImageDict], self.meta.setdefault('image_list', []))
+
+    def put(self, index: int, image: str) -> None:
+        """Queue screenshot ``index`` for upload; a screenshot is only uploaded once."""
+        if index in self.queued:
+            return
+        self.queued.add(index)
+        if not self._consumers:
+            # Started on the first screenshot, so a run that captures nothing leaves no tasks behind
+            self._base = len(self.image_list)
+            self._start_time = time.time()
+            self._consumers = [asyncio.create_task(self._consume()) for _ in range(upload_limiter.max_concurrency)]
+        self.queue.put_nowait((index, image))
+
+    async def _consume(self) -> None:
+        if self._host_controller is None:
+            self._host_controller = await upload_limiter.host(self.img_host)
+        while True:
+            item = await self.queue.get()
+            if item is None:
+                return
+            index, image = item
+            result = await _upload_with_retries((index, image, self.img_host, self.config, self.meta), self._host_controller, self._running_tasks)
+            if result is None:
+                self.failed.append(index)
+            else:
+                self._add(index, result[1])
+
+    def _add(self, index: int, upload: dict[str, Any]) -> None:
+        raw_url = upload['raw_url']
+        position = bisect.bisect(self._indices, index)
+        self._indices.insert(position, index)
+        self.image_list.insert(self._base + position, {'img_url': upload['img_url'], 'raw_url': raw_url, 'web_url': upload['web_url']})
+        local_file_path = upload.get('local_file_path')
+        if local_file_path:
+            with contextlib.suppress(OSError):
+                self.meta.setdefault('image_sizes', {})[raw_url] = os.path.getsize(local_file_path)
+        if self.meta.get('debug'):
+            console.print(f"[blue]Streamed screenshot {index} to {self.img_host}: {raw_url}[/blue]")
+
+    async def finish(self) -> int:
+        """Wait for the queued screenshots to be uploaded; the number that made it into ``meta['image_list']``."""
+        if not self._consumers:
+            return 0
+        for _ in self._consumers:
+            self.queue.put_nowait(None)
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+        await upload_limiter.save(self.img_host)
+
+        if self.failed or len(self._indices) < len(self.queued):
+            console.print(f"[yellow]{len(self.queued) - len(self._indices)} screenshot(s) failed to upload to {self.img_host} while capturing, uploading them again.[/yellow]")
+            del self.image_list[self._base:self._base + len(self._indices)]
+            self._indices = []
+            return 0
+        console.print(f"[green]Uploaded {len(self._indices)} screenshots to {self.img_host} while capturing.")
+        if self.meta.get('debug'):
+            console.print(f"Streamed screenshot uploads finished {time.time() - self._start_time:.4f} seconds after the first capture")
+            if self._host_controller is not None:
+                console.print(f"[blue]Image host stats: {self._host_controller.summary()}[/blue]")
+        return len(self._indices)
+
+    async def cancel(self) -> None:
+        """Stop the queued uploads after a capture error and take the streamed screenshots back out of ``meta['image_list']``."""
+        for task in [*self._running_tasks, *self._consumers]:
+            task.cancel()
+        await asyncio.gather(*self._running_tasks, *self._consumers, return_exceptions=True)
+        self._consumers = []
+        del self.image_list[self._base:self._base + len(self._indices)]
+        self._indices = []
+
 
 async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
+    image, img_host, _config, meta = args
+    # The same bytes already uploaded to this host (another tracker, an earlier run) are not sent again
+    return await image_upload_cache.cached_upload(image, img_host, lambda: _upload_image_task(args), debug=bool(meta.get('debug')))
+
+
+async def _upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
     image, img_host, config, meta = args
     try:
         timeout = 60  # Default timeout
@@ -62,7 +172,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
 
         if img_host == "imgbox":
             try:
-                image_list = await imgbox_upload(os.getcwd(), [image], return_dict={})
+                image_list = await imgbox_upload([image], return_dict={})
                 if image_list and all(
                     'img_url' in img and 'raw_url' in img and 'web_url' in img for img in image_list
                 ):
@@ -90,7 +200,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 return {'status': 'failed', 'reason': 'Missing ptpimg API key in config'}
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     async with aiofiles.open(image, 'rb') as file:
                         files = {'file-upload[0]': (os.path.basename(image), await file.read())}
                         headers = {'referer': 'https://ptpimg.me/index.php'}
@@ -140,7 +250,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'image': encoded_image,
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -178,7 +288,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'key': config['DEFAULT']['dalexni_api'],
                     'image': encoded_image,
                 }
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, data=data, timeout=timeout)
                     response_data = response.json()
                     if response.status_code != 200 or not response_data.get('success'):
@@ -213,7 +323,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['ptscreens_api']
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client, aiofiles.open(image, 'rb') as file:
                     files = {
                         'source': ('file-upload[0]', await file.read())
                     }
@@ -255,7 +365,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['utppm_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -293,7 +403,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': config['DEFAULT']['onlyimage_api'],
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
 
@@ -326,7 +436,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'max_th_size': 350
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as file:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client, aiofiles.open(image, 'rb') as file:
                     files = {
                         'img': ('file-upload[0]', await file.read())
                     }
@@ -372,7 +482,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {
                     'X-API-Key': config['DEFAULT']['lensdump_api']
                 }
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, data=data, headers=headers, timeout=timeout)
                     response_data = response.json()
                     if response_data.get('status_code') == 200:
@@ -405,7 +515,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'Authorization': f'{api_key}',
                 }
 
-                async with httpx.AsyncClient() as client:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client:
                     response = await client.post(url, files={'file': (filename, file_bytes)}, headers=headers, timeout=timeout)
                     if response.status_code == 200:
                         response_data = response.json()
@@ -448,7 +558,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                     'X-API-Key': pass_api_key
                 }
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'source': (os.path.basename(image), await img_file.read())}
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
 
@@ -499,7 +609,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
             try:
                 headers = {'Authorization': f'Bearer {api_key}'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'files[]': (os.path.basename(image), await img_file.read())}
 
                     response = await client.post(url, headers=headers, files=files, timeout=timeout)
@@ -559,7 +669,7 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
                 headers = {'Authorization': f'{api_key}'}
                 data = {'title': 'Upload-Assistant screenshot'}
 
-                async with httpx.AsyncClient() as client, aiofiles.open(image, 'rb') as img_file:
+                async with httpx.AsyncClient(transport=http_pool.transport()) as client, aiofiles.open(image, 'rb') as img_file:
                     files = {'file': (os.path.basename(image), await img_file.read())}
                     response = await client.post(url, headers=headers, data=data, files=files, timeout=timeout)
 
@@ -623,6 +733,83 @@ async def upload_image_task(args: Sequence[Any]) -> dict[str, Any]:
         }
 
 
+async def _upload_with_retries(
+    task: tuple[int, str, str, dict[str, Any], dict[str, Any]],
+    host_controller: HostController,
+    running_tasks: set[asyncio.Task[dict[str, Any]]],
+    max_retries: int = 3,
+) -> Union[tuple[int, dict[str, Any]], None]:
+    """Upload image with concurrency control and retry logic."""
+    index, *task_args = task
+    img_host = task[2]
+    retry_count = 0
+
+    while retry_count <= max_retries:
+        future: Optional[asyncio.Task[dict[str, Any]]] = None
+        try:
+            try:
+                # The slot is held for the attempt only, retries wait outside of it
+                async with upload_limiter.slot(host_controller) as slot:
+                    with http_pool.observe(slot.observe):
+                        future = asyncio.create_task(upload_image_task(task_args))
+                    running_tasks.add(future)
+                    result = await asyncio.wait_for(future, timeout=60.0)
+                    running_tasks.discard(future)
+                    slot.result = result
+
+                if result.get('status') == 'success':
+                    return (index, result)
+                else:
+                    reason = result.get('reason', 'Unknown error')
+                    if "duplicate" in reason.lower():
+                        console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
+                        return None
+                    elif "api key" in reason.lower():
+                        console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
+                        return None
+                    if retry_count < max_retries:
+                        retry_count += 1
+                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
+                        await asyncio.sleep(1.1 * retry_count)
+                        continue
+                    else:
+                        console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
+                        return None
+
+            except asyncio.TimeoutError:
+                console.print(f"[red]Upload task {index} timed out after 60 seconds[/red]")
+                if future in running_tasks:
+                    future.cancel()
+                    running_tasks.discard(future)
+
+                if retry_count < max_retries:
+                    retry_count += 1
+                    console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index} after timeout[/yellow]")
+                    await asyncio.sleep(1.1 * retry_count)
+                    continue
+                return None
+
+        except asyncio.CancelledError:
+            console.print(f"[red]Upload task {index} cancelled.[/red]")
+            if future and future in running_tasks:
+                future.cancel()
+                running_tasks.discard(future)
+            return None
+
+        except Exception as e:
+            console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
+            if retry_count < max_retries:
+                retry_count += 1
+                console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
+                await asyncio.sleep(1.5 * retry_count)
+                continue
+            else:
+                console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
+                return None
+
+    return None
+
+
 async def _upload_screens(
     config: dict[str, Any],
     meta: Meta,
@@ -643,7 +830,8 @@ async def _upload_screens(
     if meta.get('debug'):
         upload_start_time = time.time()
 
-    os.chdir(f"{meta['base_dir']}/tmp/{meta['uuid']}")
+    # Screenshots are named relative to the run's tmp folder; the working directory is shared by every queued item
+    tmp_dir = f"{meta['base_dir']}/tmp/{meta['uuid']}"
 
     initial_img_host = default_config[f'img_host_{img_host_num}']
     img_host = str(meta.get('imghost', ''))
@@ -686,24 +874,24 @@ async def _upload_screens(
     # Handle image selection
 
     if using_custom_img_list:
-        image_glob: list[str] = custom_img_list
+        image_glob: list[str] = [os.path.join(tmp_dir, image) for image in custom_img_list]
         existing_images: list[ImageDict] = []
         existing_count = 0
     else:
         image_patterns = ["*.png", ".[!.]*.png"]
         image_glob: list[str] = []
         for pattern in image_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(tmp_dir), pattern))
             image_glob.extend(glob_results)
 
         unwanted_patterns = ["FILE*", "PLAYLIST*", "POSTER*"]
         unwanted_files: set[str] = set()
         for pattern in unwanted_patterns:
-            glob_results = await asyncio.to_thread(glob.glob, pattern)
+            glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(tmp_dir), pattern))
             unwanted_files.update(glob_results)
             if pattern.startswith("FILE") or pattern.startswith("PLAYLIST") or pattern.startswith("POSTER"):
                 hidden_pattern = "." + pattern
-                hidden_glob_results = await asyncio.to_thread(glob.glob, hidden_pattern)
+                hidden_glob_results = await asyncio.to_thread(glob.glob, os.path.join(glob.escape(tmp_dir), hidden_pattern))
                 unwanted_files.update(hidden_glob_results)
 
         image_glob = [file for file in image_glob if file not in unwanted_files]
@@ -736,100 +924,27 @@ async def _upload_screens(
         for index, image in enumerate(image_glob[:images_needed])
     ]
 
-    # Concurrency Control
-    default_pool_size = len(upload_tasks)
-    host_limits = {"onlyimage": 6, "ptscreens": 6, "lensdump": 1, "passtheimage": 6}
-    pool_size = host_limits.get(img_host, default_pool_size)
-    max_workers = min(len(upload_tasks), pool_size)
-    semaphore = asyncio.Semaphore(max_workers)
+    # Concurrency adapts per host to latency, 429/5xx responses and Retry-After
+    host_controller = await upload_limiter.host(img_host)
 
     # Track running tasks for cancellation
     running_tasks: set[asyncio.Task[dict[str, Any]]] = set()
 
-    async def async_upload(
-        task: tuple[int, str, str, dict[str, Any], dict[str, Any]],
-        max_retries: int = 3,
-    ) -> Union[tuple[int, dict[str, Any]], None]:
-        """Upload image with concurrency control and retry logic."""
-        index, *task_args = task
-        retry_count = 0
-
-        async with semaphore:
-            while retry_count <= max_retries:
-                future: Optional[asyncio.Task[dict[str, Any]]] = None
-                try:
-                    future = asyncio.create_task(upload_image_task(task_args))
-                    running_tasks.add(future)
-
-                    try:
-                        result = await asyncio.wait_for(future, timeout=60.0)
-                        running_tasks.discard(future)
-
-                        if result.get('status') == 'success':
-                            return (index, result)
-                        else:
-                            reason = result.get('reason', 'Unknown error')
-                            if "duplicate" in reason.lower():
-                                console.print(f"[yellow]Skipping host because duplicate image {index}: {reason}[/yellow]")
-                                return None
-                            elif "api key" in reason.lower():
-                                console.print(f"[red]API key error for {img_host}. Aborting further attempts.[/red]")
-                                return None
-                            if retry_count < max_retries:
-                                retry_count += 1
-                                console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {reason}[/yellow]")
-                                await asyncio.sleep(1.1 * retry_count)
-                                continue
-                            else:
-                                console.print(f"[red]Failed to upload image {index} after {max_retries} attempts: {reason}[/red]")
-                                return None
-
-                    except asyncio.TimeoutError:
-                        console.print(f"[red]Upload task {index} timed out after 60 seconds[/red]")
-                        if future in running_tasks:
-                            future.cancel()
-                            running_tasks.discard(future)
-
-                        if retry_count < max_retries:
-                            retry_count += 1
-                            console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index} after timeout[/yellow]")
-                            await asyncio.sleep(1.1 * retry_count)
-                            continue
-                        return None
-
-                except asyncio.CancelledError:
-                    console.print(f"[red]Upload task {index} cancelled.[/red]")
-                    if future and future in running_tasks:
-                        future.cancel()
-                        running_tasks.discard(future)
-                    return None
-
-                except Exception as e:
-                    console.print(f"[red]Error during upload for image {index}: {str(e)}[/red]")
-                    if retry_count < max_retries:
-                        retry_count += 1
-                        console.print(f"[yellow]Retry {retry_count}/{max_retries} for image {index}: {str(e)}[/yellow]")
-                        await asyncio.sleep(1.5 * retry_count)
-                        continue
-                    else:
-                        console.print(f"[red]Error during upload for image {index} after {max_retries} attempts: {str(e)}[/red]")
-                        return None
-
-        return None
-
     try:
         max_retries = 3
         results: list[tuple[int, dict[str, Any]]] = []
         try:
-            upload_results = await asyncio.gather(*[async_upload(task, max_retries) for task in upload_tasks])
+            upload_results = await asyncio.gather(*[_upload_with_retries(task, host_controller, running_tasks, max_retries) for task in upload_tasks])
             results = [res for res in upload_results if res is not None]
             results.sort(key=lambda x: x[0])
         except Exception as e:
             console.print(f"[red]Error during uploads: {str(e)}[/red]")
+        await upload_limiter.save(img_host)
 
         successfully_uploaded = [(index, result) for index, result in results if result['status'] == 'success']
         if meta['debug']:
             console.print(f"[blue]Successfully uploaded {len(successfully_uploaded)} out of {len(upload_tasks)} attempted uploads.[/blue]")
+            console.print(f"[blue]Image host stats: {host_controller.summary()}[/blue]")
 
         # Ensure we only switch hosts if necessary
         if meta['debug']:
@@ -896,12 +1011,10 @@ async def _upload_screens(
 
 
 async def imgbox_upload(
-    chdir: str,
     image_glob: list[str],
     return_dict: dict[str, Any],
 ) -> list[dict[str, str]]:
     try:
-        os.chdir(chdir)
         image_list: list[dict[str, str]] = []
 
         async with pyimgbox.Gallery(thumb_width=350, square_thumbs=False) as gallery:
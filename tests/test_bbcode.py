@@ -0,0 +1,62 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import json
+
+import pytest
+
+from benchmarks.bbcode import CASES, EXPECTED_PATH, load_corpus, run_case
+from src.bbcode import (
+    BBCODE,
+    CODE_TO_PRE,
+    NAMED_SPOILER_TO_NAMED_HIDE,
+    REMOVE_HIDE,
+    REMOVE_IMG_RESIZE,
+    REMOVE_SUB,
+    REMOVE_SUP,
+    SPOILER_TO_HIDE,
+)
+from src.bbcode_engine import DROP, Rule, transform
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    return load_corpus()
+
+
+@pytest.fixture(scope='module')
+def expected():
+    with open(EXPECTED_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('name,filename,method,args', CASES, ids=[case[0] for case in CASES])
+def test_corpus(corpus, expected, name, filename, method, args):
+    assert run_case(BBCODE(), method, corpus[filename], args) == expected[name]
+
+
+def test_apply_matches_the_conversions_one_by_one(corpus):
+    bbcode = BBCODE()
+    text = corpus['tracker.txt']
+    steps = (bbcode.remove_sub, bbcode.remove_sup, bbcode.convert_spoiler_to_hide, bbcode.remove_img_resize)
+    one_by_one = text
+    for step in steps:
+        one_by_one = step(one_by_one)
+    assert bbcode.apply(text, REMOVE_SUB, REMOVE_SUP, SPOILER_TO_HIDE, REMOVE_IMG_RESIZE) == one_by_one
+
+
+@pytest.mark.parametrize('text,rule_sets,result', [
+    # Only bare hides are removed; the closer of a named hide stays with it
+    ('[hide=Info][hide]a[/hide][/hide] [hide]b[/hide]', (REMOVE_HIDE,), '[hide=Info]a[/hide] b'),
+    ('[spoiler]a[spoiler=Named]b[/spoiler][/spoiler]', (NAMED_SPOILER_TO_NAMED_HIDE,), '[spoiler]a[hide=Named]b[/hide][/spoiler]'),
+    # Rule sets apply in order, so a renamed spoiler is removed as a bare hide
+    ('[spoiler]a[/spoiler] [spoiler=N]b[/spoiler]', (SPOILER_TO_HIDE, REMOVE_HIDE), 'a [hide=N]b[/hide]'),
+    ('[code]x[/code] [spoiler=N][code]y[/code][/spoiler]', (NAMED_SPOILER_TO_NAMED_HIDE, REMOVE_HIDE, CODE_TO_PRE), '[pre]x[/pre] [hide=N][pre]y[/pre][/hide]'),
+    ('[img=300]https://ptpimg.me/a.png[/img]', (REMOVE_IMG_RESIZE,), '[img]https://ptpimg.me/a.png[/img]'),
+    # Stray closers and tags without brackets around them are left alone
+    ('[/spoiler] spoiler [spoiler=N', (NAMED_SPOILER_TO_NAMED_HIDE,), '[/spoiler] spoiler [spoiler=N'),
+    ('no tags at all', (REMOVE_HIDE,), 'no tags at all'),
+    # Only lowercase tags are rewritten, also when a rule drops content and the tree is used
+    ('[SPOILER]a[/SPOILER] [spoiler]b[/spoiler]', (SPOILER_TO_HIDE,), '[SPOILER]a[/SPOILER] [hide]b[/hide]'),
+    ('[SPOILER]a[/SPOILER] [spoiler]b[/spoiler] [video]c[/video]', (SPOILER_TO_HIDE, {'video': [Rule(DROP)]}), '[SPOILER]a[/SPOILER] [hide]b[/hide] '),
+])
+def test_transform(text, rule_sets, result):
+    assert transform(text, *rule_sets) == result
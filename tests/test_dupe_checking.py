@@ -0,0 +1,175 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+"""
+The precompiled dupe rule plan against what the per-entry rule chain it replaced returned.
+
+Each scenario's kept names and meta changes were recorded from that chain.
+"""
+import asyncio
+import copy
+from typing import Any
+
+import pytest
+
+from src.dupe_checking import DupeChecker, filter_dupes
+
+CONFIG: dict[str, Any] = {'TRACKERS': {}}
+
+BASE_META: dict[str, Any] = {
+    'uuid': 'Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP',
+    'name': 'Movie 2020 1080p WEB-DL DDP 5.1 H.264-GRP',
+    'base_dir': '/tmp',
+    'category': 'MOVIE',
+    'type': 'WEBDL',
+    'resolution': '1080p',
+    'source': 'Web',
+    'tag': '-GRP',
+    'hdr': '',
+    'sd': 0,
+    'video_encode': 'H.264',
+    'is_disc': None,
+    'season': '',
+    'episode': '',
+    'filelist': ['/data/Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP.mkv'],
+    'mediainfo': {'media': {'track': [{'FileSize': '5000000000'}]}},
+}
+
+ENCODE = {'type': 'ENCODE', 'source': 'BluRay', 'video_encode': 'x264', 'name': 'Movie 2020 1080p BluRay DD 5.1 x264-GRP', 'uuid': 'Movie.2020.1080p.BluRay.DD5.1.x264-GRP'}
+EPISODE = {'category': 'TV', 'season': 'S01', 'episode': 'E02', 'name': 'Show S01E02 1080p WEB-DL DDP 5.1 H.264-GRP', 'uuid': 'Show.S01E02.1080p.WEB-DL.DDP5.1.H.264-GRP'}
+SEASON = {'category': 'TV', 'season': 'S01', 'episode': '', 'name': 'Show S01 1080p WEB-DL DDP 5.1 H.264-GRP', 'uuid': 'Show.S01.1080p.WEB-DL.DDP5.1.H.264-GRP'}
+BDMV = {'is_disc': 'BDMV', 'type': 'DISC', 'source': 'BluRay', 'source_size': '45000000000', 'name': 'Movie 2020 1080p BluRay AVC DTS-HD MA 5.1-GRP', 'uuid': 'Movie.2020.1080p.BluRay.AVC-GRP'}
+DVD = {'is_disc': 'DVD', 'type': 'DISC', 'source': 'NTSC DVD', 'resolution': '480i', 'sd': 1, 'name': 'Movie 2020 NTSC DVD5-GRP'}
+HDR_2160 = {'type': 'ENCODE', 'source': 'BluRay', 'resolution': '2160p', 'hdr': 'DV HDR', 'name': 'Movie 2020 2160p BluRay DV HDR DD 5.1 x265-GRP', 'uuid': 'Movie.2020.2160p.BluRay.DV.HDR.x265-GRP'}
+
+# id: (tracker, meta changes, results, kept names, meta changes made by filtering besides trumpable_id)
+SCENARIOS: dict[str, tuple[str, dict[str, Any], list[Any], list[str], dict[str, Any]]] = {
+    'webdl_sources': ('AITHER', {}, [
+        'Movie 2020 1080p BluRay DD 5.1 x264-OTHER',
+        'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'Movie 2020 720p WEB-DL DDP 5.1 H.264-OTHER',
+        'Movie 2020 1080p HDTV H.264-OTHER',
+        'Movie 2020 1080p BluRay REMUX AVC DTS-HD MA 5.1-OTHER',
+        'Movie 2020 1080p WEBRip x264-OTHER',
+    ], ['Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER', 'Movie 2020 1080p WEBRip x264-OTHER'], {}),
+    'encode_sources': ('BLU', ENCODE, [
+        'Movie 2020 1080p BluRay DD 5.1 x264-OTHER',
+        'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'Movie 2020 1080p BluRay REMUX AVC DTS-HD MA 5.1-OTHER',
+        'Movie 2020 2160p BluRay DD 5.1 x265-OTHER',
+    ], ['Movie 2020 1080p BluRay DD 5.1 x264-OTHER'], {}),
+    'hdr': ('BLU', HDR_2160, [
+        'Movie 2020 2160p BluRay DV HDR DD 5.1 x265-OTHER',
+        'Movie 2020 2160p BluRay HDR DD 5.1 x265-OTHER',
+        'Movie 2020 2160p BluRay DD 5.1 x265-OTHER',
+        {'name': 'Movie 2020 2160p BluRay DD 5.1 x265-FLAGS', 'flags': ['DV', 'HDR10']},
+        'Movie 2020 2160p BluRay DV DD 5.1 x265-OTHER',
+    ], [
+        'Movie 2020 2160p BluRay DV HDR DD 5.1 x265-OTHER',
+        'Movie 2020 2160p BluRay DD 5.1 x265-FLAGS',
+        'Movie 2020 2160p BluRay DV DD 5.1 x265-OTHER',
+    ], {}),
+    'hdr_1080p_with_2160p': ('BLU', {'hdr': 'HDR'}, [
+        'Movie 2020 2160p WEB-DL HDR DDP 5.1 H.265-OTHER',
+        'Movie 2020 1080p WEB-DL HDR DDP 5.1 H.265-OTHER',
+    ], ['Movie 2020 2160p WEB-DL HDR DDP 5.1 H.265-OTHER', 'Movie 2020 1080p WEB-DL HDR DDP 5.1 H.265-OTHER'], {}),
+    'episode': ('AITHER', EPISODE, [
+        {'name': 'Show S01 1080p WEB-DL DDP 5.1 H.264-OTHER', 'id': 7, 'link': 'https://aither.cc/torrents/7'},
+        'Show S01E02 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'Show S01E03 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'Show S02E02 1080p WEB-DL DDP 5.1 H.264-OTHER',
+    ], ['Show S01 1080p WEB-DL DDP 5.1 H.264-OTHER', 'Show S01E02 1080p WEB-DL DDP 5.1 H.264-OTHER'], {
+        'season_pack_exists': True,
+        'season_pack_name': 'Show S01 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'season_pack_link': 'https://aither.cc/torrents/7',
+        'season_pack_id': 7,
+        'AITHER_matched_name': 'Show S01 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'AITHER_matched_link': 'https://aither.cc/torrents/7',
+        'AITHER_matched_reason': 'season_pack_contains_episode',
+        'AITHER_matched_id': 7,
+    }),
+    'season_trumps_episodes': ('AITHER', SEASON, [
+        {'name': 'Show S01E01 1080p WEB-DL DDP 5.1 H.264-OTHER', 'id': 11, 'type': 'WEB-DL', 'res': '1080p', 'link': 'https://aither.cc/torrents/11'},
+        {'name': 'Show S01E02 1080p WEB-DL DDP 5.1 H.264-OTHER', 'id': 12, 'type': 'WEB-DL', 'res': '1080p', 'internal': 1},
+        'Show S02 1080p WEB-DL DDP 5.1 H.264-OTHER',
+    ], ['Show S01E01 1080p WEB-DL DDP 5.1 H.264-OTHER'], {
+        'AITHER_matched_episode_ids': [
+            {'id': 11, 'name': 'Show S01E01 1080p WEB-DL DDP 5.1 H.264-OTHER', 'link': 'https://aither.cc/torrents/11', 'tracker': 'AITHER', 'internal': 0},
+        ],
+        'AITHER_matched_name': 'Show S01E01 1080p WEB-DL DDP 5.1 H.264-OTHER',
+        'AITHER_matched_link': 'https://aither.cc/torrents/11',
+        'AITHER_matched_reason': 'season_pack_contains_episode',
+        'AITHER_matched_id': 11,
+    }),
+    'filename_and_trumpable': ('LST', {}, [
+        {'name': 'Some Other Name 1080p WEB-DL', 'files': ['Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP.mkv'], 'id': 3, 'link': 'https://lst.gg/3', 'trumpable': True, 'res': '1080p'},
+        {'name': 'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER', 'files': 'a.mkv, b.mkv'},
+    ], ['Some Other Name 1080p WEB-DL', 'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER'], {
+        'trumpable_id': 3,
+        'LST_matched_name': 'Some Other Name 1080p WEB-DL',
+        'LST_matched_link': 'https://lst.gg/3',
+        'LST_matched_reason': 'file_count',
+        'LST_matched_file_count': 1,
+        'LST_matched_id': 3,
+        'filename_match': 'Some Other Name 1080p WEB-DL = https://lst.gg/3',
+        'file_count_match': 1,
+    }),
+    'bdmv': ('BLU', BDMV, [
+        {'name': 'Movie 2020 1080p BluRay AVC DTS-HD MA 5.1-OTHER', 'file_count': 1},
+        {'name': 'Movie.2020.1080p.BluRay.x264-OTHER.mkv', 'file_count': 3},
+        {'name': 'Movie 2020 1080p Blu-ray AVC DTS-HD MA 5.1-SIZE', 'size': 45000000000, 'id': 9},
+        {'name': 'Movie 2020 1080p BluRay AVC DTS-HD MA 5.1-KEEP', 'file_count': 120},
+        '00001.m2ts',
+    ], ['Movie 2020 1080p Blu-ray AVC DTS-HD MA 5.1-SIZE', 'Movie 2020 1080p BluRay AVC DTS-HD MA 5.1-KEEP', '00001.m2ts'], {
+        'size_match': 'Movie 2020 1080p Blu-ray AVC DTS-HD MA 5.1-SIZE = None',
+        'BLU_matched_name': 'Movie 2020 1080p Blu-ray AVC DTS-HD MA 5.1-SIZE',
+        'BLU_matched_reason': 'size',
+        'BLU_matched_id': 9,
+    }),
+    'mtv_name': ('MTV', {}, ['Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP', 'Movie.2020.1080p.BluRay.x264-OTHER'], ['Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP'], {
+        'filename_match': 'Movie.2020.1080p.WEB-DL.DDP5.1.H.264-GRP = None',
+    }),
+    'rf_other_tag': ('RF', {}, ['Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER'], [], {}),
+    'rf_same_tag': ('RF', {}, ['Movie 2020 1080p WEB-DL DDP 5.1 H.264-GRP'], ['Movie 2020 1080p WEB-DL DDP 5.1 H.264-GRP'], {}),
+    'size_ratio': ('OE', ENCODE, [{'name': 'Movie 2020 1080p BluRay DD 5.1 x264-OTHER', 'size': 3000000000}], [], {}),
+    'repack': ('BLU', {'uuid': 'Movie.2020.REPACK.1080p.WEB-DL.DDP5.1.H.264-GRP'}, [
+        'Movie 2020 1080p WEB-DL DDP 5.1 H.264-GRP',
+        'Movie 2020 REPACK 1080p WEB-DL DDP 5.1 H.264-GRP',
+        'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER',
+    ], ['Movie 2020 REPACK 1080p WEB-DL DDP 5.1 H.264-GRP', 'Movie 2020 1080p WEB-DL DDP 5.1 H.264-OTHER'], {}),
+    'dvd': ('AITHER', DVD, ['Movie 2020 NTSC DVD9-GRP', 'Movie 2020 NTSC DVD5-OTHER', 'Movie 2020 1080p BluRay x264-GRP'], [
+        'Movie 2020 NTSC DVD9-GRP', 'Movie 2020 1080p BluRay x264-GRP',
+    ], {}),
+}
+
+
+def scenario_meta(changes: dict[str, Any]) -> dict[str, Any]:
+    meta = copy.deepcopy(BASE_META)
+    meta.update(copy.deepcopy(changes))
+    return meta
+
+
+def meta_changes(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    changes = {key: value for key, value in after.items() if key not in before or before[key] != value}
+    if changes.get('trumpable_id', 'unset') is None:
+        del changes['trumpable_id']
+    return changes
+
+
+@pytest.mark.parametrize('scenario', list(SCENARIOS))
+def test_plan_matches_recorded_rules(scenario):
+    tracker, changes, results, kept, meta_after = SCENARIOS[scenario]
+    meta = scenario_meta(changes)
+    before = copy.deepcopy(meta)
+
+    dupes = asyncio.run(filter_dupes(copy.deepcopy(results), meta, tracker, CONFIG))
+
+    assert [dupe['name'] for dupe in dupes] == kept
+    assert meta_changes(before, meta) == meta_after
+
+
+def test_reused_checker_matches_fresh_checkers():
+    """The upload's target is cached across trackers; a changed upload must not reuse it."""
+    checker = DupeChecker(CONFIG)
+    for scenario in ('webdl_sources', 'encode_sources', 'episode', 'encode_sources', 'bdmv', 'webdl_sources'):
+        tracker, changes, results, kept, _meta_after = SCENARIOS[scenario]
+        dupes = asyncio.run(checker.filter_dupes(copy.deepcopy(results), scenario_meta(changes), tracker))
+        assert [dupe['name'] for dupe in dupes] == kept
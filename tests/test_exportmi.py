@@ -0,0 +1,21 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import wave
+
+import pytest
+from pymediainfo import MediaInfo
+
+from src.exportmi import parse_text_and_json
+
+
+@pytest.mark.skipif(not MediaInfo.can_parse(), reason="libmediainfo is not installed")
+def test_single_open_matches_separate_parses(tmp_path):
+    video = str(tmp_path / 'tone.wav')
+    with wave.open(video, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(8000)
+        f.writeframes(b'\0\1' * 8000)
+
+    text_report, json_report = parse_text_and_json(video)
+    assert text_report == MediaInfo.parse(video, output="STRING", full=False)
+    assert json_report == MediaInfo.parse(video, output="JSON", full=True)
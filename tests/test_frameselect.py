@@ -0,0 +1,100 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import random
+
+import pytest
+
+from src import frameselect
+from src.frameselect import THUMB_SIZE, _parse_batch, _score_frames_python, score_frames, select_frames
+
+
+def noise(rng, low=0, high=255):
+    return bytes(rng.randint(low, high) for _ in range(THUMB_SIZE))
+
+
+def showinfo(index, pts_time):
+    return (
+        f"[Parsed_showinfo_{index * 5 + 3}@c{index} @ 0x55d0c0ffee00] n:   0 pts:  {int(pts_time * 1000)} pts_time:{pts_time:.3f} duration:1\n"
+        f"[Parsed_showinfo_{index * 5 + 3}@c{index} @ 0x55d0c0ffee00]   color_range:tv color_space:bt709\n"
+    )
+
+
+class FakeFfmpeg:
+    """Answers batched sampling commands from a table of keyframe time -> thumbnail."""
+
+    def __init__(self, keyframes):
+        self.keyframes = sorted(keyframes.items())
+        self.commands = []
+
+    async def __call__(self, command):
+        args = command.compile()
+        self.commands.append(args)
+        times = [float(args[i + 1]) for i, arg in enumerate(args) if arg == '-ss']
+        window = float(args[args.index('-t') + 1])
+        stdout, stderr = b'', ''
+        for index, ss_time in enumerate(times):
+            for frame_time, thumb in [k for k in self.keyframes if ss_time <= k[0] < ss_time + window][:2]:
+                stdout += thumb
+                stderr += showinfo(index, frame_time - ss_time)
+        return 0, stdout, stderr.encode()
+
+
+def test_numpy_scores_match_python():
+    pytest.importorskip('numpy')
+    rng = random.Random(1)
+    first = noise(rng) + bytes(THUMB_SIZE) + noise(rng, 100, 110) + noise(rng, 0, 60)
+    second = noise(rng) + noise(rng) + bytes(THUMB_SIZE) + noise(rng, 0, 60)
+    assert score_frames(first, second, 4) == pytest.approx(_score_frames_python(first, second, 4))
+
+
+def test_python_scores():
+    rng = random.Random(2)
+    busy = noise(rng, 20, 200)
+    black = bytes(THUMB_SIZE)
+    flat = bytes([128]) * THUMB_SIZE
+    scores = _score_frames_python(busy + black + flat + busy, busy + black + flat + noise(rng, 20, 200), 4)
+    assert scores[1] == scores[2] == -1.0
+    assert 0 < scores[3] < scores[0] <= 1
+    assert score_frames(busy, busy, 1) == pytest.approx(scores[:1])
+
+
+def test_parse_batch_maps_frames_to_their_inputs():
+    rng = random.Random(3)
+    a1, a2, c1 = noise(rng), noise(rng), noise(rng)
+    stderr = (showinfo(0, 0.5) + showinfo(2, 1.25) + showinfo(0, 2.5)).encode()
+    samples = _parse_batch([10.0, 20.0, 30.0], a1 + a2 + c1, stderr)
+    assert samples == [(10.5, a1, a2), None, (31.25, c1, c1)]
+
+    # Thumbnails that don't add up to the log can't be attributed
+    assert _parse_batch([10.0, 20.0, 30.0], a1 + a2, stderr) == [None, None, None]
+
+
+def test_select_frames_picks_keyframes_and_falls_back(monkeypatch):
+    monkeypatch.setattr(frameselect, 'np', None)
+    rng = random.Random(4)
+    # 100 s runtime, 4 slots over 5-90 s, a keyframe every 2 s; the second slot is all black
+    keyframes = {}
+    for n in range(50):
+        frame_time = n * 2 + 0.4
+        black = 26.25 <= frame_time < 47.5
+        keyframes[frame_time] = bytes(THUMB_SIZE) if black else noise(rng, 10 + n, 200 + n // 2)
+    run_ffmpeg = FakeFfmpeg(keyframes)
+
+    times = asyncio.run(select_frames('/media/movie.mkv', 4, 100.0, {}, run_ffmpeg, limit=3))
+
+    assert times is not None and len(times) == 4
+    assert times[1] == str(5.0 + 21.25)
+    for slot in (0, 2, 3):
+        picked = float(times[slot])
+        assert min(abs(picked - frame_time) for frame_time in keyframes) < 0.001
+        assert 5.0 + slot * 21.25 <= picked < 5.0 + (slot + 1) * 21.25
+    # Candidates are sampled in `limit` processes, six per slot
+    assert len(run_ffmpeg.commands) == 3
+    assert sum(args.count('-ss') for args in run_ffmpeg.commands) == 24
+
+
+def test_select_frames_fails_without_samples():
+    async def broken(command):
+        return 1, b'', b'error'
+
+    assert asyncio.run(select_frames('/media/movie.mkv', 2, 100.0, {}, broken)) is None
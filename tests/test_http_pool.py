@@ -0,0 +1,36 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+
+import httpx
+
+from src.http_pool import HttpPool
+
+
+def routes(pool, *urls):
+    async def run():
+        pools = pool._loop_pools()
+        chosen = [pools.transport_for(httpx.URL(url)) for url in urls]
+        await pool.aclose()
+        return pools, chosen
+
+    return asyncio.run(run())
+
+
+def test_environment_proxy_is_used(monkeypatch):
+    for name in ('HTTP_PROXY', 'http_proxy', 'https_proxy', 'ALL_PROXY', 'all_proxy', 'no_proxy'):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv('HTTPS_PROXY', 'proxy.local:3128')
+    monkeypatch.setenv('NO_PROXY', 'tracker.internal')
+
+    pools, chosen = routes(HttpPool(), 'https://api.example.com/', 'https://tracker.internal/', 'http://api.example.com/')
+    assert set(pools.proxy_transports) == {'https'}
+    assert chosen == [pools.proxy_transports['https'], pools.transport, pools.transport]
+
+
+def test_no_proxy_configured(monkeypatch):
+    for name in ('HTTP_PROXY', 'HTTPS_PROXY', 'ALL_PROXY', 'http_proxy', 'https_proxy', 'all_proxy'):
+        monkeypatch.delenv(name, raising=False)
+
+    pools, chosen = routes(HttpPool(), 'https://api.example.com/')
+    assert pools.proxy_transports == {}
+    assert chosen == [pools.transport]
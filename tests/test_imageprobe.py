@@ -0,0 +1,71 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import random
+from io import BytesIO
+
+import aiohttp
+import pytest
+from aiohttp import web
+from PIL import Image
+
+from src.imageprobe import ImageProbeError, probe_image
+
+
+def image_bytes(fmt, size=(320, 180)):
+    rng = random.Random(fmt)
+    out = BytesIO()
+    Image.frombytes('RGB', size, bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3))).save(out, fmt)
+    return out.getvalue()
+
+
+def probe(body, honour_range=True):
+    """``probe_image`` against a local server holding ``body``; returns the probe and the requested ranges."""
+    requested = []
+
+    async def handler(request):
+        requested.append(request.headers.get('Range'))
+        if not honour_range or 'Range' not in request.headers:
+            return web.Response(body=body, content_type='image/png')
+        chunk = body[request.http_range]
+        start = len(body) - len(chunk) if request.http_range.start is None or request.http_range.start < 0 else request.http_range.start
+        headers = {'Content-Range': f'bytes {start}-{start + len(chunk) - 1}/{len(body)}'}
+        return web.Response(status=206, body=chunk, content_type='image/png', headers=headers)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/image', handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with aiohttp.ClientSession() as session:
+                return await probe_image(session, f'http://127.0.0.1:{port}/image')
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run()), requested
+
+
+@pytest.mark.parametrize('fmt', ['PNG', 'JPEG', 'GIF', 'WEBP'])
+def test_complete_images_are_probed_from_the_ends(fmt):
+    body = image_bytes(fmt)
+    result, requested = probe(body)
+    assert (result.width, result.height, result.size, result.content) == (320, 180, len(body), None)
+    assert requested[-1] == 'bytes=-64'
+
+
+@pytest.mark.parametrize('fmt', ['PNG', 'JPEG', 'GIF', 'WEBP'])
+def test_truncated_images_are_rejected(fmt):
+    body = image_bytes(fmt)
+    with pytest.raises(ImageProbeError):
+        probe(body[:len(body) * 2 // 3])
+
+
+def test_hosts_ignoring_ranges_get_a_full_verify():
+    body = image_bytes('PNG')
+    result, _ = probe(body, honour_range=False)
+    assert (result.width, result.height, result.content) == (320, 180, body)
+    with pytest.raises(ImageProbeError):
+        probe(body[:len(body) - 200], honour_range=False)
@@ -0,0 +1,113 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+import json
+import os
+import shutil
+from typing import Any
+
+from src.metastore import MetaStore
+
+
+def make_meta(base_dir: Any) -> dict[str, Any]:
+    return {
+        'base_dir': str(base_dir),
+        'uuid': 'Movie.2020.1080p.WEB-DL-GRP',
+        'name': 'Movie 2020 1080p WEB-DL-GRP',
+        'mediainfo_text': 'General\nFormat : Matroska\n' * 100,
+        'image_list': [],
+        'tracker_status': {'BLU': {'upload': False}},
+        'season_int': 0,
+    }
+
+
+def read_meta(meta: dict[str, Any]) -> dict[str, Any]:
+    with open(MetaStore.path_for(meta), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_immediate_save_writes_meta(tmp_path):
+    store = MetaStore()
+    meta = make_meta(tmp_path)
+    asyncio.run(store.save(meta, immediate=True))
+
+    assert read_meta(meta) == meta
+    # Written to a temporary name and renamed into place
+    assert os.listdir(os.path.dirname(MetaStore.path_for(meta))) == ['meta.json']
+
+
+def test_saves_are_debounced_until_flush(tmp_path):
+    store = MetaStore(delay=60)
+    meta = make_meta(tmp_path)
+
+    async def run() -> None:
+        await store.save(meta)
+        meta['name'] = 'Renamed'
+        await store.save(meta)
+        assert not os.path.exists(MetaStore.path_for(meta))
+        await store.flush()
+
+    asyncio.run(run())
+    assert read_meta(meta)['name'] == 'Renamed'
+
+
+def test_delayed_save_is_written_by_the_timer(tmp_path):
+    store = MetaStore(delay=0.01)
+    meta = make_meta(tmp_path)
+
+    async def run() -> None:
+        await store.save(meta)
+        for _ in range(100):
+            if os.path.exists(MetaStore.path_for(meta)):
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+    assert read_meta(meta) == meta
+
+
+def test_in_place_changes_are_never_written_stale(tmp_path):
+    store = MetaStore()
+    meta = make_meta(tmp_path)
+
+    async def run() -> None:
+        await store.save(meta, immediate=True)
+        # Containers changed in place, scalars rebound, keys added and removed
+        meta['image_list'].append({'img_url': 'https://ptpimg.me/a.png'})
+        meta['tracker_status']['BLU']['upload'] = True
+        meta['season_int'] = 2
+        meta['mediainfo_text'] = meta['mediainfo_text'] + 'Video\n'
+        meta['new_key'] = None
+        del meta['name']
+        await store.save(meta, immediate=True)
+
+    asyncio.run(run())
+    assert read_meta(meta) == meta
+
+
+def test_forget_drops_pending_writes(tmp_path):
+    store = MetaStore(delay=60)
+    meta = make_meta(tmp_path)
+
+    async def run() -> None:
+        await store.save(meta)
+        store.forget(MetaStore.path_for(meta))
+        await store.flush()
+
+    asyncio.run(run())
+    assert not os.path.exists(MetaStore.path_for(meta))
+
+
+def test_discard_keeps_a_removed_directory_removed(tmp_path):
+    store = MetaStore(delay=0.01)
+    meta = make_meta(tmp_path)
+    tmp_dir = os.path.dirname(MetaStore.path_for(meta))
+
+    async def run() -> None:
+        await store.save(meta, immediate=True)
+        await store.save(meta)
+        await store.discard(str(tmp_path / 'tmp'))
+        shutil.rmtree(tmp_dir)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert not os.path.exists(tmp_dir)
@@ -0,0 +1,41 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+from src.metaview import MetaOverlay
+
+
+def make_meta():
+    return {
+        'name': 'Movie 2020 1080p',
+        'tracker_status': {'BLU': {'upload': False}},
+        'mediainfo': {'media': {'track': []}},
+    }
+
+
+def test_writes_stay_private_until_merged():
+    meta = make_meta()
+    view = MetaOverlay(meta)
+    view['tracker_status']['BLU']['upload'] = True
+    view['trumpable_id'] = [1]
+    del view['name']
+
+    assert meta == make_meta()
+    assert view['mediainfo'] is meta['mediainfo']
+    assert 'name' not in view and 'name' in meta
+    assert view.written_keys == {'trumpable_id', 'name'}
+
+    view.merge_into(meta, ['trumpable_id', 'tracker_status', 'missing'])
+    assert meta['trumpable_id'] == [1] and meta['tracker_status']['BLU']['upload'] is True
+
+
+def test_merges_do_not_leak_between_views():
+    meta = make_meta()
+    first, second = MetaOverlay(meta), MetaOverlay(meta)
+    first['trumpable_id'] = [1]
+    first.merge_into(meta, ['trumpable_id'])
+
+    # A view created before the merge still sees meta as it was then
+    assert 'trumpable_id' not in second
+    assert MetaOverlay(meta)['trumpable_id'] == [1]
+
+    # Later changes in the merged view stay in that view
+    first['trumpable_id'].append(2)
+    assert meta['trumpable_id'] == [1]
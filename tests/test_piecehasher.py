@@ -0,0 +1,84 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import hashlib
+import os
+
+import pytest
+import torf
+
+from src import piecehasher
+from src.piecehasher import hash_pieces
+
+PIECE_SIZE = 16 * 1024
+
+
+def write_files(directory, sizes):
+    files = []
+    for index, size in enumerate(sizes):
+        path = os.path.join(str(directory), f'file{index:02d}.bin')
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size))
+        files.append((path, size))
+    return files
+
+
+def reference_pieces(files, piece_size):
+    data = b''
+    for path, _size in files:
+        with open(path, 'rb') as f:
+            data += f.read()
+    return b''.join(hashlib.sha1(data[offset:offset + piece_size]).digest() for offset in range(0, len(data), piece_size))  # nosec B324
+
+
+@pytest.mark.parametrize('sizes', [
+    [PIECE_SIZE * 3],
+    [1, PIECE_SIZE - 1, PIECE_SIZE + 1],
+    [PIECE_SIZE * 5 + 123, 0, 77, PIECE_SIZE * 2],
+    [PIECE_SIZE * 40 + 5],
+])
+@pytest.mark.parametrize('workers', [1, 4])
+def test_pieces_match_reference(tmp_path, monkeypatch, sizes, workers):
+    # Several pieces per read buffer and more reads than buffers
+    monkeypatch.setattr(piecehasher, 'READ_SIZE', PIECE_SIZE * 3)
+    files = write_files(tmp_path, sizes)
+    assert hash_pieces(files, PIECE_SIZE, workers=workers) == reference_pieces(files, PIECE_SIZE)
+
+
+def test_pieces_match_torf(tmp_path):
+    content = tmp_path / 'Movie.2020'
+    content.mkdir()
+    files = write_files(content, [PIECE_SIZE * 7 + 9, 3, PIECE_SIZE * 2])
+    torrent = torf.Torrent(path=str(content), piece_size=PIECE_SIZE)
+    torrent.generate()
+    assert hash_pieces(files, PIECE_SIZE) == torrent.metainfo['info']['pieces']
+
+
+def test_no_files_hash_to_nothing():
+    assert hash_pieces([], PIECE_SIZE) == b''
+
+
+def test_short_file_raises_read_error(tmp_path):
+    path, size = write_files(tmp_path, [PIECE_SIZE])[0]
+    with pytest.raises(torf.ReadError):
+        hash_pieces([(path, size + 1)], PIECE_SIZE)
+
+
+def test_callback_reports_progress_and_can_cancel(tmp_path, monkeypatch):
+    monkeypatch.setattr(piecehasher, 'READ_SIZE', PIECE_SIZE * 2)
+    files = write_files(tmp_path, [PIECE_SIZE * 10])
+    reports = []
+
+    def record(filepath, done, total):
+        reports.append((filepath, done, total))
+
+    assert hash_pieces(files, PIECE_SIZE, callback=record) == reference_pieces(files, PIECE_SIZE)
+    assert reports[-1] == (files[0][0], 10, 10)
+
+    def cancel(_filepath, done, _total):
+        return True if done else None
+
+    assert hash_pieces(files, PIECE_SIZE, workers=1, callback=cancel) is None
+
+
+def test_invalid_piece_size():
+    with pytest.raises(ValueError):
+        hash_pieces([], 0)
@@ -0,0 +1,83 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import json
+import os
+
+from src import processedlog
+from src.processedlog import ProcessedLog, processed_log
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_added_paths_are_journaled_once(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    log = ProcessedLog(log_path)
+    log.add('/data/a.mkv')
+    log.add('/data/b "quoted".mkv')
+    log.add('/data/a.mkv')
+
+    assert log.load() == {'/data/a.mkv', '/data/b "quoted".mkv'}
+    assert [json.loads(line) for line in read_lines(log_path)] == ['/data/a.mkv', '/data/b "quoted".mkv']
+
+
+def test_entries_from_another_run_are_picked_up(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    first = ProcessedLog(log_path)
+    second = ProcessedLog(log_path)
+    first.add('/data/a.mkv')
+    assert second.load() == {'/data/a.mkv'}
+
+    second.add('/data/b.mkv')
+    # Already journaled by the other run
+    first.add('/data/b.mkv')
+    assert first.load() == {'/data/a.mkv', '/data/b.mkv'}
+    assert len(read_lines(log_path)) == 2
+
+
+def test_legacy_json_array_is_converted(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    with open(log_path, 'w', encoding='utf-8') as f:
+        json.dump(['/data/a.mkv', '/data/b.mkv'], f)
+
+    log = ProcessedLog(log_path)
+    assert log.load() == {'/data/a.mkv', '/data/b.mkv'}
+    log.add('/data/c.mkv')
+    assert [json.loads(line) for line in read_lines(log_path)] == ['/data/a.mkv', '/data/b.mkv', '/data/c.mkv']
+
+
+def test_unfinished_line_is_not_glued_to_the_next_entry(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    with open(log_path, 'w', encoding='utf-8') as f:
+        f.write('"/data/a.mkv"\n"/data/b.m')
+
+    log = ProcessedLog(log_path)
+    log.add('/data/c.mkv')
+    assert log.load() == {'/data/a.mkv', '/data/c.mkv'}
+    assert read_lines(log_path)[-1] == '"/data/c.mkv"'
+
+
+def test_duplicate_lines_are_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(processedlog, 'COMPACT_MIN_DUPLICATES', 2)
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    with open(log_path, 'w', encoding='utf-8') as f:
+        f.write('"/data/a.mkv"\n' * 5)
+
+    log = ProcessedLog(log_path)
+    log.add('/data/b.mkv')
+    assert read_lines(log_path) == ['"/data/a.mkv"', '"/data/b.mkv"']
+    assert ProcessedLog(log_path).load() == {'/data/a.mkv', '/data/b.mkv'}
+
+
+def test_replaced_journal_is_read_again(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    log = ProcessedLog(log_path)
+    log.add('/data/a.mkv')
+    os.remove(log_path)
+    assert log.load() == set()
+
+
+def test_processed_log_is_shared_per_path(tmp_path):
+    log_path = str(tmp_path / 'queue_processed_files.log')
+    assert processed_log(log_path) is processed_log(os.path.join(str(tmp_path), '.', 'queue_processed_files.log'))
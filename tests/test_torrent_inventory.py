@@ -0,0 +1,125 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import os
+import random
+
+from src.torrent_inventory import TorrentFileIndex, TorrentInventory, client_inventory
+
+
+def torrent(name, content_path, progress=0.0):
+    return {'name': name, 'content_path': content_path, 'progress': progress}
+
+
+def names(torrents):
+    return [t['name'] for t in torrents]
+
+
+def test_full_sync_is_searchable():
+    inventory = TorrentInventory()
+    inventory.apply({'rid': 1, 'full_update': True, 'torrents': {
+        'aaa': torrent('Movie.2020.1080p-GRP', '/data/Movie.2020.1080p-GRP'),
+        'bbb': torrent('Show.S01-GRP', '/data/Show.S01-GRP'),
+        'ccc': torrent('movie.2020.1080p-grp', '/other/movie.2020.1080p-grp'),
+    }})
+
+    assert len(inventory) == 3
+    assert inventory.rid == 1
+    assert names(inventory.by_name('MOVIE.2020.1080p-GRP')) == ['Movie.2020.1080p-GRP', 'movie.2020.1080p-grp']
+    assert names(inventory.by_name('Show.S01-GRP', 'Missing', '')) == ['Show.S01-GRP']
+    assert names(inventory.by_content_path('/data/Show.S01-GRP/')) == ['Show.S01-GRP']
+    assert inventory.get('AAA') == {'hash': 'aaa', **torrent('Movie.2020.1080p-GRP', '/data/Movie.2020.1080p-GRP')}
+
+
+def test_incremental_updates_keep_indexes_current():
+    inventory = TorrentInventory()
+    inventory.apply({'rid': 1, 'full_update': True, 'torrents': {'aaa': torrent('Old.Name', '/data/Old.Name')}})
+    inventory.apply({'rid': 2, 'torrents': {'aaa': {'progress': 0.5}}})
+    assert names(inventory.by_name('Old.Name')) == ['Old.Name']
+
+    inventory.apply({'rid': 3, 'torrents': {'aaa': {'name': 'New.Name', 'content_path': '/data/New.Name'}}})
+    assert inventory.by_name('Old.Name') == []
+    assert inventory.by_content_path('/data/Old.Name') == []
+    assert inventory.by_name('new.name')[0]['progress'] == 0.5
+
+    inventory.apply({'rid': 4, 'torrents_removed': ['aaa']})
+    assert inventory.by_name('New.Name') == []
+    assert len(inventory) == 0
+
+    inventory.apply({'rid': 5, 'torrents': {'bbb': torrent('Other', '/data/Other')}})
+    inventory.apply({'rid': 1, 'full_update': True, 'torrents': {'ccc': torrent('Fresh', '/data/Fresh')}})
+    assert inventory.by_name('Other') == []
+    assert names(inventory.by_name('Fresh')) == ['Fresh']
+
+
+def test_searches_match_a_full_scan():
+    """Random syncs, searched through the indexes and by scanning what the client would list."""
+    rng = random.Random(1)
+    inventory = TorrentInventory()
+    client: dict[str, dict[str, object]] = {}
+    pool = ['Movie.A', 'movie.a', 'Movie.B', 'Show.S01', 'Show.S02']
+    for rid in range(1, 300):
+        changes: dict[str, dict[str, object]] = {}
+        removed = []
+        for _ in range(rng.randint(1, 4)):
+            info_hash = f'{rng.randrange(20):040x}'
+            if info_hash in client and rng.random() < 0.2:
+                removed.append(info_hash)
+                changes.pop(info_hash, None)
+                del client[info_hash]
+                continue
+            if info_hash in client and rng.random() < 0.5:
+                change: dict[str, object] = {'progress': rng.random()}
+            else:
+                name = rng.choice(pool)
+                change = {'name': name, 'content_path': f'/data/{rng.choice(["a", "b"])}/{name}'}
+            client.setdefault(info_hash, {'hash': info_hash}).update(change)
+            changes.setdefault(info_hash, {}).update(change)
+            if info_hash in removed:
+                removed.remove(info_hash)
+        inventory.apply({'rid': rid, 'torrents': changes, 'torrents_removed': removed})
+
+        for name in pool:
+            expected = sorted(h for h, t in client.items() if str(t['name']).lower() == name.lower())
+            assert sorted(t['hash'] for t in inventory.by_name(name)) == expected
+            path = f'/data/a/{name}'
+            expected = sorted(h for h, t in client.items() if t['content_path'] == path)
+            assert sorted(t['hash'] for t in inventory.by_content_path(path)) == expected
+    assert len(inventory) == len(client)
+
+
+def test_refresh_reuses_a_recent_sync():
+    inventory = TorrentInventory()
+    rids = []
+
+    def fetch(rid):
+        rids.append(rid)
+        return {'rid': rid + 1, 'full_update': rid == 0, 'torrents': {}}
+
+    inventory.refresh(fetch)
+    inventory.refresh(fetch)
+    inventory.refresh(fetch, max_age=0)
+    assert rids == [0, 1]
+
+
+def test_client_inventory_is_per_session():
+    class Session:
+        pass
+
+    first, second = Session(), Session()
+    assert client_inventory(first) is client_inventory(first)
+    assert client_inventory(first) is not client_inventory(second)
+
+
+def test_torrent_file_index_follows_directory_changes(tmp_path):
+    index = TorrentFileIndex()
+    session_dir = str(tmp_path)
+    (tmp_path / 'ABCDEF.torrent').write_bytes(b'')
+    (tmp_path / 'ABCDEF.torrent.libtorrent_resume').write_bytes(b'')
+
+    assert index.find(session_dir, 'abcdef') == os.path.join(session_dir, 'ABCDEF.torrent')
+    assert index.find(session_dir, '123456') is None
+
+    (tmp_path / '123456.torrent').write_bytes(b'')
+    stat = os.stat(session_dir)
+    os.utime(session_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert index.find(session_dir, '123456') == os.path.join(session_dir, '123456.torrent')
+    assert index.find(str(tmp_path / 'missing'), 'abcdef') is None
@@ -0,0 +1,66 @@
+# Upload Assistant © 2025 Audionut & wastaken7 — Licensed under UAPL v1.0
+import asyncio
+
+import httpx
+
+from src import tracker_lists as tracker_lists_module
+from src.tracker_lists import BANNED, ListSource, TrackerLists
+
+URL = 'https://tracker.example/api/blacklists/releasegroups'
+
+
+def run_refresh(lists, store, pages, fail_cursor=''):
+    """One refresh of the banned list, served from ``pages`` (cursor -> (names, next cursor, etag))."""
+
+    def handler(request):
+        cursor = request.url.params.get('cursor')
+        if cursor == fail_cursor:
+            return httpx.Response(500)
+        names, next_cursor, etag = pages[cursor]
+        if etag and request.headers.get('If-None-Match') == etag:
+            return httpx.Response(304)
+        body = {'data': [{'name': name} for name in names], 'meta': {'next_cursor': next_cursor}}
+        return httpx.Response(200, json=body, headers={'ETag': etag} if etag else {})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await lists._refresh_list(client, store, BANNED, ListSource(URL), debug=False)
+
+    return asyncio.run(run())
+
+
+def names(store):
+    return [item['name'] for item in store.lists[BANNED].items]
+
+
+def test_pages_are_read_and_resumed(tmp_path):
+    lists = TrackerLists(str(tmp_path))
+    store = asyncio.run(lists.store('AITHER'))
+    pages = {None: (['GrpA', 'GrpB'], 'c1', 'v1'), 'c1': (['GrpC'], None, None)}
+    assert run_refresh(lists, store, pages)
+    assert names(store) == ['GrpA', 'GrpB', 'GrpC']
+
+    # Only the last page is read again, with what was appended to it
+    pages['c1'] = (['GrpC', 'GrpD'], None, None)
+    assert run_refresh(lists, store, pages)
+    assert names(store) == ['GrpA', 'GrpB', 'GrpC', 'GrpD']
+    store.invalidate()
+    assert 'GRPD' in store.banned_groups()
+
+
+def test_failed_page_leaves_the_snapshot_as_it_was(tmp_path, monkeypatch):
+    lists = TrackerLists(str(tmp_path))
+    store = asyncio.run(lists.store('AITHER'))
+    pages = {None: (['GrpA'], 'c1', 'v1'), 'c1': (['GrpB'], None, None)}
+    assert run_refresh(lists, store, pages)
+    before = store.lists[BANNED].to_json()
+
+    # A full refetch whose first page changed and whose second page fails
+    monkeypatch.setattr(tracker_lists_module, 'FULL_REFRESH_INTERVAL', 0)
+    pages[None] = (['GrpA', 'GrpNew'], 'c1', 'v2')
+    assert not run_refresh(lists, store, pages, fail_cursor='c1')
+    assert store.lists[BANNED].to_json() == before
+
+    # The old validators still ask for the changed list
+    assert run_refresh(lists, store, pages)
+    assert names(store) == ['GrpA', 'GrpNew', 'GrpB']
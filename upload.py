@@ -14,6 +14,7 @@ import threading
 import time
 import traceback
 from collections.abc import Iterable, Mapping
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Optional, cast
 
@@ -32,26 +33,33 @@ from src.add_comparison import ComparisonManager
 from src.args import Args
 from src.cleanup import cleanup_manager
 from src.clients import Clients
-from src.console import console
+from src.console import OutputBuffer, console, task_routed_console
 from src.disc_menus import process_disc_menus
 from src.dupe_checking import DupeChecker
+from src.fs_index import fs_index
 from src.get_desc import gen_desc
 from src.get_name import NameManager
 from src.get_tracker_data import TrackerDataManager
+from src.http_pool import http_pool
+from src.image_upload_cache import image_upload_cache
 from src.languages import languages_manager
+from src.metadata_cache import metadata_cache
+from src.metastore import meta_store
 from src.nfo_link import NfoLinkManager
+from src.processedlog import processed_log
 from src.qbitwait import Wait
 from src.queuemanage import QueueManager
+from src.queuepipeline import QueuePipeline
 from src.takescreens import TakeScreensManager
 from src.torrentcreate import TorrentCreator
+from src.tracker_lists import tracker_lists
 from src.trackerhandle import process_trackers
-from src.trackers.AR import AR
 from src.trackers.COMMON import COMMON
-from src.trackers.PTP import PTP
 from src.trackersetup import TRACKER_SETUP, api_trackers, http_trackers, other_api_trackers, tracker_class_map
 from src.trackerstatus import TrackerStatusManager
 from src.uphelper import UploadHelper
-from src.uploadscreens import UploadScreensManager
+from src.upload_limiter import upload_limiter
+from src.uploadscreens import ScreenUploadStream, UploadScreensManager
 
 cli_ui.setup(color='always', title="Upload Assistant")
 base_dir = os.path.abspath(os.path.dirname(__file__))
@@ -107,6 +115,9 @@ _defaults_data_dir = os.path.join(base_dir, "defaults", "data")
 # Directories that should never be copied into user-facing data/
 _SKIP_DIRS = {"__pycache__", ".mypy_cache", ".ruff_cache"}
 
+# Trackers that only accept some image hosts; the host for screenshots is settled after capture when any is selected
+TRACKERS_WITH_IMAGE_HOST_REQUIREMENTS = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
+
 if os.path.isdir(_defaults_data_dir):
     os.makedirs(_data_dir, exist_ok=True)
     _restored_count = 0
@@ -167,6 +178,8 @@ if _is_webui_arg and not os.path.exists(_config_path):
             console.print("Continuing without config file...", markup=False)
 
 Meta: TypeAlias = dict[str, Any]
+# (meta, path, current_item_path, tmp_path, prepped meta) of an item prepared by a pipeline worker
+PrefetchedItem: TypeAlias = tuple[Meta, str, str, str, Optional[Meta]]
 
 from src.prep import Prep  # noqa: E402
 
@@ -212,6 +225,12 @@ if os.path.exists(_config_path):
     try:
         from data.config import config as _imported_config  # pyright: ignore[reportMissingImports,reportUnknownVariableType]
         config = cast(dict[str, Any], _imported_config)
+        metadata_cache.configure(config)
+        image_upload_cache.configure(config)
+        upload_limiter.configure(config)
+        http_pool.configure(config)
+        fs_index.configure(config)
+        tracker_lists.configure(config)
         parser = Args(config)
         client = Clients(config)
         name_manager = NameManager(config)
@@ -410,13 +429,8 @@ async def validate_tracker_logins(meta: Meta, trackers: Optional[list[str]] = No
         await asyncio.gather(*[validate_single_tracker(tracker) for tracker in valid_trackers])
 
 
-async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
-    """Process the metadata for each queued path."""
-    if use_discord and bot:
-        await DiscordNotifier.send_discord_notification(
-            config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta
-        )
-
+async def prepare_meta(meta: Meta) -> Optional[Meta]:
+    """Run the prep stage (Prep.gather_prep) for a queued path; None if it failed."""
     if meta['imghost'] is None:
         meta['imghost'] = config['DEFAULT']['img_host_1']
         try:
@@ -430,7 +444,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 update_oeimg_to_onlyimage()
         except Exception as e:
             console.print(f"[red]Error checking image hosts: {e}[/red]")
-            return
+            return None
 
     if not meta['unattended']:
         ua = config['DEFAULT'].get('auto_mode', False)
@@ -439,11 +453,29 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
             console.print("[yellow]Running in Auto Mode")
     prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
     try:
-        meta = await prep.gather_prep(meta=meta, mode='cli')
+        return await prep.gather_prep(meta=meta, mode='cli')
     except Exception as e:
         console.print(f"Error in gather_prep: {e}")
         console.print(traceback.format_exc())
-        return
+        return None
+
+
+async def process_meta(meta: Meta, base_dir: str, bot: Any = None, prepped: Optional[Meta] = None) -> None:
+    """Process the metadata for each queued path.
+
+    ``prepped`` is the meta returned by an earlier ``prepare_meta`` call (pipelined
+    queues); without it the prep stage runs here.
+    """
+    if use_discord and bot:
+        await DiscordNotifier.send_discord_notification(
+            config, bot, f"Starting upload process for: {meta['path']}", debug=meta.get('debug', False), meta=meta
+        )
+
+    if prepped is None:
+        prepped = await prepare_meta(meta)
+        if prepped is None:
+            return
+    meta = prepped
 
     meta['emby_debug'] = meta.get('emby_debug') if meta.get('emby_debug', False) else config['DEFAULT'].get('emby_debug', False)
     if meta.get('emby_cat', None) == "movie" and meta.get('category', None) != "MOVIE":
@@ -486,8 +518,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
         if meta['debug']:
             console.print(f"Trackers list before editing: {meta['trackers']}")
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
 
     if meta.get('emby_debug', False):
         meta['original_imdb'] = meta.get('imdb_id', None)
@@ -558,6 +589,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
         if meta['debug']:
             console.print(f"Trackers list during edit process: {meta['trackers']}")
         meta['edit'] = True
+        prep = Prep(screens=meta['screens'], img_host=meta['imghost'], config=config)
         meta = await prep.gather_prep(meta=meta, mode='cli')
         meta['name_notag'], meta['name'], meta['clean_name'], meta['potential_missing'] = await name_manager.get_name(meta)
         try:
@@ -618,8 +650,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                         meta['tracker_status'][tracker]['skip_upload'] = False
 
         await asyncio.sleep(0.2)
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta)
         await asyncio.sleep(0.2)
 
         try:
@@ -818,15 +849,29 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                             raise Exception(f"Error during screenshot capture: {e}") from e
 
                     else:
+                        upload_stream: Optional[ScreenUploadStream] = None
                         try:
                             if meta['debug']:
                                 console.print(f"videopath: {videopath}, filename: {filename}, meta: {meta['uuid']}, base_dir: {base_dir}, manual_frames: {manual_frames}")
 
+                            # Upload each screenshot as soon as it is ready when the image host is already settled
+                            stream_host = str(meta.get('imghost') or '')
+                            if (
+                                stream_host
+                                and meta.get('skip_imghost_upload', False) is False
+                                and len(meta.get('image_list', [])) < int(meta.get('cutoff') or 1)
+                                and not any(t in TRACKERS_WITH_IMAGE_HOST_REQUIREMENTS for t in cast(list[Any], meta.get('trackers', [])))
+                            ):
+                                upload_stream = uploadscreens_manager.screen_stream(meta, stream_host)
+
                             await takescreens_manager.screenshots(
                                 videopath, filename, meta['uuid'], base_dir, meta,
-                                manual_frames=manual_frames  # Pass additional kwargs directly
+                                manual_frames=manual_frames,  # Pass additional kwargs directly
+                                upload_stream=upload_stream,
                             )
                         except asyncio.CancelledError as e:
+                            if upload_stream is not None:
+                                await upload_stream.cancel()
                             await cleanup_screenshot_temp_files(meta)
                             await asyncio.sleep(0.1)
                             await cleanup_manager.cleanup()
@@ -835,6 +880,8 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                             raise Exception("Error during screenshot capture") from e
                         except Exception as e:
                             console.print(traceback.format_exc())
+                            if upload_stream is not None:
+                                await upload_stream.cancel()
                             await cleanup_screenshot_temp_files(meta)
                             await asyncio.sleep(0.1)
                             await cleanup_manager.cleanup()
@@ -879,11 +926,9 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 cutoff = int(meta.get('cutoff') or 1)
                 if len(meta.get('image_list', [])) < cutoff and meta.get('skip_imghost_upload', False) is False:
                     # Validate and (if needed) rehost images to tracker-approved hosts before uploading any new screenshots.
-                    trackers_with_image_host_requirements = {'A4K', 'BHD', 'DC', 'GPW', 'HUNO', 'MTV', 'OE', 'PTP', 'STC', 'TVC'}
-
                     relevant_trackers = [
                         t for t in cast(list[Any], meta.get('trackers', []))
-                        if isinstance(t, str) and t in trackers_with_image_host_requirements and t in tracker_class_map
+                        if isinstance(t, str) and t in TRACKERS_WITH_IMAGE_HOST_REQUIREMENTS and t in tracker_class_map
                     ]
 
                     # If all relevant trackers share exactly one common approved host that the user has configured,
@@ -1071,8 +1116,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
                 elif meta.get('skip_imghost_upload', False) is True and meta.get('image_list', False) is False:
                     meta['image_list'] = []
 
-                async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(meta, indent=4))
+                await meta_store.save(meta)
 
                 if 'image_list' in meta and meta['image_list']:
                     try:
@@ -1153,8 +1197,7 @@ async def process_meta(meta: Meta, base_dir: str, bot: Any = None) -> None:
 
         meta = await gen_desc(meta, takescreens_manager, uploadscreens_manager)
 
-        async with aiofiles.open(f"{meta['base_dir']}/tmp/{meta['uuid']}/meta.json", 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(meta, indent=4))
+        await meta_store.save(meta, immediate=True)
 
 
 async def cleanup_screenshot_temp_files(meta: Meta) -> None:
@@ -1174,24 +1217,9 @@ async def cleanup_screenshot_temp_files(meta: Meta) -> None:
 
 async def save_processed_file(log_file: str, file_path: str) -> None:
     """
-    Adds a processed file to the log, deduplicating and always appending to the end.
+    Adds a processed file to the log (an append-only journal, see src/processedlog.py).
     """
-    if os.path.exists(log_file):
-        async with aiofiles.open(log_file, encoding='utf-8') as f:
-            try:
-                content = await f.read()
-                loaded: Any = json.loads(content) if content.strip() else []
-                processed_files = cast(list[Any], loaded) if isinstance(loaded, list) else []
-            except Exception:
-                processed_files = []
-    else:
-        processed_files = []
-
-    processed_files_clean: list[str] = [str(entry) for entry in processed_files if entry != file_path]
-    processed_files_clean.append(file_path)
-
-    async with aiofiles.open(log_file, "w", encoding='utf-8') as f:
-        await f.write(json.dumps(processed_files_clean, indent=4))
+    await asyncio.to_thread(processed_log(log_file).add, file_path)
 
 
 def get_local_version(version_file: str) -> Optional[str]:
@@ -1327,6 +1355,9 @@ async def do_the_thing(base_dir: str) -> None:
 
     bot: Any = None
     connect_task: Optional[asyncio.Task[None]] = None
+    pipeline: Optional[QueuePipeline] = None
+    prefetched: dict[int, tuple[Future[PrefetchedItem], OutputBuffer]] = {}
+    console_routing = contextlib.ExitStack()
     meta: Meta = {}
     paths: list[str] = []
     for each in sys.argv[1:]:
@@ -1467,6 +1498,7 @@ async def do_the_thing(base_dir: str) -> None:
 
         if meta.get('cleanup'):
             if os.path.exists(f"{base_dir}/tmp"):
+                await meta_store.discard(f"{base_dir}/tmp")
                 shutil.rmtree(f"{base_dir}/tmp")
                 console.print("[yellow]Successfully emptied tmp directory[/yellow]")
                 console.print()
@@ -1495,21 +1527,26 @@ async def do_the_thing(base_dir: str) -> None:
             console.print()
             meta['mkbrr'] = False
 
+        # Banned groups and claims of the run's trackers are refreshed together while the queue is built
+        tracker_lists_task = asyncio.create_task(TRACKER_SETUP(config=config).refresh_tracker_lists(meta))
         queue, log_file = await QueueManager.handle_queue(path, meta, paths, base_dir)
+        try:
+            await tracker_lists_task
+        except Exception as e:
+            console.print(f"[yellow]Could not refresh tracker banned groups and claims: {e}[/yellow]")
         queue_list = cast(list[Any], queue)
 
         processed_files_count = 0
         skipped_files_count = 0
         base_meta = dict(meta.items())
 
-        for queue_item in queue_list:
-            total_files = len(queue_list)
-            bot = None
+        async def setup_queue_item(queue_item: Any) -> tuple[Meta, str, str, str]:
+            """Fresh meta and tmp dir for a queue item; returns (meta, path, current_item_path, tmp_path)."""
+            meta: Meta = base_meta.copy()
+            path = ""
             current_item_path = ""
             tmp_path = ""
             try:
-                meta = base_meta.copy()
-
                 if meta.get('site_upload_queue'):
                     # Extract path and metadata from site upload queue item
                     queue_item_mapping = cast(Mapping[str, Any], queue_item)
@@ -1533,6 +1570,8 @@ async def do_the_thing(base_dir: str) -> None:
 
                 if meta.get('delete_tmp', False) and os.path.exists(tmp_path):
                     try:
+                        # A pending meta.json write would recreate the directory after it is removed
+                        await meta_store.discard(tmp_path)
                         shutil.rmtree(tmp_path)
                         if os.name != 'nt':
                             os.makedirs(tmp_path, mode=0o700, exist_ok=True)
@@ -1545,6 +1584,8 @@ async def do_the_thing(base_dir: str) -> None:
                         console.print(f"[bold red]Failed to delete temp directory: {str(e)}")
 
                 meta_file = os.path.join(base_dir, "tmp", os.path.basename(path), "meta.json")
+                # Fragments cached for a previous run of this path would not match a deleted or merged file
+                meta_store.forget(meta_file)
 
                 keep_meta = config['DEFAULT'].get('keep_meta', False)
 
@@ -1570,6 +1611,71 @@ async def do_the_thing(base_dir: str) -> None:
             except Exception as e:
                 console.print(f"[red]Exception: '{path}': {e}")
                 cleanup_manager.reset_terminal()
+            return meta, path, current_item_path, tmp_path
+
+        async def prefetch_queue_item(queue_item: Any) -> PrefetchedItem:
+            """Setup and prep stage of a queue item, run on a pipeline worker ahead of its turn."""
+            item_meta, item_path, item_current_path, item_tmp_path = await setup_queue_item(queue_item)
+            console.print(f"[green]Gathering info for {os.path.basename(item_path)}")
+            prepped = await prepare_meta(item_meta)
+            # Don't leave a pending meta.json write on the worker's loop
+            await meta_store.flush(prepped if prepped is not None else item_meta)
+            return item_meta, item_path, item_current_path, item_tmp_path, prepped
+
+        def queue_item_name(queue_item: Any) -> str:
+            item_path = cast(Mapping[str, Any], queue_item).get('path') if isinstance(queue_item, dict) else queue_item
+            return os.path.basename(str(item_path or ''))
+
+        next_prefetch = 1
+
+        def fill_pipeline(current_index: int) -> None:
+            """Hand the next items to idle prep workers, at most ``queue_prep_workers`` ahead of the current one."""
+            nonlocal next_prefetch
+            if pipeline is None:
+                return
+            next_prefetch = max(next_prefetch, current_index + 1)
+            in_flight = {queue_item_name(queue_list[i]) for i in (current_index, *prefetched)}
+            while next_prefetch < len(queue_list) and next_prefetch - current_index <= pipeline.workers and pipeline.has_idle_worker:
+                queue_item = queue_list[next_prefetch]
+                name = queue_item_name(queue_item)
+                if name in in_flight:
+                    # Same tmp dir as an item that is still in flight; wait until it is done
+                    break
+                prefetched[next_prefetch] = pipeline.submit(lambda item=queue_item: prefetch_queue_item(item))
+                in_flight.add(name)
+                next_prefetch += 1
+
+        # Pipelined queue: prep the next items on background workers while the current one uploads.
+        # Prompts from a prefetched item would stall behind the current item, so this needs unattended mode.
+        if len(queue_list) > 1 and (meta.get('queue') or meta.get('site_upload_queue')) and config['DEFAULT'].get('queue_pipeline', False):
+            auto_mode = str(config['DEFAULT'].get('auto_mode', False)).lower() == "true"
+            if (meta.get('unattended') or auto_mode) and not meta.get('unattended_confirm', False):
+                try:
+                    prep_workers = max(1, int(config['DEFAULT'].get('queue_prep_workers', 1)))
+                except (TypeError, ValueError):
+                    prep_workers = 1
+                pipeline = QueuePipeline(prep_workers)
+                console_routing.enter_context(task_routed_console())
+                console.print(f"[cyan]Pipelined queue: preparing up to {prep_workers} item(s) ahead[/cyan]")
+            else:
+                console.print("[yellow]queue_pipeline needs unattended mode, processing the queue one item at a time[/yellow]")
+
+        for index, queue_item in enumerate(queue_list):
+            total_files = len(queue_list)
+            bot = None
+            prepped: Optional[Meta] = None
+            prefetch = prefetched.pop(index, None)
+            fill_pipeline(index)
+            if prefetch is not None:
+                try:
+                    meta, path, current_item_path, tmp_path, prepped = await QueuePipeline.result(*prefetch)
+                except Exception as e:
+                    # Only this item is affected; it is prepared again here like any unpipelined item
+                    console.print(f"[red]Background prep of {queue_item_name(queue_item)} failed: {e}[/red]")
+                    console.print(traceback.format_exc())
+                    prefetch = None
+            if prefetch is None:
+                meta, path, current_item_path, tmp_path = await setup_queue_item(queue_item)
 
             discord_bot_token = discord_config.get('discord_bot_token') if discord_config is not None else None
             only_unattended = bool(discord_config.get('only_unattended', False)) if discord_config is not None else False
@@ -1610,9 +1716,11 @@ async def do_the_thing(base_dir: str) -> None:
             if meta['debug']:
                 start_time = time.time()
 
-            console.print(f"[green]Gathering info for {os.path.basename(path)}")
-
-            await process_meta(meta, base_dir, bot=bot)
+            if prefetch is None:
+                console.print(f"[green]Gathering info for {os.path.basename(path)}")
+                await process_meta(meta, base_dir, bot=bot)
+            elif prepped is not None:
+                await process_meta(meta, base_dir, bot=bot, prepped=prepped)
             tracker_setup = TRACKER_SETUP(config=config)
             if 'we_are_uploading' not in meta or not meta.get('we_are_uploading', False):
                 if config['DEFAULT'].get('cross_seeding', True):
@@ -1806,6 +1914,7 @@ async def do_the_thing(base_dir: str) -> None:
 
             if meta.get('delete_tmp', False) and tmp_path and os.path.exists(tmp_path) and meta.get('emby', False):
                 try:
+                    await meta_store.discard(tmp_path)
                     shutil.rmtree(tmp_path)
                     console.print(f"[yellow]Successfully deleted temp directory for {os.path.basename(path)}[/yellow]")
                     console.print()
@@ -1842,6 +1951,13 @@ async def do_the_thing(base_dir: str) -> None:
         cleanup_manager.reset_terminal()
 
     finally:
+        if pipeline is not None:
+            for future, _ in prefetched.values():
+                future.cancel()
+            await asyncio.to_thread(pipeline.shutdown)
+        if meta.get('debug', False):
+            console.print(f"[cyan]Metadata cache: {metadata_cache.summary()}")
+        console_routing.close()
         if bot is not None:
             await bot.close()
         if connect_task is not None:
@@ -1929,7 +2045,7 @@ async def process_cross_seeds(meta: Meta) -> None:
                 if tracker != "PTP":
                     dupes = await tracker_class.search_existing(meta, disctype)
                 else:
-                    ptp = PTP(config=config)
+                    ptp = tracker_class_map['PTP'](config=config)
                     group_id = meta.get('ptp_groupID')
                     if not group_id:
                         group_id = await ptp.get_group_by_imdb(meta['imdb'])
@@ -2003,7 +2119,7 @@ async def process_cross_seeds(meta: Meta) -> None:
 
         if tracker == "AR" and download_url:
             try:
-                ar = AR(config=config)
+                ar = tracker_class_map['AR'](config=config)
                 auth_key = await ar.get_auth_key(meta)
 
                 # Extract torrent_pass from announce_url
@@ -2077,6 +2193,9 @@ async def main() -> None:
     except Exception as e:
         if not _shutdown_requested:
             console.print(f"[bold red]Unexpected error: {e}[/bold red]")
+    finally:
+        await meta_store.flush()
+        await http_pool.aclose()
 
 
 if __name__ == "__main__":
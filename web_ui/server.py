@@ -41,6 +41,7 @@ except Exception:
     ansi_to_html = None
 
 from src.console import console
+from src.fs_index import IndexEntry, fs_index, tokenize
 
 cfg_dir = auth_mod.get_config_dir()
 cfg_dir.mkdir(parents=True, exist_ok=True)
@@ -492,9 +493,6 @@ SUPPORTED_VIDEO_EXTS = {'.mkv', '.mp4', '.ts'}
 # Supported description file extensions for WebUI description file browser
 SUPPORTED_DESC_EXTS = {'.txt', '.nfo', '.md'}
 
-# Regex for splitting filenames on common separators (dots, dashes, underscores, spaces)
-_BROWSE_SEARCH_SEP_RE = re.compile(r'[\s.\-_]+')
-
 # Lock to prevent concurrent in-process uploads (avoids cross-session interference)
 inproc_lock = threading.Lock()
 
@@ -1122,6 +1120,8 @@ def set_runtime_browse_roots(browse_roots: str) -> None:
     """Set browse roots at runtime (used by upload.py when starting web UI)"""
     global _runtime_browse_roots
     _runtime_browse_roots = browse_roots
+    # Build the search index now rather than in the first browse_search request
+    fs_index.prime(_get_browse_roots())
 
 
 def _load_config_from_file(path: Path) -> dict[str, Any] | None:
@@ -2858,88 +2858,38 @@ def browse_search():
     if not roots:
         return jsonify({"success": False, "error": "Browsing is not configured"}), 400
 
-    # Split on common separators
-    query_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(query.lower()) if t]
-    if not query_tokens:
+    if not tokenize(query):
         return jsonify({"success": True, "items": [], "query": query})
 
-    def name_matches(name: str) -> bool:
-        """Check if query tokens appear as whole-word ordered subsequence in the name."""
-        name_tokens = [t for t in _BROWSE_SEARCH_SEP_RE.split(name.lower()) if t]
-        pos = 0
-        for qt in query_tokens:
-            found = False
-            while pos < len(name_tokens):
-                if name_tokens[pos] == qt:
-                    pos += 1
-                    found = True
-                    break
-                pos += 1
-            if not found:
-                return False
-        return True
-
     allowed_exts = SUPPORTED_DESC_EXTS if file_filter == "desc" else SUPPORTED_VIDEO_EXTS
-    items: list[BrowseItem] = []
-
-    try:
-        for root in roots:
-            root_abs = os.path.abspath(root)
-            if not os.path.isdir(root_abs):
-                continue
-            try:
-                for dirpath, dirnames, filenames in os.walk(root_abs):
-                    # Skip hidden dirs
-                    dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-                    # Check dirs
-                    for dirname in dirnames:
-                        if name_matches(dirname):
-                            full_path = os.path.join(dirpath, dirname)
-                            try:
-                                _assert_safe_resolved_path(full_path)
-                            except ValueError:
-                                continue
-                            items.append({"name": dirname, "path": full_path, "type": "folder", "children": []})
-                            if len(items) >= max_results:
-                                break
 
-                    if len(items) >= max_results:
-                        break
-
-                    # Check files
-                    for filename in filenames:
-                        if filename.startswith("."):
-                            continue
-                        if not name_matches(filename):
-                            continue
-                        _, ext = os.path.splitext(filename.lower())
-                        if ext not in allowed_exts:
-                            continue
-                        full_path = os.path.join(dirpath, filename)
-                        try:
-                            _assert_safe_resolved_path(full_path)
-                        except ValueError:
-                            continue
-                        items.append({"name": filename, "path": full_path, "type": "file", "children": None})
-                        if len(items) >= max_results:
-                            break
-
-                    if len(items) >= max_results:
-                        break
-            except PermissionError:
-                continue
-            except Exception as e:
-                console.print(f"Error searching in {root}: {e}", markup=False)
-                continue
+    def accept(entry: IndexEntry) -> bool:
+        if not entry.is_dir and os.path.splitext(entry.name.lower())[1] not in allowed_exts:
+            return False
+        try:
+            _assert_safe_resolved_path(entry.path)
+        except ValueError:
+            return False
+        return True
 
-            if len(items) >= max_results:
-                break
+    try:
+        # Served from the persistent name index; directories are only re-listed when their mtime changes.
+        # A root whose first index is still being built is skipped rather than scanned in the request.
+        matches = fs_index.match_tokens(roots, query, accept=accept, limit=max_results, block=False)
+        items: list[BrowseItem] = [
+            {"name": entry.name, "path": entry.path, "type": "folder", "children": []}
+            if entry.is_dir
+            else {"name": entry.name, "path": entry.path, "type": "file", "children": None}
+            for entry in matches
+        ]
 
         # Sort by folders first and then alphabetically
         items.sort(key=lambda x: (0 if x.get("type") == "folder" else 1, (x.get("name") or "").lower()))
 
-        return jsonify({"success": True, "items": items, "query": query, "count": len(items), "truncated": len(items) >= max_results})
+        return jsonify({
+            "success": True, "items": items, "query": query, "count": len(items), "truncated": len(items) >= max_results,
+            "indexing": not fs_index.ready(roots),
+        })
 
     except Exception as e:
         console.print(f"Error in browse_search: {e}", markup=False)